@@ -0,0 +1,65 @@
+"""add_hot_query_indexes
+
+Revision ID: d5e8a2f47b1c
+Revises: 43cb4a16de9d
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a2f47b1c'
+down_revision: Union[str, None] = '43cb4a16de9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors proxywhirl.storage._HOT_QUERY_INDEXES (static copy: migrations do not
+# import application code).
+HOT_QUERY_INDEXES = {
+    "idx_proxy_status_health_latency": (
+        "proxy_statuses(health_status, avg_response_time_ms IS NULL, "
+        "avg_response_time_ms, last_success_at, proxy_url)"
+    ),
+    "idx_proxy_status_check_order": "proxy_statuses(last_check_at, updated_at, proxy_url)",
+    "idx_proxy_status_checks": "proxy_statuses(total_checks, proxy_url)",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema.
+
+    Add composite/covering indexes on proxy_statuses for healthy-proxy
+    selection (fastest first), oldest-first revalidation and cleanup, replacing
+    idx_proxy_status_health. The normalized tables are created by
+    SQLiteStorage.initialize, so databases without proxy_statuses are left
+    untouched.
+
+    This migration applies forward schema changes. Always test migrations
+    in a development environment before applying to production.
+    """
+    if not sa.inspect(op.get_bind()).has_table("proxy_statuses"):
+        return
+    for name, target in HOT_QUERY_INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    # Superseded by idx_proxy_status_health_latency (the planner would keep
+    # picking it and sorting every healthy proxy)
+    op.execute("DROP INDEX IF EXISTS idx_proxy_status_health")
+
+
+def downgrade() -> None:
+    """Downgrade database schema.
+
+    This migration reverts schema changes. Use with caution in production.
+    Ensure data backups exist before running downgrades.
+    """
+    for name in HOT_QUERY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    if sa.inspect(op.get_bind()).has_table("proxy_statuses"):
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS idx_proxy_status_health "
+            "ON proxy_statuses(health_status, last_success_at DESC)"
+        )
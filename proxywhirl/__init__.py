@@ -81,7 +81,9 @@ from proxywhirl.safe_regex import (
     RegexTimeoutError,
     safe_regex_compile,
     safe_regex_findall,
+    safe_regex_findall_many,
     safe_regex_match,
+    safe_regex_match_many,
     safe_regex_search,
     validate_regex_pattern,
 )
@@ -246,7 +248,9 @@ __all__ = [
     "redact_url",
     "safe_regex_compile",
     "safe_regex_findall",
+    "safe_regex_findall_many",
     "safe_regex_match",
+    "safe_regex_match_many",
     "safe_regex_search",
     "scrub_credentials_from_dict",
     "validate_proxy_model",
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from proxywhirl.models import HealthStatus, Proxy
+from proxywhirl.models import HealthStatus, Proxy, ProxyPool
 from proxywhirl.security import redact_url
 from proxywhirl.utils import create_proxy_from_url, public_proxy_url
 
@@ -75,9 +76,26 @@ def list_proxy_result(rotator: Any, query: ProxyListQuery | None = None) -> Prox
 
 def list_proxy_views(rotator: Any, query: ProxyListQuery | None = None) -> list[ProxyView]:
     """Return matching credential-safe proxy views from a rotator."""
+    return list(iter_proxy_views(rotator, query))
+
+
+def iter_proxy_views(
+    rotator: Any,
+    query: ProxyListQuery | None = None,
+    batch_size: int = 1000,
+) -> Iterator[ProxyView]:
+    """Lazily yield matching credential-safe proxy views from a rotator.
+
+    The pool is read in batches of ``batch_size`` so callers that stream views
+    (API exports) keep memory flat regardless of pool size.
+    """
     query = query or ProxyListQuery()
-    views = [proxy_to_view(rotator, proxy) for proxy in _pool_snapshot(rotator)]
-    return [view for view in views if _matches_query(view, query)]
+    circuit_breakers = _circuit_breaker_lookup(rotator)
+    for batch in _pool_batches(rotator, batch_size):
+        for proxy in batch:
+            view = _build_view(proxy, circuit_breakers.get(str(proxy.id)))
+            if _matches_query(view, query):
+                yield view
 
 
 def find_proxy(rotator: Any, proxy_ref: UUID | str) -> Proxy | None:
@@ -150,7 +168,10 @@ async def select_proxy_view_async(rotator: Any) -> ProxyView:
 
 def proxy_to_view(rotator: Any, proxy: Proxy) -> ProxyView:
     """Return a credential-safe public view for a proxy."""
-    circuit_breaker = _circuit_breakers(rotator).get(str(proxy.id))
+    return _build_view(proxy, _circuit_breaker_lookup(rotator).get(str(proxy.id)))
+
+
+def _build_view(proxy: Proxy, circuit_breaker: Any | None) -> ProxyView:
     health = proxy.health_status.value if proxy.health_status else HealthStatus.UNKNOWN.value
     total_requests = max(proxy.total_requests, proxy.requests_started, proxy.requests_completed)
     successful_requests = max(proxy.total_successes, proxy.requests_completed)
@@ -180,6 +201,23 @@ def _pool_snapshot(rotator: Any) -> list[Proxy]:
     return rotator.pool.get_all_proxies()
 
 
+def _pool_batches(rotator: Any, batch_size: int) -> Iterator[list[Proxy]]:
+    pool = rotator.pool
+    if isinstance(pool, ProxyPool):
+        yield from pool.iter_batches(batch_size)
+    else:
+        yield pool.get_all_proxies()
+
+
+def _circuit_breaker_lookup(rotator: Any) -> Mapping[str, Any]:
+    # Read live breakers by proxy ID instead of snapshotting every breaker for
+    # each view; only ``state`` is read, so no snapshot isolation is needed.
+    live = getattr(rotator, "circuit_breakers", None)
+    if isinstance(live, Mapping):
+        return live
+    return _circuit_breakers(rotator)
+
+
 def _circuit_breakers(rotator: Any) -> dict[str, Any]:
     get_states = getattr(rotator, "get_circuit_breaker_states", None)
     if get_states is None:
@@ -17,6 +17,8 @@ The API uses:
 
 from __future__ import annotations
 
+import json
+import re
 import time
 import uuid
 from collections.abc import AsyncIterator
@@ -29,7 +31,8 @@ from fastapi.responses import JSONResponse
 from loguru import logger
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from proxywhirl.api.middleware.auth import APIKeyMiddleware
 from proxywhirl.api.models import APIResponse, ErrorCode
@@ -118,10 +121,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Load proxies from storage if available
     if storage:
         try:
-            stored_proxies = await storage.load()
-            for row in stored_proxies:
-                rotator.add_proxy(dict_to_proxy(row))
-            logger.info(f"Loaded {len(stored_proxies)} proxies from storage")
+            loaded = 0
+            async for row in storage.iter_proxies():
+                rotator.add_proxy(dict_to_proxy(row, trusted=True))
+                loaded += 1
+            logger.info(f"Loaded {loaded} proxies from storage")
         except Exception as e:
             logger.warning(f"Failed to load proxies from storage: {e}")
 
@@ -224,28 +228,54 @@ app.add_middleware(
 
 
 # Security headers middleware
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Add security headers to all responses."""
+class SecurityHeadersMiddleware:
+    """Add security headers to all responses.
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
-        response = await call_next(request)
+    Implemented as pure ASGI middleware: headers are injected into the
+    ``http.response.start`` message without wrapping the response body, so
+    streaming responses pass through untouched.
+    """
+
+    SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
         # Basic security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+        (b"x-content-type-options", b"nosniff"),
+        (b"x-frame-options", b"DENY"),
+        (b"x-xss-protection", b"1; mode=block"),
         # HSTS - enforce HTTPS with 1-year max-age
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
         # CSP - restrict resource loading to same origin, prevent framing
-        response.headers["Content-Security-Policy"] = "default-src 'self'; frame-ancestors 'none'"
+        (b"content-security-policy", b"default-src 'self'; frame-ancestors 'none'"),
         # Referrer-Policy - send origin only on cross-origin requests
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
         # Permissions-Policy - disable sensitive browser features
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        return response
+        (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+    )
+    _HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() not in self._HEADER_NAMES
+                ]
+                headers.extend(self.SECURITY_HEADERS)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # Request ID middleware for request tracing
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Add request ID correlation for request tracing.
 
     This middleware ensures every request has a unique identifier that can be
@@ -258,11 +288,18 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Included in the response X-Request-ID header
     """
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and add request ID correlation."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Use existing header or generate new UUID
         # Validate client-supplied request IDs to prevent log injection
-        supplied_id = request.headers.get("X-Request-ID")
+        supplied_id = Headers(scope=scope).get("x-request-id")
         if (
             supplied_id
             and len(supplied_id) <= 128
@@ -272,18 +309,26 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             request_id = supplied_id
         else:
             request_id = str(uuid.uuid4())
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    (name, value)
+                    for name, value in message.get("headers", ())
+                    if name.lower() != b"x-request-id"
+                ]
+                headers.append(request_id_header)
+                message = {**message, "headers": headers}
+            await send(message)
 
         # Add to loguru context for all downstream logging
         with logger.contextualize(request_id=request_id):
-            response = await call_next(request)
-
-        # Include in response headers
-        response.headers["X-Request-ID"] = request_id
-        return response
+            await self.app(scope, receive, send_with_request_id)
 
 
 # Audit logging middleware for security-sensitive operations
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
+class AuditLoggingMiddleware:
     """Structured audit logging for API operations.
 
     Provides security audit trail including:
@@ -293,6 +338,9 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
     - Request body logging for writes (with sensitive data redaction)
 
     All logs use structured JSON format for easy parsing by SIEM tools.
+
+    Whether auditing is enabled (``PROXYWHIRL_AUDIT_LOG``) is resolved once when
+    the middleware stack is built, not on every request.
     """
 
     # Paths that require audit logging
@@ -322,17 +370,24 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
         }
     )
 
+    WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+    BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+    def __init__(self, app: ASGIApp, audit_log: bool | None = None) -> None:
+        self.app = app
+        self.enabled = APISettings().audit_log if audit_log is None else audit_log
+
     def _get_operation_type(self, method: str, path: str) -> str:
         """Classify the operation type for audit purposes."""
         # Check specific paths first
         for audit_path, op_type in self.AUDIT_PATHS.items():
             if path.startswith(audit_path):
-                if method in ("POST", "PUT", "PATCH", "DELETE"):
+                if method in self.WRITE_METHODS:
                     return op_type
                 return "read"
 
         # Default classification by method
-        if method in ("POST", "PUT", "PATCH", "DELETE"):
+        if method in self.WRITE_METHODS:
             return "write"
         return "read"
 
@@ -358,45 +413,69 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
                 redacted[key] = value
         return redacted
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+    async def _read_body(self, receive: Receive) -> tuple[bytes, Receive]:
+        """Read the full request body and return a receive callable that replays it."""
+        chunks: list[bytes] = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] != "http.request":
+                # Client disconnected before the body was complete
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return body, replay_receive
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and emit audit log for sensitive operations."""
-        if not APISettings().audit_log:
-            return await call_next(request)
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        path = str(request.url.path)
-        method = request.method
+        path: str = scope["path"]
+        method: str = scope["method"]
 
         # Skip audit logging for non-API paths and GET requests to non-sensitive endpoints
         if not path.startswith("/api/"):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         operation_type = self._get_operation_type(method, path)
 
         # Only audit write/admin/auth operations
         if operation_type == "read":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Extract audit context - log both real and claimed IPs
-        socket_ip = request.client.host if request.client else "unknown"
-        client_ip = socket_ip
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        headers = Headers(scope=scope)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        forwarded_for = headers.get("x-forwarded-for")
         claimed_ip = forwarded_for.split(",")[0].strip() if forwarded_for else None
 
-        api_key = request.headers.get("X-API-Key")
-        request_id = request.headers.get("X-Request-ID", "unknown")
+        api_key = headers.get("x-api-key")
+        request_id = headers.get("x-request-id", "unknown")
 
         # Try to capture request body for mutating operations
         body_summary = None
-        if method in ("POST", "PUT", "PATCH"):
-            try:
-                body_bytes = await request.body()
-                if body_bytes:
-                    import json
-
-                    body = json.loads(body_bytes)
-                    body_summary = self._redact_body(body)
-            except Exception:
-                body_summary = {"_parse_error": "Could not parse request body"}
+        if method in self.BODY_METHODS:
+            body_bytes, receive = await self._read_body(receive)
+            if body_bytes:
+                try:
+                    body_summary = self._redact_body(json.loads(body_bytes))
+                except Exception:
+                    body_summary = {"_parse_error": "Could not parse request body"}
 
         # Emit audit log before processing
         logger.bind(
@@ -412,11 +491,19 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
             body_summary=body_summary,
         ).info(f"AUDIT: {operation_type.upper()} operation {method} {path}")
 
+        status_code = 500
+
+        async def send_capturing_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process request
-        response = await call_next(request)
+        await self.app(scope, receive, send_capturing_status)
 
         # Log outcome for write operations
-        if response.status_code >= 400:
+        if status_code >= 400:
             logger.bind(
                 event="audit",
                 audit_type="api_response",
@@ -425,9 +512,9 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
                 path=path,
                 client_ip=client_ip,
                 request_id=request_id,
-                status_code=response.status_code,
+                status_code=status_code,
                 success=False,
-            ).warning(f"AUDIT: {operation_type.upper()} operation failed: {response.status_code}")
+            ).warning(f"AUDIT: {operation_type.upper()} operation failed: {status_code}")
         else:
             logger.bind(
                 event="audit",
@@ -436,15 +523,13 @@ class AuditLoggingMiddleware(BaseHTTPMiddleware):
                 method=method,
                 path=path,
                 request_id=request_id,
-                status_code=response.status_code,
+                status_code=status_code,
                 success=True,
-            ).info(f"AUDIT: {operation_type.upper()} operation succeeded: {response.status_code}")
-
-        return response
+            ).info(f"AUDIT: {operation_type.upper()} operation succeeded: {status_code}")
 
 
 # Request logging middleware
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Log all HTTP requests with structured JSON logging.
 
     Logs:
@@ -455,26 +540,33 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     - Sensitive data redaction (passwords, tokens, API keys)
     """
 
-    async def dispatch(self, request: Request, call_next: Any) -> Any:
+    _SENSITIVE_QUERY_PATTERN = re.compile(
+        r"(password|token|key|secret|auth|api_key|api-key)=[^&]*",
+        flags=re.IGNORECASE,
+    )
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and log details."""
-        start_time = time.time()
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method: str = scope["method"]
 
         # Extract client IP - use socket IP (do not trust X-Forwarded-For)
-        client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
 
         # Redact sensitive information from URL
-        path = str(request.url.path)
-        query_string = str(request.url.query) if request.url.query else ""
+        path: str = scope["path"]
+        query_string = scope.get("query_string", b"").decode("latin-1")
         if query_string:
             # Redact sensitive query parameters
-            import re
-
-            query_string = re.sub(
-                r"(password|token|key|secret|auth|api_key|api-key)=[^&]*",
-                r"\1=***",
-                query_string,
-                flags=re.IGNORECASE,
-            )
+            query_string = self._SENSITIVE_QUERY_PATTERN.sub(r"\1=***", query_string)
             full_path = f"{path}?{query_string}"
         else:
             full_path = path
@@ -482,80 +574,86 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Log request start
         logger.bind(
             event="request_start",
-            method=request.method,
+            method=method,
             path=full_path,
             client_ip=client_ip,
-            user_agent=request.headers.get("User-Agent", "unknown"),
+            user_agent=Headers(scope=scope).get("user-agent", "unknown"),
         ).debug("HTTP request started")
 
-        # Process request
-        try:
-            response = await call_next(request)
-            duration_ms = int((time.time() - start_time) * 1000)
-            duration_seconds = time.time() - start_time
+        status_code = 500
 
-            # Record Prometheus metrics (skip exposition endpoint to avoid recursion)
-            if path != "/api/metrics":
-                proxywhirl_requests_total.labels(
-                    endpoint=path,
-                    method=request.method,
-                    status=str(response.status_code),
-                ).inc()
-
-                proxywhirl_request_duration_seconds.labels(
-                    endpoint=path,
-                    method=request.method,
-                ).observe(duration_seconds)
-
-            # Log successful request
-            logger.bind(
-                event="request_complete",
-                method=request.method,
-                path=full_path,
-                client_ip=client_ip,
-                status_code=response.status_code,
-                duration_ms=duration_ms,
-            ).info(f"{request.method} {path} - {response.status_code} ({duration_ms}ms)")
-
-            return response
+        async def send_capturing_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        # Process request
+        try:
+            await self.app(scope, receive, send_capturing_status)
         except Exception as exc:
-            duration_ms = int((time.time() - start_time) * 1000)
-            duration_seconds = time.time() - start_time
+            duration_seconds = time.perf_counter() - start_time
+            duration_ms = int(duration_seconds * 1000)
 
             # Record Prometheus metrics for failed requests (skip exposition endpoint)
             if path != "/api/metrics":
                 # Use 5xx for uncaught exceptions
                 proxywhirl_requests_total.labels(
                     endpoint=path,
-                    method=request.method,
+                    method=method,
                     status="500",
                 ).inc()
 
                 proxywhirl_request_duration_seconds.labels(
                     endpoint=path,
-                    method=request.method,
+                    method=method,
                 ).observe(duration_seconds)
 
             # Log failed request
             logger.bind(
                 event="request_failed",
-                method=request.method,
+                method=method,
                 path=full_path,
                 client_ip=client_ip,
                 duration_ms=duration_ms,
                 error_type=type(exc).__name__,
                 error_message=str(exc),
-            ).error(f"{request.method} {path} - Failed ({duration_ms}ms): {exc}")
+            ).error(f"{method} {path} - Failed ({duration_ms}ms): {exc}")
 
             # Re-raise to let FastAPI handle it
             raise
 
+        duration_seconds = time.perf_counter() - start_time
+        duration_ms = int(duration_seconds * 1000)
+
+        # Record Prometheus metrics (skip exposition endpoint to avoid recursion)
+        if path != "/api/metrics":
+            proxywhirl_requests_total.labels(
+                endpoint=path,
+                method=method,
+                status=str(status_code),
+            ).inc()
+
+            proxywhirl_request_duration_seconds.labels(
+                endpoint=path,
+                method=method,
+            ).observe(duration_seconds)
+
+        # Log successful request
+        logger.bind(
+            event="request_complete",
+            method=method,
+            path=full_path,
+            client_ip=client_ip,
+            status_code=status_code,
+            duration_ms=duration_ms,
+        ).info(f"{method} {path} - {status_code} ({duration_ms}ms)")
+
 
 app.add_middleware(RequestLoggingMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RequestIDMiddleware)
-app.add_middleware(AuditLoggingMiddleware)  # Runs first (added last)
+app.add_middleware(AuditLoggingMiddleware, audit_log=api_settings.audit_log)
 app.add_middleware(APIKeyMiddleware)
 
 
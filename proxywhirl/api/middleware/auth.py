@@ -8,9 +8,10 @@ from __future__ import annotations
 
 import secrets
 
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from proxywhirl.api.models import APIResponse, ErrorCode
 from proxywhirl.settings import APISettings
@@ -21,12 +22,16 @@ def _api_error(status_code: int, code: ErrorCode, message: str) -> JSONResponse:
     return JSONResponse(status_code=status_code, content=response.model_dump(mode="json"))
 
 
-class APIKeyMiddleware(BaseHTTPMiddleware):
+class APIKeyMiddleware:
     """Middleware to enforce API key authentication on protected routes.
 
     Skips authentication for public paths (health, readiness, docs, root).
     When PROXYWHIRL_REQUIRE_AUTH is enabled, validates the X-API-Key header
     against the PROXYWHIRL_API_KEY environment variable.
+
+    Implemented as pure ASGI middleware so streaming responses are not
+    buffered. Authentication settings are still read per request so that key
+    rotation through the environment takes effect without a restart.
     """
 
     # Paths that never require authentication
@@ -55,45 +60,56 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         }
     )
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Validate API key for protected requests."""
-        api_settings = APISettings()
-        path = request.url.path
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
-        if request.method == "OPTIONS":
-            return await call_next(request)
+        api_settings = APISettings()
+        method: str = scope["method"]
+        path: str = scope["path"]
 
         # Skip public paths. Prometheus exposition is public only by explicit opt-in.
         if path in self.PUBLIC_PATHS or (
             api_settings.public_metrics and path in self.PUBLIC_METRICS_PATHS
         ):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         auth_required = (
             api_settings.require_auth
-            or (request.method, path) in self.PROTECTED_EXACT_ROUTES
+            or (method, path) in self.PROTECTED_EXACT_ROUTES
             or any(
-                request.method == method and path.startswith(prefix)
-                for method, prefix in self.PROTECTED_PREFIX_ROUTES
+                method == protected_method and path.startswith(prefix)
+                for protected_method, prefix in self.PROTECTED_PREFIX_ROUTES
             )
         )
         if not auth_required:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         expected_key = api_settings.api_key.get_secret_value() if api_settings.api_key else None
         if not expected_key:
-            return _api_error(
+            response = _api_error(
                 status.HTTP_503_SERVICE_UNAVAILABLE,
                 ErrorCode.SERVICE_UNAVAILABLE,
                 "API authentication not configured",
             )
+            await response(scope, receive, send)
+            return
 
-        api_key = request.headers.get("X-API-Key")
+        api_key = Headers(scope=scope).get("x-api-key")
         if not api_key or not secrets.compare_digest(api_key, expected_key):
-            return _api_error(
+            response = _api_error(
                 status.HTTP_401_UNAUTHORIZED,
                 ErrorCode.VALIDATION_ERROR,
                 "Invalid or missing API key",
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
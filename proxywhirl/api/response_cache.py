@@ -0,0 +1,199 @@
+"""Version-keyed response cache with strong ETags for read-heavy API endpoints.
+
+Dashboards poll listing and metrics endpoints every few seconds. Instead of
+rebuilding proxy views and metric aggregates on every poll, endpoints look up
+a cached serialized body keyed by the version counters of the state they read
+(``ProxyPool.version``, ``CIRCUIT_BREAKER_STATE_VERSION``, ``RetryMetrics.version``).
+Each body carries a strong ETag derived from its bytes, so clients that send
+``If-None-Match`` get an empty ``304 Not Modified`` while nothing changed.
+
+Endpoints whose output also depends on the clock (rolling windows, uptime
+based rates) pass ``max_age`` so entries are rebuilt periodically even when
+no version changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+from proxywhirl.circuit_breaker import CIRCUIT_BREAKER_STATE_VERSION
+
+DEFAULT_MAX_ENTRIES = 256
+"""Maximum number of cached bodies kept before least recently used ones are evicted."""
+
+CACHE_CONTROL = "private, no-cache"
+"""Allow clients to store responses but require revalidation on every use."""
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A serialized JSON body with its strong ETag."""
+
+    body: bytes
+    etag: str
+    created_at: float
+
+    def to_response(self, request: Request) -> Response:
+        """Build a 200 response, or a bodiless 304 if the client's validator matches."""
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate an ``If-None-Match`` header against an ETag.
+
+    Uses the weak comparison required for ``If-None-Match`` (RFC 9110), so a
+    ``W/`` prefix on the client's validator is ignored.
+
+    Args:
+        if_none_match: Raw header value, possibly a comma-separated list or ``*``
+        etag: Current strong ETag (quoted)
+
+    Returns:
+        True if the client already has the current representation
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of serialized API responses keyed by state versions."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of bodies to keep
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable | None, max_age: float | None = None) -> CachedResponse | None:
+        """Return the cached body for ``key`` if present and fresh.
+
+        Args:
+            key: Cache key including the versions of the state the body was built
+                from; ``None`` never hits
+            max_age: Maximum age in seconds for clock-dependent bodies, or None
+                if the body only changes with the versions in ``key``
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if max_age is not None and time.monotonic() - entry.created_at >= max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable | None, payload: BaseModel) -> CachedResponse:
+        """Serialize ``payload`` and store it under ``key``.
+
+        Args:
+            key: Cache key; with ``None`` the body is serialized but not stored
+            payload: Response model to serialize
+
+        Returns:
+            The serialized response with its ETag
+        """
+        body = payload.model_dump_json(by_alias=True).encode()
+        entry = CachedResponse(body=body, etag=compute_etag(body), created_at=time.monotonic())
+        if key is None:
+            return entry
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached bodies."""
+        with self._lock:
+            self._entries.clear()
+
+
+def cache_key(
+    endpoint: str, versions: tuple[Hashable | None, ...], *params: Hashable
+) -> tuple[Hashable, ...] | None:
+    """Build a cache key from an endpoint name, state versions and request parameters.
+
+    Args:
+        endpoint: Endpoint identifier
+        versions: Version key components; if any is None the response is not cached
+        *params: Request parameters that affect the response body
+
+    Returns:
+        Hashable cache key, or None if the state is unversioned
+    """
+    if any(version is None for version in versions):
+        return None
+    return (endpoint, versions, params)
+
+
+def rotator_version_key(rotator: Any) -> tuple[int, int, int] | None:
+    """Return a cache key component for the pool and circuit breaker state of a rotator.
+
+    Args:
+        rotator: ProxyWhirl instance serving the request
+
+    Returns:
+        ``(pool identity, pool version, circuit breaker version)``, or None if the
+        rotator does not expose version counters (caching is then bypassed)
+    """
+    pool = getattr(rotator, "pool", None)
+    version = getattr(pool, "version", None)
+    if type(version) is not int:
+        return None
+    return id(pool), version, CIRCUIT_BREAKER_STATE_VERSION.value
+
+
+def retry_metrics_version_key(metrics: Any) -> tuple[int, int] | None:
+    """Return a cache key component for a ``RetryMetrics`` instance.
+
+    Args:
+        metrics: Retry metrics collection serving the request
+
+    Returns:
+        ``(metrics identity, metrics version)``, or None if unversioned
+    """
+    version = getattr(metrics, "version", None)
+    if type(version) is not int:
+        return None
+    return id(metrics), version
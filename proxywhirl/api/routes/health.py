@@ -10,7 +10,7 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from fastapi.responses import JSONResponse, StreamingResponse
 from prometheus_client import REGISTRY, generate_latest
 
@@ -22,10 +22,13 @@ from proxywhirl.api.models import (
     ReadinessResponse,
     StatusResponse,
 )
+from proxywhirl.api.response_cache import cache_key, rotator_version_key
 from proxywhirl.api.runtime import (
     get_app_start_time,
     get_config,
     get_last_rotation_time,
+    get_response_cache,
+    get_response_cache_ttl,
     get_rotator,
     get_storage,
     update_prometheus_metrics,
@@ -193,8 +196,9 @@ async def get_status(
     summary="Get performance statistics",
 )
 async def get_stats(
+    request: Request,
     rotator: ProxyWhirl = Depends(get_rotator),
-) -> APIResponse[MetricsResponse]:
+) -> Response:
     """Get API performance statistics (general aggregate metrics).
 
     This endpoint provides high-level performance statistics for the API,
@@ -210,9 +214,19 @@ async def get_stats(
         This endpoint provides aggregate metrics. For detailed metrics, use:
         - /api/metrics - Prometheus format metrics
         - /api/metrics/retries - Retry-specific metrics
+
+        The serialized response is cached until the pool changes (at most
+        ``PROXYWHIRL_RESPONSE_CACHE_TTL`` seconds) and carries an ETag, so
+        conditional requests with ``If-None-Match`` return 304.
     """
     from proxywhirl.api.models import ProxyStats
 
+    cache = get_response_cache()
+    key = cache_key("stats", (rotator_version_key(rotator),))
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     proxy_views = list_proxy_views(rotator)
     total_requests = sum(view.total_requests for view in proxy_views)
     total_completed = sum(view.successful_requests for view in proxy_views)
@@ -254,7 +268,7 @@ async def get_stats(
         proxy_stats=proxy_stats_list,
     )
 
-    return APIResponse.success(data=metrics_response)
+    return cache.put(key, APIResponse.success(data=metrics_response)).to_response(request)
 
 
 @router.get(
@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from loguru import logger
 
 from proxywhirl.api.models import (
@@ -26,9 +26,16 @@ from proxywhirl.api.models import (
     TimeSeriesResponse,
     UpdateConfigRequest,
 )
+from proxywhirl.api.response_cache import (
+    cache_key,
+    retry_metrics_version_key,
+    rotator_version_key,
+)
 from proxywhirl.api.runtime import (
     get_config,
     get_current_rotator,
+    get_response_cache,
+    get_response_cache_ttl,
     get_rotator,
     limiter,
     verify_api_key,
@@ -270,10 +277,14 @@ async def update_retry_policy(
     summary="List all circuit breaker states",
 )
 async def list_circuit_breakers(
+    request: Request,
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[list[CircuitBreakerResponse]]:
+) -> Response:
     """Get circuit breaker states for all proxies.
 
+    Responses are cached until a circuit breaker changes state and carry an
+    ETag, so polling with ``If-None-Match`` returns 304 while nothing changed.
+
     Returns:
         List of circuit breaker states
     """
@@ -286,6 +297,12 @@ async def list_circuit_breakers(
             detail="Rotator not initialized",
         )
 
+    cache = get_response_cache()
+    key = cache_key("circuit-breakers", (rotator_version_key(rotator),))
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     circuit_breakers = rotator.get_circuit_breaker_states()
 
     responses = []
@@ -305,7 +322,7 @@ async def list_circuit_breakers(
             )
         )
 
-    return APIResponse.success(data=responses)
+    return cache.put(key, APIResponse.success(data=responses)).to_response(request)
 
 
 @router.get(
@@ -315,9 +332,10 @@ async def list_circuit_breakers(
     summary="Get circuit breaker metrics",
 )
 async def get_circuit_breaker_metrics(
+    request: Request,
     hours: int = 24,
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[list[CircuitBreakerEventResponse]]:
+) -> Response:
     """Get circuit breaker state change events.
 
     Args:
@@ -336,6 +354,12 @@ async def get_circuit_breaker_metrics(
         )
 
     metrics = rotator.get_retry_metrics()
+    cache = get_response_cache()
+    key = cache_key("circuit-breaker-events", (retry_metrics_version_key(metrics),), hours)
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
 
     events = [
@@ -350,7 +374,7 @@ async def get_circuit_breaker_metrics(
         if event.timestamp >= cutoff
     ]
 
-    return APIResponse.success(data=events)
+    return cache.put(key, APIResponse.success(data=events)).to_response(request)
 
 
 @router.get(
@@ -471,8 +495,9 @@ async def reset_circuit_breaker(
     summary="Get retry metrics summary",
 )
 async def get_retry_metrics(
+    request: Request,
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[RetryMetricsResponse]:
+) -> Response:
     """Get aggregated retry metrics.
 
     Returns:
@@ -488,6 +513,12 @@ async def get_retry_metrics(
         )
 
     metrics = rotator.get_retry_metrics()
+    cache = get_response_cache()
+    key = cache_key("retry-summary", (retry_metrics_version_key(metrics),))
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     # Use asyncio.to_thread to avoid blocking event loop with threading.Lock
     summary = await asyncio.to_thread(metrics.get_summary)
 
@@ -498,7 +529,7 @@ async def get_retry_metrics(
         retention_hours=summary["retention_hours"],
     )
 
-    return APIResponse.success(data=response)
+    return cache.put(key, APIResponse.success(data=response)).to_response(request)
 
 
 @router.get(
@@ -508,9 +539,10 @@ async def get_retry_metrics(
     summary="Get time-series retry data",
 )
 async def get_retry_timeseries(
+    request: Request,
     hours: int = 24,
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[TimeSeriesResponse]:
+) -> Response:
     """Get hourly retry metrics for the specified time range.
 
     Args:
@@ -529,6 +561,12 @@ async def get_retry_timeseries(
         )
 
     metrics = rotator.get_retry_metrics()
+    cache = get_response_cache()
+    key = cache_key("retry-timeseries", (retry_metrics_version_key(metrics),), hours)
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     # Use asyncio.to_thread to avoid blocking event loop with threading.Lock
     timeseries_data = await asyncio.to_thread(metrics.get_timeseries, hours=hours)
 
@@ -545,7 +583,7 @@ async def get_retry_timeseries(
 
     response = TimeSeriesResponse(data_points=data_points)
 
-    return APIResponse.success(data=response)
+    return cache.put(key, APIResponse.success(data=response)).to_response(request)
 
 
 @router.get(
@@ -555,9 +593,10 @@ async def get_retry_timeseries(
     summary="Get per-proxy retry statistics",
 )
 async def get_retry_stats_by_proxy(
+    request: Request,
     hours: int = 24,
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[ProxyRetryStatsResponse]:
+) -> Response:
     """Get retry statistics grouped by proxy.
 
     Args:
@@ -576,6 +615,12 @@ async def get_retry_stats_by_proxy(
         )
 
     metrics = rotator.get_retry_metrics()
+    cache = get_response_cache()
+    key = cache_key("retry-by-proxy", (retry_metrics_version_key(metrics),), hours)
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     # Use asyncio.to_thread to avoid blocking event loop with threading.Lock
     stats_by_proxy = await asyncio.to_thread(metrics.get_by_proxy, hours=hours)
 
@@ -583,4 +628,6 @@ async def get_retry_stats_by_proxy(
 
     response = ProxyRetryStatsResponse(proxies=proxies)
 
-    return APIResponse.success(data=response.model_dump(mode="json"))
+    return cache.put(key, APIResponse.success(data=response.model_dump(mode="json"))).to_response(
+        request
+    )
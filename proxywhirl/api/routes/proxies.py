@@ -1,7 +1,7 @@
 """Proxy endpoints for ProxyWhirl API.
 
 Includes all /api/proxies/* endpoints and the /api/request
-proxied request endpoint.
+proxied request endpoints (buffered and streamed passthrough).
 """
 
 # ruff: noqa: B008
@@ -11,14 +11,15 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import time
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import datetime, timezone
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
 from loguru import logger
+from starlette.background import BackgroundTask
 
 from proxywhirl._proxy_views import (
     ProxyListQuery,
@@ -26,7 +27,7 @@ from proxywhirl._proxy_views import (
     add_proxy_to_rotator,
     find_proxy,
     find_proxy_view,
-    list_proxy_views,
+    iter_proxy_views,
     proxy_to_view,
     remove_proxy_from_rotator,
     select_proxy_view,
@@ -41,7 +42,10 @@ from proxywhirl.api.models import (
     ProxiedResponse,
     ProxyResource,
 )
+from proxywhirl.api.response_cache import cache_key, rotator_version_key
 from proxywhirl.api.runtime import (
+    get_response_cache,
+    get_response_cache_ttl,
     get_rotator,
     get_storage,
     limiter,
@@ -49,6 +53,7 @@ from proxywhirl.api.runtime import (
     validate_proxied_request_url,
     verify_api_key,
 )
+from proxywhirl.api.streaming import get_json_lines_media_type, stream_proxies_as_jsonl
 from proxywhirl.exceptions import (
     ProxyAuthenticationError,
     ProxyConnectionError,
@@ -58,6 +63,7 @@ from proxywhirl.exceptions import (
 from proxywhirl.models import HealthStatus, Proxy
 from proxywhirl.rotator import ProxyWhirl
 from proxywhirl.security import validate_proxy_url_safety
+from proxywhirl.settings import APISettings
 from proxywhirl.utils import public_proxy_url
 
 router = APIRouter()
@@ -104,22 +110,27 @@ def _proxy_resource_from_view(view: ProxyView) -> ProxyResource:
     )
 
 
-def _proxy_views_for_status(rotator: ProxyWhirl, status_filter: str | None) -> list[ProxyView]:
-    """Return credential-safe proxy views for API list/stream/export endpoints."""
-    if not status_filter:
-        return list_proxy_views(rotator)
-
-    status_lower = status_filter.lower()
+def _iter_proxy_views_for_status(
+    rotator: ProxyWhirl,
+    status_filter: str | None,
+) -> Iterator[ProxyView]:
+    """Lazily yield credential-safe proxy views for API list/stream/export endpoints."""
+    status_lower = status_filter.lower() if status_filter else None
     if status_lower == "healthy":
-        return list_proxy_views(rotator, ProxyListQuery(health=HealthStatus.HEALTHY))
+        return iter_proxy_views(rotator, ProxyListQuery(health=HealthStatus.HEALTHY))
     if status_lower == "active":
-        return [view for view in list_proxy_views(rotator) if view.status != "failed"]
+        return (view for view in iter_proxy_views(rotator) if view.status != "failed")
     if status_lower == "unhealthy":
-        return [
-            view for view in list_proxy_views(rotator) if view.health != HealthStatus.HEALTHY.value
-        ]
+        return (
+            view for view in iter_proxy_views(rotator) if view.health != HealthStatus.HEALTHY.value
+        )
+
+    return iter_proxy_views(rotator)
 
-    return list_proxy_views(rotator)
+
+def _proxy_views_for_status(rotator: ProxyWhirl, status_filter: str | None) -> list[ProxyView]:
+    """Return credential-safe proxy views for API list/stream/export endpoints."""
+    return list(_iter_proxy_views_for_status(rotator, status_filter))
 
 
 @router.post(
@@ -220,6 +231,223 @@ async def make_proxied_request(
     return APIResponse.success(data=response_data)
 
 
+# Hop-by-hop headers (RFC 9110 section 7.6.1) are connection-specific and must
+# not be relayed from the upstream response to the API client.
+_HOP_BY_HOP_HEADERS = frozenset(
+    {
+        b"connection",
+        b"keep-alive",
+        b"proxy-authenticate",
+        b"proxy-authorization",
+        b"proxy-connection",
+        b"te",
+        b"trailer",
+        b"transfer-encoding",
+        b"upgrade",
+    }
+)
+
+
+class _UpstreamBodyTooLargeError(Exception):
+    """Raised mid-stream when an upstream body exceeds ``PROXYWHIRL_STREAM_MAX_BYTES``.
+
+    Headers have already been sent at that point, so the error propagates to the
+    ASGI server, which aborts the connection instead of ending a truncated body
+    as if it were complete.
+    """
+
+
+def _passthrough_headers(
+    upstream: httpx.Response,
+    proxy_used: str,
+    elapsed_ms: int,
+) -> list[tuple[bytes, bytes]]:
+    """Build raw response headers for a streamed passthrough response.
+
+    Upstream headers are kept verbatim (including repeated ``Set-Cookie``
+    values) minus hop-by-hop headers, followed by ProxyWhirl metadata headers.
+    """
+    headers = [
+        (name.lower(), value)
+        for name, value in upstream.headers.raw
+        if name.lower() not in _HOP_BY_HOP_HEADERS
+    ]
+    headers.append((b"x-proxywhirl-proxy-used", proxy_used.encode("latin-1")))
+    headers.append((b"x-proxywhirl-elapsed-ms", str(elapsed_ms).encode("latin-1")))
+    return headers
+
+
+async def _close_upstream(upstream: httpx.Response, client: httpx.AsyncClient) -> None:
+    """Release the upstream connection and its per-request client (idempotent)."""
+    await upstream.aclose()
+    await client.aclose()
+
+
+async def _relay_upstream_body(
+    upstream: httpx.Response,
+    client: httpx.AsyncClient,
+    max_bytes: int,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """Relay upstream bytes chunk by chunk, failing once ``max_bytes`` is exceeded.
+
+    Raw (still content-encoded) bytes are relayed so the upstream
+    ``Content-Length`` and ``Content-Encoding`` headers stay valid. Each chunk is
+    only read after the previous one has been sent, so memory use is bounded by
+    ``chunk_size`` and a slow client applies backpressure to the upstream.
+
+    Raises:
+        _UpstreamBodyTooLargeError: If the upstream sends more than ``max_bytes``
+    """
+    relayed = 0
+    try:
+        async for chunk in upstream.aiter_raw(chunk_size):
+            relayed += len(chunk)
+            if relayed > max_bytes:
+                logger.warning(
+                    "Streamed upstream response exceeded max bytes, aborting",
+                    max_bytes=max_bytes,
+                )
+                raise _UpstreamBodyTooLargeError(
+                    f"Upstream response exceeds maximum streamed size ({max_bytes} bytes)"
+                )
+            yield chunk
+    finally:
+        await _close_upstream(upstream, client)
+
+
+@router.post(
+    "/api/request/stream",
+    tags=["Proxied Requests"],
+    summary="Stream proxied HTTP response",
+    response_class=StreamingResponse,
+)
+@limiter.limit("50/minute")
+async def stream_proxied_request(
+    request: Request,
+    request_data: ProxiedRequest = Depends(validate_proxied_request_url),
+    rotator: ProxyWhirl = Depends(get_rotator),
+    api_key: None = Depends(verify_api_key),
+) -> StreamingResponse:
+    """Make an HTTP request through a rotating proxy and stream the raw response.
+
+    Unlike ``/api/request``, the upstream body is not decoded, buffered or wrapped
+    in an ``APIResponse`` envelope. The upstream status code and headers are
+    relayed as-is and the body is streamed chunk by chunk, so time-to-first-byte
+    does not depend on the size of the page and memory use per request is
+    constant.
+
+    The proxy used and the time to upstream response headers are reported in the
+    ``X-ProxyWhirl-Proxy-Used`` and ``X-ProxyWhirl-Elapsed-Ms`` response headers.
+    Bodies larger than ``PROXYWHIRL_STREAM_MAX_BYTES`` are rejected with 502 when
+    the upstream announces their size; otherwise the connection is aborted once
+    the limit is crossed, so clients never see a truncated body as complete.
+
+    SSRF protection is identical to ``/api/request``. No retries are attempted
+    once upstream bytes may have been sent to the client.
+
+    Args:
+        request_data: Request details (URL, method, headers, body, timeout) - validated for SSRF
+        rotator: ProxyWhirl dependency injection
+        api_key: API key verification dependency
+
+    Returns:
+        StreamingResponse relaying the upstream response
+
+    Raises:
+        HTTPException: If no proxy is available or the selected one is rate
+            limited, the upstream fails, or the announced body size exceeds the
+            configured limit
+    """
+    api_settings = APISettings()
+    start_time = time.time()
+    record_rotation()
+
+    try:
+        # Same bootstrap, selection and rate limiting as ``/api/request``
+        proxy = await asyncio.to_thread(rotator._select_proxy_for_request)
+    except ProxyPoolEmptyError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="No proxies available in the pool",
+        ) from e
+    except ProxyWhirlError as e:
+        logger.warning(f"Streamed proxied request failed: {type(e).__name__}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Proxy service temporarily unavailable",
+        ) from e
+
+    client = httpx.AsyncClient(
+        proxy=rotator._get_proxy_dict(proxy)["http://"],
+        timeout=request_data.timeout,
+        verify=rotator.config.verify_ssl,
+        follow_redirects=False,
+    )
+    upstream_request = client.build_request(
+        request_data.method.upper(),
+        str(request_data.url),
+        headers=request_data.headers,
+        content=request_data.body.encode() if request_data.body else None,
+    )
+
+    try:
+        upstream = await client.send(upstream_request, stream=True)
+    except httpx.HTTPError as e:
+        await client.aclose()
+        rotator._record_request_result(proxy, success=False)
+        logger.warning(f"Streamed proxied request failed: {type(e).__name__}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="All proxy attempts failed",
+        ) from e
+
+    elapsed_ms = int((time.time() - start_time) * 1000)
+
+    if upstream.status_code in (401, 407):
+        await _close_upstream(upstream, client)
+        rotator._record_request_result(proxy, success=False, circuit_breaker=False)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Proxy authentication failed",
+        )
+
+    rotator._record_request_result(proxy, success=True, response_time_ms=float(elapsed_ms))
+
+    content_length = upstream.headers.get("Content-Length")
+    if (
+        content_length
+        and content_length.isdigit()
+        and int(content_length) > api_settings.stream_max_bytes
+    ):
+        await _close_upstream(upstream, client)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=(
+                "Upstream response exceeds maximum streamed size "
+                f"({api_settings.stream_max_bytes} bytes)"
+            ),
+        )
+
+    response = StreamingResponse(
+        _relay_upstream_body(
+            upstream,
+            client,
+            max_bytes=api_settings.stream_max_bytes,
+            chunk_size=api_settings.stream_chunk_size,
+        ),
+        status_code=upstream.status_code,
+        # Also runs when the client disconnects before the body iterator starts
+        background=BackgroundTask(_close_upstream, upstream, client),
+    )
+    response.raw_headers = _passthrough_headers(
+        upstream,
+        proxy_used=public_proxy_url(str(proxy.url)),
+        elapsed_ms=elapsed_ms,
+    )
+    return response
+
+
 @router.get(
     "/api/proxies",
     response_model=APIResponse[PaginatedResponse[ProxyResource]],
@@ -227,14 +455,20 @@ async def make_proxied_request(
     summary="List all proxies",
 )
 async def list_proxies(
+    request: Request,
     page: int = 1,
     page_size: int = 50,
     status_filter: str | None = None,
     rotator: ProxyWhirl = Depends(get_rotator),
     api_key: None = Depends(verify_api_key),
-) -> APIResponse[PaginatedResponse[ProxyResource]]:
+) -> Response:
     """List all proxies in the pool with pagination and filtering.
 
+    Pages are cached until the pool or a circuit breaker changes, for at most
+    ``PROXYWHIRL_RESPONSE_CACHE_TTL`` seconds so that time-driven changes (e.g. a
+    breaker becoming due for HALF_OPEN) show up, and carry an ETag, so polling
+    with ``If-None-Match`` returns 304 while nothing changed.
+
     Args:
         page: Page number (1-indexed)
         page_size: Number of items per page (max 100)
@@ -251,6 +485,12 @@ async def list_proxies(
     if page_size < 1 or page_size > 100:
         raise HTTPException(status_code=400, detail="Page size must be between 1 and 100")
 
+    cache = get_response_cache()
+    key = cache_key("proxies", (rotator_version_key(rotator),), page, page_size, status_filter)
+    cached = cache.get(key, max_age=get_response_cache_ttl())
+    if cached is not None:
+        return cached.to_response(request)
+
     all_views = _proxy_views_for_status(rotator, status_filter)
 
     # Calculate pagination
@@ -271,7 +511,7 @@ async def list_proxies(
         has_prev=page > 1,
     )
 
-    return APIResponse.success(data=paginated)
+    return cache.put(key, APIResponse.success(data=paginated)).to_response(request)
 
 
 @router.get(
@@ -297,28 +537,37 @@ async def rotate_proxy(
     return APIResponse.success(data=_proxy_resource_from_view(view))
 
 
-async def _stream_proxies_async(
-    proxy_views: list[ProxyView],
-) -> AsyncIterator[str]:
-    """Stream proxies as JSON lines asynchronously.
+def _iter_proxy_resource_dicts(proxy_views: Iterable[ProxyView]) -> Iterator[dict[str, Any]]:
+    """Lazily convert proxy views to JSON-ready proxy resource dictionaries.
 
     Args:
-        proxy_views: List of credential-safe proxy views to stream
+        proxy_views: Iterable of credential-safe proxy views to convert
 
     Yields:
-        JSON-formatted proxy resource lines
+        Proxy resource dictionaries (views that fail conversion are skipped)
     """
-    import json
-
     for view in proxy_views:
         try:
-            resource_dict = _proxy_resource_from_view(view).model_dump(mode="json")
-            yield json.dumps(resource_dict) + "\n"
+            yield _proxy_resource_from_view(view).model_dump(mode="json")
         except Exception as e:
             logger.warning(f"Failed to stream proxy: {e}")
             continue
 
 
+def _ndjson_proxy_response(rotator: ProxyWhirl, status_filter: str | None) -> StreamingResponse:
+    """Build an NDJSON response that reads the pool lazily while streaming."""
+    proxy_views = _iter_proxy_views_for_status(rotator, status_filter)
+
+    return StreamingResponse(
+        stream_proxies_as_jsonl(_iter_proxy_resource_dicts(proxy_views)),
+        media_type=get_json_lines_media_type(),
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get(
     "/api/proxies/stream",
     tags=["Pool Management"],
@@ -342,16 +591,7 @@ async def stream_proxies(
     Returns:
         StreamingResponse with NDJSON content
     """
-    proxy_views = _proxy_views_for_status(rotator, status_filter)
-
-    return StreamingResponse(
-        _stream_proxies_async(proxy_views),
-        media_type="application/x-ndjson",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return _ndjson_proxy_response(rotator, status_filter)
 
 
 @router.get(
@@ -377,16 +617,7 @@ async def export_proxies(
     Returns:
         StreamingResponse with NDJSON content
     """
-    proxy_views = _proxy_views_for_status(rotator, status_filter)
-
-    return StreamingResponse(
-        _stream_proxies_async(proxy_views),
-        media_type="application/x-ndjson",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-        },
-    )
+    return _ndjson_proxy_response(rotator, status_filter)
 
 
 @router.post(
@@ -16,6 +16,7 @@ from prometheus_client import Counter, Gauge, Histogram
 from slowapi import Limiter
 
 from proxywhirl.api.models import ProxiedRequest
+from proxywhirl.api.response_cache import ResponseCache
 from proxywhirl.rotator import ProxyWhirl
 from proxywhirl.settings import APISettings
 from proxywhirl.storage import SQLiteStorage
@@ -26,12 +27,15 @@ _storage: SQLiteStorage | None = None
 _config: dict[str, Any] = {}
 _app_start_time = datetime.now(timezone.utc)
 _last_rotation_time: datetime | None = None
+_response_cache = ResponseCache()
+_response_cache_ttl = APISettings().response_cache_ttl
 
 
 def set_rotator(rotator: ProxyWhirl | None) -> None:
     """Set the process-global API rotator instance."""
     global _rotator
     _rotator = rotator
+    _response_cache.clear()
 
 
 def get_current_rotator() -> ProxyWhirl | None:
@@ -81,6 +85,16 @@ def reset_api_state() -> None:
     _last_rotation_time = None
 
 
+def get_response_cache() -> ResponseCache:
+    """Return the process-global cache of serialized read-endpoint responses."""
+    return _response_cache
+
+
+def get_response_cache_ttl() -> float:
+    """Return the freshness window in seconds for clock-dependent cached responses."""
+    return _response_cache_ttl
+
+
 def get_app_start_time() -> datetime:
     """Return API process start time."""
     return _app_start_time
@@ -2,112 +2,204 @@
 
 Provides async generators and streaming utilities for efficient
 data transfer over HTTP with async/await patterns.
+
+All helpers accept lazy sync or async iterables, serialize rows in batches
+into a reusable buffer and yield ``bytes`` chunks of roughly ``chunk_size``
+bytes, so memory use stays flat no matter how many rows are streamed.
 """
 
 from __future__ import annotations
 
+import asyncio
+import csv
 import json
-from collections.abc import AsyncGenerator, AsyncIterator
-from typing import Any
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable, Iterable
+from io import StringIO
+from typing import Any, TypeVar
 
 from fastapi.responses import StreamingResponse
 from loguru import logger
 
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""Target size in bytes of each chunk handed to the ASGI server."""
+
+DEFAULT_BATCH_SIZE = 500
+"""Number of rows pulled from the source iterable between event loop yields."""
+
+# Compact separators: smaller payloads and a faster C encoder path than json.dumps
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
 
-async def stream_json_lines(data: list[dict[str, Any]]) -> AsyncGenerator[str, None]:
+async def _iter_batches(
+    items: Iterable[T] | AsyncIterable[T],
+    batch_size: int,
+) -> AsyncGenerator[list[T], None]:
+    """Group a sync or async iterable into lists of at most ``batch_size`` items.
+
+    Sync iterables yield control to the event loop between batches so that a
+    large export does not starve other requests.
+    """
+    batch: list[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+                await asyncio.sleep(0)
+    if batch:
+        yield batch
+
+
+async def _stream_encoded(
+    items: Iterable[T] | AsyncIterable[T],
+    encode: Callable[[T], str],
+    chunk_size: int,
+    batch_size: int,
+    skip_errors: bool = False,
+) -> AsyncGenerator[bytes, None]:
+    """Encode rows into a reusable buffer and yield it whenever it fills up."""
+    buffer = bytearray()
+    async for batch in _iter_batches(items, batch_size):
+        for item in batch:
+            try:
+                buffer += encode(item).encode()
+            except (TypeError, ValueError) as e:
+                if not skip_errors:
+                    raise
+                logger.warning(f"Failed to serialize row: {e}")
+                continue
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _json_line(item: Any) -> str:
+    return _json_encode(item) + "\n"
+
+
+async def stream_json_lines(
+    data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncGenerator[bytes, None]:
     """Stream data as JSON Lines format.
 
     Each line is a complete JSON object, allowing streaming without
     buffering the entire dataset in memory.
 
     Args:
-        data: List of dictionaries to stream
+        data: Sync or async iterable of dictionaries to stream
+        chunk_size: Target size in bytes of each yielded chunk
+        batch_size: Rows pulled from ``data`` between event loop yields
 
     Yields:
-        JSON line strings (one per item)
+        Byte chunks containing one or more complete JSON lines
     """
-    for item in data:
-        line = json.dumps(item) + "\n"
-        yield line
+    async for chunk in _stream_encoded(data, _json_line, chunk_size, batch_size):
+        yield chunk
 
 
 async def stream_proxies_as_jsonl(
-    proxies: list[dict[str, Any]],
-) -> AsyncGenerator[str, None]:
+    proxies: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncGenerator[bytes, None]:
     """Stream proxy data as JSON Lines.
 
     Converts proxy data to JSON Lines format for efficient streaming.
-    Each proxy is a complete JSON object on one line.
+    Each proxy is a complete JSON object on one line. Proxies that cannot
+    be serialized are logged and skipped.
 
     Args:
-        proxies: List of proxy dictionaries
+        proxies: Sync or async iterable of proxy dictionaries
+        chunk_size: Target size in bytes of each yielded chunk
+        batch_size: Rows pulled from ``proxies`` between event loop yields
 
     Yields:
-        Proxy JSON line strings
+        Byte chunks containing one or more complete proxy JSON lines
     """
-    for proxy in proxies:
-        try:
-            line = json.dumps(proxy) + "\n"
-            yield line
-        except Exception as e:
-            logger.warning(f"Failed to serialize proxy: {e}")
-            continue
+    async for chunk in _stream_encoded(
+        proxies, _json_line, chunk_size, batch_size, skip_errors=True
+    ):
+        yield chunk
 
 
-async def stream_text_lines(lines: list[str]) -> AsyncGenerator[str, None]:
+async def stream_text_lines(
+    lines: Iterable[str] | AsyncIterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncGenerator[bytes, None]:
     """Stream text data as lines.
 
     Simple line-by-line streaming with newline separators.
 
     Args:
-        lines: List of strings to stream
+        lines: Sync or async iterable of strings to stream
+        chunk_size: Target size in bytes of each yielded chunk
+        batch_size: Lines pulled from ``lines`` between event loop yields
 
     Yields:
-        Text lines with newline separators
+        Byte chunks containing one or more newline-terminated lines
     """
-    for line in lines:
-        yield line + "\n"
+    async for chunk in _stream_encoded(lines, lambda line: line + "\n", chunk_size, batch_size):
+        yield chunk
 
 
 async def stream_csv_lines(
-    data: list[dict[str, Any]], fieldnames: list[str]
-) -> AsyncGenerator[str, None]:
+    data: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+    fieldnames: list[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncGenerator[bytes, None]:
     """Stream data as CSV format.
 
-    Yields header row and then data rows as CSV lines.
+    Yields header row and then data rows as CSV lines. A single ``DictWriter``
+    and text buffer are reused for every row.
 
     Args:
-        data: List of dictionaries to stream
+        data: Sync or async iterable of dictionaries to stream
         fieldnames: Column names for CSV header
+        chunk_size: Target size in bytes of each yielded chunk
+        batch_size: Rows pulled from ``data`` between event loop yields
 
     Yields:
-        CSV lines (header + data rows)
+        Byte chunks of CSV (header + data rows)
     """
-    import csv
-    from io import StringIO
+    text_buffer = StringIO()
+    writer = csv.DictWriter(text_buffer, fieldnames=fieldnames)
+
+    def encode_row(row: dict[str, Any]) -> str:
+        text_buffer.seek(0)
+        text_buffer.truncate()
+        writer.writerow(row)
+        return text_buffer.getvalue()
 
-    # Yield header
-    buffer = StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
     writer.writeheader()
-    yield buffer.getvalue()
+    yield text_buffer.getvalue().encode()
 
-    # Yield data rows
-    for row in data:
-        buffer = StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-        writer.writerow(row)
-        yield buffer.getvalue()
+    async for chunk in _stream_encoded(data, encode_row, chunk_size, batch_size):
+        yield chunk
 
 
 def create_streaming_response(
-    generator: AsyncIterator[str],
+    generator: AsyncIterator[str] | AsyncIterator[bytes],
     media_type: str = "application/x-ndjson",
 ) -> StreamingResponse:
     """Create a StreamingResponse from an async generator.
 
     Args:
-        generator: Async generator yielding strings
+        generator: Async generator yielding strings or bytes
         media_type: MIME type for response (default: JSON Lines)
 
     Returns:
@@ -9,6 +9,7 @@ Key Features:
     - Automatic page cleanup and resource management
     - Configurable timeout, wait strategies, and viewport settings
     - Custom user agent support for scraper-friendly rendering
+    - Optional request interception to skip images, fonts and stylesheets
 
 Architecture:
     The BrowserRenderer uses a pool of pre-created browser contexts instead of
@@ -79,12 +80,19 @@ Examples:
 from __future__ import annotations
 
 import asyncio
+import os
+import signal
+import time
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Any, Literal
 
 from loguru import logger
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, BrowserContext, Page
+    from playwright.async_api import Browser, BrowserContext, Page, Route
+
+DEFAULT_BLOCKED_RESOURCE_TYPES: frozenset[str] = frozenset({"image", "font", "stylesheet", "media"})
+"""Playwright resource types that proxy list pages never need to render their data."""
 
 
 class BrowserRenderer:
@@ -126,6 +134,7 @@ class BrowserRenderer:
         viewport: dict[str, int] | None = None,
         max_contexts: int = 3,
         extra_args: list[str] | None = None,
+        block_resource_types: Collection[str] | None = None,
     ) -> None:
         """Initialize browser renderer with pooled context management.
 
@@ -161,6 +170,10 @@ class BrowserRenderer:
             extra_args: Additional command-line arguments for the browser.
                 Dangerous arguments (e.g., --no-sandbox, --remote-debugging-port)
                 are rejected to prevent security risks.
+            block_resource_types: Playwright resource types (e.g. "image", "font",
+                "stylesheet") whose requests are aborted in every pooled context.
+                Default: None (load everything). Pass DEFAULT_BLOCKED_RESOURCE_TYPES
+                to skip assets that do not affect the rendered markup.
 
         Raises:
             ValueError: If max_contexts < 1 (automatically adjusted to 1)
@@ -193,6 +206,7 @@ class BrowserRenderer:
         self.viewport = viewport or {"width": 1280, "height": 720}
         self.max_contexts = max(1, max_contexts)
         self.extra_args = self._validate_browser_args(extra_args or [])
+        self.block_resource_types = frozenset(block_resource_types or ())
 
         self._playwright: Any | None = None
         self._browser: Browser | None = None
@@ -204,6 +218,9 @@ class BrowserRenderer:
         self._all_contexts: list[BrowserContext] = []
         self._pool_lock: asyncio.Lock | None = None
 
+        # Monotonic timestamp of the last render, used by owners for idle shutdown
+        self._last_used = time.monotonic()
+
     @staticmethod
     def _validate_browser_args(args: list[str]) -> list[str]:
         """Validate browser command-line arguments for security.
@@ -276,6 +293,8 @@ class BrowserRenderer:
             context_options = self._get_context_options()
             for i in range(self.max_contexts):
                 context = await self._browser.new_context(**context_options)
+                if self.block_resource_types:
+                    await context.route("**/*", self._route_request)
                 self._all_contexts.append(context)
                 await self._context_pool.put(context)
                 logger.debug(f"Created browser context {i + 1}/{self.max_contexts} for pool")
@@ -288,6 +307,17 @@ class BrowserRenderer:
             await self.close()
             raise
 
+    async def _route_request(self, route: Route) -> None:
+        """Abort requests for blocked resource types and let everything else through.
+
+        Args:
+            route: Intercepted Playwright route
+        """
+        if route.request.resource_type in self.block_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
+
     def _get_context_options(self) -> dict[str, Any]:
         """Get context creation options.
 
@@ -348,6 +378,48 @@ class BrowserRenderer:
         self._is_started = False
         logger.debug("BrowserRenderer closed and all contexts cleaned up")
 
+    def _driver_process(self) -> Any | None:
+        """Return the Playwright driver subprocess, or None if it cannot be found.
+
+        Playwright has no public handle for the driver, so this follows its
+        private connection objects and tolerates them being renamed.
+        """
+        node: Any = self._playwright
+        for attr in ("_impl_obj", "_connection", "_transport", "_proc"):
+            node = getattr(node, attr, None)
+            if node is None:
+                return None
+        return node if isinstance(getattr(node, "pid", None), int) else None
+
+    def terminate(self) -> None:
+        """Kill the browser without awaiting anything.
+
+        Last resort for when :meth:`close` cannot run because the event loop the
+        browser was started on is gone: this signals the Playwright driver
+        process instead; the browser is attached to the driver through a pipe
+        and exits with it. Safe to call multiple times.
+        """
+        if self._playwright is not None:
+            process = self._driver_process()
+            if process is None:
+                logger.warning(
+                    "Cannot find the Playwright driver process to terminate; "
+                    "the browser may outlive its event loop"
+                )
+            elif process.returncode is None:
+                try:
+                    os.kill(process.pid, signal.SIGTERM)
+                except OSError as e:
+                    logger.warning(f"Error terminating browser driver: {e}")
+
+        self._all_contexts = []
+        self._context_pool = None
+        self._pool_lock = None
+        self._context = None
+        self._browser = None
+        self._playwright = None
+        self._is_started = False
+
     async def acquire_context(self, timeout: float | None = None) -> BrowserContext:
         """Acquire a browser context from the pool.
 
@@ -404,6 +476,16 @@ class BrowserRenderer:
         """Total capacity of the context pool."""
         return self.max_contexts
 
+    @property
+    def is_healthy(self) -> bool:
+        """Whether the renderer is started and its browser is still connected."""
+        return self._is_started and self._browser is not None and bool(self._browser.is_connected())
+
+    @property
+    def idle_seconds(self) -> float:
+        """Seconds since the last render started or finished."""
+        return time.monotonic() - self._last_used
+
     async def render(
         self,
         url: str,
@@ -498,6 +580,7 @@ class BrowserRenderer:
             raise RuntimeError("Browser not started. Call start() or use as context manager.")
 
         # Acquire context from pool
+        self._last_used = time.monotonic()
         context = await self.acquire_context()
         page: Page | None = None
 
@@ -528,6 +611,7 @@ class BrowserRenderer:
                     logger.warning(f"Error closing browser page: {e}")
             # Always release context back to pool
             await self.release_context(context)
+            self._last_used = time.monotonic()
 
     async def __aenter__(self) -> BrowserRenderer:
         """Context manager entry - starts the browser."""
@@ -10,19 +10,23 @@ Defines:
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import os
 import sqlite3
 import threading
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from contextlib import closing
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 
 import portalocker
 from loguru import logger
+from pydantic import SecretStr
 
 from proxywhirl.types import CacheEvictionCallback
 
@@ -352,7 +356,12 @@ class JsonlCacheTier(CacheTier):
     """L2 JSONL file-based cache with sharding and encryption.
 
     Provides persistent caching using JSONL (JSON Lines) files with:
-    - Sharded storage for better I/O performance
+    - Sharded, append-only storage: puts append the new record and deletes
+      append a tombstone, so a write never rereads or rewrites its shard
+    - An in-memory offset index (key -> shard, byte offset) so reads seek
+      straight to a single line
+    - Background compaction that rewrites a shard once the share of
+      superseded records and tombstones crosses ``compaction_ratio``
     - File locking for concurrent access safety
     - Encrypted credentials at rest
     - Simple text format for debugging and portability
@@ -363,8 +372,8 @@ class JsonlCacheTier(CacheTier):
     - Cases requiring human-readable cache files
     - Simple deployment without database dependencies
 
-    For larger caches (>10K entries), consider DiskCacheTier (SQLite-based)
-    which provides O(log n) lookups vs O(n) for JSONL.
+    For larger caches (>10K entries), consider DiskCacheTier (SQLite-based),
+    which does not need to hold the key index in memory.
     """
 
     def __init__(
@@ -374,6 +383,8 @@ class JsonlCacheTier(CacheTier):
         cache_dir: Path,
         encryptor: CredentialEncryptor | None = None,
         num_shards: int = 16,
+        compaction_ratio: float = 0.5,
+        compaction_min_garbage: int = 128,
     ) -> None:
         """Initialize JSONL-based L2 cache.
 
@@ -383,6 +394,12 @@ class JsonlCacheTier(CacheTier):
             cache_dir: Directory for JSONL shard files
             encryptor: Credential encryptor for username/password
             num_shards: Number of shard files (default: 16)
+            compaction_ratio: Fraction of dead records (superseded puts,
+                tombstones, corrupted lines) in a shard that triggers a
+                background compaction (default: 0.5)
+            compaction_min_garbage: Minimum number of dead records before a
+                shard is compacted, so small shards are not rewritten on
+                every write (default: 128)
 
         """
         super().__init__(config, tier_type)
@@ -390,12 +407,19 @@ class JsonlCacheTier(CacheTier):
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.encryptor = encryptor or CredentialEncryptor()
         self.num_shards = num_shards
-
-        # In-memory index for fast lookups (key -> shard_id)
-        self._index: dict[str, int] = {}
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min_garbage = compaction_min_garbage
+
+        # In-memory offset index for single-line reads (key -> (shard_id, byte offset))
+        self._index: dict[str, tuple[int, int]] = {}
+        # Live keys and total record count per shard, for garbage accounting
+        self._shard_keys: list[set[str]] = [set() for _ in range(num_shards)]
+        self._shard_records: list[int] = [0] * num_shards
         # OrderedDict for O(1) LRU eviction tracking (key -> last_accessed timestamp)
         self._access_order: OrderedDict[str, float] = OrderedDict()
         self._state_lock = threading.RLock()
+        # Shards with a background compaction scheduled or running
+        self._compacting: set[int] = set()
         self._rebuild_index()
 
     def _get_shard_path(self, shard_id: int) -> Path:
@@ -403,9 +427,13 @@ class JsonlCacheTier(CacheTier):
         return self.cache_dir / f"shard_{shard_id:02d}.jsonl"
 
     def _get_shard_lock_path(self, shard_id: int) -> Path:
-        """Get path to the coarse lock for a shard read-modify-write cycle."""
+        """Get path to the coarse lock serializing appends and compaction of a shard."""
         return self.cache_dir / f"shard_{shard_id:02d}.lock"
 
+    def _shard_lock(self, shard_id: int) -> portalocker.Lock:
+        """Return the inter-process lock guarding writes to a shard."""
+        return portalocker.Lock(self._get_shard_lock_path(shard_id), "a+", timeout=5)
+
     def _get_shard_id(self, key: str) -> int:
         """Compute shard ID for a cache key using deterministic hashing.
 
@@ -416,6 +444,14 @@ class JsonlCacheTier(CacheTier):
             int(hashlib.md5(key.encode(), usedforsecurity=False).hexdigest(), 16) % self.num_shards
         )
 
+    @staticmethod
+    def _record_timestamp(data: dict) -> float:
+        """Return a record's last_accessed time, defaulting to now if missing or invalid."""
+        try:
+            return datetime.fromisoformat(data["last_accessed"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return datetime.now(timezone.utc).timestamp()
+
     def _evict_oldest(self) -> bool:
         """Evict oldest entry based on last_accessed time for LRU behavior.
 
@@ -440,120 +476,421 @@ class JsonlCacheTier(CacheTier):
 
     def _rebuild_index(self) -> None:
         """Rebuild in-memory index and access order from all shard files."""
-        self._index.clear()
-        self._access_order.clear()
+        with self._state_lock:
+            self._index.clear()
+            self._access_order.clear()
+            for keys in self._shard_keys:
+                keys.clear()
+            self._shard_records = [0] * self.num_shards
+
+            # Collect all live entries with their last_accessed times
+            entries_with_times: list[tuple[str, float]] = []
+
+            for shard_id in range(self.num_shards):
+                if not self._get_shard_path(shard_id).exists():
+                    continue
+                try:
+                    with self._shard_lock(shard_id):
+                        live, records = self._scan_shard(shard_id)
+                except (OSError, portalocker.LockException) as e:
+                    logger.warning(f"Failed to read shard {shard_id} during index rebuild: {e}")
+                    continue
+
+                self._shard_records[shard_id] = records
+                for key, (offset, data) in live.items():
+                    self._index[key] = (shard_id, offset)
+                    self._shard_keys[shard_id].add(key)
+                    entries_with_times.append((key, self._record_timestamp(data)))
+
+            # Sort by timestamp (oldest first) and populate OrderedDict
+            entries_with_times.sort(key=lambda x: x[1])
+            for key, timestamp in entries_with_times:
+                self._access_order[key] = timestamp
+
+    def _scan_shard(self, shard_id: int) -> tuple[dict[str, tuple[int, dict]], int]:
+        """Replay a shard's log, keeping the last record per key.
+
+        Tombstones remove their key; corrupted lines are skipped but still
+        counted as records so they are reclaimed by compaction.
+
+        Returns:
+            Tuple of (key -> (byte offset, record) for live keys, total record count)
+
+        """
+        live: dict[str, tuple[int, dict]] = {}
+        shard_path = self._get_shard_path(shard_id)
+        if not shard_path.exists():
+            return live, 0
 
-        # Collect all entries with their last_accessed times
-        entries_with_times: list[tuple[str, int, float]] = []
+        with open(shard_path, "rb") as f:
+            records = self._replay_lines(shard_id, f, live)
+        return live, records
 
-        for shard_id in range(self.num_shards):
-            shard_path = self._get_shard_path(shard_id)
-            if not shard_path.exists():
+    def _replay_lines(
+        self,
+        shard_id: int,
+        lines: Iterable[bytes],
+        live: dict[str, tuple[int, dict]],
+        offset: int = 0,
+    ) -> int:
+        """Replay log lines starting at byte ``offset`` into ``live``.
+
+        Returns:
+            Number of records (non-blank lines) replayed
+
+        """
+        records = 0
+        for line in lines:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
                 continue
+            records += 1
             try:
-                with portalocker.Lock(shard_path, "r", timeout=5) as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            if "key" in data:
-                                key = data["key"]
-                                self._index[key] = shard_id
-
-                                # Extract last_accessed time for ordering
-                                if "last_accessed" in data:
-                                    try:
-                                        last_accessed = datetime.fromisoformat(
-                                            data["last_accessed"]
-                                        )
-                                        entries_with_times.append(
-                                            (key, shard_id, last_accessed.timestamp())
-                                        )
-                                    except (ValueError, AttributeError):
-                                        # Default to current time if parse fails
-                                        entries_with_times.append(
-                                            (key, shard_id, datetime.now(timezone.utc).timestamp())
-                                        )
-                                else:
-                                    # No timestamp, use current time
-                                    entries_with_times.append(
-                                        (key, shard_id, datetime.now(timezone.utc).timestamp())
-                                    )
-                        except json.JSONDecodeError as e:
-                            logger.debug(f"Skipping corrupted line during index rebuild: {e}")
-                            continue
-            except (OSError, portalocker.LockException) as e:
-                logger.warning(f"Failed to read shard {shard_id} during index rebuild: {e}")
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.debug(f"Skipping corrupted line in shard {shard_id}: {e}")
                 continue
-
-        # Sort by timestamp (oldest first) and populate OrderedDict
-        entries_with_times.sort(key=lambda x: x[2])
-        for key, _, timestamp in entries_with_times:
-            self._access_order[key] = timestamp
+            if not isinstance(data, dict) or "key" not in data:
+                continue
+            if data.get("deleted"):
+                live.pop(data["key"], None)
+            else:
+                live[data["key"]] = (line_offset, data)
+        return records
 
     def _read_shard(self, shard_id: int) -> dict[str, dict]:
-        """Read all entries from a shard file.
+        """Read all live entries from a shard file.
 
         Returns:
             dict[str, dict]: Mapping of key to entry data dict.
 
         """
-        shard_path = self._get_shard_path(shard_id)
-        entries: dict[str, dict] = {}
-
-        if not shard_path.exists():
-            return entries
-
         try:
-            with portalocker.Lock(shard_path, "r", timeout=5) as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    try:
-                        data = json.loads(line)
-                        if "key" in data:
-                            entries[data["key"]] = data
-                    except json.JSONDecodeError as e:
-                        logger.debug(f"Skipping corrupted line in shard {shard_id}: {e}")
-                        continue
-        except (OSError, portalocker.LockException) as e:
+            live, _ = self._scan_shard(shard_id)
+        except OSError as e:
             logger.warning(f"Failed to read shard {shard_id}: {e}")
+            return {}
+        return {key: data for key, (_, data) in live.items()}
 
-        return entries
+    def _read_record(self, shard_id: int, offset: int) -> dict | None:
+        """Read the single record starting at ``offset`` in a shard.
+
+        Returns:
+            The decoded record, or None if the line is missing or corrupted
+
+        """
+        try:
+            with open(self._get_shard_path(shard_id), "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+        except FileNotFoundError:
+            return None
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
 
-    def _write_shard(self, shard_id: int, entries: dict[str, dict]) -> bool:
-        """Write all entries to a shard file atomically.
+    def _write_temp_shard(
+        self, shard_id: int, entries: dict[str, dict]
+    ) -> tuple[Path, dict[str, int]] | None:
+        """Write entries to a temp file next to a shard, for an atomic replace.
 
         Args:
             shard_id: Shard file ID
             entries: Mapping of key to entry data dict.
 
         Returns:
-            True if write succeeded
+            Tuple of (temp file path, key -> byte offset in it), or None if the write failed
 
         """
         shard_path = self._get_shard_path(shard_id)
-
+        temp_path = shard_path.with_name(
+            f"{shard_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
-            # Write to temp file first, then rename for atomicity
-            temp_path = shard_path.with_name(
-                f"{shard_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            offsets: dict[str, int] = {}
+            with open(temp_path, "wb") as f:
+                offset = 0
+                for key, data in entries.items():
+                    line = json.dumps(data).encode() + b"\n"
+                    f.write(line)
+                    offsets[key] = offset
+                    offset += len(line)
+            return temp_path, offsets
+        except OSError as e:
+            logger.error(f"Failed to write shard {shard_id}: {e}")
+            temp_path.unlink(missing_ok=True)
+            return None
+
+    def _append_records(self, shard_id: int, records: list[dict]) -> list[int]:
+        """Append records to a shard's log under its inter-process lock.
+
+        Args:
+            shard_id: Shard file ID
+            records: Entry records or tombstones to append, in order
+
+        Returns:
+            Byte offset of each appended record
+
+        """
+        lines = [json.dumps(data).encode() + b"\n" for data in records]
+        with self._shard_lock(shard_id), open(self._get_shard_path(shard_id), "a+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                # Terminate a torn trailing line so it cannot swallow the new record
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+                    end += 1
+            offsets = []
+            for line in lines:
+                offsets.append(end)
+                end += len(line)
+            f.write(b"".join(lines))
+        self._shard_records[shard_id] += len(records)
+        return offsets
+
+    def _apply_shard_index(self, shard_id: int, offsets: dict[str, int], records: int) -> None:
+        """Replace the index of one shard, while caller holds _state_lock."""
+        for key in self._shard_keys[shard_id] - offsets.keys():
+            self._index.pop(key, None)
+            self._access_order.pop(key, None)
+        for key, offset in offsets.items():
+            self._index[key] = (shard_id, offset)
+            self._access_order.setdefault(key, datetime.now(timezone.utc).timestamp())
+        self._shard_keys[shard_id] = set(offsets)
+        self._shard_records[shard_id] = records
+
+    def _reindex_shard(self, shard_id: int) -> None:
+        """Re-scan one shard after it was rewritten behind our back (e.g. by another process)."""
+        with self._state_lock, self._shard_lock(shard_id):
+            live, records = self._scan_shard(shard_id)
+            self._apply_shard_index(
+                shard_id, {key: offset for key, (offset, _) in live.items()}, records
             )
-            with portalocker.Lock(temp_path, "w", timeout=5) as f:
-                for data in entries.values():
-                    json.dump(data, f)
-                    f.write("\n")
 
-            # Atomic rename
-            temp_path.replace(shard_path)
-            return True
-        except (OSError, portalocker.LockException) as e:
-            logger.error(f"Failed to write shard {shard_id}: {e}")
+    def _compact_shard(self, shard_id: int, expired_before: datetime | None = None) -> int:
+        """Rewrite a shard with only its live records.
+
+        The shard is replayed from disk rather than from the in-memory index so
+        records appended by other processes survive compaction. Only the
+        snapshot and the final swap hold the locks: the live records are
+        rewritten without them, and records appended meanwhile are copied
+        over and replayed into the index just before the new file replaces
+        the old one.
+
+        Args:
+            shard_id: Shard file ID
+            expired_before: If given, also drop entries that expired before this time
+
+        Returns:
+            Number of expired entries dropped
+
+        """
+        shard_path = self._get_shard_path(shard_id)
+        with self._state_lock, self._shard_lock(shard_id):
+            try:
+                with open(shard_path, "rb") as f:
+                    stat = os.fstat(f.fileno())
+                    snapshot = f.read(stat.st_size)
+            except FileNotFoundError:
+                self._apply_shard_index(shard_id, {}, 0)
+                return 0
+
+        live: dict[str, tuple[int, dict]] = {}
+        records = self._replay_lines(shard_id, io.BytesIO(snapshot), live)
+        expired: list[str] = []
+        if expired_before is not None:
+            for key, (_, data) in live.items():
+                try:
+                    if datetime.fromisoformat(data["expires_at"]) < expired_before:
+                        expired.append(key)
+                except (KeyError, TypeError, ValueError):
+                    # Missing or invalid timestamp - keep entry
+                    continue
+            for key in expired:
+                del live[key]
+        if records == len(live):
+            with self._state_lock, self._shard_lock(shard_id):
+                if self._shard_unchanged(shard_path, stat, len(snapshot)):
+                    self._apply_shard_index(
+                        shard_id, {key: offset for key, (offset, _) in live.items()}, records
+                    )
+            return 0
+
+        written = self._write_temp_shard(shard_id, {key: data for key, (_, data) in live.items()})
+        if written is None:
+            return 0
+        temp_path, offsets = written
+
+        with self._state_lock, self._shard_lock(shard_id):
+            if not self._shard_unchanged(shard_path, stat, len(snapshot), appended=True):
+                # Another process compacted or cleared the shard; keep its result
+                temp_path.unlink(missing_ok=True)
+                live, records = self._scan_shard(shard_id)
+                self._apply_shard_index(
+                    shard_id, {key: offset for key, (offset, _) in live.items()}, records
+                )
+                return 0
+            try:
+                with open(shard_path, "rb") as f:
+                    f.seek(len(snapshot))
+                    tail = f.read()
+                with open(temp_path, "ab") as f:
+                    base = f.seek(0, os.SEEK_END)
+                    f.write(tail)
+                merged = {key: (offsets[key], data) for key, (_, data) in live.items()}
+                tail_records = self._replay_lines(shard_id, io.BytesIO(tail), merged, base)
+                temp_path.replace(shard_path)
+            except OSError as e:
+                logger.error(f"Failed to write shard {shard_id}: {e}")
+                temp_path.unlink(missing_ok=True)
+                return 0
+            self._apply_shard_index(
+                shard_id,
+                {key: offset for key, (offset, _) in merged.items()},
+                len(offsets) + tail_records,
+            )
+            return len(expired)
+
+    @staticmethod
+    def _shard_unchanged(
+        shard_path: Path, snapshot: os.stat_result, size: int, appended: bool = False
+    ) -> bool:
+        """Return whether a shard is still the file snapshotted, optionally with appends."""
+        try:
+            current = os.stat(shard_path)
+        except FileNotFoundError:
+            return False
+        if (current.st_dev, current.st_ino) != (snapshot.st_dev, snapshot.st_ino):
             return False
+        return current.st_size >= size if appended else current.st_size == size
+
+    def _needs_compaction(self, shard_id: int) -> bool:
+        """Return whether a shard's dead records crossed the compaction threshold."""
+        records = self._shard_records[shard_id]
+        garbage = records - len(self._shard_keys[shard_id])
+        return garbage >= self.compaction_min_garbage and garbage >= records * self.compaction_ratio
+
+    def _maybe_schedule_compaction(self, shard_id: int) -> None:
+        """Start a background compaction of a shard if needed, while caller holds _state_lock."""
+        if shard_id in self._compacting or not self._needs_compaction(shard_id):
+            return
+        self._compacting.add(shard_id)
+        threading.Thread(
+            target=self._background_compact,
+            args=(shard_id,),
+            daemon=True,
+            name=f"JsonlCompaction-{shard_id:02d}",
+        ).start()
+
+    def _background_compact(self, shard_id: int) -> None:
+        """Compact a shard from a background thread."""
+        try:
+            self._compact_shard(shard_id)
+        except Exception as e:
+            logger.warning(f"Background compaction of shard {shard_id} failed: {e}")
+        finally:
+            with self._state_lock:
+                self._compacting.discard(shard_id)
+
+    def compact(self) -> int:
+        """Compact every shard that holds dead records, regardless of threshold.
+
+        Returns:
+            Number of dead records reclaimed
+
+        """
+        try:
+            reclaimed = 0
+            for shard_id in range(self.num_shards):
+                with self._state_lock:
+                    garbage = self._shard_records[shard_id] - len(self._shard_keys[shard_id])
+                if garbage > 0:
+                    self._compact_shard(shard_id)
+                    reclaimed += garbage
+            self.reset_failures()
+            return reclaimed
+        except Exception as e:
+            self.handle_failure(e)
+            return 0
+
+    def _decode_record(self, data: dict) -> CacheEntry:
+        """Build a CacheEntry from a stored record, decrypting credentials."""
+        # Decrypt credentials
+        if data.get("username_encrypted"):
+            username_bytes = bytes.fromhex(data["username_encrypted"])
+            data["username"] = self.encryptor.decrypt(username_bytes)
+            del data["username_encrypted"]
+
+        if data.get("password_encrypted"):
+            password_bytes = bytes.fromhex(data["password_encrypted"])
+            data["password"] = self.encryptor.decrypt(password_bytes)
+            del data["password_encrypted"]
+
+        # Convert timestamps (including optional health monitoring timestamps)
+        for field in [
+            "fetch_time",
+            "last_accessed",
+            "expires_at",
+            "last_health_check",
+            "next_check_time",
+        ]:
+            if field in data and data[field] is not None and isinstance(data[field], str):
+                data[field] = datetime.fromisoformat(data[field])
+
+        # Ensure health monitoring fields have defaults for backward compatibility
+        data.setdefault("consecutive_health_failures", 0)
+        data.setdefault("consecutive_health_successes", 0)
+        data.setdefault("recovery_attempt", 0)
+        data.setdefault("total_health_checks", 0)
+        data.setdefault("total_health_check_failures", 0)
+
+        return CacheEntry(**data)
+
+    def _encode_entry(self, entry: CacheEntry) -> dict:
+        """Build the stored record for an entry, encrypting credentials."""
+        # Prepare entry data with all fields including health monitoring
+        data = {
+            "key": entry.key,
+            "proxy_url": entry.proxy_url,
+            "source": entry.source,
+            "fetch_time": entry.fetch_time.isoformat(),
+            "last_accessed": entry.last_accessed.isoformat(),
+            "access_count": entry.access_count,
+            "ttl_seconds": entry.ttl_seconds,
+            "expires_at": entry.expires_at.isoformat(),
+            "health_status": entry.health_status.value,
+            "failure_count": entry.failure_count,
+            "evicted_from_l1": entry.evicted_from_l1,
+            # Health monitoring fields (Feature 006)
+            "last_health_check": entry.last_health_check.isoformat()
+            if entry.last_health_check
+            else None,
+            "consecutive_health_failures": entry.consecutive_health_failures,
+            "consecutive_health_successes": entry.consecutive_health_successes,
+            "recovery_attempt": entry.recovery_attempt,
+            "next_check_time": entry.next_check_time.isoformat() if entry.next_check_time else None,
+            "last_health_error": entry.last_health_error,
+            "total_health_checks": entry.total_health_checks,
+            "total_health_check_failures": entry.total_health_check_failures,
+        }
+
+        # Encrypt credentials
+        if entry.username:
+            encrypted = self.encryptor.encrypt(entry.username)
+            data["username_encrypted"] = encrypted.hex()
+
+        if entry.password:
+            encrypted = self.encryptor.encrypt(entry.password)
+            data["password_encrypted"] = encrypted.hex()
+
+        return data
 
     def get(self, key: str) -> CacheEntry | None:
-        """Retrieve entry from JSONL shard.
+        """Retrieve entry from JSONL shard by seeking to its indexed line.
 
         Args:
             key: Cache key to lookup
@@ -563,60 +900,38 @@ class JsonlCacheTier(CacheTier):
 
         """
         try:
-            shard_id = self._index.get(key)
-            if shard_id is None:
+            location = self._index.get(key)
+            if location is None:
                 return None
 
-            entries = self._read_shard(shard_id)
-            data = entries.get(key)
-            if not data:
-                # Key was in index but not in file - remove from both index and access order
-                self._index.pop(key, None)
-                self._access_order.pop(key, None)
-                return None
+            shard_id, offset = location
+            data = self._read_record(shard_id, offset)
+            if data is None or data.get("key") != key:
+                # Shard was compacted since the lookup or rewritten by another process
+                self._reindex_shard(shard_id)
+                location = self._index.get(key)
+                data = self._read_record(*location) if location else None
+                if data is None or data.get("key") != key:
+                    with self._state_lock:
+                        self._access_order.pop(key, None)
+                    return None
 
-            # Decrypt credentials
-            if data.get("username_encrypted"):
-                username_bytes = bytes.fromhex(data["username_encrypted"])
-                data["username"] = self.encryptor.decrypt(username_bytes)
-                del data["username_encrypted"]
-
-            if data.get("password_encrypted"):
-                password_bytes = bytes.fromhex(data["password_encrypted"])
-                data["password"] = self.encryptor.decrypt(password_bytes)
-                del data["password_encrypted"]
-
-            # Convert timestamps (including optional health monitoring timestamps)
-            for field in [
-                "fetch_time",
-                "last_accessed",
-                "expires_at",
-                "last_health_check",
-                "next_check_time",
-            ]:
-                if field in data and data[field] is not None and isinstance(data[field], str):
-                    data[field] = datetime.fromisoformat(data[field])
-
-            # Ensure health monitoring fields have defaults for backward compatibility
-            data.setdefault("consecutive_health_failures", 0)
-            data.setdefault("consecutive_health_successes", 0)
-            data.setdefault("recovery_attempt", 0)
-            data.setdefault("total_health_checks", 0)
-            data.setdefault("total_health_check_failures", 0)
+            entry = self._decode_record(data)
 
             # Update access order (move to end for LRU)
-            if key in self._access_order:
-                self._access_order.move_to_end(key)
-            self._access_order[key] = datetime.now(timezone.utc).timestamp()
+            with self._state_lock:
+                if key in self._access_order:
+                    self._access_order.move_to_end(key)
+                self._access_order[key] = datetime.now(timezone.utc).timestamp()
 
             self.reset_failures()
-            return CacheEntry(**data)
+            return entry
         except Exception as e:
             self.handle_failure(e)
             return None
 
     def put(self, key: str, entry: CacheEntry) -> bool:
-        """Store entry in JSONL shard with encrypted credentials.
+        """Append entry to its JSONL shard with encrypted credentials.
 
         Args:
             key: Cache key for entry (should match entry.key)
@@ -635,61 +950,22 @@ class JsonlCacheTier(CacheTier):
 
             # Always use entry.key for consistency
             shard_id = self._get_shard_id(entry.key)
-
-            # Prepare entry data with all fields including health monitoring
-            data = {
-                "key": entry.key,
-                "proxy_url": entry.proxy_url,
-                "source": entry.source,
-                "fetch_time": entry.fetch_time.isoformat(),
-                "last_accessed": entry.last_accessed.isoformat(),
-                "access_count": entry.access_count,
-                "ttl_seconds": entry.ttl_seconds,
-                "expires_at": entry.expires_at.isoformat(),
-                "health_status": entry.health_status.value,
-                "failure_count": entry.failure_count,
-                "evicted_from_l1": entry.evicted_from_l1,
-                # Health monitoring fields (Feature 006)
-                "last_health_check": entry.last_health_check.isoformat()
-                if entry.last_health_check
-                else None,
-                "consecutive_health_failures": entry.consecutive_health_failures,
-                "consecutive_health_successes": entry.consecutive_health_successes,
-                "recovery_attempt": entry.recovery_attempt,
-                "next_check_time": entry.next_check_time.isoformat()
-                if entry.next_check_time
-                else None,
-                "last_health_error": entry.last_health_error,
-                "total_health_checks": entry.total_health_checks,
-                "total_health_check_failures": entry.total_health_check_failures,
-            }
-
-            # Encrypt credentials
-            if entry.username:
-                encrypted = self.encryptor.encrypt(entry.username)
-                data["username_encrypted"] = encrypted.hex()
-
-            if entry.password:
-                encrypted = self.encryptor.encrypt(entry.password)
-                data["password_encrypted"] = encrypted.hex()
+            data = self._encode_entry(entry)
 
             with self._state_lock:
                 self._evict_to_capacity_for_new_key(entry.key)
 
-                with portalocker.Lock(self._get_shard_lock_path(shard_id), "a+", timeout=5):
-                    # Read existing shard while holding the shard lock to avoid lost updates.
-                    entries = self._read_shard(shard_id)
-                    entries[entry.key] = data
-
-                    if self._write_shard(shard_id, entries):
-                        self._index[entry.key] = shard_id
-                        # Update access order for LRU tracking
-                        if entry.key in self._access_order:
-                            self._access_order.move_to_end(entry.key)
-                        self._access_order[entry.key] = entry.last_accessed.timestamp()
-                        self.reset_failures()
-                        return True
-            return False
+                (offset,) = self._append_records(shard_id, [data])
+                self._index[entry.key] = (shard_id, offset)
+                self._shard_keys[shard_id].add(entry.key)
+                # Update access order for LRU tracking
+                if entry.key in self._access_order:
+                    self._access_order.move_to_end(entry.key)
+                self._access_order[entry.key] = entry.last_accessed.timestamp()
+                self._maybe_schedule_compaction(shard_id)
+
+            self.reset_failures()
+            return True
         except Exception as e:
             self.handle_failure(e)
             return False
@@ -701,17 +977,18 @@ class JsonlCacheTier(CacheTier):
 
         while len(self._index) >= self.config.max_entries and self._access_order:
             oldest_key, _ = self._access_order.popitem(last=False)
-            oldest_shard_id = self._index.pop(oldest_key, None)
-            if oldest_shard_id is None:
+            location = self._index.get(oldest_key)
+            if location is None:
                 continue
 
-            with portalocker.Lock(self._get_shard_lock_path(oldest_shard_id), "a+", timeout=5):
-                entries = self._read_shard(oldest_shard_id)
-                entries.pop(oldest_key, None)
-                self._write_shard(oldest_shard_id, entries)
+            oldest_shard_id = location[0]
+            self._append_records(oldest_shard_id, [{"key": oldest_key, "deleted": True}])
+            self._index.pop(oldest_key, None)
+            self._shard_keys[oldest_shard_id].discard(oldest_key)
+            self._maybe_schedule_compaction(oldest_shard_id)
 
     def delete(self, key: str) -> bool:
-        """Remove entry from JSONL shard.
+        """Remove entry by appending a tombstone to its JSONL shard.
 
         Args:
             key: Cache key to delete
@@ -721,24 +998,18 @@ class JsonlCacheTier(CacheTier):
 
         """
         try:
-            shard_id = self._index.get(key)
-            if shard_id is None:
-                return False
-
             with self._state_lock:
-                with portalocker.Lock(self._get_shard_lock_path(shard_id), "a+", timeout=5):
-                    entries = self._read_shard(shard_id)
-                    if key not in entries:
-                        self._index.pop(key, None)
-                        self._access_order.pop(key, None)
-                        return False
+                location = self._index.get(key)
+                if location is None:
+                    return False
 
-                    del entries[key]
-                    if self._write_shard(shard_id, entries):
-                        self._index.pop(key, None)
-                        self._access_order.pop(key, None)
-                        return True
-            return False
+                shard_id = location[0]
+                self._append_records(shard_id, [{"key": key, "deleted": True}])
+                self._index.pop(key, None)
+                self._shard_keys[shard_id].discard(key)
+                self._access_order.pop(key, None)
+                self._maybe_schedule_compaction(shard_id)
+            return True
         except Exception as e:
             self.handle_failure(e)
             return False
@@ -751,16 +1022,19 @@ class JsonlCacheTier(CacheTier):
 
         """
         try:
-            count = len(self._index)
-
-            # Delete all shard files
-            for shard_id in range(self.num_shards):
-                shard_path = self._get_shard_path(shard_id)
-                if shard_path.exists():
-                    shard_path.unlink()
-
-            self._index.clear()
-            self._access_order.clear()
+            with self._state_lock:
+                count = len(self._index)
+
+                # Delete all shard files
+                for shard_id in range(self.num_shards):
+                    shard_path = self._get_shard_path(shard_id)
+                    if shard_path.exists():
+                        shard_path.unlink()
+                    self._shard_keys[shard_id].clear()
+                    self._shard_records[shard_id] = 0
+
+                self._index.clear()
+                self._access_order.clear()
             self.reset_failures()
             return count
         except Exception as e:
@@ -788,6 +1062,9 @@ class JsonlCacheTier(CacheTier):
     def cleanup_expired(self) -> int:
         """Remove all expired entries from all shards.
 
+        Each shard holding entries is compacted with its expired entries
+        dropped, which also reclaims dead records.
+
         Returns:
             Number of entries removed
 
@@ -797,31 +1074,8 @@ class JsonlCacheTier(CacheTier):
             now = datetime.now(timezone.utc)
 
             for shard_id in range(self.num_shards):
-                entries = self._read_shard(shard_id)
-                original_count = len(entries)
-
-                # Filter out expired entries
-                valid_entries = {}
-                for key, data in entries.items():
-                    expires_at_str = data.get("expires_at")
-                    if expires_at_str:
-                        try:
-                            expires_at = datetime.fromisoformat(expires_at_str)
-                            if expires_at >= now:
-                                valid_entries[key] = data
-                            else:
-                                self._index.pop(key, None)
-                                self._access_order.pop(key, None)
-                                removed += 1
-                        except ValueError:
-                            # Invalid timestamp - keep entry
-                            valid_entries[key] = data
-                    else:
-                        valid_entries[key] = data
-
-                # Write back if entries were removed
-                if len(valid_entries) < original_count:
-                    self._write_shard(shard_id, valid_entries)
+                if self._get_shard_path(shard_id).exists():
+                    removed += self._compact_shard(shard_id, expired_before=now)
 
             self.reset_failures()
             return removed
@@ -1353,42 +1607,21 @@ class DiskCacheTier(CacheTier):
             return 0
 
         for shard_file in shard_files:
+            # Replay the append-only log: the last record per key wins and
+            # tombstones drop the key, so superseded and deleted entries are skipped
+            records: dict[str, dict] = {}
             try:
                 with portalocker.Lock(shard_file, "r", timeout=5) as f:
                     for line in f:
                         if not line.strip():
                             continue
-
                         try:
                             data = json.loads(line)
-
-                            # Create CacheEntry from JSONL data
-                            # Handle both old and new timestamp formats
-                            for field in ["fetch_time", "last_accessed", "expires_at"]:
-                                if field in data and isinstance(data[field], str):
-                                    data[field] = datetime.fromisoformat(data[field])
-
-                            # Handle encrypted credentials if present
-                            if "username_encrypted" in data:
-                                username_hex = data.pop("username_encrypted")
-                                data["username"] = self.encryptor.decrypt(
-                                    bytes.fromhex(username_hex)
-                                )
-
-                            if "password_encrypted" in data:
-                                password_hex = data.pop("password_encrypted")
-                                data["password"] = self.encryptor.decrypt(
-                                    bytes.fromhex(password_hex)
-                                )
-
-                            # Create entry and store in SQLite
-                            entry = CacheEntry(**data)
-                            if self.put(entry.key, entry):
-                                migrated += 1
+                            if data.get("deleted"):
+                                records.pop(data["key"], None)
                             else:
-                                errors += 1
-
-                        except (json.JSONDecodeError, ValueError, KeyError):
+                                records[data["key"]] = data
+                        except (json.JSONDecodeError, AttributeError, KeyError):
                             # Skip corrupted entries
                             errors += 1
                             continue
@@ -1398,21 +1631,109 @@ class DiskCacheTier(CacheTier):
                 errors += 1
                 continue
 
+            for data in records.values():
+                try:
+                    # Create CacheEntry from JSONL data
+                    # Handle both old and new timestamp formats
+                    for field in ["fetch_time", "last_accessed", "expires_at"]:
+                        if field in data and isinstance(data[field], str):
+                            data[field] = datetime.fromisoformat(data[field])
+
+                    # Handle encrypted credentials if present
+                    if "username_encrypted" in data:
+                        username_hex = data.pop("username_encrypted")
+                        data["username"] = self.encryptor.decrypt(bytes.fromhex(username_hex))
+
+                    if "password_encrypted" in data:
+                        password_hex = data.pop("password_encrypted")
+                        data["password"] = self.encryptor.decrypt(bytes.fromhex(password_hex))
+
+                    # Create entry and store in SQLite
+                    entry = CacheEntry(**data)
+                    if self.put(entry.key, entry):
+                        migrated += 1
+                    else:
+                        errors += 1
+
+                except (ValueError, KeyError):
+                    # Skip corrupted entries
+                    errors += 1
+                    continue
+
         return migrated
 
 
+_L3_COLUMNS = (
+    "key",
+    "proxy_url",
+    "username_encrypted",
+    "password_encrypted",
+    "source",
+    "fetch_time",
+    "last_accessed",
+    "access_count",
+    "ttl_seconds",
+    "expires_at",
+    "health_status",
+    "failure_count",
+    "created_at",
+    "updated_at",
+    # Health monitoring fields
+    "last_health_check",
+    "consecutive_health_failures",
+    "consecutive_health_successes",
+    "recovery_attempt",
+    "next_check_time",
+    "last_health_error",
+    "total_health_checks",
+    "total_health_check_failures",
+    "evicted_from_l1",
+)
+"""Column order shared by L3 SELECTs and upserts so rows map positionally."""
+
+_L3_SELECT = f"SELECT {', '.join(_L3_COLUMNS)} FROM cache_entries"
+_L3_UPSERT = (
+    f"INSERT OR REPLACE INTO cache_entries ({', '.join(_L3_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _L3_COLUMNS)})"
+)
+_L3_TIMESTAMP_COLUMNS = (
+    "fetch_time",
+    "last_accessed",
+    "expires_at",
+    "created_at",
+    "updated_at",
+    "last_health_check",
+    "next_check_time",
+)
+
+_SQLITE_IN_BATCH = 500
+"""Keys per ``IN (...)`` lookup, below SQLite's default host-parameter limit."""
+
+
 class SQLiteCacheTier(CacheTier):
     """L3 SQLite database cache with encrypted credentials.
 
     Provides durable persistence with SQL indexing for fast lookups.
+
+    Connections are opened once in WAL mode and reused from a small pool
+    (up to ``pool_size`` idle connections), so each operation runs on a
+    connection whose prepared-statement cache is already warm and concurrent
+    readers do not serialize on one handle. ``get_many``/``put_many`` batch
+    lookups into ``IN (...)`` queries and writes into one ``executemany``
+    transaction. Decrypted credentials are cached for ``credential_cache_ttl``
+    seconds, keyed by ciphertext, so repeated hits skip Fernet.
     """
 
+    _CREDENTIAL_CACHE_SIZE = 10_000
+
     def __init__(
         self,
         config: CacheTierConfig,
         tier_type: TierType,
         db_path: Path,
         encryptor: CredentialEncryptor | None = None,
+        pool_size: int = 4,
+        credential_cache_ttl: float = 60.0,
     ) -> None:
         """Initialize SQLite-based L3 cache with health monitoring.
 
@@ -1422,6 +1743,9 @@ class SQLiteCacheTier(CacheTier):
             db_path: Path to SQLite database file.
             encryptor: Optional credential encryptor for username/password.
                       Creates default CredentialEncryptor if not provided.
+            pool_size: Maximum number of idle connections kept open for reuse.
+            credential_cache_ttl: Seconds a decrypted credential is reused
+                      before Fernet runs again; 0 disables the cache.
 
         Side Effects:
             - Creates parent directories for database if they don't exist.
@@ -1433,8 +1757,74 @@ class SQLiteCacheTier(CacheTier):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.encryptor = encryptor or CredentialEncryptor()
+        self.pool_size = pool_size
+        self.credential_cache_ttl = credential_cache_ttl
+
+        # Idle connection pool; bumping the generation retires checked-out connections
+        self._idle: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._generation = 0
+
+        # ciphertext -> (monotonic expiry, decrypted secret)
+        self._credentials: OrderedDict[bytes, tuple[float, SecretStr]] = OrderedDict()
+        self._credentials_lock = threading.Lock()
+
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new WAL-mode connection to the cache database."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,  # Pooled connections move between threads
+            timeout=30.0,  # Wait up to 30s for locks
+            isolation_level="DEFERRED",
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Check a connection out of the pool for the duration of one operation."""
+        with self._pool_lock:
+            conn = self._idle.pop() if self._idle else None
+            generation = self._generation
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                if generation == self._generation and len(self._idle) < self.pool_size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self) -> None:
+        """Close pooled SQLite connections and drop cached credentials.
+
+        Connections checked out by in-flight operations are closed when they
+        are returned. Safe to call multiple times; the tier reconnects on the
+        next operation.
+
+        """
+        with self._pool_lock:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception:
+                pass  # Ignore errors on close
+        with self._credentials_lock:
+            self._credentials.clear()
+
+    def __del__(self) -> None:
+        """Close pooled connections when the tier is garbage collected."""
+        if hasattr(self, "_pool_lock"):
+            self.close()
+
     def _init_db(self) -> None:
         """Initialize database schema with health monitoring fields.
 
@@ -1452,7 +1842,7 @@ class SQLiteCacheTier(CacheTier):
             - Creates performance indexes.
             - Commits schema changes.
         """
-        with closing(sqlite3.connect(str(self.db_path))) as conn:
+        with self._connection() as conn:
             # Create cache_entries table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
@@ -1564,6 +1954,100 @@ class SQLiteCacheTier(CacheTier):
                     # Column may already exist in a concurrent process
                     pass
 
+    def _decrypt_credential(self, ciphertext: bytes) -> SecretStr:
+        """Decrypt a stored credential, reusing recent results for the same ciphertext."""
+        if self.credential_cache_ttl <= 0:
+            return self.encryptor.decrypt(ciphertext)
+
+        now = time.monotonic()
+        with self._credentials_lock:
+            cached = self._credentials.get(ciphertext)
+            if cached is not None and cached[0] > now:
+                self._credentials.move_to_end(ciphertext)
+                return cached[1]
+
+        secret = self.encryptor.decrypt(ciphertext)
+        self._remember_credential(ciphertext, secret, now)
+        return secret
+
+    def _remember_credential(self, ciphertext: bytes, secret: SecretStr, now: float) -> None:
+        """Cache a ciphertext's plaintext until the credential TTL elapses."""
+        if self.credential_cache_ttl <= 0:
+            return
+        with self._credentials_lock:
+            self._credentials[ciphertext] = (now + self.credential_cache_ttl, secret)
+            self._credentials.move_to_end(ciphertext)
+            while len(self._credentials) > self._CREDENTIAL_CACHE_SIZE:
+                self._credentials.popitem(last=False)
+
+    def _row_to_entry(self, row: tuple) -> CacheEntry:
+        """Build a CacheEntry from a row selected with ``_L3_SELECT``."""
+        data = dict(zip(_L3_COLUMNS, row, strict=True))
+
+        # Decrypt credentials
+        username_encrypted = data.pop("username_encrypted")
+        password_encrypted = data.pop("password_encrypted")
+        if username_encrypted:
+            data["username"] = self._decrypt_credential(username_encrypted)
+        if password_encrypted:
+            data["password"] = self._decrypt_credential(password_encrypted)
+
+        # Convert timestamps
+        for field in _L3_TIMESTAMP_COLUMNS:
+            if data[field] is not None:
+                data[field] = datetime.fromtimestamp(data[field], tz=timezone.utc)
+
+        # Convert boolean
+        if data["evicted_from_l1"] is not None:
+            data["evicted_from_l1"] = bool(data["evicted_from_l1"])
+
+        return CacheEntry(**data)
+
+    def _entry_params(self, entry: CacheEntry, now: float) -> tuple:
+        """Build upsert parameters for an entry in ``_L3_COLUMNS`` order, encrypting credentials."""
+        mono = time.monotonic()
+
+        # Encrypt credentials, remembering the plaintext so the next read skips Fernet
+        username_encrypted = None
+        if entry.username:
+            username_encrypted = self.encryptor.encrypt(entry.username)
+            self._remember_credential(username_encrypted, entry.username, mono)
+        password_encrypted = None
+        if entry.password:
+            password_encrypted = self.encryptor.encrypt(entry.password)
+            self._remember_credential(password_encrypted, entry.password, mono)
+
+        # Helper to convert optional datetime to timestamp
+        def to_timestamp(dt: datetime | None) -> float | None:
+            return dt.timestamp() if dt is not None else None
+
+        return (
+            entry.key,
+            entry.proxy_url,
+            username_encrypted,
+            password_encrypted,
+            entry.source,
+            entry.fetch_time.timestamp(),
+            entry.last_accessed.timestamp(),
+            entry.access_count,
+            entry.ttl_seconds,
+            entry.expires_at.timestamp(),
+            entry.health_status.value,
+            entry.failure_count,
+            now,
+            now,
+            # Health monitoring fields
+            to_timestamp(entry.last_health_check),
+            entry.consecutive_health_failures,
+            entry.consecutive_health_successes,
+            entry.recovery_attempt,
+            to_timestamp(entry.next_check_time),
+            entry.last_health_error,
+            entry.total_health_checks,
+            entry.total_health_check_failures,
+            int(entry.evicted_from_l1),
+        )
+
     def get(self, key: str) -> CacheEntry | None:
         """Retrieve entry from SQLite database with decrypted credentials.
 
@@ -1574,8 +2058,8 @@ class SQLiteCacheTier(CacheTier):
             CacheEntry if found with decrypted username/password, None otherwise.
 
         Side Effects:
-            - Opens new SQLite connection for query.
-            - Decrypts username_encrypted and password_encrypted BLOBs.
+            - Runs the query on a pooled connection.
+            - Decrypts username_encrypted and password_encrypted BLOBs (cached by ciphertext).
             - Converts UNIX timestamps to datetime objects.
             - Resets failure counter on success.
 
@@ -1584,74 +2068,50 @@ class SQLiteCacheTier(CacheTier):
 
         """
         try:
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
-                cursor = conn.execute("SELECT * FROM cache_entries WHERE key = ?", (key,))
-                row = cursor.fetchone()
+            with self._connection() as conn:
+                row = conn.execute(f"{_L3_SELECT} WHERE key = ?", (key,)).fetchone()
 
             if not row:
                 return None
 
-            # Map row to dict
-            columns = [
-                "key",
-                "proxy_url",
-                "username_encrypted",
-                "password_encrypted",
-                "source",
-                "fetch_time",
-                "last_accessed",
-                "access_count",
-                "ttl_seconds",
-                "expires_at",
-                "health_status",
-                "failure_count",
-                "created_at",
-                "updated_at",
-                # Health monitoring fields
-                "last_health_check",
-                "consecutive_health_failures",
-                "consecutive_health_successes",
-                "recovery_attempt",
-                "next_check_time",
-                "last_health_error",
-                "total_health_checks",
-                "total_health_check_failures",
-                "evicted_from_l1",
-            ]
-            data = dict(zip(columns, row, strict=True))
+            entry = self._row_to_entry(row)
+            self.reset_failures()
+            return entry
+        except Exception as e:
+            self.handle_failure(e)
+            return None
 
-            # Decrypt credentials
-            if data["username_encrypted"]:
-                data["username"] = self.encryptor.decrypt(data["username_encrypted"])
-            if data["password_encrypted"]:
-                data["password"] = self.encryptor.decrypt(data["password_encrypted"])
+    def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Retrieve several entries with batched ``IN (...)`` lookups.
 
-            # Convert timestamps
-            for field in [
-                "fetch_time",
-                "last_accessed",
-                "expires_at",
-                "created_at",
-                "updated_at",
-                "last_health_check",
-                "next_check_time",
-            ]:
-                if data.get(field) is not None:
-                    data[field] = datetime.fromtimestamp(data[field], tz=timezone.utc)
+        Args:
+            keys: Cache keys to lookup; duplicates are ignored.
 
-            # Convert boolean
-            if data.get("evicted_from_l1") is not None:
-                data["evicted_from_l1"] = bool(data["evicted_from_l1"])
+        Returns:
+            Mapping of found keys to entries; missing keys are absent. Empty on error.
 
-            # Remove encrypted fields
-            data.pop("username_encrypted")
-            data.pop("password_encrypted")
+        Raises:
+            Exception: Caught and handled via handle_failure(), returns {}.
 
+        """
+        try:
+            unique = list(dict.fromkeys(keys))
+            entries: dict[str, CacheEntry] = {}
+            with self._connection() as conn:
+                for start in range(0, len(unique), _SQLITE_IN_BATCH):
+                    batch = unique[start : start + _SQLITE_IN_BATCH]
+                    placeholders = ", ".join("?" for _ in batch)
+                    rows = conn.execute(
+                        f"{_L3_SELECT} WHERE key IN ({placeholders})", batch
+                    ).fetchall()
+                    for row in rows:
+                        entry = self._row_to_entry(row)
+                        entries[entry.key] = entry
             self.reset_failures()
-            return CacheEntry(**data)
+            return entries
         except Exception as e:
             self.handle_failure(e)
-            return None
+            return {}
 
     def put(self, key: str, entry: CacheEntry) -> bool:
         """Store entry in SQLite database with encrypted credentials.
@@ -1664,7 +2124,7 @@ class SQLiteCacheTier(CacheTier):
             True if stored successfully, False on error.
 
         Side Effects:
-            - Opens new SQLite connection for write.
+            - Runs the write on a pooled connection.
             - Encrypts username and password fields as BLOBs.
             - Uses INSERT OR REPLACE (upsert) to handle updates.
             - Sets created_at and updated_at to current timestamp.
@@ -1676,68 +2136,43 @@ class SQLiteCacheTier(CacheTier):
 
         """
         try:
-            # Encrypt credentials
-            username_encrypted = None
-            if entry.username:
-                username_encrypted = self.encryptor.encrypt(entry.username)
-            password_encrypted = None
-            if entry.password:
-                password_encrypted = self.encryptor.encrypt(entry.password)
+            params = self._entry_params(entry, datetime.now(timezone.utc).timestamp())
+            with self._connection() as conn, conn:
+                conn.execute(_L3_UPSERT, params)
 
-            # Convert timestamps to UNIX epoch
-            now = datetime.now(timezone.utc).timestamp()
+            self.reset_failures()
+            return True
+        except Exception as e:
+            self.handle_failure(e)
+            return False
 
-            # Helper to convert optional datetime to timestamp
-            def to_timestamp(dt: datetime | None) -> float | None:
-                return dt.timestamp() if dt is not None else None
+    def put_many(self, entries: Iterable[CacheEntry]) -> int:
+        """Store several entries in one transaction with ``executemany``.
 
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO cache_entries (
-                        key, proxy_url, username_encrypted, password_encrypted,
-                        source, fetch_time, last_accessed, access_count,
-                        ttl_seconds, expires_at, health_status, failure_count,
-                        created_at, updated_at,
-                        last_health_check, consecutive_health_failures, consecutive_health_successes,
-                        recovery_attempt, next_check_time, last_health_error,
-                        total_health_checks, total_health_check_failures, evicted_from_l1
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        entry.key,
-                        entry.proxy_url,
-                        username_encrypted,
-                        password_encrypted,
-                        entry.source,
-                        entry.fetch_time.timestamp(),
-                        entry.last_accessed.timestamp(),
-                        entry.access_count,
-                        entry.ttl_seconds,
-                        entry.expires_at.timestamp(),
-                        entry.health_status.value,
-                        entry.failure_count,
-                        now,
-                        now,
-                        # Health monitoring fields
-                        to_timestamp(entry.last_health_check),
-                        entry.consecutive_health_failures,
-                        entry.consecutive_health_successes,
-                        entry.recovery_attempt,
-                        to_timestamp(entry.next_check_time),
-                        entry.last_health_error,
-                        entry.total_health_checks,
-                        entry.total_health_check_failures,
-                        int(entry.evicted_from_l1),
-                    ),
-                )
-                conn.commit()
+        Entries are keyed by ``entry.key``. Either all entries are stored or,
+        on error, none are.
+
+        Args:
+            entries: CacheEntry objects to store.
+
+        Returns:
+            Number of entries stored, 0 on error.
+
+        Raises:
+            Exception: Caught and handled via handle_failure(), returns 0.
 
+        """
+        try:
+            now = datetime.now(timezone.utc).timestamp()
+            params = [self._entry_params(entry, now) for entry in entries]
+            if params:
+                with self._connection() as conn, conn:
+                    conn.executemany(_L3_UPSERT, params)
             self.reset_failures()
-            return True
+            return len(params)
         except Exception as e:
             self.handle_failure(e)
-            return False
+            return 0
 
     def delete(self, key: str) -> bool:
         """Remove entry from SQLite database by key.
@@ -1749,7 +2184,7 @@ class SQLiteCacheTier(CacheTier):
             True if entry existed and was deleted, False if not found.
 
         Side Effects:
-            - Opens new SQLite connection for deletion.
+            - Runs the deletion on a pooled connection.
             - Cascades to delete related health_history records via FOREIGN KEY.
             - Commits transaction before returning.
 
@@ -1758,10 +2193,9 @@ class SQLiteCacheTier(CacheTier):
 
         """
         try:
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
+            with self._connection() as conn, conn:
                 cursor = conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
                 deleted = cursor.rowcount > 0
-                conn.commit()
             return deleted
         except Exception as e:
             self.handle_failure(e)
@@ -1774,22 +2208,23 @@ class SQLiteCacheTier(CacheTier):
             Number of entries that were deleted.
 
         Side Effects:
-            - Opens new SQLite connection for operation.
+            - Runs the deletion on a pooled connection.
             - Deletes all rows from cache_entries table.
             - Cascades to delete all health_history records via FOREIGN KEY.
+            - Drops cached decrypted credentials.
             - Commits transaction before returning.
-            - Resets failure counter on success.
 
         Raises:
             Exception: Caught and handled via handle_failure(), returns 0.
 
         """
         try:
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
+            with self._connection() as conn, conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM cache_entries")
                 count: int = int(cursor.fetchone()[0])
                 conn.execute("DELETE FROM cache_entries")
-                conn.commit()
+            with self._credentials_lock:
+                self._credentials.clear()
             return count
         except Exception as e:
             self.handle_failure(e)
@@ -1802,17 +2237,15 @@ class SQLiteCacheTier(CacheTier):
             Count of entries in cache_entries table, 0 on error.
 
         Side Effects:
-            - Opens new SQLite connection for query.
-            - Resets failure counter on success.
+            - Runs the query on a pooled connection.
 
         Raises:
             Exception: Caught and handled via handle_failure(), returns 0.
 
         """
         try:
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM cache_entries")
-                result = cursor.fetchone()
+            with self._connection() as conn:
+                result = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()
             return int(result[0]) if result else 0
         except Exception as e:
             self.handle_failure(e)
@@ -1825,15 +2258,14 @@ class SQLiteCacheTier(CacheTier):
             List of all cache keys, empty list on error.
 
         Side Effects:
-            - Opens new SQLite connection for query.
-            - Resets failure counter on success.
+            - Runs the query on a pooled connection.
 
         Raises:
             Exception: Caught and handled via handle_failure(), returns [].
 
         """
         try:
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
+            with self._connection() as conn:
                 cursor = conn.execute("SELECT key FROM cache_entries")
                 result = [str(row[0]) for row in cursor.fetchall()]
             return result
@@ -1841,6 +2273,24 @@ class SQLiteCacheTier(CacheTier):
             self.handle_failure(e)
             return []
 
+    def __contains__(self, key: str) -> bool:
+        """Check if key exists with a primary-key lookup instead of listing all keys.
+
+        Args:
+            key: Cache key to check
+
+        Returns:
+            True if key exists, False otherwise (including on error)
+
+        """
+        try:
+            with self._connection() as conn:
+                row = conn.execute("SELECT 1 FROM cache_entries WHERE key = ?", (key,)).fetchone()
+            return row is not None
+        except Exception as e:
+            self.handle_failure(e)
+            return False
+
     def cleanup_expired(self) -> int:
         """Remove all expired entries in bulk using SQL DELETE.
 
@@ -1853,13 +2303,12 @@ class SQLiteCacheTier(CacheTier):
         """
         try:
             now = datetime.now(timezone.utc).timestamp()
-            with closing(sqlite3.connect(str(self.db_path))) as conn:
+            with self._connection() as conn, conn:
                 cursor = conn.execute(
                     "DELETE FROM cache_entries WHERE expires_at < ?",
                     (now,),
                 )
                 removed = cursor.rowcount
-                conn.commit()
             self.reset_failures()
             return removed
         except Exception as e:
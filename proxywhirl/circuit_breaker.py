@@ -17,7 +17,10 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from proxywhirl.models import CircuitBreakerConfig
+from proxywhirl.models import CircuitBreakerConfig, VersionCounter
+
+CIRCUIT_BREAKER_STATE_VERSION = VersionCounter()
+"""Bumped whenever the state or failure window of any circuit breaker changes."""
 
 
 class CircuitBreakerState(str, Enum):
@@ -103,6 +106,7 @@ class CircuitBreakerBase(BaseModel):
             # Test failed, reopen circuit
             self._half_open_pending = False
             self._transition_to_open(now)
+        CIRCUIT_BREAKER_STATE_VERSION.bump()
 
     def _do_record_success(self) -> None:
         """Core success recording logic (call while holding lock)."""
@@ -139,11 +143,13 @@ class CircuitBreakerBase(BaseModel):
         self.next_test_time = now + self.timeout_duration
         self.last_state_change = datetime.now(timezone.utc)
         self._half_open_pending = False
+        CIRCUIT_BREAKER_STATE_VERSION.bump()
 
     def _transition_to_half_open(self) -> None:
         """Transition to HALF_OPEN state."""
         self.state = CircuitBreakerState.HALF_OPEN
         self.last_state_change = datetime.now(timezone.utc)
+        CIRCUIT_BREAKER_STATE_VERSION.bump()
 
     def _transition_to_closed(self) -> None:
         """Transition to CLOSED state."""
@@ -153,6 +159,7 @@ class CircuitBreakerBase(BaseModel):
         self.next_test_time = None
         self.last_state_change = datetime.now(timezone.utc)
         self._half_open_pending = False
+        CIRCUIT_BREAKER_STATE_VERSION.bump()
 
 
 class CircuitBreaker(CircuitBreakerBase):
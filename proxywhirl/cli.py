@@ -6,10 +6,15 @@ Supports multiple output formats (text, JSON, CSV, YAML) with TTY-aware renderin
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
+import json
 import socket
 import sys
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -23,7 +28,14 @@ from typer.core import TyperGroup
 
 from proxywhirl.config import CLIConfig, discover_config, load_config
 from proxywhirl.formatters import OutputFormat as FormatterOutputFormat
-from proxywhirl.models import RequestResult
+from proxywhirl.models import (
+    PROXY_STATE_VERSION,
+    HealthStatus,
+    PoolSummary,
+    Proxy,
+    ProxyStatus,
+    RequestResult,
+)
 from proxywhirl.types import ConfigAction, PoolAction
 from proxywhirl.utils import CLILock, mask_proxy_url, public_proxy_url
 
@@ -1322,14 +1334,29 @@ def export(
         "--proxies-only",
         help="Only export proxy list",
     ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Regenerate and rewrite every file even if the database is unchanged",
+    ),
+    precompress: bool = typer.Option(
+        True,
+        "--precompress/--no-precompress",
+        help="Write .gz (and .br with brotli installed) siblings of changed files",
+    ),
 ) -> None:
     """Export proxy data and statistics for web dashboard.
 
+    Only files whose content changed are rewritten (see manifest.json in the
+    output directory), and nothing is regenerated if the database is unchanged
+    since the last export.
+
     Examples:
       proxywhirl export
       proxywhirl export --output ./exports
       proxywhirl export --stats-only
       proxywhirl export --proxies-only --db custom.db
+      proxywhirl export --full --no-precompress
     """
     import asyncio
 
@@ -1349,6 +1376,8 @@ def export(
                 output_dir=output,
                 include_stats=include_stats,
                 include_rich_proxies=include_proxies,
+                incremental=not full,
+                precompress=precompress,
             )
         )
 
@@ -1392,6 +1421,7 @@ async def _fetch_from_sources(
     timeout: int,
     max_concurrent: int,
     console: Console | None = None,
+    validation_filter: Any | None = None,
 ) -> list[Any]:
     """Fetch proxies from all configured sources with progress display.
 
@@ -1400,6 +1430,8 @@ async def _fetch_from_sources(
         timeout: Validation timeout in seconds
         max_concurrent: Maximum concurrent validation requests
         console: Rich console for progress display
+        validation_filter: Optional async callable selecting which fetched proxies
+            to validate (see ``ProxyFetcher.fetch_all``)
 
     Returns:
         List of fetched Proxy objects
@@ -1488,6 +1520,7 @@ async def _fetch_from_sources(
             max_concurrent=max_concurrent,
             fetch_progress_callback=fetch_progress,
             validate_progress_callback=validate_progress if validate else None,
+            validation_filter=validation_filter,
         )
 
         # Mark tasks complete
@@ -1498,7 +1531,57 @@ async def _fetch_from_sources(
     return result
 
 
-async def _save_results(proxies: list[Any], db_path: Path, validated: bool = True) -> None:
+async def _fetch_incremental(
+    db_path: Path,
+    fresh_hours: int,
+    timeout: int,
+    max_concurrent: int,
+    console: Console,
+) -> tuple[list[Any], set[str]]:
+    """Fetch from all sources, validating only proxies that are new or stale in the database.
+
+    Args:
+        db_path: Path to SQLite database file
+        fresh_hours: Stored proxies checked within this many hours are not re-validated
+        timeout: Validation timeout in seconds
+        max_concurrent: Maximum concurrent validation requests
+        console: Rich console for progress display
+
+    Returns:
+        Tuple of (valid proxy dicts, URLs of stored proxies that were re-validated)
+    """
+    from proxywhirl.storage import IncrementalIngestFilter, SQLiteStorage
+
+    storage = SQLiteStorage(db_path)
+    await storage.initialize()
+    try:
+        ingest_filter = IncrementalIngestFilter(storage, timedelta(hours=fresh_hours))
+        proxies = await _fetch_from_sources(
+            validate=True,
+            timeout=timeout,
+            max_concurrent=max_concurrent,
+            console=console,
+            validation_filter=ingest_filter,
+        )
+    finally:
+        await storage.close()
+
+    diff = ingest_filter.diff
+    if diff is None:
+        return proxies, set()
+    console.print(
+        f"[cyan]Incremental: validated {len(diff.new):,} new and {len(diff.stale):,} stale "
+        f"proxies, skipped {len(diff.fresh):,} checked within {fresh_hours}h[/cyan]"
+    )
+    return proxies, set(diff.stale)
+
+
+async def _save_results(
+    proxies: list[Any],
+    db_path: Path,
+    validated: bool = True,
+    revalidated_urls: set[str] | None = None,
+) -> None:
     """Save fetched proxies to database.
 
     Args:
@@ -1506,6 +1589,8 @@ async def _save_results(proxies: list[Any], db_path: Path, validated: bool = Tru
         db_path: Path to SQLite database file
         validated: If True, mark proxies as already validated (healthy status).
             Default is True since fetch validates before saving.
+        revalidated_urls: URLs of already-stored proxies that were validated in
+            this run; successes and failures are recorded against their status.
     """
     from proxywhirl.models import Proxy
     from proxywhirl.storage import SQLiteStorage
@@ -1520,6 +1605,20 @@ async def _save_results(proxies: list[Any], db_path: Path, validated: bool = Tru
                 proxy_objects.append(Proxy.model_validate(p))
             else:
                 proxy_objects.append(p)
+
+        if revalidated_urls:
+            # Existing proxies are skipped by save(), so record their outcome explicitly
+            validation_results: list[tuple[str, bool, float | None, str | None]] = [
+                (p.url, True, p.average_response_time_ms, None)
+                for p in proxy_objects
+                if p.url in revalidated_urls
+            ]
+            passed = {url for url, *_ in validation_results}
+            validation_results.extend(
+                (url, False, None, "validation_failed") for url in revalidated_urls - passed
+            )
+            await storage.record_validations_batch(validation_results)
+
         await storage.save(proxy_objects, validated=validated)
     finally:
         await storage.close()
@@ -1698,6 +1797,208 @@ async def _revalidate_existing_proxies(
         await storage.close()
 
 
+@dataclass
+class _RevalidationCheckpoint:
+    """Durable progress of a chunked ``fetch --revalidate`` run.
+
+    Written next to the database after every committed chunk and removed when
+    the run completes, so an interrupted run resumes after its last chunk.
+    """
+
+    checked_before: datetime
+    last_check_at: str | None = None
+    url: str | None = None
+    processed: int = 0
+    valid: int = 0
+    failed: int = 0
+
+    @staticmethod
+    def path_for(db_path: Path) -> Path:
+        """Return the checkpoint path for a database."""
+        return db_path.with_name(f"{db_path.name}.revalidate.json")
+
+    @classmethod
+    def load(cls, path: Path) -> _RevalidationCheckpoint | None:
+        """Load a checkpoint, or None if there is none.
+
+        An unreadable checkpoint is treated as absent: the run then starts over,
+        which only re-checks proxies that were already done.
+        """
+        try:
+            data = json.loads(path.read_text())
+            return cls(
+                checked_before=datetime.fromisoformat(data["checked_before"]),
+                last_check_at=data.get("last_check_at"),
+                url=data.get("url"),
+                processed=int(data.get("processed", 0)),
+                valid=int(data.get("valid", 0)),
+                failed=int(data.get("failed", 0)),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        """Atomically write the checkpoint."""
+        data = {
+            "checked_before": self.checked_before.isoformat(),
+            "last_check_at": self.last_check_at,
+            "url": self.url,
+            "processed": self.processed,
+            "valid": self.valid,
+            "failed": self.failed,
+        }
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(path)
+
+
+async def _revalidate_in_chunks(
+    db_path: Path,
+    timeout: int,
+    max_concurrent: int,
+    prune_failed: bool,
+    revalidate_limit: int | None,
+    chunk_size: int,
+    console: Any,
+) -> tuple[int, int]:
+    """Re-validate existing proxies chunk by chunk with bounded memory.
+
+    Candidates are paged oldest-first with a keyset cursor, each chunk is
+    validated and its results committed before the next page is read, and a
+    checkpoint is written after every chunk so an interrupted run resumes
+    where it stopped.
+
+    Args:
+        db_path: Path to SQLite database file
+        timeout: Validation timeout in seconds
+        max_concurrent: Maximum concurrent validation requests
+        prune_failed: If True, delete failed proxies. If False, mark them as DEAD.
+        revalidate_limit: Maximum proxies to revalidate per run (including resumed progress)
+        chunk_size: Proxies validated and committed per chunk
+        console: Rich console for progress display
+
+    Returns:
+        Tuple of (count of valid proxies, count of failed proxies)
+    """
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from proxywhirl.fetchers import ProxyValidator
+    from proxywhirl.storage import RevalidationCursor, SQLiteStorage
+
+    checkpoint_path = _RevalidationCheckpoint.path_for(db_path)
+    checkpoint = _RevalidationCheckpoint.load(checkpoint_path)
+    if checkpoint is None:
+        checkpoint = _RevalidationCheckpoint(checked_before=datetime.now(timezone.utc))
+    else:
+        console.print(
+            f"[cyan]Resuming re-validation started {checkpoint.checked_before:%Y-%m-%d %H:%M} "
+            f"UTC ({checkpoint.processed:,} proxies already done)[/cyan]"
+        )
+
+    storage = SQLiteStorage(db_path)
+    await storage.initialize()
+    validator = ProxyValidator(timeout=timeout, concurrency=max_concurrent)
+
+    try:
+        remaining = await storage.count_revalidation_candidates(checkpoint.checked_before)
+        if revalidate_limit is not None:
+            remaining = min(remaining, max(revalidate_limit - checkpoint.processed, 0))
+        if remaining == 0:
+            checkpoint_path.unlink(missing_ok=True)
+            console.print("[yellow]No proxies in database to re-validate[/yellow]")
+            return checkpoint.valid, checkpoint.failed
+        console.print(
+            f"[cyan]Re-validating {remaining:,} proxies in chunks of {chunk_size:,}[/cyan]"
+        )
+
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            MofNCompleteColumn(),
+            TextColumn("•"),
+            TimeElapsedColumn(),
+            TextColumn("{task.fields[status]}"),
+            console=console,
+            transient=False,
+        )
+        done_before_chunk = 0
+        valid_before_chunk = checkpoint.valid
+
+        def progress_callback(done: int, total: int, valid: int) -> None:
+            checked = done_before_chunk + done
+            valid_total = valid_before_chunk + valid
+            pct = (valid_total / checked * 100) if checked > 0 else 0
+            progress.update(
+                task_id,
+                completed=checked,
+                status=f"[green]{valid_total:,} valid[/green] ({pct:.1f}%)",
+            )
+
+        after = (
+            RevalidationCursor(checkpoint.last_check_at, checkpoint.url)
+            if checkpoint.url is not None
+            else None
+        )
+        with progress:
+            task_id = progress.add_task(
+                "Re-validating proxies", total=remaining, status="[cyan]starting...[/cyan]"
+            )
+            async for chunk, cursor in storage.iter_revalidation_candidates(
+                checkpoint.checked_before, after=after, chunk_size=chunk_size, limit=remaining
+            ):
+                validated = await validator.validate_batch(
+                    [{"url": p["url"], "protocol": p.get("protocol", "http")} for p in chunk],
+                    progress_callback=progress_callback,
+                )
+                valid_urls = {p["url"] for p in validated}
+                results: list[tuple[str, bool, float | None, str | None]] = [
+                    (p["url"], True, p.get("average_response_time_ms"), None) for p in validated
+                ]
+                results.extend(
+                    (p["url"], False, None, "validation_failed")
+                    for p in chunk
+                    if p["url"] not in valid_urls
+                )
+                await storage.record_validations_batch(results)
+
+                checkpoint.last_check_at = cursor.last_check_at
+                checkpoint.url = cursor.url
+                checkpoint.processed += len(chunk)
+                checkpoint.valid += len(valid_urls)
+                checkpoint.failed += len(chunk) - len(valid_urls)
+                checkpoint.save(checkpoint_path)
+                done_before_chunk += len(chunk)
+                valid_before_chunk = checkpoint.valid
+
+        if prune_failed and checkpoint.failed > 0:
+            await storage.cleanup(
+                remove_dead=True,
+                remove_stale_days=0,  # Don't remove stale
+                remove_never_validated=False,
+                vacuum=False,
+            )
+            console.print(f"[yellow]Deleted {checkpoint.failed} failed proxies[/yellow]")
+        else:
+            console.print(f"[yellow]Marked {checkpoint.failed} proxies as DEAD[/yellow]")
+
+        checkpoint_path.unlink(missing_ok=True)
+        return checkpoint.valid, checkpoint.failed
+
+    finally:
+        await validator.close()
+        await storage.close()
+
+
 def _display_summary(
     context: CommandContext,
     proxies: list[Any],
@@ -1759,11 +2060,30 @@ def fetch(
         "--revalidate-limit",
         help="Maximum proxies to re-validate in oldest-first order (0 = all; use with --revalidate)",
     ),
+    revalidate_chunk_size: int = typer.Option(
+        0,
+        "--revalidate-chunk-size",
+        help=(
+            "Re-validate in chunks of N proxies, committing each chunk and resuming an "
+            "interrupted run (0 = single batch; use with --revalidate)"
+        ),
+    ),
     prune_failed: bool = typer.Option(
         False,
         "--prune-failed",
         help="Delete failed proxies instead of marking them as DEAD (use with --revalidate)",
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        "-I",
+        help="Only validate proxies that are new or stale in the database",
+    ),
+    fresh_hours: int = typer.Option(
+        24,
+        "--fresh-hours",
+        help="Skip stored proxies checked within this many hours (use with --incremental)",
+    ),
     https_validate: bool = typer.Option(
         True,
         "--https-validate/--no-https-validate",
@@ -1788,7 +2108,9 @@ def fetch(
       proxywhirl fetch --timeout 5 --concurrency 50
       proxywhirl fetch --revalidate --timeout 5 --concurrency 2000
       proxywhirl fetch --revalidate --revalidate-limit 2000
+      proxywhirl fetch --revalidate --revalidate-chunk-size 5000
       proxywhirl fetch --revalidate --prune-failed
+      proxywhirl fetch --incremental --fresh-hours 6
       proxywhirl fetch --no-https-validate
       proxywhirl fetch --https-timeout 10
     """
@@ -1810,6 +2132,29 @@ def fetch(
         )
         raise typer.Exit(code=1)
 
+    if revalidate_chunk_size < 0:
+        command_ctx.console.print("[red]--revalidate-chunk-size must be >= 0[/red]")
+        raise typer.Exit(code=1)
+
+    if revalidate_chunk_size > 0 and not revalidate:
+        command_ctx.console.print(
+            "[red]--revalidate-chunk-size can only be used with --revalidate[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    if incremental and (revalidate or no_validate or no_save_db):
+        command_ctx.console.print(
+            "[red]--incremental cannot be combined with --revalidate, --no-validate "
+            "or --no-save-db[/red]"
+        )
+        raise typer.Exit(code=1)
+
+    if fresh_hours < 0:
+        command_ctx.console.print("[red]--fresh-hours must be >= 0[/red]")
+        raise typer.Exit(code=1)
+
+    revalidated_urls: set[str] | None = None
+
     if revalidate:
         # Re-validate existing proxies in database
         if effective_revalidate_limit is None:
@@ -1820,36 +2165,60 @@ def fetch(
                 f"(limit {effective_revalidate_limit:,})...[/bold]"
             )
         try:
-            valid_proxies, failed_count = asyncio.run(
-                _revalidate_existing_proxies(
-                    db_path=Path("proxywhirl.db"),
-                    timeout=fetch_config["timeout"],
-                    max_concurrent=fetch_config["max_concurrent"],
-                    prune_failed=prune_failed,
-                    revalidate_limit=effective_revalidate_limit,
-                    console=command_ctx.console,
+            if revalidate_chunk_size > 0:
+                valid_count, failed_count = asyncio.run(
+                    _revalidate_in_chunks(
+                        db_path=Path("proxywhirl.db"),
+                        timeout=fetch_config["timeout"],
+                        max_concurrent=fetch_config["max_concurrent"],
+                        prune_failed=prune_failed,
+                        revalidate_limit=effective_revalidate_limit,
+                        chunk_size=revalidate_chunk_size,
+                        console=command_ctx.console,
+                    )
                 )
-            )
+            else:
+                valid_proxies, failed_count = asyncio.run(
+                    _revalidate_existing_proxies(
+                        db_path=Path("proxywhirl.db"),
+                        timeout=fetch_config["timeout"],
+                        max_concurrent=fetch_config["max_concurrent"],
+                        prune_failed=prune_failed,
+                        revalidate_limit=effective_revalidate_limit,
+                        console=command_ctx.console,
+                    )
+                )
+                valid_count = len(valid_proxies)
             command_ctx.console.print(
                 f"[green]✓[/green] Re-validation complete: "
-                f"[green]{len(valid_proxies):,} valid[/green], "
+                f"[green]{valid_count:,} valid[/green], "
                 f"[red]{failed_count:,} failed[/red]"
             )
-            proxies = valid_proxies
         except Exception as e:
             command_ctx.console.print(f"[red]Re-validation failed:[/red] {e}")
             raise typer.Exit(code=1) from e
     else:
         # Normal mode: fetch from sources
         try:
-            proxies = asyncio.run(
-                _fetch_from_sources(
-                    validate=fetch_config["validate"],
-                    timeout=fetch_config["timeout"],
-                    max_concurrent=fetch_config["max_concurrent"],
-                    console=command_ctx.console,
+            if incremental:
+                proxies, revalidated_urls = asyncio.run(
+                    _fetch_incremental(
+                        db_path=Path("proxywhirl.db"),
+                        fresh_hours=fresh_hours,
+                        timeout=fetch_config["timeout"],
+                        max_concurrent=fetch_config["max_concurrent"],
+                        console=command_ctx.console,
+                    )
+                )
+            else:
+                proxies = asyncio.run(
+                    _fetch_from_sources(
+                        validate=fetch_config["validate"],
+                        timeout=fetch_config["timeout"],
+                        max_concurrent=fetch_config["max_concurrent"],
+                        console=command_ctx.console,
+                    )
                 )
-            )
         except Exception as e:
             command_ctx.console.print(f"[red]Fetch failed:[/red] {e}")
             raise typer.Exit(code=1) from e
@@ -1936,7 +2305,9 @@ def fetch(
         if not no_save_db:
             command_ctx.console.print("[bold]Saving to database...[/bold]")
             try:
-                asyncio.run(_save_results(proxies, Path("proxywhirl.db")))
+                asyncio.run(
+                    _save_results(proxies, Path("proxywhirl.db"), revalidated_urls=revalidated_urls)
+                )
                 command_ctx.console.print("[green]✓[/green] Saved to database")
             except Exception as e:
                 command_ctx.console.print(f"[red]Save failed:[/red] {e}")
@@ -2046,6 +2417,179 @@ def sources(
         raise typer.Exit(code=1)
 
 
+class _HealthChecker:
+    """Concurrent proxy health checks over one keep-alive client per proxy.
+
+    httpx binds the proxy to the client, so each proxy gets its own
+    ``AsyncClient`` that is kept open across checks; a semaphore bounds how
+    many checks run at once.
+    """
+
+    def __init__(self, test_url: str, timeout: float, verify: bool, concurrency: int) -> None:
+        """Initialize the checker.
+
+        Args:
+            test_url: URL requested through each proxy
+            timeout: Request timeout in seconds
+            verify: Whether to verify TLS certificates
+            concurrency: Maximum number of checks in flight
+        """
+        self.test_url = test_url
+        self.timeout = timeout
+        self.verify = verify
+        # Building an SSL context per client costs ~100 ms; share one across proxies
+        self._ssl_context = httpx.create_ssl_context(verify=verify)
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def _client_for(self, proxy: Proxy) -> httpx.AsyncClient:
+        """Return the keep-alive client routed through ``proxy``."""
+        client = self._clients.get(proxy.url)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy.url, timeout=self.timeout, verify=self._ssl_context
+            )
+            self._clients[proxy.url] = client
+        return client
+
+    async def check(self, proxy: Proxy) -> tuple[ProxyStatus, str]:
+        """Check one proxy and record the outcome on it.
+
+        Args:
+            proxy: Proxy to check
+
+        Returns:
+            Tuple of (status row, short detail: HTTP status code or error)
+        """
+        async with self._semaphore:
+            start_time = time.perf_counter()
+            try:
+                response = await self._client_for(proxy).get(self.test_url)
+            except Exception as e:
+                return _record_health_check(proxy, None, 0.0), str(e)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+        status = _record_health_check(proxy, response.status_code, elapsed_ms)
+        return status, str(response.status_code)
+
+    async def check_all(
+        self,
+        proxies: list[Proxy],
+        on_result: Callable[[Proxy, ProxyStatus, str], None] | None = None,
+    ) -> list[ProxyStatus]:
+        """Check all proxies concurrently, reporting each result as it completes.
+
+        Args:
+            proxies: Proxies to check
+            on_result: Optional callback invoked in completion order
+
+        Returns:
+            Status rows in the order of ``proxies``
+        """
+
+        async def run(index: int, proxy: Proxy) -> tuple[int, Proxy, ProxyStatus, str]:
+            status, detail = await self.check(proxy)
+            return index, proxy, status, detail
+
+        results: list[ProxyStatus | None] = [None] * len(proxies)
+        for next_done in asyncio.as_completed([run(i, p) for i, p in enumerate(proxies)]):
+            index, proxy, status, detail = await next_done
+            results[index] = status
+            if on_result is not None:
+                on_result(proxy, status, detail)
+        return [status for status in results if status is not None]
+
+    async def aclose(self) -> None:
+        """Close all per-proxy clients."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+def _record_health_check(proxy: Proxy, status_code: int | None, elapsed_ms: float) -> ProxyStatus:
+    """Apply a health check outcome to a proxy.
+
+    Args:
+        proxy: Proxy that was checked
+        status_code: HTTP status returned through the proxy, or None if the request failed
+        elapsed_ms: Request duration in milliseconds
+
+    Returns:
+        Status row for display
+    """
+    now = datetime.now(timezone.utc)
+    proxy.total_requests += 1
+    if status_code == 200:
+        proxy.health_status = HealthStatus.HEALTHY
+        proxy.last_success_at = now
+        proxy.total_successes += 1
+        proxy.consecutive_failures = 0
+    else:
+        proxy.health_status = (
+            HealthStatus.UNHEALTHY if status_code is None else HealthStatus.DEGRADED
+        )
+        proxy.last_failure_at = now
+        proxy.total_failures += 1
+        proxy.consecutive_failures += 1
+    if status_code is not None:
+        proxy.average_response_time_ms = elapsed_ms
+    # Direct field writes do not advance pool versions on their own
+    PROXY_STATE_VERSION.bump()
+
+    return ProxyStatus(
+        url=proxy.url,
+        health=proxy.health_status,
+        response_time_ms=elapsed_ms,
+        success_rate=proxy.success_rate,
+    )
+
+
+async def _monitor_health(
+    checker: _HealthChecker,
+    proxies: list[Proxy],
+    interval: float,
+    on_result: Callable[[Proxy, ProxyStatus, str], None],
+    on_summary: Callable[[list[ProxyStatus]], None],
+) -> None:
+    """Re-check each proxy on its own schedule until cancelled.
+
+    Every proxy is re-checked ``interval`` seconds after its previous check
+    started, so slow or failing proxies do not delay the others. A summary of
+    the latest status of every proxy is reported once per interval.
+
+    Args:
+        checker: Health checker bounding concurrency
+        proxies: Proxies to monitor
+        interval: Seconds between checks of the same proxy
+        on_result: Callback invoked after every check
+        on_summary: Callback receiving the latest status of every checked proxy
+    """
+    latest: dict[str, ProxyStatus] = {}
+
+    async def watch(proxy: Proxy) -> None:
+        while True:
+            started = time.monotonic()
+            status, detail = await checker.check(proxy)
+            latest[proxy.url] = status
+            on_result(proxy, status, detail)
+            await asyncio.sleep(max(0.0, started + interval - time.monotonic()))
+
+    async def summarize() -> None:
+        while True:
+            await asyncio.sleep(interval)
+            on_summary(list(latest.values()))
+
+    await asyncio.gather(*(watch(proxy) for proxy in proxies), summarize())
+
+
+def _health_color(health: str) -> str:
+    """Rich color for a health status."""
+    if health == HealthStatus.HEALTHY:
+        return "green"
+    if health == HealthStatus.DEGRADED:
+        return "yellow"
+    return "red"
+
+
 @app.command()
 def health(
     continuous: bool = typer.Option(False, "--continuous", "-C", help="Run continuously"),
@@ -2058,24 +2602,23 @@ def health(
         "--allow-private",
         help="Allow testing against localhost/private IPs (use with caution)",
     ),
+    concurrency: int = typer.Option(
+        20,
+        "--concurrency",
+        help="Maximum number of proxies checked at the same time",
+        min=1,
+    ),
 ) -> None:
     """Check health of all proxies in the pool.
 
     Examples:
       proxywhirl health
+      proxywhirl health --concurrency 50
       proxywhirl health --continuous --interval 60
       proxywhirl health -C -i 60
       proxywhirl health --target-url https://api.example.com
       proxywhirl health --target-url http://localhost:8080 --allow-private
     """
-    import time
-    from datetime import datetime, timezone
-
-    import httpx
-
-    from proxywhirl.models import HealthStatus, PoolSummary, Proxy, ProxyStatus
-    from proxywhirl.rotator import ProxyWhirl
-
     command_ctx = get_context()
 
     # Validate target URL if provided
@@ -2101,160 +2644,123 @@ def health(
         command_ctx.console.print("Add proxies using: proxywhirl pool add <URL>")
         raise typer.Exit(code=0)
 
+    from proxywhirl.rotator import ProxyWhirl
+
     rotator = ProxyWhirl(proxies=proxies, strategy=command_ctx.config.rotation_strategy)
     check_interval = interval if interval is not None else command_ctx.config.health_check_interval
+    # Use thread-safe snapshot
+    pool_proxies = rotator.pool.get_all_proxies()
 
-    def check_health() -> list[ProxyStatus]:
-        """Check health of all proxies."""
-        results = []
-        # Use thread-safe snapshot
-        for proxy in rotator.pool.get_all_proxies():
-            try:
-                start_time = time.time()
-                with httpx.Client(
-                    proxy=proxy.url,
-                    timeout=command_ctx.config.timeout,
-                    verify=command_ctx.config.verify_ssl,
-                ) as client:
-                    response = client.get(test_url)
-
-                elapsed_ms = (time.time() - start_time) * 1000
-                is_healthy = response.status_code == 200
-
-                # Update proxy health
-                proxy.health_status = HealthStatus.HEALTHY if is_healthy else HealthStatus.DEGRADED
-                if is_healthy:
-                    proxy.last_success_at = datetime.now(timezone.utc)
-                    proxy.total_successes += 1
-                    proxy.consecutive_failures = 0
-                else:
-                    proxy.last_failure_at = datetime.now(timezone.utc)
-                    proxy.total_failures += 1
-                    proxy.consecutive_failures += 1
-
-                proxy.total_requests += 1
-                proxy.average_response_time_ms = elapsed_ms
-
-                results.append(
-                    ProxyStatus(
-                        url=proxy.url,
-                        health=proxy.health_status,
-                        response_time_ms=elapsed_ms,
-                        success_rate=proxy.success_rate,
-                    )
-                )
-
-                if command_ctx.verbose:
-                    command_ctx.console.print(
-                        f"✓ {proxy.url}: {response.status_code} ({elapsed_ms:.0f}ms)"
-                    )
-
-            except Exception as e:
-                # Mark as unhealthy
-                proxy.health_status = HealthStatus.UNHEALTHY
-                proxy.last_failure_at = datetime.now(timezone.utc)
-                proxy.total_failures += 1
-                proxy.total_requests += 1
-                proxy.consecutive_failures += 1
-
-                results.append(
-                    ProxyStatus(
-                        url=proxy.url,
-                        health=HealthStatus.UNHEALTHY,
-                        response_time_ms=0,
-                        success_rate=proxy.success_rate,
-                    )
-                )
-
-                if command_ctx.verbose:
-                    command_ctx.console.print(f"✗ {proxy.url}: {e}")
+    def print_result(proxy: Proxy, status: ProxyStatus, detail: str) -> None:
+        color = _health_color(status.health)
+        mark = "✓" if status.health == HealthStatus.HEALTHY else "✗"
+        command_ctx.console.print(
+            f"  [{color}]●[/{color}] {status.url} "
+            f"({status.response_time_ms or 0:.0f}ms, {status.success_rate * 100:.0f}% success)"
+            + (f" [dim]{mark} {detail}[/dim]" if command_ctx.verbose else "")
+        )
 
-        return results
+    async def run_checks(
+        on_result: Callable[[Proxy, ProxyStatus, str], None] | None,
+    ) -> list[ProxyStatus]:
+        checker = _HealthChecker(
+            test_url, command_ctx.config.timeout, command_ctx.config.verify_ssl, concurrency
+        )
+        try:
+            return await checker.check_all(pool_proxies, on_result)
+        finally:
+            await checker.aclose()
 
     # Single check mode
     if not continuous:
-        command_ctx.console.print("\n[bold]Checking proxy health...[/bold]\n")
-        results = check_health()
-
-        # Display results
-        summary = PoolSummary(
-            total_proxies=len(results),
-            healthy=sum(1 for r in results if r.health == HealthStatus.HEALTHY),
-            degraded=sum(1 for r in results if r.health == HealthStatus.DEGRADED),
-            failed=sum(
-                1 for r in results if r.health in (HealthStatus.UNHEALTHY, HealthStatus.DEAD)
-            ),
-            rotation_strategy=command_ctx.config.rotation_strategy,
-            current_index=0,
-            proxies=results,
-        )
-
         if command_ctx.format == FormatterOutputFormat.JSON:
-            render_json(summary.model_dump())
+            results = asyncio.run(run_checks(None))
+            render_json(_health_summary(results, command_ctx.config.rotation_strategy).model_dump())
         elif command_ctx.format == FormatterOutputFormat.CSV:
             import csv
-            import sys
 
             writer = csv.DictWriter(
                 sys.stdout, fieldnames=["url", "health", "response_time_ms", "success_rate"]
             )
             writer.writeheader()
-            writer.writerows([r.model_dump() for r in results])
-        else:  # TEXT
-            command_ctx.console.print("[bold]Health Check Results[/bold]")
+
+            def write_row(proxy: Proxy, status: ProxyStatus, detail: str) -> None:
+                writer.writerow(
+                    status.model_dump(include={"url", "health", "response_time_ms", "success_rate"})
+                )
+                sys.stdout.flush()
+
+            asyncio.run(run_checks(write_row))
+        else:  # TEXT: rows stream in as checks complete, summary follows
+            command_ctx.console.print(
+                f"\n[bold]Checking proxy health ({len(pool_proxies)} proxies, "
+                f"concurrency {concurrency})...[/bold]\n"
+            )
+            results = asyncio.run(run_checks(print_result))
+            summary = _health_summary(results, command_ctx.config.rotation_strategy)
+            command_ctx.console.print("\n[bold]Health Check Results[/bold]")
             command_ctx.console.print(
                 f"Healthy: [green]{summary.healthy}[/green] | "
                 f"Degraded: [yellow]{summary.degraded}[/yellow] | "
-                f"Failed: [red]{summary.failed}[/red]\n"
+                f"Failed: [red]{summary.failed}[/red]"
             )
 
-            for r in results:
-                health_color = (
-                    "green"
-                    if r.health == HealthStatus.HEALTHY
-                    else "yellow"
-                    if r.health == HealthStatus.DEGRADED
-                    else "red"
-                )
-                command_ctx.console.print(
-                    f"  [{health_color}]●[/{health_color}] {r.url} "
-                    f"({r.response_time_ms:.0f}ms, {r.success_rate * 100:.0f}% success)"
-                )
-
     # Continuous monitoring mode
     else:
         command_ctx.console.print(
-            f"\n[bold]Continuous health monitoring (interval: {check_interval}s)[/bold]"
+            f"\n[bold]Continuous health monitoring (interval: {check_interval}s, "
+            f"concurrency {concurrency})[/bold]"
         )
         command_ctx.console.print("Press Ctrl+C to stop\n")
 
-        try:
-            iteration = 0
-            while True:
-                iteration += 1
-                command_ctx.console.print(f"\n[dim]Check #{iteration}[/dim]")
-                results = check_health()
-
-                # Display brief summary
-                healthy = sum(1 for r in results if r.health == HealthStatus.HEALTHY)
-                degraded = sum(1 for r in results if r.health == HealthStatus.DEGRADED)
-                failed = sum(
-                    1 for r in results if r.health in (HealthStatus.UNHEALTHY, HealthStatus.DEAD)
-                )
+        last_health: dict[str, str] = {}
 
-                command_ctx.console.print(
-                    f"Status: [green]{healthy} healthy[/green] | "
-                    f"[yellow]{degraded} degraded[/yellow] | "
-                    f"[red]{failed} failed[/red]"
-                )
+        def report_change(proxy: Proxy, status: ProxyStatus, detail: str) -> None:
+            # Only print proxies whose health changed (every check when verbose)
+            if command_ctx.verbose or last_health.get(status.url) != status.health:
+                print_result(proxy, status, detail)
+            last_health[status.url] = status.health
+
+        def print_summary(results: list[ProxyStatus]) -> None:
+            summary = _health_summary(results, command_ctx.config.rotation_strategy)
+            command_ctx.console.print(
+                f"[dim]{datetime.now().strftime('%H:%M:%S')}[/dim] "
+                f"Status: [green]{summary.healthy} healthy[/green] | "
+                f"[yellow]{summary.degraded} degraded[/yellow] | "
+                f"[red]{summary.failed} failed[/red]"
+            )
 
-                time.sleep(check_interval)
+        async def monitor() -> None:
+            checker = _HealthChecker(
+                test_url, command_ctx.config.timeout, command_ctx.config.verify_ssl, concurrency
+            )
+            try:
+                await _monitor_health(
+                    checker, pool_proxies, check_interval, report_change, print_summary
+                )
+            finally:
+                await checker.aclose()
 
+        try:
+            asyncio.run(monitor())
         except KeyboardInterrupt:
             command_ctx.console.print("\n[yellow]Monitoring stopped[/yellow]")
             raise typer.Exit(code=0)
 
 
+def _health_summary(results: list[ProxyStatus], rotation_strategy: str) -> PoolSummary:
+    """Aggregate health check results into a pool summary."""
+    return PoolSummary(
+        total_proxies=len(results),
+        healthy=sum(1 for r in results if r.health == HealthStatus.HEALTHY),
+        degraded=sum(1 for r in results if r.health == HealthStatus.DEGRADED),
+        failed=sum(1 for r in results if r.health in (HealthStatus.UNHEALTHY, HealthStatus.DEAD)),
+        rotation_strategy=rotation_strategy,
+        current_index=0,
+        proxies=results,
+    )
+
+
 @app.command()
 def validate_proxy(
     proxy_url: str = typer.Argument(
@@ -0,0 +1,948 @@
+"""Columnar proxy pool for very large pools.
+
+:class:`ColumnarProxyPool` keeps per-proxy state in typed :mod:`array` columns
+and an interned URL table instead of one :class:`~proxywhirl.models.Proxy`
+model per entry, and maintains its pool-wide statistics incrementally.
+
+Example:
+    >>> pool = ColumnarProxyPool(proxies=proxies)
+    >>> pool.record_success("http://1.2.3.4:8080", response_time_ms=120.0)
+    >>> pool.healthy_count, pool.overall_success_rate
+    (1, 1.0)
+    >>> fast_us = pool.filter_proxies(country_code="US", limit=10)
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import threading
+import time
+from array import array
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import accumulate, compress, islice
+from typing import Any, TypeVar, cast
+from uuid import UUID
+
+from proxywhirl.exceptions import ProxyPoolEmptyError
+from proxywhirl.models import HealthStatus, Proxy, ProxySource, VersionCounter
+
+_T = TypeVar("_T")
+
+_HEALTH_STATUSES: tuple[HealthStatus, ...] = tuple(HealthStatus)
+_HEALTH_CODES = {status: code for code, status in enumerate(_HEALTH_STATUSES)}
+_SOURCES: tuple[ProxySource, ...] = tuple(ProxySource)
+_SOURCE_CODES = {source: code for code, source in enumerate(_SOURCES)}
+_PROTOCOLS: tuple[str | None, ...] = (None, "http", "https", "socks4", "socks5", "socks5h")
+_PROTOCOL_CODES = {protocol: code for code, protocol in enumerate(_PROTOCOLS)}
+
+# Columns: unsigned counters, floats (NaN for None) and timestamps as UTC epoch
+# seconds (NaN for None; NaN never compares greater, so it never expires)
+_COUNTER_FIELDS = (
+    "requests_started",
+    "requests_completed",
+    "requests_active",
+    "total_requests",
+    "total_successes",
+    "total_failures",
+    "consecutive_failures",
+    "consecutive_successes",
+    "total_checks",
+)
+_FLOAT_FIELDS = ("average_response_time_ms", "ema_response_time_ms")
+_TIME_FIELDS = (
+    "created_at",
+    "updated_at",
+    "last_success_at",
+    "last_failure_at",
+    "last_health_check",
+    "expires_at",
+)
+_COLUMN_FIELDS = frozenset(
+    {
+        "id",
+        "url",
+        "protocol",
+        "health_status",
+        "source",
+        "country_code",
+        *_COUNTER_FIELDS,
+        *_FLOAT_FIELDS,
+        *_TIME_FIELDS,
+    }
+)
+# Remaining fields are stored per row only when they differ from the default
+_SPARSE_DEFAULTS = {
+    name: info.get_default(call_default_factory=True)
+    for name, info in Proxy.model_fields.items()
+    if name not in _COLUMN_FIELDS
+}
+
+# Health states served by get_healthy_proxies / select (same as ProxyPool)
+_AVAILABLE = frozenset({HealthStatus.HEALTHY, HealthStatus.UNKNOWN, HealthStatus.DEGRADED})
+_KEPT_BY_CLEAR_UNHEALTHY = frozenset(HealthStatus) - {HealthStatus.DEAD, HealthStatus.UNHEALTHY}
+_INVERT = bytes([1, 0]) + bytes(254)
+
+
+def _code_table(codes: Iterable[int]) -> bytes:
+    """``bytes.translate`` table mapping the given one-byte codes to 1, others to 0."""
+    wanted = set(codes)
+    return bytes(1 if code in wanted else 0 for code in range(256))
+
+
+def _as_collection(value: _T | Collection[_T]) -> Collection[_T]:
+    """Wrap a scalar filter value (strings and enums are scalars)."""
+    if isinstance(value, (str, bytes)) or not isinstance(value, Collection):
+        return (cast(_T, value),)
+    return cast(Collection[_T], value)
+
+
+def _to_epoch(value: datetime | None) -> float:
+    """UTC epoch seconds for a datetime (naive values are UTC), NaN for None."""
+    if value is None:
+        return math.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _from_epoch(value: float) -> datetime | None:
+    """Aware UTC datetime for epoch seconds, None for NaN."""
+    if math.isnan(value):
+        return None
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy mutable field values so rows and materialized proxies never alias."""
+    if isinstance(value, set):
+        return value.copy()
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+@dataclass
+class PoolColumns:
+    """Per-row columns of a pool in the layout used by :class:`ColumnarProxyPool`.
+
+    The bulk interchange format between pools and
+    :mod:`proxywhirl.pool_snapshot`. Every column has one entry per row, in the
+    same row order as ``urls``.
+
+    Attributes:
+        urls: Proxy URLs (unique)
+        ids: Proxy UUIDs, 16 bytes per row
+        health: Index into ``HealthStatus``, one byte per row
+        source: Index into ``ProxySource``, one byte per row
+        protocol: Index into ``(None, "http", "https", "socks4", "socks5", "socks5h")``
+        country: Index into ``countries`` (``array("H")``)
+        countries: Interned country codes; entry 0 is None
+        counters: Request and health counters (``array("I")`` per field)
+        floats: Response times and timestamps as UTC epoch seconds
+            (``array("d")`` per field, NaN for None)
+        sparse: Remaining fields of rows where they differ from the defaults
+    """
+
+    urls: list[str]
+    ids: bytearray
+    health: bytearray
+    source: bytearray
+    protocol: bytearray
+    country: array[int]
+    countries: list[str | None]
+    counters: dict[str, array[int]]
+    floats: dict[str, array[float]]
+    sparse: dict[int, dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    @classmethod
+    def from_proxies(cls, proxies: Iterable[Proxy]) -> PoolColumns:
+        """Encode proxies one column at a time; later duplicates of a URL are skipped."""
+        by_url: dict[str, dict[str, Any]] = {}
+        for proxy in proxies:
+            by_url.setdefault(proxy.url, proxy.__dict__)
+        rows = list(by_url.values())
+
+        countries: list[str | None] = [None]
+        country_codes: dict[str | None, int] = {None: 0}
+        country = array("H")
+        for fields in rows:
+            code = country_codes.get(fields["country_code"])
+            if code is None:
+                code = country_codes[fields["country_code"]] = len(countries)
+                countries.append(fields["country_code"])
+            country.append(code)
+
+        sparse: dict[int, dict[str, Any]] = {}
+        for row, fields in enumerate(rows):
+            changed = {
+                name: _copy_value(value)
+                for name, default in _SPARSE_DEFAULTS.items()
+                if (value := fields[name]) != default
+            }
+            if changed:
+                sparse[row] = changed
+
+        floats = {
+            name: array("d", [math.nan if (value := f[name]) is None else value for f in rows])
+            for name in _FLOAT_FIELDS
+        }
+        floats.update(
+            (name, array("d", [_to_epoch(f[name]) for f in rows])) for name in _TIME_FIELDS
+        )
+        return cls(
+            urls=list(by_url),
+            ids=bytearray().join(f["id"].bytes for f in rows),
+            health=bytearray(_HEALTH_CODES[f["health_status"]] for f in rows),
+            source=bytearray(_SOURCE_CODES[f["source"]] for f in rows),
+            protocol=bytearray(_PROTOCOL_CODES[f["protocol"]] for f in rows),
+            country=country,
+            countries=countries,
+            counters={name: array("I", [f[name] for f in rows]) for name in _COUNTER_FIELDS},
+            floats=floats,
+            sparse=sparse,
+        )
+
+
+class ColumnarProxyPool:
+    """Memory-compact proxy pool for hundreds of thousands to millions of proxies.
+
+    Health, protocol, source and country are one- or two-byte codes, counters are
+    32-bit, latencies and timestamps are doubles, and URLs live in an interned
+    table with a URL-to-row index. Fields that are usually at their defaults
+    (credentials, tags, metadata, region, ...) are stored only for rows that set
+    them. A pooled proxy takes roughly 10x less memory than a
+    :class:`~proxywhirl.models.Proxy` in a :class:`~proxywhirl.models.ProxyPool`.
+
+    Health/source counts and request totals are maintained on every change, so
+    ``healthy_count``, ``total_requests``, ``overall_success_rate`` and the
+    breakdowns are O(1); filters build byte masks over whole columns in C.
+
+    Proxies returned by this pool are materialized copies built with
+    :meth:`Proxy.from_trusted`. Changes made to them are not seen by the pool
+    until written back with :meth:`update_proxy`; :meth:`record_success`,
+    :meth:`record_failure` and :meth:`set_health_status` update rows in place.
+    Timestamps come back as aware UTC datetimes.
+
+    Thread-safe: all operations take a reentrant lock. Removing a single proxy
+    moves the last row into its slot, so iteration follows insertion order only
+    until the first single removal (bulk clears keep the order).
+
+    Attributes:
+        name: Pool name
+        max_pool_size: Maximum number of proxies (None for no limit)
+        created_at: When the pool was created
+        updated_at: When proxies were last added, removed or updated
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        proxies: Iterable[Proxy] = (),
+        max_pool_size: int | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            name: Pool name
+            proxies: Initial proxies (duplicate URLs are ignored)
+            max_pool_size: Maximum number of proxies (None for no limit)
+
+        Raises:
+            ValueError: If ``proxies`` exceeds ``max_pool_size``
+        """
+        self.name = name
+        self.max_pool_size = max_pool_size
+        self.created_at = datetime.now(timezone.utc)
+        self.updated_at = self.created_at
+        self._lock = threading.RLock()
+        self._version = VersionCounter()
+
+        self._urls: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._ids = bytearray()
+        self._health = bytearray()
+        self._source = bytearray()
+        self._protocol = bytearray()
+        self._country = array("H")
+        self._countries: list[str | None] = [None]
+        self._country_codes: dict[str | None, int] = {None: 0}
+        self._counters = {name: array("I") for name in _COUNTER_FIELDS}
+        self._floats = {name: array("d") for name in (*_FLOAT_FIELDS, *_TIME_FIELDS)}
+        self._sparse: dict[int, dict[str, Any]] = {}
+
+        self._health_counts = [0] * len(_HEALTH_STATUSES)
+        self._source_counts = [0] * len(_SOURCES)
+        self._total_requests = 0
+        self._total_successes = 0
+
+        self.add_proxies(proxies)
+
+    # ------------------------------------------------------------------
+    # Pool statistics (O(1))
+    # ------------------------------------------------------------------
+
+    @property
+    def version(self) -> int:
+        """Monotonically increasing version, bumped on every change to the pool."""
+        return self._version.value
+
+    def bump_version(self) -> None:
+        """Mark the pool as changed."""
+        self._version.bump()
+
+    @property
+    def size(self) -> int:
+        """Number of proxies in the pool."""
+        with self._lock:
+            return len(self._urls)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def healthy_count(self) -> int:
+        """Number of HEALTHY proxies."""
+        with self._lock:
+            return self._health_counts[_HEALTH_CODES[HealthStatus.HEALTHY]]
+
+    @property
+    def unhealthy_count(self) -> int:
+        """Number of proxies that are not HEALTHY."""
+        with self._lock:
+            return len(self._urls) - self._health_counts[_HEALTH_CODES[HealthStatus.HEALTHY]]
+
+    @property
+    def total_requests(self) -> int:
+        """Sum of ``total_requests`` over all proxies."""
+        with self._lock:
+            return self._total_requests
+
+    @property
+    def overall_success_rate(self) -> float:
+        """Pool-wide successes divided by requests (0.0 without requests)."""
+        with self._lock:
+            if self._total_requests == 0:
+                return 0.0
+            return self._total_successes / self._total_requests
+
+    def get_source_breakdown(self) -> dict[str, int]:
+        """Count proxies by source value (sources without proxies are omitted)."""
+        with self._lock:
+            return {
+                source.value: count
+                for source, count in zip(_SOURCES, self._source_counts, strict=True)
+                if count
+            }
+
+    def get_health_breakdown(self) -> dict[str, int]:
+        """Count proxies by health status value (statuses without proxies are omitted)."""
+        with self._lock:
+            return {
+                status.value: count
+                for status, count in zip(_HEALTH_STATUSES, self._health_counts, strict=True)
+                if count
+            }
+
+    # ------------------------------------------------------------------
+    # Membership
+    # ------------------------------------------------------------------
+
+    def add_proxy(self, proxy: Proxy) -> None:
+        """Add a proxy; duplicate URLs are silently ignored.
+
+        Raises:
+            ValueError: If the pool is at ``max_pool_size``
+        """
+        self.add_proxies((proxy,))
+
+    def add_proxies(self, proxies: Iterable[Proxy]) -> int:
+        """Add proxies under one lock acquisition; duplicate URLs are skipped.
+
+        Args:
+            proxies: Proxies to add
+
+        Returns:
+            Number of proxies added
+
+        Raises:
+            ValueError: If the pool reaches ``max_pool_size`` (proxies before
+                the one that did not fit stay added)
+        """
+        added = 0
+        with self._lock:
+            try:
+                for proxy in proxies:
+                    if proxy.url in self._rows:
+                        continue
+                    if self.max_pool_size is not None and len(self._urls) >= self.max_pool_size:
+                        raise ValueError(f"Pool at maximum capacity ({self.max_pool_size})")
+                    self._append(proxy)
+                    added += 1
+            finally:
+                if added:
+                    self._touch()
+        return added
+
+    def remove_proxy(self, proxy_id: UUID) -> None:
+        """Remove the proxy with ``proxy_id``; unknown IDs are ignored."""
+        with self._lock:
+            row = self._find_id(proxy_id)
+            if row is None:
+                return
+            self._remove_row(row)
+            self._touch()
+
+    def has_proxy_url(self, proxy_url: str) -> bool:
+        """Whether a proxy with this exact URL is in the pool (O(1))."""
+        with self._lock:
+            return proxy_url in self._rows
+
+    def get_proxy_by_url(self, proxy_url: str) -> Proxy | None:
+        """Materialize the proxy with this URL, or None."""
+        with self._lock:
+            row = self._rows.get(proxy_url)
+            return None if row is None else self._materialize(row)
+
+    def get_proxy_by_id(self, proxy_id: UUID) -> Proxy | None:
+        """Materialize the proxy with this ID, or None (scans the packed ID column)."""
+        with self._lock:
+            row = self._find_id(proxy_id)
+            return None if row is None else self._materialize(row)
+
+    def get_all_proxies(self) -> list[Proxy]:
+        """Materialize every proxy (prefer :meth:`iter_batches` for large pools)."""
+        with self._lock:
+            return [self._materialize(row) for row in range(len(self._urls))]
+
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[list[Proxy]]:
+        """Iterate over materialized proxies in batches, locking per batch.
+
+        Weakly consistent: unlike :meth:`ProxyPool.iter_batches` no snapshot is
+        taken, so rows removed or moved between batches may be missed or repeated.
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        offset = 0
+        while True:
+            with self._lock:
+                end = min(offset + batch_size, len(self._urls))
+                batch = [self._materialize(row) for row in range(offset, end)]
+            if not batch:
+                return
+            offset = end
+            yield batch
+
+    # ------------------------------------------------------------------
+    # Bulk export / import
+    # ------------------------------------------------------------------
+
+    def export_columns(self) -> PoolColumns:
+        """Copy the pool's columns without materializing any proxy."""
+        with self._lock:
+            return PoolColumns(
+                urls=self._urls.copy(),
+                ids=self._ids.copy(),
+                health=self._health.copy(),
+                source=self._source.copy(),
+                protocol=self._protocol.copy(),
+                country=self._country[:],
+                countries=self._countries.copy(),
+                counters={name: column[:] for name, column in self._counters.items()},
+                floats={name: column[:] for name, column in self._floats.items()},
+                sparse={
+                    row: {name: _copy_value(value) for name, value in fields.items()}
+                    for row, fields in self._sparse.items()
+                },
+            )
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: PoolColumns,
+        name: str = "default",
+        max_pool_size: int | None = None,
+    ) -> ColumnarProxyPool:
+        """Build a pool that takes over ``columns`` (they are not copied).
+
+        Only the URL index and the aggregates are computed, so this is far
+        cheaper than adding proxies one by one.
+
+        Raises:
+            ValueError: If the columns differ in length, repeat a URL or exceed
+                ``max_pool_size``
+        """
+        size = len(columns.urls)
+        lengths = {
+            len(columns.ids) // 16,
+            len(columns.health),
+            len(columns.source),
+            len(columns.protocol),
+            len(columns.country),
+            *map(len, columns.counters.values()),
+            *map(len, columns.floats.values()),
+        }
+        if (
+            lengths - {size}
+            or columns.counters.keys() != set(_COUNTER_FIELDS)
+            or columns.floats.keys() != {*_FLOAT_FIELDS, *_TIME_FIELDS}
+        ):
+            raise ValueError("Columns do not describe the same rows")
+        if max_pool_size is not None and size > max_pool_size:
+            raise ValueError(f"Pool at maximum capacity ({max_pool_size})")
+        rows = {url: row for row, url in enumerate(columns.urls)}
+        if len(rows) != size:
+            raise ValueError("Columns contain duplicate URLs")
+
+        pool = cls(name=name, max_pool_size=max_pool_size)
+        pool._urls = columns.urls
+        pool._rows = rows
+        pool._ids = columns.ids
+        pool._health = columns.health
+        pool._source = columns.source
+        pool._protocol = columns.protocol
+        pool._country = columns.country
+        pool._countries = columns.countries
+        pool._country_codes = {code: index for index, code in enumerate(columns.countries)}
+        pool._counters = {name: columns.counters[name] for name in _COUNTER_FIELDS}
+        pool._floats = {name: columns.floats[name] for name in (*_FLOAT_FIELDS, *_TIME_FIELDS)}
+        pool._sparse = columns.sparse
+        pool._health_counts = [columns.health.count(code) for code in range(len(_HEALTH_STATUSES))]
+        pool._source_counts = [columns.source.count(code) for code in range(len(_SOURCES))]
+        pool._total_requests = sum(pool._counters["total_requests"])
+        pool._total_successes = sum(pool._counters["total_successes"])
+        return pool
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def update_proxy(self, proxy: Proxy) -> bool:
+        """Write a (materialized and modified) proxy back to its row, matched by URL.
+
+        Returns:
+            True if the pool holds the URL, False otherwise
+        """
+        with self._lock:
+            row = self._rows.get(proxy.url)
+            if row is None:
+                return False
+            self._retract(row)
+            self._write(row, proxy)
+            self._touch()
+            return True
+
+    def record_success(
+        self, proxy_url: str, response_time_ms: float, alpha: float | None = None
+    ) -> None:
+        """Record a successful request in place (same rules as :meth:`Proxy.record_success`).
+
+        Raises:
+            KeyError: If the URL is not in the pool
+        """
+        with self._lock:
+            row = self._row(proxy_url)
+            now = time.time()
+            self._add_requests(row, successes=1)
+            self._counters["consecutive_failures"][row] = 0
+            self._floats["last_success_at"][row] = now
+            self._floats["updated_at"][row] = now
+
+            sparse = self._sparse.get(row)
+            effective_alpha = (
+                alpha
+                if alpha is not None
+                else (sparse or {}).get("ema_alpha", _SPARSE_DEFAULTS["ema_alpha"])
+            )
+            for name in _FLOAT_FIELDS:
+                column = self._floats[name]
+                previous = column[row]
+                column[row] = (
+                    response_time_ms
+                    if math.isnan(previous)
+                    else effective_alpha * response_time_ms + (1 - effective_alpha) * previous
+                )
+
+            if _HEALTH_STATUSES[self._health[row]] in (
+                HealthStatus.UNKNOWN,
+                HealthStatus.DEGRADED,
+            ):
+                self._set_health(row, HealthStatus.HEALTHY)
+            self._touch()
+
+    def record_failure(self, proxy_url: str, error: str | None = None) -> None:
+        """Record a failed request in place (same rules as :meth:`Proxy.record_failure`).
+
+        Raises:
+            KeyError: If the URL is not in the pool
+        """
+        with self._lock:
+            row = self._row(proxy_url)
+            now = time.time()
+            self._add_requests(row, successes=0)
+            self._counters["total_failures"][row] += 1
+            failures = self._counters["consecutive_failures"][row] + 1
+            self._counters["consecutive_failures"][row] = failures
+            self._floats["last_failure_at"][row] = now
+            self._floats["updated_at"][row] = now
+
+            if failures >= 5:
+                self._set_health(row, HealthStatus.DEAD)
+            elif failures >= 3:
+                self._set_health(row, HealthStatus.UNHEALTHY)
+            else:
+                self._set_health(row, HealthStatus.DEGRADED)
+
+            if error:
+                metadata = self._sparse.setdefault(row, {}).setdefault("metadata", {})
+                entry = {"timestamp": datetime.now(timezone.utc).isoformat(), "error": error}
+                metadata["last_errors"] = [*metadata.get("last_errors", []), entry][-10:]
+            self._touch()
+
+    def set_health_status(self, proxy_url: str, status: HealthStatus) -> None:
+        """Set a proxy's health status in place.
+
+        Raises:
+            KeyError: If the URL is not in the pool
+        """
+        with self._lock:
+            row = self._row(proxy_url)
+            self._set_health(row, status)
+            self._floats["updated_at"][row] = time.time()
+            self._touch()
+
+    # ------------------------------------------------------------------
+    # Filters
+    # ------------------------------------------------------------------
+
+    def filter_proxies(
+        self,
+        *,
+        health_status: HealthStatus | Collection[HealthStatus] | None = None,
+        protocol: str | Collection[str] | None = None,
+        country_code: str | Collection[str] | None = None,
+        source: ProxySource | Collection[ProxySource] | None = None,
+        exclude_expired: bool = False,
+        limit: int | None = None,
+    ) -> list[Proxy]:
+        """Materialize proxies matching every given filter, in pool order.
+
+        Each filter accepts one value or a collection of accepted values.
+
+        Args:
+            health_status: Accepted health statuses
+            protocol: Accepted protocols
+            country_code: Accepted country codes
+            source: Accepted sources
+            exclude_expired: Skip proxies past ``expires_at``
+            limit: Maximum number of proxies to return (None for all)
+        """
+        with self._lock:
+            rows = self._matching_rows(
+                health_status, protocol, country_code, source, exclude_expired
+            )
+            return [self._materialize(row) for row in islice(rows, limit)]
+
+    def count_proxies(
+        self,
+        *,
+        health_status: HealthStatus | Collection[HealthStatus] | None = None,
+        protocol: str | Collection[str] | None = None,
+        country_code: str | Collection[str] | None = None,
+        source: ProxySource | Collection[ProxySource] | None = None,
+        exclude_expired: bool = False,
+    ) -> int:
+        """Count proxies matching every given filter (see :meth:`filter_proxies`)."""
+        with self._lock:
+            mask = self._mask(health_status, protocol, country_code, source, exclude_expired)
+            return len(self._urls) if mask is None else mask.count(1)
+
+    def filter_by_source(self, source: ProxySource) -> list[Proxy]:
+        """Materialize proxies from ``source``."""
+        return self.filter_proxies(source=source)
+
+    def filter_by_tags(self, tags: set[str]) -> list[Proxy]:
+        """Materialize proxies that have all of ``tags``."""
+        with self._lock:
+            if not tags:
+                return self.get_all_proxies()
+            rows = sorted(
+                row for row, fields in self._sparse.items() if tags.issubset(fields.get("tags", ()))
+            )
+            return [self._materialize(row) for row in rows]
+
+    def get_healthy_proxies(self) -> list[Proxy]:
+        """Materialize HEALTHY, DEGRADED and UNKNOWN proxies that have not expired."""
+        return self.filter_proxies(health_status=_AVAILABLE, exclude_expired=True)
+
+    def select(self) -> Proxy:
+        """Return the first available (healthy or untested, unexpired) proxy.
+
+        Raises:
+            ProxyPoolEmptyError: If no proxy is available
+        """
+        proxies = self.filter_proxies(health_status=_AVAILABLE, exclude_expired=True, limit=1)
+        if not proxies:
+            raise ProxyPoolEmptyError("No healthy proxies available in pool")
+        return proxies[0]
+
+    def clear_unhealthy(self) -> int:
+        """Remove DEAD and UNHEALTHY proxies; returns the number removed."""
+        with self._lock:
+            table = _code_table(_HEALTH_CODES[status] for status in _KEPT_BY_CLEAR_UNHEALTHY)
+            return self._compact(bytes(self._health.translate(table)))
+
+    def clear_expired(self) -> int:
+        """Remove proxies past ``expires_at``; returns the number removed."""
+        with self._lock:
+            now = time.time()
+            return self._compact(
+                bytes(map(now.__gt__, self._floats["expires_at"])).translate(_INVERT)
+            )
+
+    # ------------------------------------------------------------------
+    # Internals (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _touch(self) -> None:
+        self.updated_at = datetime.now(timezone.utc)
+        self._version.bump()
+
+    def _row(self, proxy_url: str) -> int:
+        row = self._rows.get(proxy_url)
+        if row is None:
+            raise KeyError(f"Proxy not in pool: {proxy_url}")
+        return row
+
+    def _find_id(self, proxy_id: UUID) -> int | None:
+        needle = proxy_id.bytes
+        start = 0
+        while (position := self._ids.find(needle, start)) != -1:
+            if position % 16 == 0:
+                return position // 16
+            start = position + 1
+        return None
+
+    def _columns(self) -> list[bytearray | array[Any]]:
+        """All per-row columns, in the order :meth:`_encode` produces values."""
+        return [
+            self._health,
+            self._source,
+            self._protocol,
+            self._country,
+            *self._counters.values(),
+            *self._floats.values(),
+        ]
+
+    def _encode(self, proxy: Proxy) -> tuple[list[Any], dict[str, Any]]:
+        """Column values (in :meth:`_columns` order) and sparse fields of ``proxy``."""
+        values = proxy.__dict__
+        country_code = values["country_code"]
+        country = self._country_codes.get(country_code)
+        if country is None:
+            country = len(self._countries)
+            self._countries.append(country_code)
+            self._country_codes[country_code] = country
+        encoded: list[Any] = [
+            _HEALTH_CODES[values["health_status"]],
+            _SOURCE_CODES[values["source"]],
+            _PROTOCOL_CODES[values["protocol"]],
+            country,
+        ]
+        encoded += [values[name] for name in _COUNTER_FIELDS]
+        encoded += [
+            math.nan if (value := values[name]) is None else value for name in _FLOAT_FIELDS
+        ]
+        encoded += [_to_epoch(values[name]) for name in _TIME_FIELDS]
+        sparse = {
+            name: _copy_value(value)
+            for name, default in _SPARSE_DEFAULTS.items()
+            if (value := values[name]) != default
+        }
+        return encoded, sparse
+
+    def _append(self, proxy: Proxy) -> None:
+        encoded, sparse = self._encode(proxy)
+        row = len(self._urls)
+        self._urls.append(proxy.url)
+        self._rows[proxy.url] = row
+        self._ids += proxy.id.bytes
+        for column, value in zip(self._columns(), encoded, strict=True):
+            column.append(value)
+        if sparse:
+            self._sparse[row] = sparse
+        self._count(row)
+
+    def _write(self, row: int, proxy: Proxy) -> None:
+        """Overwrite ``row`` with ``proxy`` and count it in the aggregates."""
+        encoded, sparse = self._encode(proxy)
+        self._ids[row * 16 : row * 16 + 16] = proxy.id.bytes
+        for column, value in zip(self._columns(), encoded, strict=True):
+            column[row] = value
+        if sparse:
+            self._sparse[row] = sparse
+        else:
+            self._sparse.pop(row, None)
+        self._count(row)
+
+    def _count(self, row: int) -> None:
+        """Add ``row`` to the aggregates."""
+        self._health_counts[self._health[row]] += 1
+        self._source_counts[self._source[row]] += 1
+        self._total_requests += self._counters["total_requests"][row]
+        self._total_successes += self._counters["total_successes"][row]
+
+    def _retract(self, row: int) -> None:
+        """Remove ``row`` from the aggregates."""
+        self._health_counts[self._health[row]] -= 1
+        self._source_counts[self._source[row]] -= 1
+        self._total_requests -= self._counters["total_requests"][row]
+        self._total_successes -= self._counters["total_successes"][row]
+
+    def _add_requests(self, row: int, successes: int) -> None:
+        self._counters["total_requests"][row] += 1
+        self._counters["total_successes"][row] += successes
+        self._total_requests += 1
+        self._total_successes += successes
+
+    def _set_health(self, row: int, status: HealthStatus) -> None:
+        self._health_counts[self._health[row]] -= 1
+        self._health[row] = _HEALTH_CODES[status]
+        self._health_counts[self._health[row]] += 1
+
+    def _remove_row(self, row: int) -> None:
+        """Remove ``row`` by moving the last row into its slot."""
+        self._retract(row)
+        last = len(self._urls) - 1
+        del self._rows[self._urls[row]]
+        self._sparse.pop(row, None)
+        if row != last:
+            moved_url = self._urls[last]
+            self._urls[row] = moved_url
+            self._rows[moved_url] = row
+            self._ids[row * 16 : row * 16 + 16] = self._ids[last * 16 :]
+            for column in self._columns():
+                column[row] = column[last]
+            moved_sparse = self._sparse.pop(last, None)
+            if moved_sparse is not None:
+                self._sparse[row] = moved_sparse
+        self._urls.pop()
+        del self._ids[last * 16 :]
+        for column in self._columns():
+            column.pop()
+
+    def _compact(self, keep: bytes) -> int:
+        """Drop rows whose ``keep`` byte is 0, preserving order; returns rows dropped."""
+        removed = len(self._urls) - keep.count(1)
+        if not removed:
+            return 0
+
+        new_rows = list(accumulate(keep))
+        self._sparse = {
+            new_rows[row] - 1: fields for row, fields in self._sparse.items() if keep[row]
+        }
+        self._urls = list(compress(self._urls, keep))
+        self._rows = {url: row for row, url in enumerate(self._urls)}
+        ids = self._ids
+        self._ids = bytearray().join(
+            compress((ids[start : start + 16] for start in range(0, len(ids), 16)), keep)
+        )
+        self._health = bytearray(compress(self._health, keep))
+        self._source = bytearray(compress(self._source, keep))
+        self._protocol = bytearray(compress(self._protocol, keep))
+        self._country = array("H", compress(self._country, keep))
+        self._counters = {
+            name: array("I", compress(column, keep)) for name, column in self._counters.items()
+        }
+        self._floats = {
+            name: array("d", compress(column, keep)) for name, column in self._floats.items()
+        }
+
+        self._health_counts = [self._health.count(code) for code in range(len(_HEALTH_STATUSES))]
+        self._source_counts = [self._source.count(code) for code in range(len(_SOURCES))]
+        self._total_requests = sum(self._counters["total_requests"])
+        self._total_successes = sum(self._counters["total_successes"])
+        self._touch()
+        return removed
+
+    def _mask(
+        self,
+        health_status: HealthStatus | Collection[HealthStatus] | None,
+        protocol: str | Collection[str] | None,
+        country_code: str | Collection[str] | None,
+        source: ProxySource | Collection[ProxySource] | None,
+        exclude_expired: bool,
+    ) -> bytes | None:
+        """One byte per row, 1 where every filter matches (None when unfiltered)."""
+        masks: list[bytes] = []
+        if health_status is not None:
+            codes = (_HEALTH_CODES[HealthStatus(s)] for s in _as_collection(health_status))
+            masks.append(bytes(self._health.translate(_code_table(codes))))
+        if protocol is not None:
+            codes = (_PROTOCOL_CODES[p] for p in _as_collection(protocol) if p in _PROTOCOL_CODES)
+            masks.append(bytes(self._protocol.translate(_code_table(codes))))
+        if source is not None:
+            codes = (_SOURCE_CODES[ProxySource(s)] for s in _as_collection(source))
+            masks.append(bytes(self._source.translate(_code_table(codes))))
+        if country_code is not None:
+            wanted = {
+                self._country_codes[c]
+                for c in _as_collection(country_code)
+                if c in self._country_codes
+            }
+            masks.append(bytes(map(wanted.__contains__, self._country)))
+        if exclude_expired:
+            now = time.time()
+            masks.append(bytes(map(now.__gt__, self._floats["expires_at"])).translate(_INVERT))
+
+        if not masks:
+            return None
+        if len(masks) == 1:
+            return masks[0]
+        # AND the masks as big integers (linear, in C)
+        combined = int.from_bytes(masks[0], "big")
+        for mask in masks[1:]:
+            combined &= int.from_bytes(mask, "big")
+        return combined.to_bytes(len(self._urls), "big")
+
+    def _matching_rows(
+        self,
+        health_status: HealthStatus | Collection[HealthStatus] | None,
+        protocol: str | Collection[str] | None,
+        country_code: str | Collection[str] | None,
+        source: ProxySource | Collection[ProxySource] | None,
+        exclude_expired: bool,
+    ) -> Iterator[int]:
+        mask = self._mask(health_status, protocol, country_code, source, exclude_expired)
+        rows = range(len(self._urls))
+        return iter(rows) if mask is None else compress(rows, mask)
+
+    def _materialize(self, row: int) -> Proxy:
+        fields: dict[str, Any] = {
+            "id": UUID(bytes=bytes(self._ids[row * 16 : row * 16 + 16])),
+            "url": self._urls[row],
+            "protocol": _PROTOCOLS[self._protocol[row]],
+            "health_status": _HEALTH_STATUSES[self._health[row]],
+            "source": _SOURCES[self._source[row]],
+            "country_code": self._countries[self._country[row]],
+        }
+        for name, column in self._counters.items():
+            fields[name] = column[row]
+        for name in _FLOAT_FIELDS:
+            value = self._floats[name][row]
+            fields[name] = None if math.isnan(value) else value
+        for name in _TIME_FIELDS:
+            fields[name] = _from_epoch(self._floats[name][row])
+        sparse = self._sparse.get(row)
+        if sparse:
+            fields.update((name, _copy_value(value)) for name, value in sparse.items())
+        return Proxy.from_trusted(fields)
@@ -1154,6 +1154,32 @@ class StorageRecoveryError(ProxyStorageError):
         self.recovery_strategy = recovery_strategy
 
 
+class SnapshotFormatError(ProxyWhirlError):
+    """Raised when a file is not a readable pool snapshot.
+
+    Covers foreign or truncated files, checksum mismatches and unsupported
+    format versions. Callers restoring a warm start usually fall back to a
+    cold start.
+    """
+
+    error_code = ProxyErrorCode.PROXY_STORAGE_FAILED
+
+    def __init__(self, message: str, *, path: str | None = None, **kwargs: Any) -> None:
+        """Initialize with the snapshot location.
+
+        Args:
+            message: Error message
+            path: Path of the snapshot file
+            **kwargs: Additional metadata
+        """
+        enhanced_msg = message
+        if path:
+            enhanced_msg += f" (snapshot: {path})"
+
+        super().__init__(enhanced_msg, **kwargs)
+        self.path = path
+
+
 # ============================================================================
 # EXCEPTION FACTORY FUNCTIONS
 # ============================================================================
@@ -6,15 +6,26 @@ for consumption by the web dashboard.
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
-import statistics
-from collections import Counter, defaultdict
-from datetime import datetime, timezone
+import os
+import shutil
+import tempfile
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import ExitStack
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 from proxywhirl.geo import batch_geolocate, enrich_proxies_with_geo
 from proxywhirl.sources import ALL_HTTP_SOURCES, ALL_SOCKS4_SOURCES, ALL_SOCKS5_SOURCES
 from proxywhirl.storage import SQLiteStorage
@@ -30,6 +41,22 @@ RESPONSE_TIME_BINS: list[tuple[float, float, str]] = [
     (5000, float("inf"), ">5s"),
 ]
 
+# Protocols exported as plain-text lists, in output order
+LIST_PROTOCOLS: tuple[str, ...] = ("http", "https", "socks4", "socks5")
+
+# Content-hash manifest of published export files
+MANIFEST_FILENAME = "manifest.json"
+_MANIFEST_VERSION = 1
+# Generation timestamps ignored when deciding whether to republish these files
+_RICH_VOLATILE_KEYS = ("generated_at",)
+_STATS_VOLATILE_KEYS = ("generated_at", "metadata_generated_at")
+
+# Read size when hashing and compressing export files
+_COPY_CHUNK = 1 << 20
+
+# Near-maximum compression ratio at a fraction of quality 11's cost on multi-MB JSON
+_BROTLI_QUALITY = 9
+
 # Continent code to name mapping
 CONTINENT_NAMES = {
     "AF": "Africa",
@@ -82,6 +109,226 @@ def parse_proxy_url(url: str) -> tuple[str, int]:
         return "", 0
 
 
+class _RichProxyExport:
+    """Streams deduplicated proxies and SQL-side aggregations for proxies-rich.json.
+
+    Counts, averages and percentiles come from ``SQLiteStorage.export_aggregates``;
+    proxies are streamed in protocol/speed order from
+    ``SQLiteStorage.iter_export_proxies``. Only geo-derived tallies (country,
+    continent and source flow counts, which depend on the lookup results) are
+    accumulated while streaming, so memory use does not grow with the pool.
+    """
+
+    def __init__(
+        self,
+        storage: SQLiteStorage,
+        include_geo: bool,
+        geo_sample_size: int,
+        max_age_hours: int,
+        allow_external_geo: bool,
+    ) -> None:
+        self.storage = storage
+        self.include_geo = include_geo
+        self.geo_sample_size = geo_sample_size
+        self.max_age_hours = max_age_hours
+        self.allow_external_geo = allow_external_geo
+        self.generated_at = datetime.now(timezone.utc)
+        self.summary: dict[str, Any] = {}
+        self.country_counts: Counter[str] = Counter()
+        self.continent_counts: Counter[str] = Counter()
+        self.country_continents: dict[str, str] = {}
+        self.source_flow: Counter[tuple[str, str, str]] = Counter()
+
+    @property
+    def total(self) -> int:
+        """Number of deduplicated proxies (available after ``prepare``)."""
+        return int(self.summary.get("total", 0))
+
+    async def prepare(self) -> None:
+        """Run the aggregate queries."""
+        self.summary = await self.storage.export_aggregates(
+            self.max_age_hours,
+            response_time_bins=[(low, high) for low, high, _ in RESPONSE_TIME_BINS],
+            top_ports=15,
+            discovered_since=self.generated_at - timedelta(days=91),
+        )
+
+    async def proxies(self) -> AsyncIterator[dict[str, Any]]:
+        """Yield dashboard proxy records, geolocating the first ``geo_sample_size``."""
+        pending: list[dict[str, Any]] = []
+        geo_data: dict[str, dict[str, str]] | None = (
+            None if self.include_geo and self.geo_sample_size > 0 else {}
+        )
+        async for rows in self.storage.iter_export_proxies(
+            self.max_age_hours, protocols=LIST_PROTOCOLS
+        ):
+            for row in rows:
+                proxy = _rich_proxy_record(row)
+                if geo_data is None:
+                    pending.append(proxy)
+                    if len(pending) < self.geo_sample_size:
+                        continue
+                    geo_data = await self._geolocate(pending)
+                    for buffered in pending:
+                        yield self._enrich(buffered, geo_data)
+                    pending = []
+                    continue
+                yield self._enrich(proxy, geo_data)
+        if pending:
+            geo_data = await self._geolocate(pending)
+            for buffered in pending:
+                yield self._enrich(buffered, geo_data)
+
+    async def _geolocate(self, proxies: list[dict[str, Any]]) -> dict[str, dict[str, str]]:
+        return await batch_geolocate(
+            [p["ip"] for p in proxies],
+            max_batches=50,  # Up to 5000 IPs
+            allow_external_api=self.allow_external_geo,
+        )
+
+    def _enrich(self, proxy: dict[str, Any], geo_data: dict[str, dict[str, str]]) -> dict[str, Any]:
+        if not self.include_geo:
+            return proxy
+        enrich_proxies_with_geo([proxy], geo_data)
+
+        # Count countries and continents, build source flow (source → protocol → country)
+        country_code = proxy.get("country_code")
+        continent_code = proxy.get("continent_code")
+        if country_code:
+            self.country_counts[country_code] += 1
+            if continent_code:
+                self.country_continents[country_code] = continent_code
+        if continent_code:
+            self.continent_counts[continent_code] += 1
+        self.source_flow[(proxy["source"], proxy["protocol"], country_code or "Unknown")] += 1
+        return proxy
+
+    def aggregations(self) -> dict[str, Any]:
+        """Build the aggregations block (after ``proxies`` has been consumed)."""
+        summary = self.summary
+        response_times = summary["response_times"]
+
+        response_time_distribution = [
+            {
+                "range": bin_label,
+                "min": bin_min,
+                "max": bin_max if bin_max != float("inf") else None,
+                "count": count,
+            }
+            for (bin_min, bin_max, bin_label), count in zip(
+                RESPONSE_TIME_BINS, response_times["bins"], strict=True
+            )
+        ]
+
+        # Port distribution (top 15 + others)
+        by_port: list[dict[str, Any]] = [
+            {"port": port, "count": count} for port, count in summary["top_ports"]
+        ]
+        if summary["other_ports"] > 0:
+            by_port.append({"port": 0, "count": summary["other_ports"], "label": "Other"})
+
+        performance = {}
+        if response_times["samples"]:
+            performance = {
+                "avg_ms": round(response_times["avg"], 1),
+                "median_ms": round(response_times["median"], 1),
+                "p95_ms": round(response_times["p95"], 1),
+                "min_ms": round(response_times["min"], 1),
+                "max_ms": round(response_times["max"], 1),
+                "samples": response_times["samples"],
+            }
+
+        reliability_tiers: Counter[str] = Counter({name: 0 for name, _, _ in RELIABILITY_TIERS})
+        for success_rate, count in summary["success_rates"].items():
+            reliability_tiers[_classify_reliability_tier(success_rate)] += count
+
+        now = datetime.now(timezone.utc)
+        source_metrics: list[dict[str, Any]] = []
+        for source in summary["sources"]:
+            total_checks = source["total_checks"]
+            hours_since_check = (
+                (now - source["latest_check"]).total_seconds() / 3600
+                if source["latest_check"]
+                else 168.0
+            )
+            source_metrics.append(
+                {
+                    "name": source["name"],
+                    "count": source["count"],
+                    "reliability_pct": (
+                        round(source["successful_checks"] / total_checks * 100, 1)
+                        if total_checks > 0
+                        else 50.0
+                    ),
+                    "avg_response_ms": _round_or_none(source["avg_response_ms"]),
+                    "country_count": source["country_count"],
+                    "freshness_pct": round(
+                        max(0.0, 100.0 - (hours_since_check / 168.0) * 100.0), 1
+                    ),
+                }
+            )
+
+        by_country_detail = [
+            {
+                "code": country["code"],
+                "count": country["count"],
+                "avg_response_ms": _round_or_none(country["avg_response_ms"]),
+                "continent_code": self.country_continents.get(country["code"]),
+            }
+            for country in summary["countries"]
+        ]
+
+        return {
+            "by_protocol": summary["by_protocol"],
+            "by_status": summary["by_status"],
+            "by_source": summary["by_source"],
+            "by_country": dict(self.country_counts),
+            "by_port": by_port,
+            "by_continent": dict(self.continent_counts),
+            "response_time_distribution": response_time_distribution,
+            "performance": performance,
+            "source_flow": [
+                {"source": s, "protocol": p, "country": c, "count": cnt}
+                for (s, p, c), cnt in self.source_flow.most_common(200)
+            ],
+            "reliability_tiers": [
+                {"tier": name, "count": reliability_tiers[name]} for name, _, _ in RELIABILITY_TIERS
+            ],
+            "by_country_detail": by_country_detail,
+            "source_metrics": source_metrics,
+            "discovery_by_date": summary["discovery_by_date"],
+        }
+
+
+def _round_or_none(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+def _rich_proxy_record(row: dict[str, Any]) -> dict[str, Any]:
+    """Convert an exported storage row into a proxies-rich.json record."""
+    total_checks = row["total_checks"] or 0
+    total_successes = row["total_successes"] or 0
+    last_checked = row["last_success_at"] or row["last_failure_at"]
+    discovered_at = row["discovered_at"]
+    return {
+        "ip": row["host"],
+        "port": row["port"],
+        "protocol": row["protocol"],
+        "status": row["health_status"],
+        "response_time": row["avg_response_time_ms"],
+        "success_rate": (
+            round(total_successes / total_checks * 100, 1) if total_checks > 0 else None
+        ),
+        "total_checks": total_checks,
+        "source": row["source"],
+        "last_checked": last_checked.isoformat() if last_checked else None,
+        "created_at": discovered_at.isoformat() if discovered_at else None,
+        "country": None,
+        "country_code": row["country_code"],
+        "continent_code": row.get("continent_code"),
+    }
+
+
 async def generate_rich_proxies(
     storage: SQLiteStorage,
     include_geo: bool = True,
@@ -91,6 +338,10 @@ async def generate_rich_proxies(
 ) -> dict[str, Any]:
     """Generate rich proxy data from database.
 
+    Proxies are deduplicated by IP:port and aggregated in SQL; see
+    ``write_rich_proxies`` to stream the same document to a file instead of
+    building it in memory.
+
     Args:
         storage: SQLiteStorage instance to query
         include_geo: Whether to include country data from a local GeoLite database
@@ -102,273 +353,59 @@ async def generate_rich_proxies(
     Returns:
         dict[str, Any]: Proxies with metadata and aggregations.
     """
-    if max_age_hours > 0:
-        proxies_data = await storage.load_validated(max_age_hours)
-    else:
-        proxies_data = await storage.load()
-
-    proxies = []
-    seen_addresses: set[str] = set()  # Track unique IP:port combinations
-    protocol_counts: Counter[str] = Counter()
-    status_counts: Counter[str] = Counter()
-    source_counts: Counter[str] = Counter()
-    country_counts: Counter[str] = Counter()
-    port_counts: Counter[int] = Counter()
-    continent_counts: Counter[str] = Counter()
-    response_times: list[float] = []
-
-    # For source flow (Sankey) data
-    source_flow: defaultdict[tuple[str, str, str], int] = defaultdict(int)
-
-    reliability_tiers: Counter[str] = Counter({name: 0 for name, _, _ in RELIABILITY_TIERS})
-    source_metrics: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "count": 0,
-            "total_checks": 0,
-            "successful_checks": 0,
-            "total_response": 0.0,
-            "response_samples": 0,
-            "countries": set(),
-            "latest_check": None,
-        }
+    export = _RichProxyExport(
+        storage, include_geo, geo_sample_size, max_age_hours, allow_external_geo
     )
-    country_detail: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "count": 0,
-            "total_response": 0.0,
-            "samples": 0,
-            "continent_code": None,
-        }
-    )
-    discovery_by_date: Counter[str] = Counter()
-
-    for proxy in proxies_data:
-        ip, port = parse_proxy_url(proxy["url"])
-        if not ip or not port:
-            continue
-
-        # Deduplicate by IP:port (same proxy may appear with different protocols)
-        addr = f"{ip}:{port}"
-        if addr in seen_addresses:
-            continue
-        seen_addresses.add(addr)
-
-        total_checks = proxy.get("total_checks", 0) or 0
-        total_successes = proxy.get("total_successes", 0) or 0
-        last_success = proxy.get("last_success_at")
-        last_failure = proxy.get("last_failure_at")
-        discovered_at = proxy.get("discovered_at")
-        avg_response = proxy.get("avg_response_time_ms")
-
-        proxy_dict = {
-            "ip": ip,
-            "port": port,
-            "protocol": proxy.get("protocol") or "http",
-            "status": proxy.get("health_status", "unknown"),
-            "response_time": avg_response,
-            "success_rate": (
-                round(total_successes / total_checks * 100, 1) if total_checks > 0 else None
-            ),
-            "total_checks": total_checks,
-            "source": proxy.get("source", "fetched"),
-            "last_checked": (
-                last_success.isoformat()
-                if last_success
-                else last_failure.isoformat()
-                if last_failure
-                else None
-            ),
-            "created_at": discovered_at.isoformat() if discovered_at else None,
-            "country": None,
-            "country_code": proxy.get("country_code"),
-            "continent_code": proxy.get("continent_code"),
-        }
-        proxies.append(proxy_dict)
-
-        protocol_counts[proxy_dict["protocol"]] += 1
-        status_counts[proxy_dict["status"]] += 1
-        source_counts[proxy_dict["source"]] += 1
-        port_counts[port] += 1
-
-        # Collect response times for statistics
-        if avg_response is not None and avg_response > 0:
-            response_times.append(avg_response)
-
-        success_rate = proxy_dict["success_rate"]
-        reliability_tiers[_classify_reliability_tier(success_rate)] += 1
-
-        source = proxy_dict["source"] or "unknown"
-        sm = source_metrics[source]
-        sm["count"] += 1
-        sm["total_checks"] += total_checks
-        if success_rate is not None and total_checks > 0:
-            sm["successful_checks"] += round((success_rate / 100) * total_checks)
-        if avg_response is not None and avg_response > 0:
-            sm["total_response"] += avg_response
-            sm["response_samples"] += 1
-        country_code = proxy_dict.get("country_code")
-        if country_code:
-            sm["countries"].add(country_code)
-            cd = country_detail[country_code]
-            cd["count"] += 1
-            if avg_response is not None and avg_response > 0:
-                cd["total_response"] += avg_response
-                cd["samples"] += 1
-            continent_code = proxy_dict.get("continent_code")
-            if continent_code:
-                cd["continent_code"] = continent_code
-        if proxy_dict["last_checked"]:
-            check_dt = _as_utc_aware(
-                datetime.fromisoformat(proxy_dict["last_checked"].replace("Z", "+00:00"))
-            )
-            if sm["latest_check"] is None or check_dt > sm["latest_check"]:
-                sm["latest_check"] = check_dt
-        if proxy_dict["created_at"]:
-            created_dt = _as_utc_aware(
-                datetime.fromisoformat(proxy_dict["created_at"].replace("Z", "+00:00"))
-            )
-            days_ago = (datetime.now(timezone.utc) - created_dt).days
-            if 0 <= days_ago <= 90:
-                discovery_by_date[created_dt.date().isoformat()] += 1
-
-    # Add geo data if requested
-    if include_geo and proxies:
-        ips = [p["ip"] for p in proxies[:geo_sample_size]]
-        geo_data = await batch_geolocate(
-            ips,
-            max_batches=50,  # Up to 5000 IPs
-            allow_external_api=allow_external_geo,
-        )
-        proxies = enrich_proxies_with_geo(proxies, geo_data)
-
-        # Count countries and continents, build source flow
-        for p in proxies:
-            country_code = p.get("country_code")
-            continent_code = p.get("continent_code")
-            if country_code:
-                country_counts[country_code] += 1
-            if continent_code:
-                continent_counts[continent_code] += 1
-
-            # Build source flow data (source → protocol → country)
-            source = p.get("source", "unknown")
-            protocol = p.get("protocol", "http")
-            country = country_code or "Unknown"
-            source_flow[(source, protocol, country)] += 1
-
-            if country_code:
-                cd = country_detail[country_code]
-                if continent_code:
-                    cd["continent_code"] = continent_code
-
-    # Build response time distribution
-    response_time_distribution = []
-    for bin_min, bin_max, bin_label in RESPONSE_TIME_BINS:
-        count = sum(1 for rt in response_times if bin_min <= rt < bin_max)
-        response_time_distribution.append(
-            {
-                "range": bin_label,
-                "min": bin_min,
-                "max": bin_max if bin_max != float("inf") else None,
-                "count": count,
-            }
-        )
+    await export.prepare()
+    proxies = [proxy async for proxy in export.proxies()]
+    return {
+        "generated_at": export.generated_at.isoformat(),
+        "total": len(proxies),
+        "proxies": proxies,
+        "aggregations": export.aggregations(),
+    }
 
-    # Build port distribution (top 15 + others)
-    top_ports = port_counts.most_common(15)
-    by_port = [{"port": port, "count": count} for port, count in top_ports]
-    other_port_count = sum(
-        count for port, count in port_counts.items() if port not in dict(top_ports)
-    )
-    if other_port_count > 0:
-        by_port.append({"port": 0, "count": other_port_count, "label": "Other"})
-
-    # Performance statistics
-    performance = {}
-    if response_times:
-        sorted_times = sorted(response_times)
-        p95_idx = int(len(sorted_times) * 0.95)
-        performance = {
-            "avg_ms": round(statistics.mean(response_times), 1),
-            "median_ms": round(statistics.median(response_times), 1),
-            "p95_ms": round(
-                sorted_times[p95_idx] if p95_idx < len(sorted_times) else sorted_times[-1], 1
-            ),
-            "min_ms": round(min(response_times), 1),
-            "max_ms": round(max(response_times), 1),
-            "samples": len(response_times),
-        }
 
-    # Build source flow for Sankey (limit to top entries)
-    source_flow_list = [
-        {"source": s, "protocol": p, "country": c, "count": cnt}
-        for (s, p, c), cnt in sorted(source_flow.items(), key=lambda x: -x[1])[:200]
-    ]
+async def write_rich_proxies(
+    storage: SQLiteStorage,
+    path: Path,
+    include_geo: bool = True,
+    geo_sample_size: int = 5000,
+    max_age_hours: int = 72,
+    allow_external_geo: bool = False,
+) -> int:
+    """Stream rich proxy data to a JSON file.
 
-    now = datetime.now(timezone.utc)
-    source_metrics_list: list[dict[str, Any]] = []
-    for name, sm in sorted(source_metrics.items(), key=lambda x: -x[1]["count"]):
-        total_checks = sm["total_checks"]
-        reliability_pct = (
-            round(sm["successful_checks"] / total_checks * 100, 1) if total_checks > 0 else 50.0
-        )
-        avg_response_ms = (
-            round(sm["total_response"] / sm["response_samples"], 1)
-            if sm["response_samples"] > 0
-            else None
-        )
-        hours_since_check = (
-            (now - sm["latest_check"]).total_seconds() / 3600 if sm["latest_check"] else 168.0
-        )
-        freshness_pct = round(max(0.0, 100.0 - (hours_since_check / 168.0) * 100.0), 1)
-        source_metrics_list.append(
-            {
-                "name": name,
-                "count": sm["count"],
-                "reliability_pct": reliability_pct,
-                "avg_response_ms": avg_response_ms,
-                "country_count": len(sm["countries"]),
-                "freshness_pct": freshness_pct,
-            }
-        )
+    Writes the same document as ``generate_rich_proxies`` (serialized like
+    ``json.dump``) one proxy at a time, so memory stays flat for large pools.
 
-    by_country_detail = [
-        {
-            "code": code,
-            "count": stats["count"],
-            "avg_response_ms": (
-                round(stats["total_response"] / stats["samples"], 1)
-                if stats["samples"] > 0
-                else None
-            ),
-            "continent_code": stats["continent_code"],
-        }
-        for code, stats in sorted(country_detail.items(), key=lambda x: -x[1]["count"])
-        if stats["count"] > 0
-    ]
+    Args:
+        storage: SQLiteStorage instance to query
+        path: Output file (typically proxies-rich.json)
+        include_geo: Whether to include country data from a local GeoLite database
+        geo_sample_size: Max IPs to geolocate
+        max_age_hours: Only include proxies validated within this time window.
+            Set to 0 to include all proxies.
+        allow_external_geo: Whether to send IPs to an external HTTPS geolocation API
 
-    return {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "total": len(proxies),
-        "proxies": proxies,
-        "aggregations": {
-            "by_protocol": dict(protocol_counts),
-            "by_status": dict(status_counts),
-            "by_source": dict(source_counts),
-            "by_country": dict(country_counts),
-            "by_port": by_port,
-            "by_continent": dict(continent_counts),
-            "response_time_distribution": response_time_distribution,
-            "performance": performance,
-            "source_flow": source_flow_list,
-            "reliability_tiers": [
-                {"tier": name, "count": reliability_tiers[name]} for name, _, _ in RELIABILITY_TIERS
-            ],
-            "by_country_detail": by_country_detail,
-            "source_metrics": source_metrics_list,
-            "discovery_by_date": dict(discovery_by_date),
-        },
-    }
+    Returns:
+        Number of proxies written
+    """
+    export = _RichProxyExport(
+        storage, include_geo, geo_sample_size, max_age_hours, allow_external_geo
+    )
+    await export.prepare()
+    written = 0
+    with open(path, "w") as f:
+        f.write(
+            f'{{"generated_at": {json.dumps(export.generated_at.isoformat())}, '
+            f'"total": {export.total}, "proxies": ['
+        )
+        async for proxy in export.proxies():
+            f.write((", " if written else "") + json.dumps(proxy))
+            written += 1
+        f.write(f'], "aggregations": {json.dumps(export.aggregations())}}}')
+    return written
 
 
 def generate_stats_from_files(proxy_dir: Path) -> dict[str, Any]:
@@ -542,14 +579,6 @@ def generate_stats_from_files(proxy_dir: Path) -> dict[str, Any]:
     }
 
 
-def _sort_by_speed(addr_times: dict[str, float | None]) -> list[str]:
-    """Sort addresses by response time (fastest first, unknowns last)."""
-    return sorted(
-        addr_times.keys(),
-        key=lambda a: (addr_times[a] is None, addr_times[a] or float("inf")),
-    )
-
-
 async def generate_proxy_lists(
     storage: SQLiteStorage,
     output_dir: Path,
@@ -563,6 +592,9 @@ async def generate_proxy_lists(
         - proxies.json (structured JSON with metadata)
         - metadata.json (counts and timestamp)
 
+    Addresses are deduplicated per protocol and sorted fastest-first (unknown
+    response times last) in SQL, then streamed into all files in one pass.
+
     Args:
         storage: SQLiteStorage instance to query
         output_dir: Directory to write output files
@@ -574,34 +606,7 @@ async def generate_proxy_lists(
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    if max_age_hours > 0:
-        proxies_data = await storage.load_validated(max_age_hours)
-    else:
-        proxies_data = await storage.load()
-
-    # Group proxies by protocol, tracking response time for sorting
-    # Maps protocol -> {addr: best_response_time_ms} (None = unknown)
-    proxies_by_protocol: dict[str, dict[str, float | None]] = {
-        "http": {},
-        "https": {},
-        "socks4": {},
-        "socks5": {},
-    }
-
-    for proxy in proxies_data:
-        ip, port = parse_proxy_url(proxy["url"])
-        if not ip:
-            continue
-
-        addr = f"{ip}:{port}"
-        protocol = (proxy.get("protocol") or "http").lower()
-        response_time = proxy.get("avg_response_time_ms")
-
-        if protocol in proxies_by_protocol:
-            existing = proxies_by_protocol[protocol].get(addr)
-            # Keep the best (lowest) response time for deduped addresses
-            if existing is None or (response_time is not None and response_time < existing):
-                proxies_by_protocol[protocol][addr] = response_time
+    counts = await storage.count_proxy_list_entries(LIST_PROTOCOLS, max_age_hours)
 
     timestamp = datetime.now(timezone.utc).isoformat()
     total_sources = len(ALL_HTTP_SOURCES) + len(ALL_SOCKS4_SOURCES) + len(ALL_SOCKS5_SOURCES)
@@ -609,39 +614,58 @@ async def generate_proxy_lists(
     metadata = {
         "generated_at": timestamp,
         "total_sources": total_sources,
-        "counts": {protocol: len(addrs) for protocol, addrs in proxies_by_protocol.items()},
+        "counts": counts,
     }
 
-    # Save each protocol in TXT format (sorted fastest-first)
-    for protocol, addr_times in proxies_by_protocol.items():
-        txt_file = output_dir / f"{protocol}.txt"
-        with open(txt_file, "w") as f:
-            for proxy_addr in _sort_by_speed(addr_times):
-                f.write(f"{proxy_addr}\n")
-        logger.info(f"Saved {len(addr_times)} {protocol} proxies to {txt_file}")
-
-    # Save all proxies in one file (sorted fastest-first per section)
     all_txt = output_dir / "all.txt"
-    with open(all_txt, "w") as f:
-        for protocol in ["http", "https", "socks4", "socks5"]:
-            addr_times = proxies_by_protocol[protocol]
-            f.write(f"# {protocol.upper()} Proxies ({len(addr_times)})\n")
-            for proxy_addr in _sort_by_speed(addr_times):
-                f.write(f"{proxy_addr}\n")
-            f.write("\n")
-    logger.info(f"Saved all proxies to {all_txt}")
-
-    # Save in JSON format (sorted fastest-first)
     json_file = output_dir / "proxies.json"
-    json_data = {
-        "metadata": metadata,
-        "proxies": {
-            protocol: _sort_by_speed(addr_times)
-            for protocol, addr_times in proxies_by_protocol.items()
-        },
-    }
-    with open(json_file, "w") as f:
-        json.dump(json_data, f, indent=2)
+    with ExitStack() as stack:
+        txt_files = {
+            protocol: stack.enter_context(open(output_dir / f"{protocol}.txt", "w"))
+            for protocol in LIST_PROTOCOLS
+        }
+        all_file = stack.enter_context(open(all_txt, "w"))
+        json_out = stack.enter_context(open(json_file, "w"))
+
+        # proxies.json is written incrementally in the same layout as json.dump(indent=2)
+        metadata_json = json.dumps(metadata, indent=2).replace("\n", "\n  ")
+        json_out.write(f'{{\n  "metadata": {metadata_json},\n  "proxies": {{')
+        sections = iter(LIST_PROTOCOLS)
+        current: str | None = None
+        written = 0
+
+        def open_section(protocol: str) -> None:
+            all_file.write(f"# {protocol.upper()} Proxies ({counts[protocol]})\n")
+            separator = "," if protocol != LIST_PROTOCOLS[0] else ""
+            json_out.write(f"{separator}\n    {json.dumps(protocol)}: [")
+
+        def close_section() -> None:
+            all_file.write("\n")
+            json_out.write("\n    ]" if written else "]")
+
+        async for entries in storage.iter_proxy_list_entries(LIST_PROTOCOLS, max_age_hours):
+            for protocol, proxy_addr in entries:
+                while protocol != current:
+                    if current is not None:
+                        close_section()
+                    current = next(sections)
+                    written = 0
+                    open_section(current)
+                txt_files[protocol].write(f"{proxy_addr}\n")
+                all_file.write(f"{proxy_addr}\n")
+                json_out.write(f"{',' if written else ''}\n      {json.dumps(proxy_addr)}")
+                written += 1
+        if current is not None:
+            close_section()
+        for protocol in sections:
+            written = 0
+            open_section(protocol)
+            close_section()
+        json_out.write("\n  }\n}")
+
+    for protocol in LIST_PROTOCOLS:
+        logger.info(f"Saved {counts[protocol]} {protocol} proxies to {output_dir / protocol}.txt")
+    logger.info(f"Saved all proxies to {all_txt}")
     logger.info(f"Saved JSON to {json_file}")
 
     # Save metadata
@@ -650,7 +674,173 @@ async def generate_proxy_lists(
         json.dump(metadata, f, indent=2)
     logger.info(f"Saved metadata to {meta_file}")
 
-    return {protocol: len(addrs) for protocol, addrs in proxies_by_protocol.items()}
+    return counts
+
+
+def _file_digest(path: Path) -> str:
+    """Return the hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_COPY_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _json_content_digest(path: Path, volatile_keys: tuple[str, ...]) -> str:
+    """Return the hex SHA-256 of a JSON document without its volatile top-level keys.
+
+    Used for artifacts that embed a generation timestamp, so regenerating the
+    same data does not count as a content change.
+    """
+    with open(path) as f:
+        document = json.load(f)
+    if isinstance(document, dict):
+        for key in volatile_keys:
+            document.pop(key, None)
+    canonical = json.dumps(document, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _write_compressed_siblings(path: Path) -> list[Path]:
+    """Write ``.gz`` (and ``.br`` if brotli is installed) copies of ``path``.
+
+    Gzip output uses a zero mtime so identical content compresses to identical bytes.
+    """
+    siblings = [path.with_name(f"{path.name}.gz")]
+    with open(path, "rb") as src, open(siblings[0], "wb") as raw:
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, compresslevel=9, mtime=0) as gz:
+            shutil.copyfileobj(src, gz, _COPY_CHUNK)
+    if brotli is not None:
+        br_path = path.with_name(f"{path.name}.br")
+        compressor = brotli.Compressor(quality=_BROTLI_QUALITY)
+        with open(path, "rb") as src, open(br_path, "wb") as dst:
+            for chunk in iter(lambda: src.read(_COPY_CHUNK), b""):
+                dst.write(compressor.process(chunk))
+            dst.write(compressor.finish())
+        siblings.append(br_path)
+    return siblings
+
+
+class _ExportManifest:
+    """Content-addressed record of published export files (``manifest.json``).
+
+    Artifacts are generated into a staging directory and only moved over the
+    published file when their SHA-256 differs from the manifest entry, so
+    unchanged files keep their bytes and mtime and static hosting or CDN sync
+    uploads only the deltas. The manifest also stores the database watermark
+    of the last export so a run against an unchanged database can be skipped.
+    """
+
+    def __init__(self, output_dir: Path, precompress: bool) -> None:
+        self.output_dir = output_dir
+        self.precompress = precompress
+        self.path = output_dir / MANIFEST_FILENAME
+        self.watermark: dict[str, Any] | None = None
+        self.options: dict[str, Any] | None = None
+        self.valid_until: str | None = None
+        self.files: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def load(cls, output_dir: Path, precompress: bool) -> _ExportManifest:
+        """Load the manifest from ``output_dir``; missing or corrupt manifests are empty."""
+        manifest = cls(output_dir, precompress)
+        try:
+            data = json.loads(manifest.path.read_text())
+            files = data["files"]
+            if data.get("version") != _MANIFEST_VERSION or not isinstance(files, dict):
+                return manifest
+        except (OSError, ValueError, KeyError, TypeError):
+            return manifest
+        manifest.watermark = data.get("watermark")
+        manifest.options = data.get("options")
+        manifest.valid_until = data.get("valid_until")
+        manifest.files = files
+        return manifest
+
+    def is_current(
+        self, watermark: dict[str, Any], options: dict[str, Any], names: list[str]
+    ) -> bool:
+        """Whether the last export used the same data and options and is still complete."""
+        if self.watermark != watermark["watermark"] or self.options != options:
+            return False
+        valid_until = datetime.fromisoformat(self.valid_until) if self.valid_until else None
+        if valid_until is not None and datetime.now(timezone.utc) >= valid_until:
+            return False
+        return all(self.is_published(name) for name in names)
+
+    def is_published(self, name: str) -> bool:
+        """Whether ``name`` (and its compressed siblings, if wanted) matches its entry."""
+        entry = self.files.get(name)
+        path = self.output_dir / name
+        if entry is None or not path.exists() or path.stat().st_size != entry.get("size"):
+            return False
+        if not self.precompress:
+            return True
+        siblings = entry.get("compressed") or []
+        return bool(siblings) and all((self.output_dir / sibling).exists() for sibling in siblings)
+
+    def publish(
+        self, staged: Path, force: bool = False, volatile_keys: tuple[str, ...] = ()
+    ) -> bool:
+        """Move ``staged`` into the output directory unless its content is unchanged.
+
+        Args:
+            staged: Freshly generated file; its name is the published name
+            force: Publish even if the content hash matches
+            volatile_keys: Top-level JSON keys (e.g. generation timestamps) left out
+                of the comparison, recorded as ``content_sha256``
+
+        Returns:
+            True if the published file (and its compressed siblings) was replaced
+        """
+        name = staged.name
+        digest = _file_digest(staged)
+        entry = self.files.get(name)
+        if volatile_keys:
+            content_digest = _json_content_digest(staged, volatile_keys)
+            unchanged = entry is not None and entry.get("content_sha256") == content_digest
+        else:
+            content_digest = None
+            unchanged = entry is not None and entry.get("sha256") == digest
+        if unchanged and not force and self.is_published(name):
+            staged.unlink()
+            return False
+
+        target = self.output_dir / name
+        os.replace(staged, target)
+        entry = {"sha256": digest, "size": target.stat().st_size}
+        if content_digest is not None:
+            entry["content_sha256"] = content_digest
+        for sibling_name in self.files.get(name, {}).get("compressed", []):
+            (self.output_dir / sibling_name).unlink(missing_ok=True)
+        if self.precompress:
+            siblings = _write_compressed_siblings(target)
+            entry["compressed"] = [sibling.name for sibling in siblings]
+            for sibling in siblings:
+                self.files[sibling.name] = {
+                    "sha256": _file_digest(sibling),
+                    "size": sibling.stat().st_size,
+                }
+        self.files[name] = entry
+        return True
+
+    def save(self, watermark: dict[str, Any] | None, options: dict[str, Any] | None) -> None:
+        """Atomically write the manifest with the watermark of this export."""
+        if watermark is not None:
+            self.watermark = watermark["watermark"]
+            self.valid_until = watermark["valid_until"]
+            self.options = options
+        data = {
+            "version": _MANIFEST_VERSION,
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "watermark": self.watermark,
+            "options": self.options,
+            "valid_until": self.valid_until,
+            "files": dict(sorted(self.files.items())),
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.path)
 
 
 async def export_for_web(
@@ -660,9 +850,22 @@ async def export_for_web(
     include_rich_proxies: bool = True,
     include_proxy_lists: bool = True,
     max_age_hours: int = 72,
+    incremental: bool = True,
+    precompress: bool = True,
 ) -> dict[str, Path]:
     """Export data for the web dashboard.
 
+    Files are generated into a staging directory and published by content hash:
+    only files whose SHA-256 changed are replaced (protocol lists whose
+    membership changed; ``proxies.json``/``metadata.json`` only when a list
+    changed), each with ``.gz`` (and ``.br`` if ``brotli`` is installed)
+    siblings, and ``manifest.json`` records the hashes. The generation
+    timestamps in ``proxies-rich.json`` and ``stats.json`` are left out of the
+    comparison, so regenerating the same data keeps them. With ``incremental``,
+    the database exports are skipped entirely when the storage watermark
+    (row counts, latest status update, latest validation) is unchanged since
+    the last export.
+
     Args:
         db_path: Path to SQLite database
         output_dir: Directory to write output files
@@ -671,42 +874,84 @@ async def export_for_web(
         include_proxy_lists: Whether to generate text files and metadata.json
         max_age_hours: Only include proxies validated within this time window.
             Default: 72 hours (36 runs at 2h schedule). Set to 0 to include all proxies.
+        incremental: Reuse the previous export when the database has not changed;
+            False regenerates and republishes every file
+        precompress: Whether to write precompressed ``.gz``/``.br`` siblings
 
     Returns:
         dict[str, Path]: Mapping of output type to file path.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
     outputs: dict[str, Path] = {}
+    manifest = (
+        _ExportManifest.load(output_dir, precompress)
+        if incremental
+        else _ExportManifest(output_dir, precompress)
+    )
+    watermark: dict[str, Any] | None = None
+    options: dict[str, Any] | None = None
 
     # Check if we need database access
     needs_db = (include_proxy_lists or include_rich_proxies) and db_path.exists()
 
+    list_names = [f"{protocol}.txt" for protocol in LIST_PROTOCOLS]
+    db_outputs: dict[str, str] = {}
+    if include_proxy_lists:
+        db_outputs.update(metadata="metadata.json", proxies_json="proxies.json")
+    if include_rich_proxies:
+        db_outputs["proxies_rich"] = "proxies-rich.json"
+
     if needs_db:
         storage = SQLiteStorage(db_path)
         await storage.initialize()
 
         try:
-            # Generate proxy list files first (metadata.json, txt files, proxies.json)
-            # This must happen before stats since stats reads from these files
+            watermark = await storage.export_watermark(max_age_hours)
+            options = {
+                "max_age_hours": max_age_hours,
+                "total_sources": len(ALL_HTTP_SOURCES)
+                + len(ALL_SOCKS4_SOURCES)
+                + len(ALL_SOCKS5_SOURCES),
+                "proxy_lists": include_proxy_lists,
+                "rich_proxies": include_rich_proxies,
+            }
+            expected = list(db_outputs.values())
             if include_proxy_lists:
-                logger.info("Generating proxy list files from database...")
-                counts = await generate_proxy_lists(storage, output_dir, max_age_hours)
-                outputs["metadata"] = output_dir / "metadata.json"
-                outputs["proxies_json"] = output_dir / "proxies.json"
-                logger.info(f"Proxy lists generated: {counts}")
-
-            # Generate rich proxy data (proxies-rich.json)
-            if include_rich_proxies:
-                logger.info("Generating rich proxy data from database...")
-                rich_data = await generate_rich_proxies(storage, max_age_hours=max_age_hours)
-                rich_path = output_dir / "proxies-rich.json"
-                with open(rich_path, "w") as f:
-                    json.dump(rich_data, f)
-                outputs["proxies_rich"] = rich_path
-                logger.info(f"Rich proxy data saved to {rich_path}")
-                logger.info(f"Total rich proxies: {rich_data['total']}")
+                expected += [*list_names, "all.txt"]
+            if incremental and manifest.is_current(watermark, options, expected):
+                logger.info("Database unchanged since last export, reusing published files")
+            else:
+                with tempfile.TemporaryDirectory(prefix=".export-", dir=output_dir) as tmp:
+                    staging = Path(tmp)
+                    # Generate proxy list files first (metadata.json, txt files, proxies.json)
+                    # This must happen before stats since stats reads from these files
+                    if include_proxy_lists:
+                        logger.info("Generating proxy list files from database...")
+                        counts = await generate_proxy_lists(storage, staging, max_age_hours)
+                        lists_changed = False
+                        for name in [*list_names, "all.txt"]:
+                            lists_changed |= manifest.publish(staging / name)
+                        # metadata.json and proxies.json only add a timestamp to the lists
+                        for name in ("metadata.json", "proxies.json"):
+                            if lists_changed or not manifest.is_published(name):
+                                manifest.publish(staging / name, force=True)
+                        logger.info(f"Proxy lists generated: {counts}")
+
+                    # Generate rich proxy data (proxies-rich.json)
+                    if include_rich_proxies:
+                        logger.info("Generating rich proxy data from database...")
+                        total = await write_rich_proxies(
+                            storage, staging / "proxies-rich.json", max_age_hours=max_age_hours
+                        )
+                        manifest.publish(
+                            staging / "proxies-rich.json", volatile_keys=_RICH_VOLATILE_KEYS
+                        )
+                        logger.info(f"Total rich proxies: {total}")
         finally:
             await storage.close()
+
+        for output_type, name in db_outputs.items():
+            outputs[output_type] = output_dir / name
     elif include_proxy_lists or include_rich_proxies:
         logger.warning(f"Database not found at {db_path}, skipping database exports")
 
@@ -715,10 +960,15 @@ async def export_for_web(
         logger.info("Generating stats.json...")
         stats = generate_stats_from_files(output_dir)
         stats_path = output_dir / "stats.json"
-        with open(stats_path, "w") as f:
-            json.dump(stats, f, indent=2)
+        with tempfile.TemporaryDirectory(prefix=".export-", dir=output_dir) as tmp:
+            staged = Path(tmp) / stats_path.name
+            with open(staged, "w") as f:
+                json.dump(stats, f, indent=2)
+            manifest.publish(staged, volatile_keys=_STATS_VOLATILE_KEYS)
         outputs["stats"] = stats_path
         logger.info(f"Stats saved to {stats_path}")
         logger.info(f"Total proxies: {stats['proxies']['total']}")
 
+    manifest.save(watermark, options)
+    outputs["manifest"] = manifest.path
     return outputs
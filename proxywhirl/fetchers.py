@@ -10,11 +10,19 @@ from __future__ import annotations
 import asyncio
 import csv
 import hashlib
+import heapq
+import itertools
 import json
+import multiprocessing
+import os
 import re
 import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 if TYPE_CHECKING:
     from proxywhirl.models import ValidationLevel
@@ -1639,6 +1647,111 @@ def _wait_with_retry_after(retry_state: RetryCallState) -> float:
     return base_wait + jitter
 
 
+ParseExecutorMode = Literal["auto", "inline", "thread", "process"]
+"""Where source content is parsed: on the event loop, in a thread or in a worker process."""
+
+INLINE_PARSE_MAX_BYTES = 64 * 1024
+"""Sources up to this size are parsed on the event loop in ``auto`` mode (hop costs more)."""
+
+PROCESS_PARSE_MIN_BYTES = 2 * 1024 * 1024
+"""Sources at least this large are parsed in a worker process in ``auto`` mode."""
+
+_PROCESS_PARSE_FORMATS = frozenset({"csv", "plain_text", "text", "html_table", "html"})
+"""Formats whose parsers do per-row Python work and therefore benefit from a process.
+
+JSON is decoded by the C ``json`` module, so shipping the parsed result back from a
+process costs about as much as parsing it and it is parsed in a thread instead.
+"""
+
+_BUILTIN_PARSERS: dict[str, type] = {
+    "json": JSONParser,
+    "csv": CSVParser,
+    "plain_text": PlainTextParser,
+    "html_table": HTMLTableParser,
+    # Legacy aliases for backwards compatibility
+    "text": PlainTextParser,
+    "html": HTMLTableParser,
+}
+
+
+ValidationFilter = Callable[[list[dict[str, Any]]], Awaitable[list[dict[str, Any]]]]
+"""Async callable selecting which fetched proxies need validation."""
+
+
+class SourceContent(NamedTuple):
+    """Raw content fetched from a source, decoded lazily in the parse stage."""
+
+    data: bytes | str
+    encoding: str = "utf-8"
+
+    def text(self) -> str:
+        """Decode the content (replacing undecodable bytes, like ``httpx.Response.text``)."""
+        if isinstance(self.data, str):
+            return self.data
+        return self.data.decode(self.encoding, errors="replace")
+
+
+class ParseTiming(NamedTuple):
+    """Timing of the parse stage for one source fetch."""
+
+    executor: str
+    content_bytes: int
+    proxies: int
+    parse_ms: float
+    recorded_at: float
+
+
+class SourceValidators(NamedTuple):
+    """Cache validators remembered per source for conditional refreshes."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+def _content_digest(content: SourceContent) -> str:
+    """Hash fetched content so unchanged bodies can be skipped without parsing."""
+    data = content.data if isinstance(content.data, bytes) else content.data.encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _apply_source_protocol(proxies: list[dict[str, Any]], protocol: str | None) -> None:
+    """Rewrite ``http://`` URLs to the source protocol (for plain text SOCKS sources)."""
+    if not protocol or protocol == "http":
+        return
+    for proxy in proxies:
+        if "url" in proxy:
+            # Replace http:// with the specified protocol
+            url = proxy["url"]
+            if url.startswith("http://"):
+                proxy["url"] = f"{protocol}://{url[7:]}"
+            # Set protocol field explicitly
+            proxy["protocol"] = protocol
+
+
+def _parse_source_content(
+    parser: Any,
+    content: SourceContent,
+    protocol: str | None,
+) -> tuple[list[dict[str, Any]], float]:
+    """Decode and parse source content; runs inline, in a thread or in a worker process.
+
+    Args:
+        parser: Parser instance, or a parser class to instantiate with defaults
+        content: Fetched source content
+        protocol: Optional protocol override applied to parsed URLs
+
+    Returns:
+        Parsed proxy dictionaries and the parse time in milliseconds
+    """
+    start = time.perf_counter()
+    if isinstance(parser, type):
+        parser = parser()
+    proxies: list[dict[str, Any]] = parser.parse(content.text())
+    _apply_source_protocol(proxies, protocol)
+    return proxies, (time.perf_counter() - start) * 1000
+
+
 class ProxyFetcher:
     """Fetch and parse proxies from multiple sources with validation and deduplication.
 
@@ -1658,6 +1771,11 @@ class ProxyFetcher:
         sources: list[ProxySourceConfig] | None = None,
         validator: ProxyValidator | None = None,
         dedup_cache_ttl: int = 3600,
+        parse_executor: ParseExecutorMode = "auto",
+        parse_workers: int | None = None,
+        browser_max_contexts: int = 3,
+        browser_idle_timeout: float | None = 300.0,
+        browser_block_resources: bool = True,
     ) -> None:
         """
         Initialize proxy fetcher with sources and validator.
@@ -1674,6 +1792,25 @@ class ProxyFetcher:
                 If None, creates a new ProxyValidator with default settings.
             dedup_cache_ttl : int
                 TTL for request deduplication cache in seconds (default: 3600 / 1 hour).
+            parse_executor : ParseExecutorMode
+                Where fetched content is parsed (default: "auto"). "auto" parses
+                small sources inline, large CSV/text/HTML sources in a worker
+                process and everything else in a thread, so big pages do not block
+                the event loop. Sources can override this via
+                ``ProxySourceConfig.parse_executor``.
+            parse_workers : int | None
+                Maximum worker threads/processes for parsing
+                (default: min(4, CPU count)).
+            browser_max_contexts : int
+                Size of the context pool of the shared browser used for
+                ``RenderMode.BROWSER`` sources (default: 3). This bounds how many
+                pages render concurrently; further sources wait for a context.
+            browser_idle_timeout : float | None
+                Seconds without renders after which the shared browser is shut
+                down (default: 300). None keeps it running until close().
+            browser_block_resources : bool
+                Abort image, font, stylesheet and media requests in rendered
+                pages (default: True).
 
         Returns:
             None
@@ -1691,24 +1828,41 @@ class ProxyFetcher:
             - Automatic deduplication by URL+Port
             - Request caching reduces redundant HTTP fetches
             - Validator caching reduces redundant proxy tests
+            - Per-source parse timings are available via get_parse_timings()
+            - BROWSER sources share one lazily launched browser across fetches
+              and refresh cycles
         """
         self.sources = sources or []
         self.validator = validator or ProxyValidator()
-        self._parsers = {
-            "json": JSONParser,
-            "csv": CSVParser,
-            "plain_text": PlainTextParser,
-            "html_table": HTMLTableParser,
-            # Legacy aliases for backwards compatibility
-            "text": PlainTextParser,
-            "html": HTMLTableParser,
-        }
+        self._parsers = dict(_BUILTIN_PARSERS)
         self._client: httpx.AsyncClient | None = None
 
         # Request deduplication cache (URL -> (response_content, timestamp))
-        self._request_cache: dict[str, tuple[str, float]] = {}
+        self._request_cache: dict[str, tuple[SourceContent, float]] = {}
         self._dedup_cache_ttl = dedup_cache_ttl
 
+        # Parse stage: executors are created lazily and shut down in close()
+        self.parse_executor = parse_executor
+        self._parse_workers = parse_workers or min(4, os.cpu_count() or 1)
+        self._parse_thread_pool: ThreadPoolExecutor | None = None
+        self._parse_process_pool: ProcessPoolExecutor | None = None
+        self._parse_timings: dict[str, ParseTiming] = {}
+
+        # Conditional refresh state (URL -> ETag / Last-Modified / content hash)
+        self._source_validators: dict[str, SourceValidators] = {}
+
+        # Shared browser for BROWSER sources: launched on first use, closed when idle
+        self.browser_max_contexts = max(1, browser_max_contexts)
+        self.browser_idle_timeout = browser_idle_timeout
+        self.browser_block_resources = browser_block_resources
+        self._browser_renderer: Any | None = None
+        self._browser_stack: AsyncExitStack | None = None
+        self._browser_loop: asyncio.AbstractEventLoop | None = None
+        self._browser_lock: asyncio.Lock | None = None
+        self._browser_idle_task: asyncio.Task[None] | None = None
+        self._browser_in_flight = 0
+        self._browser_last_used = 0.0
+
     def add_source(self, source: ProxySourceConfig) -> None:
         """
         Add a proxy source to fetch from.
@@ -1777,11 +1931,141 @@ class ProxyFetcher:
             )
         return self._client
 
+    async def _acquire_browser_renderer(self) -> Any:
+        """
+        Get or launch the shared browser renderer for BROWSER sources.
+
+        The render is counted in ``_browser_in_flight`` under the same lock that
+        hands out the renderer, so the idle watcher cannot close it before the
+        caller starts; callers must decrement the count when done.
+
+        Returns:
+            Started BrowserRenderer shared by all sources of this fetcher
+
+        Raises:
+            ImportError: If the browser extra is not installed
+        """
+        loop = asyncio.get_running_loop()
+        if self._browser_loop is not loop:
+            # Playwright objects are bound to the loop they were created on
+            self._abandon_browser_renderer()
+            self._browser_idle_task = None
+            self._browser_lock = asyncio.Lock()
+            self._browser_loop = loop
+        assert self._browser_lock is not None
+
+        async with self._browser_lock:
+            renderer = self._browser_renderer
+            if renderer is not None and not renderer.is_healthy:
+                logger.warning("Shared browser disconnected, relaunching")
+                await self._release_browser_renderer()
+                renderer = None
+
+            if renderer is None:
+                from proxywhirl.browser import DEFAULT_BLOCKED_RESOURCE_TYPES, BrowserRenderer
+
+                stack = AsyncExitStack()
+                renderer = await stack.enter_async_context(
+                    BrowserRenderer(
+                        max_contexts=self.browser_max_contexts,
+                        block_resource_types=(
+                            DEFAULT_BLOCKED_RESOURCE_TYPES if self.browser_block_resources else None
+                        ),
+                    )
+                )
+                self._browser_renderer = renderer
+                self._browser_stack = stack
+                self._browser_last_used = time.monotonic()
+                if self.browser_idle_timeout is not None and self._browser_idle_task is None:
+                    self._browser_idle_task = asyncio.create_task(self._close_browser_when_idle())
+            self._browser_in_flight += 1
+            return renderer
+
+    async def _render_source(self, url: str) -> str:
+        """Render a page with the shared browser, launching it if needed."""
+        renderer = await self._acquire_browser_renderer()
+        try:
+            html: str = await renderer.render(url)
+            return html
+        finally:
+            self._browser_in_flight -= 1
+            self._browser_last_used = time.monotonic()
+
+    async def _close_browser_when_idle(self) -> None:
+        """Background task closing the shared browser after the idle timeout."""
+        assert self.browser_idle_timeout is not None
+        try:
+            while self._browser_renderer is not None:
+                if self._browser_in_flight:
+                    delay = self.browser_idle_timeout
+                else:
+                    delay = self._browser_last_used + self.browser_idle_timeout - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    await self._close_browser_renderer(only_if_idle=True)
+        finally:
+            if self._browser_idle_task is asyncio.current_task():
+                self._browser_idle_task = None
+
+    async def _close_browser_renderer(self, only_if_idle: bool = False) -> None:
+        """Close the shared browser; the next BROWSER source relaunches it.
+
+        Args:
+            only_if_idle: Re-check under the lock that no render started meanwhile
+        """
+        if self._browser_lock is None or self._browser_loop is not asyncio.get_running_loop():
+            self._abandon_browser_renderer()
+            return
+        async with self._browser_lock:
+            if only_if_idle and (
+                self._browser_in_flight
+                or time.monotonic() - self._browser_last_used < (self.browser_idle_timeout or 0)
+            ):
+                return
+            await self._release_browser_renderer()
+
+    def _abandon_browser_renderer(self) -> None:
+        """Drop a shared browser that belongs to another event loop without leaking it.
+
+        The browser is closed on its own loop while that loop is still running
+        (e.g. in another thread); otherwise its process is terminated.
+        """
+        stack, self._browser_stack = self._browser_stack, None
+        renderer, self._browser_renderer = self._browser_renderer, None
+        if stack is None:
+            return
+        loop = self._browser_loop
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            logger.debug("Closing shared browser on its own event loop")
+            asyncio.run_coroutine_threadsafe(stack.aclose(), loop)
+        else:
+            logger.debug("Terminating shared browser of a stopped event loop")
+            renderer.terminate()
+
+    async def _release_browser_renderer(self) -> None:
+        """Shut down the shared browser; callers hold ``_browser_lock``."""
+        stack, self._browser_stack = self._browser_stack, None
+        self._browser_renderer = None
+        if stack is not None:
+            logger.debug("Closing shared browser")
+            await stack.aclose()
+
     async def close(self) -> None:
         """Close client connection and cleanup resources."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        idle_task, self._browser_idle_task = self._browser_idle_task, None
+        if idle_task is not None and idle_task is not asyncio.current_task():
+            idle_task.cancel()
+        await self._close_browser_renderer()
+        if self._parse_thread_pool is not None:
+            self._parse_thread_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_thread_pool = None
+        if self._parse_process_pool is not None:
+            self._parse_process_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_process_pool = None
         # Also close validator's clients
         if self.validator:
             await self.validator.close()
@@ -1797,7 +2081,7 @@ class ProxyFetcher:
         """
         return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()
 
-    def _get_cached_response(self, url: str) -> str | None:
+    def _get_cached_response(self, url: str) -> SourceContent | None:
         """Get cached response if not expired.
 
         Args:
@@ -1817,7 +2101,7 @@ class ProxyFetcher:
                 del self._request_cache[cache_key]
         return None
 
-    def _set_cached_response(self, url: str, content: str) -> None:
+    def _set_cached_response(self, url: str, content: SourceContent) -> None:
         """Cache a response content.
 
         Args:
@@ -1835,6 +2119,145 @@ class ProxyFetcher:
         """Async context manager exit."""
         await self.close()
 
+    def get_parse_timings(self) -> dict[str, ParseTiming]:
+        """
+        Get the most recent parse-stage timing for each source URL.
+
+        Returns:
+            dict[str, ParseTiming]
+                Mapping of source URL to executor used, content size, proxies
+                parsed and parse time in milliseconds.
+
+        Example:
+            >>> await fetcher.fetch_all(validate=False)
+            >>> for url, timing in fetcher.get_parse_timings().items():
+            ...     print(f"{url}: {timing.parse_ms:.1f}ms via {timing.executor}")
+        """
+        return dict(self._parse_timings)
+
+    def _select_parse_executor(
+        self, source: ProxySourceConfig, format_key: str | None, size: int
+    ) -> str:
+        """Choose where to parse a source from its override, size and format.
+
+        Args:
+            source: Source being parsed
+            format_key: Built-in format key, or None for custom parsers
+            size: Content size in bytes (characters for browser-rendered pages)
+
+        Returns:
+            One of "inline", "thread" or "process"
+        """
+        mode = source.parse_executor or self.parse_executor
+        if mode == "auto":
+            if size <= INLINE_PARSE_MAX_BYTES:
+                mode = "inline"
+            elif size >= PROCESS_PARSE_MIN_BYTES and format_key in _PROCESS_PARSE_FORMATS:
+                mode = "process"
+            else:
+                mode = "thread"
+        # Only built-in parsers are guaranteed to be importable in a worker process
+        if mode == "process" and (
+            format_key is None
+            or self._parsers.get(format_key) is not _BUILTIN_PARSERS.get(format_key)
+        ):
+            mode = "thread"
+        return mode
+
+    def _get_parse_thread_pool(self) -> ThreadPoolExecutor:
+        if self._parse_thread_pool is None:
+            self._parse_thread_pool = ThreadPoolExecutor(
+                max_workers=self._parse_workers, thread_name_prefix="proxywhirl-parse"
+            )
+        return self._parse_thread_pool
+
+    def _get_parse_process_pool(self) -> ProcessPoolExecutor:
+        if self._parse_process_pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._parse_process_pool = ProcessPoolExecutor(
+                max_workers=self._parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._parse_process_pool
+
+    async def _parse_content(
+        self,
+        source: ProxySourceConfig,
+        parser: Any,
+        content: SourceContent,
+        format_key: str | None = None,
+        protocol: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the parse stage on the selected executor and record its timing.
+
+        Args:
+            source: Source the content was fetched from
+            parser: Parser class (built-in formats) or parser instance (custom)
+            content: Fetched content
+            format_key: Format key for built-in parsers, None for custom parsers
+            protocol: Optional protocol override applied to parsed URLs
+
+        Returns:
+            Parsed proxy dictionaries
+        """
+        size = len(content.data)
+        executor = self._select_parse_executor(source, format_key, size)
+
+        if executor == "inline":
+            proxies, parse_ms = _parse_source_content(parser, content, protocol)
+        else:
+            loop = asyncio.get_running_loop()
+            pool: ThreadPoolExecutor | ProcessPoolExecutor
+            if executor == "process":
+                pool = self._get_parse_process_pool()
+            else:
+                pool = self._get_parse_thread_pool()
+            try:
+                proxies, parse_ms = await loop.run_in_executor(
+                    pool, _parse_source_content, parser, content, protocol
+                )
+            except BrokenProcessPool:
+                logger.warning("Parse process pool broke; parsing {} in a thread", source.url)
+                self._parse_process_pool = None
+                executor = "thread"
+                proxies, parse_ms = await loop.run_in_executor(
+                    self._get_parse_thread_pool(), _parse_source_content, parser, content, protocol
+                )
+
+        self._parse_timings[str(source.url)] = ParseTiming(
+            executor=executor,
+            content_bytes=size,
+            proxies=len(proxies),
+            parse_ms=parse_ms,
+            recorded_at=time.time(),
+        )
+        logger.debug(
+            "Parsed {} proxies from {} ({} bytes) in {:.1f}ms via {}",
+            len(proxies),
+            source.url,
+            size,
+            parse_ms,
+            executor,
+        )
+        return proxies
+
+    async def _parse_content_by_format(
+        self, source: ProxySourceConfig, content: SourceContent
+    ) -> list[dict[str, Any]]:
+        """Parse content with the registered parser for the source format."""
+        # Note: parser field in ProxySourceConfig is now a string identifier, not an object
+        # Custom parsers should be registered via _parsers dict
+        format_key = source.format.value if hasattr(source.format, "value") else source.format
+        if format_key in self._parsers:
+            parser_class = self._parsers[format_key]
+        else:
+            raise ProxyFetchError(f"Unsupported format: {source.format}")
+
+        # Parse proxies (source protocol is applied in the parse stage)
+        return await self._parse_content(
+            source, parser_class, content, format_key=format_key, protocol=source.protocol
+        )
+
     @retry(
         stop=stop_after_attempt(5),  # More retries for rate limiting scenarios
         wait=_wait_with_retry_after,  # Respects Retry-After header with fallback to exp backoff
@@ -1895,76 +2318,136 @@ class ProxyFetcher:
             - Protocol override applied after parsing (for plain text sources)
             - Custom parsers take precedence over format-based parsers
         """
+        proxies = await self._fetch_source(source, conditional=False)
+        return proxies if proxies is not None else []
+
+    @retry(
+        stop=stop_after_attempt(5),
+        wait=_wait_with_retry_after,
+        retry=(
+            retry_if_exception_type(httpx.TimeoutException)
+            | retry_if_exception(_is_retryable_http_error)
+        ),
+        reraise=True,
+    )
+    async def fetch_if_changed(self, source: ProxySourceConfig) -> list[dict[str, Any]] | None:
+        """
+        Re-fetch a source only if its content changed since the last fetch.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` with the ETag and
+        Last-Modified values remembered from the previous response, and
+        compares a hash of the body with the last parsed body. The request
+        cache is bypassed so the origin is always consulted.
+
+        Args:
+            source : ProxySourceConfig
+                Proxy source configuration to refresh.
+
+        Returns:
+            list[dict[str, Any]] | None
+                Parsed proxies if the content changed, or None if the server
+                answered 304 Not Modified or returned an identical body.
+
+        Raises:
+            ProxyFetchError
+                If HTTP request fails after retries, format is unsupported,
+                or parsing fails.
+
+        Example:
+            >>> proxies = await fetcher.fetch_if_changed(source)
+            >>> if proxies is None:
+            ...     print("Source unchanged, nothing to validate")
+        """
+        return await self._fetch_source(source, conditional=True)
+
+    def _conditional_headers(self, url: str) -> dict[str, str]:
+        """Build conditional request headers from remembered validators."""
+        validators = self._source_validators.get(url)
+        headers: dict[str, str] = {}
+        if validators is not None:
+            if validators.etag:
+                headers["If-None-Match"] = validators.etag
+            if validators.last_modified:
+                headers["If-Modified-Since"] = validators.last_modified
+        return headers
+
+    def _remember_validators(
+        self, url: str, response: httpx.Response | None, content_hash: str
+    ) -> None:
+        """Store the body hash and, for HTTP responses, the ETag / Last-Modified.
+
+        Only called once the body is known to parse, so a body that failed to
+        parse is requested unconditionally (and parsed again) next time.
+        """
+        validators = self._source_validators.get(url, SourceValidators())
+        if response is not None:
+            validators = validators._replace(
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+        self._source_validators[url] = validators._replace(content_hash=content_hash)
+
+    async def _fetch_source(
+        self, source: ProxySourceConfig, conditional: bool
+    ) -> list[dict[str, Any]] | None:
+        """Fetch and parse a source; conditional fetches return None when unchanged."""
         try:
             # Check request cache first to avoid duplicate requests
             source_url = str(source.url)
-            cached_content = self._get_cached_response(source_url)
+            content = None if conditional else self._get_cached_response(source_url)
+            response: httpx.Response | None = None
 
             # Determine if browser rendering is needed
-            html_content: str
-
-            if cached_content is not None:
-                html_content = cached_content
-            elif source.render_mode == RenderMode.BROWSER:
-                # Use browser rendering for JavaScript-heavy pages
+            if content is None and source.render_mode == RenderMode.BROWSER:
+                # Use the shared browser for JavaScript-heavy pages
                 try:
-                    from proxywhirl.browser import BrowserRenderer
+                    content = SourceContent(await self._render_source(source_url))
                 except ImportError as e:
                     raise ProxyFetchError(
                         "Browser rendering requires Playwright. "
                         "Install with: pip install 'proxywhirl[js]' or pip install playwright"
                     ) from e
-
-                try:
-                    async with BrowserRenderer() as renderer:
-                        html_content = await renderer.render(source_url)
                 except TimeoutError as e:
                     raise ProxyFetchError(f"Browser timeout fetching from {source_url}: {e}") from e
                 except RuntimeError as e:
                     raise ProxyFetchError(f"Browser error fetching from {source_url}: {e}") from e
 
                 # Cache the rendered content
-                self._set_cached_response(source_url, html_content)
-            else:
+                self._set_cached_response(source_url, content)
+            elif content is None:
                 # Use standard HTTP client for static pages
                 client = await self._get_client()
-                response = await client.get(source_url)
+                headers = self._conditional_headers(source_url) if conditional else {}
+                if headers:
+                    response = await client.get(source_url, headers=headers)
+                    if response.status_code == 304:
+                        logger.debug("Source {} not modified (304)", source_url)
+                        return None
+                else:
+                    response = await client.get(source_url)
                 response.raise_for_status()
-                html_content = response.text
+                # Keep the raw bytes; decoding happens in the parse stage off the loop
+                content = SourceContent(response.content, response.charset_encoding or "utf-8")
 
                 # Cache the response content
-                self._set_cached_response(source_url, html_content)
+                self._set_cached_response(source_url, content)
+
+            # Skip parsing (and downstream validation) when the body is unchanged
+            digest = _content_digest(content)
+            validators = self._source_validators.get(source_url, SourceValidators())
+            if conditional and validators.content_hash == digest:
+                logger.debug("Source {} content unchanged", source_url)
+                self._remember_validators(source_url, response, digest)
+                return None
 
             # Use custom parser if provided
             if source.custom_parser:
-                proxies_list: list[dict[str, Any]] = source.custom_parser.parse(html_content)
-                return proxies_list
-
-            # Otherwise use format-based parser
-            # Note: parser field in ProxySourceConfig is now a string identifier, not an object
-            # Custom parsers should be registered via _parsers dict
-            format_key = source.format.value if hasattr(source.format, "value") else source.format
-            if format_key in self._parsers:
-                parser_class = self._parsers[format_key]
-                parser = parser_class()
+                proxies = await self._parse_content(source, source.custom_parser, content)
             else:
-                raise ProxyFetchError(f"Unsupported format: {source.format}")
-
-            # Parse proxies
-            proxies_list: list[dict[str, Any]] = parser.parse(html_content)
+                proxies = await self._parse_content_by_format(source, content)
 
-            # Apply source protocol if specified (for plain text SOCKS sources)
-            if source.protocol and source.protocol != "http":
-                for proxy in proxies_list:
-                    if "url" in proxy:
-                        # Replace http:// with the specified protocol
-                        url = proxy["url"]
-                        if url.startswith("http://"):
-                            proxy["url"] = f"{source.protocol}://{url[7:]}"
-                        # Set protocol field explicitly
-                        proxy["protocol"] = source.protocol
-
-            return proxies_list
+            self._remember_validators(source_url, response, digest)
+            return proxies
 
         except httpx.HTTPStatusError as e:
             # Let retryable HTTP errors (429, 503, 502, 504) bubble up to retry decorator
@@ -1983,6 +2466,7 @@ class ProxyFetcher:
         deduplicate: bool = True,
         fetch_progress_callback: Any | None = None,
         validate_progress_callback: Any | None = None,
+        validation_filter: ValidationFilter | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch and optionally validate proxies from all configured sources in parallel.
@@ -2002,6 +2486,11 @@ class ProxyFetcher:
             validate_progress_callback : callable | None
                 Optional callback with signature callback(completed, total, valid_count)
                 called during validation progress. Default: None.
+            validation_filter : ValidationFilter | None
+                Optional async callable given the deduplicated proxies that returns
+                the subset needing validation (e.g. only proxies that are new or
+                stale in storage). Proxies it drops are neither validated nor
+                returned. Only used when validate=True. Default: None.
 
         Returns:
             list[dict[str, Any]]
@@ -2071,37 +2560,125 @@ class ProxyFetcher:
         if deduplicate:
             all_proxies = deduplicate_proxies(all_proxies)
 
-        # Validate all proxies if requested
+        # Validate all proxies (or only those the filter selects) if requested
         if validate:
+            if validation_filter is not None:
+                fetched_count = len(all_proxies)
+                all_proxies = await validation_filter(all_proxies)
+                logger.info(
+                    "Validating {} of {} fetched proxies ({} skipped by filter)",
+                    len(all_proxies),
+                    fetched_count,
+                    fetched_count - len(all_proxies),
+                )
             return await self.validator.validate_batch(
                 all_proxies, progress_callback=validate_progress_callback
             )
 
         return all_proxies
 
+    async def _refresh_if_changed(self, source: ProxySourceConfig) -> list[dict[str, Any]] | None:
+        """Conditionally refresh one source, logging (not raising) fetch failures."""
+        try:
+            return await self.fetch_if_changed(source)
+        except (ProxyFetchError, httpx.HTTPError):
+            logger.opt(exception=True).warning("Failed to refresh {}", source.url)
+            return None
+
+    async def refresh_sources(
+        self, sources: list[ProxySourceConfig], validate: bool = True
+    ) -> list[dict[str, Any]] | None:
+        """
+        Conditionally refresh sources and return proxies from those that changed.
+
+        Args:
+            sources : list[ProxySourceConfig]
+                Sources to refresh concurrently.
+            validate : bool
+                Whether to validate proxies from changed sources (default: True).
+
+        Returns:
+            list[dict[str, Any]] | None
+                Deduplicated (and optionally validated) proxies from sources whose
+                content changed, or None if no source changed.
+        """
+        results = await asyncio.gather(*(self._refresh_if_changed(s) for s in sources))
+        changed = [result for result in results if result is not None]
+        logger.info(
+            "Refreshed {} sources: {} changed, {} unchanged or failed",
+            len(sources),
+            len(changed),
+            len(sources) - len(changed),
+        )
+        if not changed:
+            return None
+
+        proxies = deduplicate_proxies([proxy for result in changed for proxy in result])
+        if validate:
+            return await self.validator.validate_batch(proxies)
+        return proxies
+
     async def start_periodic_refresh(
         self,
         callback: Any | None = None,
-        interval: int | None = None,
+        interval: float | None = None,
+        validate: bool = True,
     ) -> None:
         """
-        Start periodic proxy refresh.
+        Start periodic proxy refresh with per-source scheduling.
+
+        Each source is refreshed on its own ``refresh_interval``, using a
+        priority queue of next-due times. Refreshes are conditional (see
+        fetch_if_changed): sources answering 304 Not Modified or returning an
+        identical body are neither parsed nor validated. Sources added or
+        removed while the loop runs are picked up at the next wake-up.
 
         Args:
-            callback: Optional callback to invoke with new proxies
-            interval: Override default refresh interval (seconds)
+            callback: Optional async callback invoked with the proxies from
+                sources that changed; not invoked when nothing changed
+            interval: Override every source's refresh interval (seconds)
+            validate: Whether to validate changed proxies before the callback
         """
+        schedule: list[tuple[float, int, ProxySourceConfig]] = []
+        scheduled: set[int] = set()
+        tiebreak = itertools.count()
+
+        def interval_for(source: ProxySourceConfig) -> float:
+            return interval or source.refresh_interval
+
         while True:
-            # Determine interval (use first source's interval if not specified)
-            refresh_interval = interval or (
-                self.sources[0].refresh_interval if self.sources else 3600
-            )
+            now = time.monotonic()
+            current = {id(source) for source in self.sources}
+
+            # Schedule sources added since the last wake-up
+            for source in self.sources:
+                if id(source) not in scheduled:
+                    scheduled.add(id(source))
+                    heapq.heappush(schedule, (now + interval_for(source), next(tiebreak), source))
 
-            await asyncio.sleep(refresh_interval)
+            if not schedule:
+                await asyncio.sleep(interval or 3600)
+                continue
+            if schedule[0][0] > now:
+                await asyncio.sleep(schedule[0][0] - now)
+                continue
+
+            due: list[ProxySourceConfig] = []
+            while schedule and schedule[0][0] <= now:
+                due_at, _, source = heapq.heappop(schedule)
+                if id(source) not in current:
+                    scheduled.discard(id(source))
+                    continue
+                due.append(source)
+                # Keep each source's cadence, but never fall behind after a slow cycle
+                next_due = max(due_at + interval_for(source), now)
+                heapq.heappush(schedule, (next_due, next(tiebreak), source))
+
+            if not due:
+                continue
 
-            # Fetch new proxies
-            proxies = await self.fetch_all()
+            proxies = await self.refresh_sources(due, validate=validate)
 
-            # Invoke callback if provided
-            if callback:
+            # Invoke callback if anything changed
+            if callback and proxies is not None:
                 await callback(proxies)
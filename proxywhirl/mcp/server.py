@@ -236,11 +236,12 @@ async def get_rotator() -> AsyncProxyWhirl:
 
                     storage = SQLiteStorage(str(db_path))
                     await storage.initialize()
-                    proxy_dicts = await storage.load()
-                    for proxy_dict in proxy_dicts:
-                        await _rotator.add_proxy(dict_to_proxy(proxy_dict))
+                    loaded = 0
+                    async for proxy_dict in storage.iter_proxies():
+                        await _rotator.add_proxy(dict_to_proxy(proxy_dict, trusted=True))
+                        loaded += 1
                     await storage.close()
-                    logger.info(f"MCP: Auto-loaded {len(proxy_dicts)} proxies from {db_path}")
+                    logger.info(f"MCP: Auto-loaded {loaded} proxies from {db_path}")
                 except Exception as e:
                     logger.warning(
                         f"MCP: Failed to auto-load proxies from {db_path}: {_sanitize_error_text(e)}"
@@ -1081,6 +1082,9 @@ async def _validate_proxy_impl(
                 }
             )
 
+    # health_status is assigned directly, outside the pool API
+    rotator.pool.bump_version()
+
     # Report completion
     if ctx is not None:
         try:
@@ -9,6 +9,15 @@ Metrics exposed:
 - proxywhirl_proxy_health_status: Gauge for proxy health (1=healthy, 0=unhealthy)
 - proxywhirl_active_proxies: Gauge for number of active proxies
 - proxywhirl_circuit_breaker_state: Gauge for circuit breaker states
+- proxywhirl_stage_duration_seconds: Histogram of per-stage latency (stage profiling)
+- proxywhirl_stage_duration_quantile_seconds: Gauge of p50/p90/p99/p99.9 per stage
+
+With ``MetricsCollector(max_proxy_series=N)`` (or
+``PROXYWHIRL_METRICS_MAX_PROXY_SERIES=N`` for the global collector) the per-proxy
+series are limited to the N busiest proxies plus ``proxy_id="other"``, and the
+request path only updates per-thread buffers; see :class:`BoundedProxyMetrics`.
+Bounded mode also exports proxywhirl_proxies_by_health and
+proxywhirl_circuit_breakers_by_state.
 
 Usage:
     from proxywhirl.metrics_collector import MetricsCollector
@@ -20,14 +29,31 @@ Usage:
 
 from __future__ import annotations
 
+import heapq
 import os
-from typing import Literal
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal
 
 from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.core import (
+    CounterMetricFamily,
+    GaugeMetricFamily,
+    HistogramMetricFamily,
+    Metric,
+)
+from prometheus_client.samples import Exemplar
+
+if TYPE_CHECKING:
+    from proxywhirl.stage_timing import StageProfiler
 
 # Optional OpenTelemetry support
 try:
     from opentelemetry import metrics as otel_metrics
+    from opentelemetry.metrics import CallbackOptions, Observation
     from opentelemetry.sdk.metrics import MeterProvider
     from opentelemetry.sdk.metrics.export import InMemoryMetricReader
 
@@ -37,6 +63,424 @@ except ImportError:
 
 OTEL_ENABLED = os.environ.get("OTEL_ENABLED", "").lower() in ("1", "true", "yes", "on")
 
+REQUEST_DURATION_BUCKETS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# proxy_id label shared by every proxy outside the top-K in bounded mode
+OTHER_PROXY_LABEL = "other"
+
+_CIRCUIT_BREAKER_STATES = {"closed": 0, "open": 1, "half-open": 2}
+
+# Prometheus buckets derived from the stage histograms when scraped
+STAGE_DURATION_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+STAGE_DURATION_QUANTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class StageDurationCollector:
+    """Prometheus collector that renders a :class:`StageProfiler` at scrape time."""
+
+    def __init__(self, profiler: StageProfiler) -> None:
+        self.profiler = profiler
+
+    def describe(self) -> Iterable[Metric]:
+        """Describe the metric families without reading the histograms."""
+        return self._families()
+
+    def collect(self) -> Iterable[Metric]:
+        """Build histogram and quantile families from the current histograms."""
+        histogram, quantiles = self._families()
+        for stage, stage_histogram in self.profiler.histograms.items():
+            cumulative = stage_histogram.cumulative_counts(STAGE_DURATION_BUCKETS)
+            buckets: list[tuple[str, float]] = [
+                (str(bound), float(count))
+                for bound, count in zip(STAGE_DURATION_BUCKETS, cumulative, strict=True)
+            ]
+            buckets.append(("+Inf", float(stage_histogram.count)))
+            histogram.add_metric([stage], buckets, sum_value=stage_histogram.sum_seconds)
+            for quantile in STAGE_DURATION_QUANTILES:
+                quantiles.add_metric(
+                    [stage, str(quantile / 100)], stage_histogram.percentile(quantile)
+                )
+        return [histogram, quantiles]
+
+    @staticmethod
+    def _families() -> tuple[HistogramMetricFamily, GaugeMetricFamily]:
+        return (
+            HistogramMetricFamily(
+                "proxywhirl_stage_duration_seconds",
+                "Per-stage request latency in seconds (sampled requests)",
+                labels=["stage"],
+            ),
+            GaugeMetricFamily(
+                "proxywhirl_stage_duration_quantile_seconds",
+                "Per-stage request latency quantiles in seconds (sampled requests)",
+                labels=["stage", "quantile"],
+            ),
+        )
+
+
+class _ThreadBuffer:
+    """Request metrics pre-aggregated by one thread between flushes.
+
+    Only the owning thread and the flusher touch it, so its lock is almost
+    never contended.
+    """
+
+    __slots__ = (
+        "durations",
+        "exemplars",
+        "hits",
+        "lock",
+        "request_exemplars",
+        "requests",
+        "thread",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.thread = threading.current_thread()
+        self._clear()
+
+    def _clear(self) -> None:
+        # (status, label) -> count
+        self.requests: dict[tuple[str, str], int] = {}
+        # label -> per-bucket counts followed by the duration sum
+        self.durations: dict[str, list[float]] = {}
+        # proxy_id -> requests, used to rank proxies for the top-K
+        self.hits: dict[str, int] = {}
+        # Latest "other" observation per duration bucket / per status
+        self.exemplars: dict[int, tuple[str, float, float]] = {}
+        self.request_exemplars: dict[str, tuple[str, float]] = {}
+
+    def drain(self) -> _ThreadBuffer:
+        """Move the buffered values into a detached copy and clear this buffer."""
+        drained = _ThreadBuffer.__new__(_ThreadBuffer)
+        with self.lock:
+            drained.requests, drained.durations, drained.hits = (
+                self.requests,
+                self.durations,
+                self.hits,
+            )
+            drained.exemplars, drained.request_exemplars = self.exemplars, self.request_exemplars
+            self._clear()
+        return drained
+
+
+class BoundedProxyMetrics:
+    """Per-proxy request, health and circuit breaker metrics with bounded cardinality.
+
+    Only the ``max_series`` busiest proxies get their own ``proxy_id`` series;
+    all others share ``proxy_id="other"``. The top-K is re-ranked on every flush
+    from exponentially decayed request counts. Series of proxies that drop out
+    are removed after their totals are added to ``other``, so sums across labels
+    stay monotonic, and later requests from them count towards ``other``.
+
+    ``record_request`` only updates a per-thread buffer. Buffers are merged
+    every ``flush_interval`` seconds and before each scrape, so the request path
+    never touches prometheus_client locks or label lookups. "other" histogram
+    buckets and counters carry the latest proxy as an exemplar (exposed in the
+    OpenMetrics format) to drill down into proxies without their own series.
+    Health and circuit breaker gauges are only exported for top-K proxies; the
+    per-state totals cover every proxy.
+
+    Args:
+        max_series: Number of proxies with their own series
+        flush_interval: Seconds between background flushes; None flushes only
+            when scraped or when :meth:`flush` is called
+        decay: Factor applied to request counts on each flush when ranking
+    """
+
+    def __init__(
+        self,
+        max_series: int,
+        flush_interval: float | None = 15.0,
+        decay: float = 0.5,
+    ) -> None:
+        if max_series < 0:
+            raise ValueError("max_series must be >= 0")
+        self.max_series = max_series
+        self.decay = decay
+        self.top_proxies: frozenset[str] = frozenset()
+
+        self._local = threading.local()
+        self._buffers: list[_ThreadBuffer] = []
+        self._buffers_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        # Flushed totals, rendered on collect()
+        self._requests: dict[tuple[str, str], float] = {}
+        self._durations: dict[str, list[float]] = {}
+        self._exemplars: dict[int, tuple[str, float, float]] = {}
+        self._request_exemplars: dict[str, tuple[str, float]] = {}
+        self._scores: dict[str, float] = {}
+
+        # Gauge state, kept per proxy with incremental per-state totals
+        self._state_lock = threading.Lock()
+        self._health: dict[str, int] = {}
+        self._health_totals = {"healthy": 0, "unhealthy": 0}
+        self._breakers: dict[str, str] = {}
+        self._breaker_totals = dict.fromkeys(_CIRCUIT_BREAKER_STATES, 0)
+
+        self._stop_event = threading.Event()
+        if flush_interval is not None:
+            threading.Thread(
+                target=BoundedProxyMetrics._flush_loop,
+                args=(weakref.ref(self), self._stop_event, flush_interval),
+                daemon=True,
+                name="proxywhirl-metrics-flush",
+            ).start()
+
+    @staticmethod
+    def _flush_loop(
+        ref: weakref.ref[BoundedProxyMetrics], stop_event: threading.Event, interval: float
+    ) -> None:
+        while not stop_event.wait(interval):
+            metrics = ref()
+            if metrics is None:
+                return
+            metrics.flush()
+            del metrics
+
+    def close(self) -> None:
+        """Stop the background flush thread."""
+        self._stop_event.set()
+
+    def label_for(self, proxy_id: str) -> str:
+        """Return the ``proxy_id`` label value used for ``proxy_id``."""
+        return proxy_id if proxy_id in self.top_proxies else OTHER_PROXY_LABEL
+
+    def _buffer(self) -> _ThreadBuffer:
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = _ThreadBuffer()
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+            return buffer
+
+    def record_request(self, status: str, duration: float, proxy_id: str) -> str:
+        """Buffer one request and return the ``proxy_id`` label it was counted under."""
+        label = proxy_id if proxy_id in self.top_proxies else OTHER_PROXY_LABEL
+        bucket = bisect_left(REQUEST_DURATION_BUCKETS, duration)
+        buffer = self._buffer()
+        with buffer.lock:
+            key = (status, label)
+            buffer.requests[key] = buffer.requests.get(key, 0) + 1
+            counts = buffer.durations.get(label)
+            if counts is None:
+                counts = buffer.durations[label] = [0.0] * (len(REQUEST_DURATION_BUCKETS) + 2)
+            counts[bucket] += 1
+            counts[-1] += duration
+            buffer.hits[proxy_id] = buffer.hits.get(proxy_id, 0) + 1
+            if label == OTHER_PROXY_LABEL:
+                now = time.time()
+                buffer.exemplars[bucket] = (proxy_id, duration, now)
+                buffer.request_exemplars[status] = (proxy_id, now)
+        return label
+
+    def flush(self) -> None:
+        """Merge thread buffers into the exported totals and re-rank the top-K."""
+        with self._flush_lock:
+            with self._buffers_lock:
+                buffers = list(self._buffers)
+                self._buffers = [b for b in buffers if b.thread.is_alive()]
+
+            top = self.top_proxies
+            hits: dict[str, int] = {}
+            for drained in (buffer.drain() for buffer in buffers):
+                # Labels recorded against an older top-K fold into "other"
+                for (status, label), count in drained.requests.items():
+                    key = (status, label if label in top else OTHER_PROXY_LABEL)
+                    self._requests[key] = self._requests.get(key, 0.0) + count
+                for label, counts in drained.durations.items():
+                    label = label if label in top else OTHER_PROXY_LABEL
+                    totals = self._durations.get(label)
+                    if totals is None:
+                        self._durations[label] = counts
+                    else:
+                        for index, value in enumerate(counts):
+                            totals[index] += value
+                for proxy_id, count in drained.hits.items():
+                    hits[proxy_id] = hits.get(proxy_id, 0) + count
+                self._exemplars.update(drained.exemplars)
+                self._request_exemplars.update(drained.request_exemplars)
+
+            self._rerank(hits)
+
+    def _rerank(self, hits: dict[str, int]) -> None:
+        scores = self._scores
+        for proxy_id in list(scores):
+            score = scores[proxy_id] * self.decay
+            if score < 0.25:
+                del scores[proxy_id]
+            else:
+                scores[proxy_id] = score
+        for proxy_id, count in hits.items():
+            scores[proxy_id] = scores.get(proxy_id, 0.0) + count
+
+        top = frozenset(heapq.nlargest(self.max_series, scores, key=scores.__getitem__))
+        dropped = self.top_proxies - top
+        if dropped:
+            # Fold evicted series into "other" so sums across labels never decrease
+            requests: dict[tuple[str, str], float] = {}
+            for (status, label), value in self._requests.items():
+                key = (status, OTHER_PROXY_LABEL if label in dropped else label)
+                requests[key] = requests.get(key, 0.0) + value
+            self._requests = requests
+            for proxy_id in dropped:
+                counts = self._durations.pop(proxy_id, None)
+                if counts is None:
+                    continue
+                totals = self._durations.get(OTHER_PROXY_LABEL)
+                if totals is None:
+                    self._durations[OTHER_PROXY_LABEL] = counts
+                else:
+                    for index, value in enumerate(counts):
+                        totals[index] += value
+        self.top_proxies = top
+
+    def update_proxy_health(self, proxy_id: str, value: int) -> None:
+        """Record a proxy's health (1=healthy, 0=unhealthy)."""
+        with self._state_lock:
+            previous = self._health.get(proxy_id)
+            if previous is not None:
+                self._health_totals["healthy" if previous else "unhealthy"] -= 1
+            self._health[proxy_id] = value
+            self._health_totals["healthy" if value else "unhealthy"] += 1
+
+    def update_circuit_breaker_state(self, proxy_id: str, state: str) -> None:
+        """Record a proxy's circuit breaker state."""
+        with self._state_lock:
+            previous = self._breakers.get(proxy_id)
+            if previous is not None:
+                self._breaker_totals[previous] -= 1
+            self._breakers[proxy_id] = state
+            self._breaker_totals[state] += 1
+
+    def forget_proxy(self, proxy_id: str) -> None:
+        """Drop all state for a removed proxy."""
+        with self._state_lock:
+            health = self._health.pop(proxy_id, None)
+            if health is not None:
+                self._health_totals["healthy" if health else "unhealthy"] -= 1
+            state = self._breakers.pop(proxy_id, None)
+            if state is not None:
+                self._breaker_totals[state] -= 1
+        with self._flush_lock:
+            self._scores.pop(proxy_id, None)
+
+    def describe(self) -> Iterable[Metric]:
+        """Describe the metric families without flushing."""
+        return self._families()
+
+    def collect(self) -> Iterable[Metric]:
+        """Flush the thread buffers and render the bounded families."""
+        self.flush()
+        requests, durations, health, breakers, health_totals, breaker_totals = self._families()
+
+        with self._flush_lock:
+            request_totals = list(self._requests.items())
+            duration_totals = {label: list(counts) for label, counts in self._durations.items()}
+            exemplars = dict(self._exemplars)
+            request_exemplars = dict(self._request_exemplars)
+            top = self.top_proxies
+
+        for (status, label), value in request_totals:
+            exemplar = None
+            if label == OTHER_PROXY_LABEL and status in request_exemplars:
+                proxy_id, timestamp = request_exemplars[status]
+                exemplar = Exemplar({"proxy_id": proxy_id}, 1.0, timestamp)
+            requests.add_metric([status, label], value, exemplar=exemplar)
+
+        bounds = [str(bound) for bound in REQUEST_DURATION_BUCKETS] + ["+Inf"]
+        for label, counts in duration_totals.items():
+            buckets: list[Any] = []
+            cumulative = 0.0
+            for index, bound in enumerate(bounds):
+                cumulative += counts[index]
+                if label == OTHER_PROXY_LABEL and index in exemplars:
+                    proxy_id, value, timestamp = exemplars[index]
+                    example = Exemplar({"proxy_id": proxy_id}, value, timestamp)
+                    buckets.append((bound, cumulative, example))
+                else:
+                    buckets.append((bound, cumulative))
+            durations.add_metric([label], buckets, sum_value=counts[-1])
+
+        with self._state_lock:
+            for proxy_id in top:
+                if proxy_id in self._health:
+                    health.add_metric([proxy_id], self._health[proxy_id])
+                if proxy_id in self._breakers:
+                    breakers.add_metric(
+                        [proxy_id], _CIRCUIT_BREAKER_STATES[self._breakers[proxy_id]]
+                    )
+            for status, count in self._health_totals.items():
+                health_totals.add_metric([status], count)
+            for state, count in self._breaker_totals.items():
+                breaker_totals.add_metric([state], count)
+
+        return [requests, durations, health, breakers, health_totals, breaker_totals]
+
+    @staticmethod
+    def _families() -> tuple[
+        CounterMetricFamily,
+        HistogramMetricFamily,
+        GaugeMetricFamily,
+        GaugeMetricFamily,
+        GaugeMetricFamily,
+        GaugeMetricFamily,
+    ]:
+        return (
+            CounterMetricFamily(
+                "proxywhirl_requests_total",
+                "Total number of requests made through proxies",
+                labels=["status", "proxy_id"],
+            ),
+            HistogramMetricFamily(
+                "proxywhirl_request_duration_seconds",
+                "Request duration in seconds",
+                labels=["proxy_id"],
+            ),
+            GaugeMetricFamily(
+                "proxywhirl_proxy_health_status",
+                "Current proxy health status (1=healthy, 0=unhealthy)",
+                labels=["proxy_id"],
+            ),
+            GaugeMetricFamily(
+                "proxywhirl_circuit_breaker_state",
+                "Circuit breaker state (0=closed, 1=open, 2=half-open)",
+                labels=["proxy_id"],
+            ),
+            GaugeMetricFamily(
+                "proxywhirl_proxies_by_health",
+                "Number of proxies per health status",
+                labels=["health"],
+            ),
+            GaugeMetricFamily(
+                "proxywhirl_circuit_breakers_by_state",
+                "Number of circuit breakers per state",
+                labels=["state"],
+            ),
+        )
+
 
 class MetricsCollector:
     """Centralized Prometheus metrics collector for ProxyWhirl.
@@ -45,39 +489,66 @@ class MetricsCollector:
     All metrics follow Prometheus naming conventions and best practices.
     """
 
-    def __init__(self, registry: CollectorRegistry | None = None) -> None:
+    def __init__(
+        self,
+        registry: CollectorRegistry | None = None,
+        max_proxy_series: int | None = None,
+        flush_interval: float | None = 15.0,
+    ) -> None:
         """Initialize Prometheus metrics collectors.
 
         Args:
             registry: Optional custom registry. If None, uses the default REGISTRY.
                      This allows for isolated testing without metric collisions.
+            max_proxy_series: Bound per-proxy series to the busiest N proxies plus
+                     ``proxy_id="other"`` (see :class:`BoundedProxyMetrics`). None
+                     keeps one series per proxy.
+            flush_interval: Seconds between background flushes in bounded mode
         """
         self._registry = registry or REGISTRY
 
-        # Counter: Total requests made through proxies
-        self.requests_total = Counter(
-            "proxywhirl_requests_total",
-            "Total number of requests made through proxies",
-            ["status", "proxy_id"],
-            registry=self._registry,
-        )
-
-        # Histogram: Request latency distribution
-        self.request_duration_seconds = Histogram(
-            "proxywhirl_request_duration_seconds",
-            "Request duration in seconds",
-            ["proxy_id"],
-            buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0),
-            registry=self._registry,
-        )
-
-        # Gauge: Proxy health status (1=healthy, 0=unhealthy)
-        self.proxy_health_status = Gauge(
-            "proxywhirl_proxy_health_status",
-            "Current proxy health status (1=healthy, 0=unhealthy)",
-            ["proxy_id"],
-            registry=self._registry,
-        )
+        self.requests_total: Counter | None = None
+        self.request_duration_seconds: Histogram | None = None
+        self.proxy_health_status: Gauge | None = None
+        self.circuit_breaker_state: Gauge | None = None
+        self.bounded: BoundedProxyMetrics | None = None
+
+        if max_proxy_series is not None:
+            self.bounded = BoundedProxyMetrics(max_proxy_series, flush_interval=flush_interval)
+            self._registry.register(self.bounded)
+        else:
+            # Counter: Total requests made through proxies
+            self.requests_total = Counter(
+                "proxywhirl_requests_total",
+                "Total number of requests made through proxies",
+                ["status", "proxy_id"],
+                registry=self._registry,
+            )
+
+            # Histogram: Request latency distribution
+            self.request_duration_seconds = Histogram(
+                "proxywhirl_request_duration_seconds",
+                "Request duration in seconds",
+                ["proxy_id"],
+                buckets=REQUEST_DURATION_BUCKETS,
+                registry=self._registry,
+            )
+
+            # Gauge: Proxy health status (1=healthy, 0=unhealthy)
+            self.proxy_health_status = Gauge(
+                "proxywhirl_proxy_health_status",
+                "Current proxy health status (1=healthy, 0=unhealthy)",
+                ["proxy_id"],
+                registry=self._registry,
+            )
+
+            # Gauge: Circuit breaker state (0=closed, 1=open, 2=half-open)
+            self.circuit_breaker_state = Gauge(
+                "proxywhirl_circuit_breaker_state",
+                "Circuit breaker state (0=closed, 1=open, 2=half-open)",
+                ["proxy_id"],
+                registry=self._registry,
+            )
 
         # Gauge: Number of active proxies in the pool
         self.active_proxies = Gauge(
@@ -86,14 +557,6 @@ class MetricsCollector:
             registry=self._registry,
         )
 
-        # Gauge: Circuit breaker state (0=closed, 1=open, 2=half-open)
-        self.circuit_breaker_state = Gauge(
-            "proxywhirl_circuit_breaker_state",
-            "Circuit breaker state (0=closed, 1=open, 2=half-open)",
-            ["proxy_id"],
-            registry=self._registry,
-        )
-
         # Initialize optional OpenTelemetry metrics
         self._otel_meter = None
         self._otel_requests_counter = None
@@ -102,6 +565,9 @@ class MetricsCollector:
         self._otel_active_proxies_gauge = None
         self._otel_circuit_breaker_gauge = None
 
+        self._stage_collector: StageDurationCollector | None = None
+        self._otel_stage_gauge: Any = None
+
         if OTEL_ENABLED and _OTEL_AVAILABLE:
             self._init_otel_metrics()
 
@@ -147,11 +613,17 @@ class MetricsCollector:
             duration: Request duration in seconds
             proxy_id: Identifier of the proxy used
         """
-        # Increment request counter
-        self.requests_total.labels(status=status, proxy_id=proxy_id).inc()
-
-        # Record request duration
-        self.request_duration_seconds.labels(proxy_id=proxy_id).observe(duration)
+        if self.bounded is not None:
+            # Buffered per thread; the label is the proxy or "other"
+            proxy_id = self.bounded.record_request(status, duration, proxy_id)
+        else:
+            assert self.requests_total is not None
+            assert self.request_duration_seconds is not None
+            # Increment request counter
+            self.requests_total.labels(status=status, proxy_id=proxy_id).inc()
+
+            # Record request duration
+            self.request_duration_seconds.labels(proxy_id=proxy_id).observe(duration)
 
         # Export to OpenTelemetry if enabled
         if self._otel_requests_counter is not None:
@@ -167,7 +639,12 @@ class MetricsCollector:
             is_healthy: True if proxy is healthy, False otherwise
         """
         value = 1 if is_healthy else 0
-        self.proxy_health_status.labels(proxy_id=proxy_id).set(value)
+        if self.bounded is not None:
+            self.bounded.update_proxy_health(proxy_id, value)
+            proxy_id = self.bounded.label_for(proxy_id)
+        else:
+            assert self.proxy_health_status is not None
+            self.proxy_health_status.labels(proxy_id=proxy_id).set(value)
 
         # Export to OpenTelemetry if enabled
         if self._otel_proxy_health_gauge is not None:
@@ -196,13 +673,56 @@ class MetricsCollector:
             proxy_id: Identifier of the proxy
             state: Circuit breaker state (closed=0, open=1, half-open=2)
         """
-        state_value = {"closed": 0, "open": 1, "half-open": 2}[state]
-        self.circuit_breaker_state.labels(proxy_id=proxy_id).set(state_value)
+        state_value = _CIRCUIT_BREAKER_STATES[state]
+        if self.bounded is not None:
+            self.bounded.update_circuit_breaker_state(proxy_id, state)
+            proxy_id = self.bounded.label_for(proxy_id)
+        else:
+            assert self.circuit_breaker_state is not None
+            self.circuit_breaker_state.labels(proxy_id=proxy_id).set(state_value)
 
         # Export to OpenTelemetry if enabled
         if self._otel_circuit_breaker_gauge is not None:
             self._otel_circuit_breaker_gauge.add(state_value, {"proxy_id": proxy_id})
 
+    def register_stage_profiler(self, profiler: StageProfiler) -> None:
+        """Expose a rotator's per-stage latency histograms.
+
+        Prometheus gets ``proxywhirl_stage_duration_seconds`` (histogram) and
+        ``proxywhirl_stage_duration_quantile_seconds`` (gauge); OpenTelemetry, when
+        enabled, gets an observable ``proxywhirl.stage.duration`` gauge with
+        ``stage`` and ``quantile`` attributes. Both are computed when scraped, so
+        recording stays a histogram increment. Registering another profiler
+        replaces the previous one.
+
+        Args:
+            profiler: Profiler assigned to ``rotator.stage_profiler``
+        """
+        if self._stage_collector is not None:
+            self._registry.unregister(self._stage_collector)
+        self._stage_collector = StageDurationCollector(profiler)
+        self._registry.register(self._stage_collector)
+
+        if self._otel_meter is not None and self._otel_stage_gauge is None:
+            self._otel_stage_gauge = self._otel_meter.create_observable_gauge(
+                "proxywhirl.stage.duration",
+                callbacks=[self._observe_stage_durations],
+                description="Per-stage request latency quantiles (sampled requests)",
+                unit="s",
+            )
+
+    def _observe_stage_durations(self, options: CallbackOptions) -> Iterator[Observation]:
+        """OpenTelemetry callback reporting stage quantiles."""
+        del options
+        if self._stage_collector is None:
+            return
+        for stage, histogram in self._stage_collector.profiler.histograms.items():
+            for quantile in STAGE_DURATION_QUANTILES:
+                yield Observation(
+                    histogram.percentile(quantile),
+                    {"stage": stage, "quantile": quantile / 100},
+                )
+
     def clear_proxy_metrics(self, proxy_id: str) -> None:
         """Clear all metrics for a specific proxy.
 
@@ -212,11 +732,26 @@ class MetricsCollector:
         Args:
             proxy_id: Identifier of the proxy to clear
         """
+        if self.bounded is not None:
+            self.bounded.forget_proxy(proxy_id)
+            return
+        assert self.proxy_health_status is not None
+        assert self.circuit_breaker_state is not None
         # Note: Prometheus client doesn't support removing specific label combinations
         # Set health to 0 and circuit breaker to closed as a workaround
         self.proxy_health_status.labels(proxy_id=proxy_id).set(0)
         self.circuit_breaker_state.labels(proxy_id=proxy_id).set(0)
 
+    def flush(self) -> None:
+        """Merge buffered request metrics now (bounded mode only)."""
+        if self.bounded is not None:
+            self.bounded.flush()
+
+    def close(self) -> None:
+        """Stop the background flush thread (bounded mode only)."""
+        if self.bounded is not None:
+            self.bounded.close()
+
 
 # Global singleton instance for convenient access
 _collector: MetricsCollector | None = None
@@ -226,6 +761,8 @@ _singleton_registry: CollectorRegistry | None = None
 def get_metrics_collector() -> MetricsCollector:
     """Get the global MetricsCollector singleton.
 
+    ``PROXYWHIRL_METRICS_MAX_PROXY_SERIES`` enables bounded per-proxy series.
+
     Returns:
         MetricsCollector: The global metrics collector instance
     """
@@ -235,7 +772,11 @@ def get_metrics_collector() -> MetricsCollector:
         # conflicts with the default REGISTRY during testing
         if _singleton_registry is None:
             _singleton_registry = CollectorRegistry()
-        _collector = MetricsCollector(registry=_singleton_registry)
+        max_series = os.environ.get("PROXYWHIRL_METRICS_MAX_PROXY_SERIES", "").strip()
+        _collector = MetricsCollector(
+            registry=_singleton_registry,
+            max_proxy_series=int(max_series) if max_series else None,
+        )
     return _collector
 
 
@@ -247,6 +788,8 @@ def reset_metrics_collector() -> None:
     allowing a new instance to be created on next access.
     """
     global _collector, _singleton_registry
+    if _collector is not None:
+        _collector.close()
     _collector = None
     _singleton_registry = None
 
@@ -316,3 +859,14 @@ def clear_proxy_metrics(proxy_id: str) -> None:
         proxy_id: Identifier of the proxy to clear
     """
     get_metrics_collector().clear_proxy_metrics(proxy_id)
+
+
+def register_stage_profiler(profiler: StageProfiler) -> None:
+    """Expose a rotator's per-stage latency histograms.
+
+    Convenience function that uses the global collector.
+
+    Args:
+        profiler: Profiler assigned to ``rotator.stage_profiler``
+    """
+    get_metrics_collector().register_stage_profiler(profiler)
@@ -5,10 +5,21 @@ Data models for ProxyWhirl using Pydantic v2.
 from __future__ import annotations
 
 import asyncio
+import functools
 import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, runtime_checkable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Literal,
+    NamedTuple,
+    Protocol,
+    TypedDict,
+    cast,
+    runtime_checkable,
+)
 from uuid import UUID, uuid4
 
 from loguru import logger
@@ -308,6 +319,104 @@ class Session(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+# ============================================================================
+# VERSIONING
+# ============================================================================
+
+
+class VersionCounter:
+    """Thread-safe, monotonically increasing counter used to version mutable state.
+
+    Writers call :meth:`bump` after they finish a mutation; readers capture
+    :attr:`value` before reading the state and compare it later to detect
+    changes without rescanning the data (e.g. to invalidate cached API
+    responses).
+
+    Example:
+        >>> counter = VersionCounter()
+        >>> before = counter.value
+        >>> counter.bump()
+        1
+        >>> counter.value != before
+        True
+    """
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def value(self) -> int:
+        """Current version."""
+        return self._value
+
+    def bump(self) -> int:
+        """Advance the version and return the new value."""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+PROXY_STATE_VERSION = VersionCounter()
+"""Bumped whenever the request or health statistics of any :class:`Proxy` change."""
+
+_PROXY_SCHEMES = frozenset({"http", "https", "socks4", "socks5", "socks5h"})
+
+
+class _TrustedTemplate(NamedTuple):
+    """Per-model defaults precomputed for :meth:`Proxy.from_trusted`."""
+
+    field_names: frozenset[str]
+    required: frozenset[str]
+    defaults: dict[str, Any]  # every field in declaration order (placeholders: None)
+    factories: tuple[tuple[str, Callable[[], Any]], ...]
+
+
+@functools.cache
+def _trusted_template(model: type[BaseModel]) -> _TrustedTemplate:
+    """Collect static defaults and default factories of ``model`` once.
+
+    ``BaseModel.model_construct`` resolves each default per call, inspecting the
+    signature of every default factory, which makes it slower than validation.
+    """
+    fields = model.model_fields
+    return _TrustedTemplate(
+        field_names=frozenset(fields),
+        required=frozenset(name for name, info in fields.items() if info.is_required()),
+        defaults={
+            name: None
+            if info.is_required() or info.default_factory is not None
+            else info.get_default(call_default_factory=False)
+            for name, info in fields.items()
+        },
+        factories=tuple(
+            (name, cast(Callable[[], Any], info.default_factory))
+            for name, info in fields.items()
+            if info.default_factory is not None
+        ),
+    )
+
+
+@functools.cache
+def _plain_assignment(model: type[BaseModel]) -> bool:
+    """Whether assigning a field of ``model`` is just a ``__dict__`` write.
+
+    True unless the model validates assignments, is frozen or overrides
+    ``__setattr__``; only then may hot paths batch field writes directly.
+    """
+    config = model.model_config
+    return (
+        not config.get("validate_assignment")
+        and not config.get("frozen")
+        and model.__setattr__ is BaseModel.__setattr__
+    )
+
+
+_MAX_RECENT_ERRORS = 10
+
+
 # ============================================================================
 # MODELS
 # ============================================================================
@@ -599,6 +708,69 @@ class Proxy(BaseModel):
             raise ValueError(f"Counter must be non-negative, got {v}")
         return v
 
+    @classmethod
+    def from_trusted(cls, fields: Mapping[str, Any]) -> Proxy:
+        """Build a proxy from already-validated fields without running validators.
+
+        For bulk loads of proxies that were validated before they were stored
+        (SQLite rows, snapshots). No URL parsing, address checks or coercion
+        happen, so values must already have their declared types (enums,
+        ``SecretStr``, aware or naive ``datetime``, ``HttpUrl``). Defaults are
+        filled in, ``protocol`` is derived from the URL scheme and ``expires_at``
+        from ``ttl`` as validation would. About 5x cheaper than
+        ``Proxy(**fields)``; most of what remains is generating the ``id``.
+
+        Args:
+            fields: Field values keyed by field name; must include ``url``
+
+        Returns:
+            Proxy instance
+
+        Raises:
+            ValueError: If ``fields`` has unknown names or lacks required fields
+        """
+        template = _trusted_template(cls)
+        names = fields.keys()
+        if not names <= template.field_names or not template.required <= names:
+            unknown = sorted(names - template.field_names)
+            missing = sorted(template.required - names)
+            raise ValueError(f"Invalid trusted fields (unknown: {unknown}, missing: {missing})")
+
+        values = template.defaults.copy()
+        for name, factory in template.factories:
+            if name not in fields:
+                values[name] = factory()
+        values.update(fields)
+        fields_set = set(names)
+        if values["protocol"] is None:
+            scheme = values["url"].partition("://")[0].lower()
+            if scheme in _PROXY_SCHEMES:
+                values["protocol"] = scheme
+                fields_set.add("protocol")
+        if values["ttl"] is not None and values["expires_at"] is None:
+            values["expires_at"] = values["created_at"] + timedelta(seconds=values["ttl"])
+            fields_set.add("expires_at")
+
+        # Same state BaseModel.model_construct leaves behind
+        proxy = cls.__new__(cls)
+        object.__setattr__(proxy, "__dict__", values)
+        object.__setattr__(proxy, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(proxy, "__pydantic_extra__", None)
+        object.__setattr__(proxy, "__pydantic_private__", None)
+        proxy.model_post_init(None)  # initializes private attributes (_window_lock)
+        return proxy
+
+    @classmethod
+    def from_trusted_rows(cls, rows: Iterable[Mapping[str, Any]]) -> list[Proxy]:
+        """Build proxies from already-validated field mappings (see :meth:`from_trusted`).
+
+        Example:
+            >>> proxies = Proxy.from_trusted_rows([{"url": "http://proxy1.com:8080"}])
+            >>> proxies[0].protocol
+            'http'
+        """
+        return [cls.from_trusted(row) for row in rows]
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate, clamped to [0.0, 1.0]."""
@@ -649,27 +821,8 @@ class Proxy(BaseModel):
                    pass their configured StrategyConfig.ema_alpha for consistent
                    behavior, or use StrategyState for independent per-proxy metrics.
         """
-        # Use provided alpha or fall back to instance's ema_alpha (deprecated path)
-        effective_alpha = alpha if alpha is not None else self.ema_alpha
-
-        # Update average response time using EMA with configurable alpha
-        if self.average_response_time_ms is None:
-            self.average_response_time_ms = response_time_ms
-        else:
-            self.average_response_time_ms = (
-                effective_alpha * response_time_ms
-                + (1 - effective_alpha) * self.average_response_time_ms
-            )
-
-        # Update EMA response time using the same alpha
-        if self.ema_response_time_ms is None:
-            self.ema_response_time_ms = response_time_ms
-        else:
-            # EMA formula: EMA_new = alpha * value + (1 - alpha) * EMA_old
-            self.ema_response_time_ms = (
-                effective_alpha * response_time_ms
-                + (1 - effective_alpha) * self.ema_response_time_ms
-            )
+        self._assign(self._response_time_updates(response_time_ms, alpha))
+        PROXY_STATE_VERSION.bump()
 
     def record_success(self, response_time_ms: float, alpha: float | None = None) -> None:
         """Record a successful request.
@@ -678,47 +831,22 @@ class Proxy(BaseModel):
             response_time_ms: Response time in milliseconds
             alpha: Optional EMA smoothing factor for metrics update
         """
-        self.total_requests += 1
-        self.total_successes += 1
-        self.consecutive_failures = 0
-        self.last_success_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
-
-        # Update metrics using centralized method
-        self.update_metrics(response_time_ms, alpha=alpha)
-
-        # Update health status
-        if self.health_status in (HealthStatus.UNKNOWN, HealthStatus.DEGRADED):
-            self.health_status = HealthStatus.HEALTHY
+        now = datetime.now(timezone.utc)
+        with self.__pydantic_private__["_window_lock"]:
+            self._assign(self._success_updates(now, response_time_ms, alpha))
+        PROXY_STATE_VERSION.bump()
 
     def record_failure(self, error: str | None = None) -> None:
-        """Record a failed request."""
-        self.total_requests += 1
-        self.total_failures += 1
-        self.consecutive_failures += 1
-        self.last_failure_at = datetime.now(timezone.utc)
-        self.updated_at = datetime.now(timezone.utc)
+        """Record a failed request.
 
-        # Update health status based on consecutive failures
-        if self.consecutive_failures >= 5:
-            self.health_status = HealthStatus.DEAD
-        elif self.consecutive_failures >= 3:
-            self.health_status = HealthStatus.UNHEALTHY
-        elif self.consecutive_failures >= 1:
-            self.health_status = HealthStatus.DEGRADED
-
-        # Store error in metadata if provided
-        if error:
-            if "last_errors" not in self.metadata:
-                self.metadata["last_errors"] = []
-            self.metadata["last_errors"].append(
-                {
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "error": error,
-                }
-            )
-            # Keep only last 10 errors
-            self.metadata["last_errors"] = self.metadata["last_errors"][-10:]
+        Args:
+            error: Optional error message, kept in ``metadata["last_errors"]``
+                (the 10 most recent, oldest first)
+        """
+        now = datetime.now(timezone.utc)
+        with self.__pydantic_private__["_window_lock"]:
+            self._assign(self._failure_updates(now, error))
+        PROXY_STATE_VERSION.bump()
 
     def start_request(self) -> None:
         """Mark a request as started (for tracking in-flight requests).
@@ -728,14 +856,18 @@ class Proxy(BaseModel):
 
         Thread-safe: Uses internal lock to prevent race conditions.
         """
-        with self._window_lock:
-            self.requests_started += 1
-            self.requests_active += 1
-            self.updated_at = datetime.now(timezone.utc)
-
+        now = datetime.now(timezone.utc)
+        with self.__pydantic_private__["_window_lock"]:
+            updates: dict[str, Any] = {
+                "requests_started": self.requests_started + 1,
+                "requests_active": self.requests_active + 1,
+                "updated_at": now,
+            }
             # Initialize window if not set
             if self.window_start is None:
-                self.window_start = datetime.now(timezone.utc)
+                updates["window_start"] = now
+            self._assign(updates)
+        PROXY_STATE_VERSION.bump()
 
     def complete_request(
         self, success: bool, response_time_ms: float, alpha: float | None = None
@@ -749,26 +881,96 @@ class Proxy(BaseModel):
                    configured alpha to ensure consistent metric calculations
                    without mutating proxy state.
 
-        This method decrements requests_active, increments requests_completed,
-        updates EMA response time, and delegates to record_success/record_failure.
+        This method decrements requests_active, increments requests_completed
+        and applies the same updates as record_success/record_failure,
+        including the EMA response time on success.
 
-        Thread-safe: Uses internal lock to prevent race conditions.
+        Thread-safe: all counters are updated under a single acquisition of the
+        internal lock, with one clock read per call.
         """
-        with self._window_lock:
-            # Decrement active count
+        now = datetime.now(timezone.utc)
+        with self.__pydantic_private__["_window_lock"]:
+            if success:
+                updates = self._success_updates(now, response_time_ms, alpha)
+            else:
+                updates = self._failure_updates(now, None)
             if self.requests_active > 0:
-                self.requests_active -= 1
+                updates["requests_active"] = self.requests_active - 1
+            updates["requests_completed"] = self.requests_completed + 1
+            self._assign(updates)
+        PROXY_STATE_VERSION.bump()
 
-            # Increment completed count
-            self.requests_completed += 1
+    def _assign(self, updates: dict[str, Any]) -> None:
+        """Apply already-typed field values in one step.
 
-        # Delegate to existing success/failure recording
-        # Note: record_success() calls update_metrics() which updates both
-        # average_response_time_ms and ema_response_time_ms consistently
-        if success:
-            self.record_success(response_time_ms, alpha=alpha)
+        Equivalent to assigning each field, but skips pydantic's per-attribute
+        ``__setattr__`` dispatch when the model allows plain assignment.
+        """
+        if _plain_assignment(type(self)):
+            self.__dict__.update(updates)
+            self.__pydantic_fields_set__.update(updates)
         else:
-            self.record_failure()
+            for name, value in updates.items():
+                setattr(self, name, value)
+
+    def _response_time_updates(
+        self, response_time_ms: float, alpha: float | None
+    ) -> dict[str, Any]:
+        """Compute new average/EMA response times (see :meth:`update_metrics`)."""
+        # Use provided alpha or fall back to instance's ema_alpha (deprecated path)
+        effective_alpha = alpha if alpha is not None else self.ema_alpha
+        average = self.average_response_time_ms
+        ema = self.ema_response_time_ms
+        # EMA formula: EMA_new = alpha * value + (1 - alpha) * EMA_old
+        return {
+            "average_response_time_ms": response_time_ms
+            if average is None
+            else effective_alpha * response_time_ms + (1 - effective_alpha) * average,
+            "ema_response_time_ms": response_time_ms
+            if ema is None
+            else effective_alpha * response_time_ms + (1 - effective_alpha) * ema,
+        }
+
+    def _success_updates(
+        self, now: datetime, response_time_ms: float, alpha: float | None
+    ) -> dict[str, Any]:
+        """Field updates for one successful request (caller holds the lock)."""
+        updates = self._response_time_updates(response_time_ms, alpha)
+        updates["total_requests"] = self.total_requests + 1
+        updates["total_successes"] = self.total_successes + 1
+        updates["consecutive_failures"] = 0
+        updates["last_success_at"] = now
+        updates["updated_at"] = now
+        if self.health_status in (HealthStatus.UNKNOWN, HealthStatus.DEGRADED):
+            updates["health_status"] = HealthStatus.HEALTHY
+        return updates
+
+    def _failure_updates(self, now: datetime, error: str | None) -> dict[str, Any]:
+        """Field updates for one failed request (caller holds the lock)."""
+        consecutive = self.consecutive_failures + 1
+        # Update health status based on consecutive failures
+        if consecutive >= 5:
+            health = HealthStatus.DEAD
+        elif consecutive >= 3:
+            health = HealthStatus.UNHEALTHY
+        else:
+            health = HealthStatus.DEGRADED
+
+        if error:
+            # Bounded in place: append, then drop the oldest entries
+            errors = self.metadata.setdefault("last_errors", [])
+            errors.append({"timestamp": now.isoformat(), "error": error})
+            if len(errors) > _MAX_RECENT_ERRORS:
+                del errors[:-_MAX_RECENT_ERRORS]
+
+        return {
+            "total_requests": self.total_requests + 1,
+            "total_failures": self.total_failures + 1,
+            "consecutive_failures": consecutive,
+            "last_failure_at": now,
+            "updated_at": now,
+            "health_status": health,
+        }
 
     def reset_window(self) -> None:
         """Reset the sliding window counters.
@@ -785,6 +987,7 @@ class Proxy(BaseModel):
             self.requests_completed = 0
             # Note: Don't reset requests_active as those are truly active
             self.updated_at = now
+        PROXY_STATE_VERSION.bump()
 
     def is_window_expired(self) -> bool:
         """Check if the current sliding window has expired.
@@ -828,6 +1031,7 @@ class Proxy(BaseModel):
                 self.requests_completed = 0
                 # Note: Don't reset requests_active as those are truly active
                 self.updated_at = now
+                PROXY_STATE_VERSION.bump()
                 return True
 
             return False
@@ -934,6 +1138,11 @@ class ProxySourceConfig(BaseModel):
     wait_selector: str | None = None
     wait_timeout: int = 30000
     refresh_interval: int = 3600
+    parse_executor: Literal["auto", "inline", "thread", "process"] | None = Field(
+        default=None,
+        description="Override where this source is parsed (inline, thread or process); "
+        "None uses the fetcher default.",
+    )
     enabled: bool = True
     priority: int = 0
     trusted: bool = Field(
@@ -1008,6 +1217,8 @@ class ProxyPool(BaseModel):
     _id_index: dict[UUID, Proxy] = PrivateAttr(default_factory=dict)
     # O(1) lookup index for proxy URLs (not serialized)
     _url_index: set[str] = PrivateAttr(default_factory=set)
+    # Structural version, bumped on membership changes (not serialized)
+    _version: VersionCounter = PrivateAttr(default_factory=VersionCounter)
 
     def __init__(self, **data: Any) -> None:
         """
@@ -1041,6 +1252,35 @@ class ProxyPool(BaseModel):
         # O(1) URL-based membership check
         object.__setattr__(self, "_url_index", url_index)
 
+    @property
+    def version(self) -> int:
+        """
+        Monotonically increasing version of the pool contents.
+
+        Changes whenever proxies are added or removed, or when the request or
+        health statistics of any proxy change. Compare against a previously
+        observed value to cheaply detect that derived data is stale.
+
+        Returns:
+            int
+                Current pool version.
+
+        Example:
+            >>> version = pool.version
+            >>> pool.add_proxy(proxy)
+            >>> pool.version > version  # True
+
+        Note:
+            Proxy statistics are tracked process-wide, so activity on a proxy in
+            another pool also advances this version. Code that assigns proxy
+            fields directly should call :meth:`bump_version` afterwards.
+        """
+        return self._version.value + PROXY_STATE_VERSION.value
+
+    def bump_version(self) -> None:
+        """Mark the pool as changed after mutating proxies outside the pool API."""
+        self._version.bump()
+
     @property
     def size(self) -> int:
         """Get pool size (thread-safe)."""
@@ -1124,6 +1364,7 @@ class ProxyPool(BaseModel):
             # Update URL index
             self._url_index.add(proxy.url)
             self.updated_at = datetime.now(timezone.utc)
+            self._version.bump()
 
     def remove_proxy(self, proxy_id: UUID) -> None:
         """
@@ -1166,6 +1407,40 @@ class ProxyPool(BaseModel):
             # Remove from list
             self.proxies = [p for p in self.proxies if p.id != proxy_id]
             self.updated_at = datetime.now(timezone.utc)
+            self._version.bump()
+
+    def replace_proxies(self, proxies: Iterable[Proxy]) -> None:
+        """
+        Replace the pool contents with already-validated proxies.
+
+        Used to restore a pool in bulk (e.g. from a warm-start snapshot). Unlike
+        the constructor, the proxies are not revalidated, so this costs O(n)
+        index updates only. Thread-safe via RLock.
+
+        Args:
+            proxies : Iterable[Proxy]
+                New pool contents; later duplicates of a URL are dropped.
+
+        Returns:
+            None
+
+        Example:
+            >>> pool.replace_proxies(snapshot.proxies())
+            >>> print(pool.size)  # len(snapshot)
+
+        Note:
+            - ``max_pool_size`` is not enforced, as in the constructor
+        """
+        by_url: dict[str, Proxy] = {}
+        for proxy in proxies:
+            by_url.setdefault(proxy.url, proxy)
+        with self._lock:
+            self.proxies = list(by_url.values())
+            # Same bypass as __init__, which set the indexes
+            object.__setattr__(self, "_id_index", {proxy.id: proxy for proxy in self.proxies})
+            object.__setattr__(self, "_url_index", set(by_url))
+            self.updated_at = datetime.now(timezone.utc)
+            self._version.bump()
 
     def has_proxy_url(self, proxy_url: str) -> bool:
         """
@@ -1349,6 +1624,7 @@ class ProxyPool(BaseModel):
             object.__setattr__(self, "_id_index", {p.id: p for p in self.proxies if p.id})
             object.__setattr__(self, "_url_index", {p.url for p in self.proxies})
             self.updated_at = datetime.now(timezone.utc)
+            self._version.bump()
             return initial_count - self.size
 
     def clear_expired(self) -> int:
@@ -1380,6 +1656,7 @@ class ProxyPool(BaseModel):
             object.__setattr__(self, "_id_index", {p.id: p for p in self.proxies if p.id})
             object.__setattr__(self, "_url_index", {p.url for p in self.proxies})
             self.updated_at = datetime.now(timezone.utc)
+            self._version.bump()
             return initial_count - self.size
 
     def get_all_proxies(self) -> list[Proxy]:
@@ -1406,6 +1683,47 @@ class ProxyPool(BaseModel):
         with self._lock:
             return self.proxies.copy()
 
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[list[Proxy]]:
+        """
+        Iterate over the pool in fixed-size batches.
+
+        The list of proxy references (one pointer per proxy, no proxy copies)
+        is snapshotted once under the lock and yielded in slices, so the lock
+        is not held while the caller processes a batch.
+
+        Args:
+            batch_size : int
+                Maximum number of proxies per batch (must be positive).
+
+        Yields:
+            list[Proxy]
+                Copy of the next slice of the pool.
+
+        Raises:
+            ValueError
+                If batch_size is not positive.
+
+        Example:
+            >>> for batch in pool.iter_batches(500):
+            ...     export(batch)
+
+        Note:
+            - Every proxy in the pool when iteration starts is yielded exactly
+              once, even if other proxies are removed between batches; proxies
+              added after iteration starts are not yielded
+            - Proxy objects are shared with the pool, so statistics read from a
+              batch are live rather than part of the snapshot
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        # remove_proxy() rebuilds self.proxies, so paging by offset into the live
+        # list would skip proxies that shift left past the cursor.
+        with self._lock:
+            snapshot = self.proxies.copy()
+        for offset in range(0, len(snapshot), batch_size):
+            yield snapshot[offset : offset + batch_size]
+
     def get_source_breakdown(self) -> dict[str, int]:
         """
         Get count of proxies by source.
@@ -2,18 +2,66 @@
 
 Allows saving and restoring proxy pool state for reproducibility,
 testing, and disaster recovery scenarios.
+
+Warm-start snapshots hold what a rotator needs to resume where it stopped:
+every proxy field (including EMA latencies and request counters), circuit
+breaker state and strategy state. They use a versioned binary format instead
+of JSON:
+
+- an 8-byte magic, the format version, flags and a table of sections
+- one section per column in the layout of
+  :class:`~proxywhirl.columnar_pool.PoolColumns` (fixed-width little-endian
+  values, 8-byte aligned, CRC32-checked), so loading copies buffers instead of
+  parsing and validating one model per proxy; files are memory-mapped by default
+- fields that are rarely set (credentials, tags, metadata, ...) in one compact
+  JSON section, Fernet-encrypted when an encryption key is configured
+
+Strategies can take part by implementing ``snapshot_state() -> dict`` and
+``restore_state(state)``; their ``StrategyConfig`` is saved as well.
+
+Example:
+    >>> manager = SnapshotManager(".snapshots")
+    >>> manager.restore_warm_snapshot(rotator)  # False on the first start
+    >>> writer = manager.start_warm_snapshots(rotator, interval=60.0)
+    >>> writer.stop()  # writes a final snapshot
 """
 
 from __future__ import annotations
 
+import gc
 import json
-from datetime import datetime
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import weakref
+import zlib
+from array import array
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final
+from uuid import uuid4
 
+from cryptography.fernet import Fernet, InvalidToken
 from loguru import logger
+from pydantic import HttpUrl, SecretStr
+
+from proxywhirl.circuit_breaker import (
+    CIRCUIT_BREAKER_STATE_VERSION,
+    CircuitBreaker,
+    CircuitBreakerState,
+)
+from proxywhirl.columnar_pool import ColumnarProxyPool, PoolColumns
+from proxywhirl.exceptions import SnapshotFormatError
+from proxywhirl.models import Proxy, ProxyPool, StrategyConfig
 
-from proxywhirl.models import Proxy
+if TYPE_CHECKING:
+    from proxywhirl.rotator.base import ProxyRotatorBase
 
 
 class PoolSnapshot:
@@ -38,11 +86,13 @@ class PoolSnapshot:
         self.proxies.append(
             {
                 "url": proxy.url,
-                "status": proxy.status,
-                "last_checked": proxy.last_checked.isoformat() if proxy.last_checked else None,
-                "failure_count": proxy.failure_count,
-                "success_count": proxy.success_count,
-                "tags": list(proxy.tags) if proxy.tags else [],
+                "status": proxy.health_status.value,
+                "last_checked": proxy.last_health_check.isoformat()
+                if proxy.last_health_check
+                else None,
+                "failure_count": proxy.total_failures,
+                "success_count": proxy.total_successes,
+                "tags": sorted(proxy.tags),
             }
         )
 
@@ -84,18 +134,581 @@ class PoolSnapshot:
         return cls.from_dict(data)
 
 
+# ============================================================================
+# WARM-START SNAPSHOTS
+# ============================================================================
+
+WARM_SNAPSHOT_VERSION: Final = 1
+WARM_SNAPSHOT_SUFFIX: Final = ".pwsnap"
+
+_WARM_MAGIC = b"PWSNAP\r\n"
+_HEADER = struct.Struct("<8sHHI")  # magic, format version, flags, section count
+_SECTION = struct.Struct("<32sQQI")  # name, offset, length, CRC32
+_FLAG_ENCRYPTED = 1
+_ALIGNMENT = 8
+
+_BREAKER_STATES: tuple[CircuitBreakerState, ...] = tuple(CircuitBreakerState)
+_BREAKER_STATE_CODES = {state: code for code, state in enumerate(_BREAKER_STATES)}
+_BREAKER_DEFAULTS = tuple(
+    CircuitBreaker.model_fields[name].default
+    for name in ("failure_threshold", "window_duration", "timeout_duration")
+)
+
+# Sparse fields whose values are not plain JSON
+_SECRET_FIELDS = frozenset({"username", "password"})
+_DATETIME_FIELDS = frozenset({"window_start", "next_check_time"})
+
+
+@contextmanager
+def _gc_paused() -> Generator[None, None, None]:
+    """Pause the cyclic garbage collector while creating many objects at once.
+
+    Collections triggered by allocations otherwise about double the cost of
+    materializing large pools; none of the objects created form cycles.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _array_bytes(values: array[Any]) -> memoryview:
+    """Little-endian bytes of an array (no copy on little-endian hosts)."""
+    if sys.byteorder == "big":
+        values = values[:]
+        values.byteswap()
+    return memoryview(values).cast("B")
+
+
+def _read_array(typecode: str, data: memoryview) -> array[Any]:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _join_strings(values: Iterable[str]) -> bytes:
+    # NUL cannot occur in proxy URLs, IDs or country codes
+    return "\0".join(values).encode()
+
+
+def _split_strings(data: memoryview, count: int) -> list[str]:
+    return bytes(data).decode().split("\0") if count else []
+
+
+def _encode_sparse_value(name: str, value: Any) -> Any:
+    if name in _SECRET_FIELDS:
+        return value.get_secret_value() if value is not None else None
+    if name in _DATETIME_FIELDS:
+        return value.isoformat() if value is not None else None
+    if isinstance(value, set):
+        return sorted(value)
+    if name == "source_url":
+        return str(value) if value is not None else None
+    return value
+
+
+def _decode_sparse_value(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if name in _SECRET_FIELDS:
+        return SecretStr(value)
+    if name in _DATETIME_FIELDS:
+        return datetime.fromisoformat(value)
+    if name == "tags":
+        return set(value)
+    if name == "source_url":
+        return HttpUrl(value)
+    return value
+
+
+def _strategy_type(strategy: Any) -> str:
+    return f"{type(strategy).__module__}.{type(strategy).__qualname__}"
+
+
+def _capture_strategy(strategy: Any) -> dict[str, Any] | None:
+    """Strategy class, configuration and ``snapshot_state()`` result."""
+    if strategy is None:
+        return None
+    state: dict[str, Any] = {"type": _strategy_type(strategy)}
+    config = getattr(strategy, "config", None)
+    if isinstance(config, StrategyConfig):
+        state["config"] = config.model_dump(mode="json")
+    snapshot_state = getattr(strategy, "snapshot_state", None)
+    if callable(snapshot_state):
+        state["state"] = snapshot_state()
+    return state
+
+
+def _restore_strategy(strategy: Any, state: dict[str, Any] | None) -> None:
+    """Apply a :func:`_capture_strategy` result to a strategy of the same class.
+
+    A saved configuration is only applied to strategies that have none, so
+    configuration passed explicitly on startup wins over the snapshot.
+    """
+    if state is None:
+        return
+    if state["type"] != _strategy_type(strategy):
+        logger.info(
+            f"Snapshot strategy {state['type']} differs from {_strategy_type(strategy)}; "
+            "strategy state not restored"
+        )
+        return
+    if "config" in state and getattr(strategy, "config", None) is None:
+        strategy.configure(StrategyConfig.model_validate(state["config"]))
+    restore_state = getattr(strategy, "restore_state", None)
+    if "state" in state and callable(restore_state):
+        restore_state(state["state"])
+
+
+def _breaker_sections(circuit_breakers: dict[str, CircuitBreaker]) -> dict[str, Any]:
+    """Columns for every circuit breaker that differs from a newly created one."""
+    kept = [
+        breaker
+        for breaker in list(circuit_breakers.values())
+        if breaker.state is not CircuitBreakerState.CLOSED
+        or breaker.failure_window
+        or (breaker.failure_threshold, breaker.window_duration, breaker.timeout_duration)
+        != _BREAKER_DEFAULTS
+    ]
+    # tuple() copies a deque in one step, so concurrent failures cannot break it
+    windows = [tuple(breaker.failure_window) for breaker in kept]
+    return {
+        "breaker:ids": _join_strings(breaker.proxy_id for breaker in kept),
+        "breaker:state": bytes(_BREAKER_STATE_CODES[breaker.state] for breaker in kept),
+        "breaker:threshold": array("I", [breaker.failure_threshold for breaker in kept]),
+        "breaker:window": array("d", [breaker.window_duration for breaker in kept]),
+        "breaker:timeout": array("d", [breaker.timeout_duration for breaker in kept]),
+        "breaker:next_test": array(
+            "d",
+            [
+                math.nan if breaker.next_test_time is None else breaker.next_test_time
+                for breaker in kept
+            ],
+        ),
+        "breaker:changed": array("d", [breaker.last_state_change.timestamp() for breaker in kept]),
+        "breaker:failures_len": array("I", [len(window) for window in windows]),
+        "breaker:failures": array("d", [when for window in windows for when in window]),
+    }
+
+
+def _read_breakers(sections: dict[str, memoryview], count: int) -> dict[str, CircuitBreaker]:
+    ids = _split_strings(sections["breaker:ids"], count)
+    states = bytes(sections["breaker:state"])
+    threshold = _read_array("I", sections["breaker:threshold"])
+    window = _read_array("d", sections["breaker:window"])
+    timeout = _read_array("d", sections["breaker:timeout"])
+    next_test = _read_array("d", sections["breaker:next_test"])
+    changed = _read_array("d", sections["breaker:changed"])
+    failures_len = _read_array("I", sections["breaker:failures_len"])
+    failures = _read_array("d", sections["breaker:failures"])
+
+    breakers: dict[str, CircuitBreaker] = {}
+    start = 0
+    for row, proxy_id in enumerate(ids):
+        breaker = CircuitBreaker(
+            proxy_id=proxy_id,
+            failure_threshold=threshold[row],
+            window_duration=window[row],
+            timeout_duration=timeout[row],
+        )
+        breaker.state = _BREAKER_STATES[states[row]]
+        breaker.failure_window.extend(failures[start : start + failures_len[row]])
+        breaker.next_test_time = None if math.isnan(next_test[row]) else next_test[row]
+        breaker.last_state_change = datetime.fromtimestamp(changed[row], timezone.utc)
+        start += failures_len[row]
+        breakers[proxy_id] = breaker
+    return breakers
+
+
+@dataclass
+class WarmSnapshot:
+    """Pool, circuit breaker and strategy state loaded from a warm-start snapshot.
+
+    Attributes:
+        columns: Proxy state in columnar form (no models are built on load)
+        circuit_breakers: Breakers that were not in their initial state, by proxy ID
+        strategy_state: Saved strategy class, configuration and state
+        pool_name: Name of the snapshotted pool
+        created_at: When the snapshot was written
+        metadata: Caller-supplied metadata
+    """
+
+    columns: PoolColumns
+    circuit_breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
+    strategy_state: dict[str, Any] | None = None
+    pool_name: str = "default"
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def proxies(self) -> list[Proxy]:
+        """Build :class:`Proxy` models for every row (skips validation)."""
+        with _gc_paused():
+            return ColumnarProxyPool.from_columns(self.columns).get_all_proxies()
+
+    def to_columnar_pool(self, max_pool_size: int | None = None) -> ColumnarProxyPool:
+        """Return a :class:`ColumnarProxyPool` that takes over :attr:`columns`.
+
+        No proxy models are built, so this is the fastest way back to a large
+        pool. The pool owns the columns afterwards; call this once.
+        """
+        return ColumnarProxyPool.from_columns(
+            self.columns, name=self.pool_name, max_pool_size=max_pool_size
+        )
+
+    def restore(self, rotator: ProxyRotatorBase) -> None:
+        """Replace a rotator's pool, circuit breakers and strategy state.
+
+        Proxies without a saved breaker get a new CLOSED one, as when added.
+        """
+        proxies = self.proxies()
+        with _gc_paused():
+            breakers = {
+                proxy_id: self.circuit_breakers.get(proxy_id) or CircuitBreaker(proxy_id=proxy_id)
+                for proxy_id in (str(proxy.id) for proxy in proxies)
+            }
+        rotator.pool.replace_proxies(proxies)
+        # The retry executor shares this dict, so update it in place
+        rotator.circuit_breakers.clear()
+        rotator.circuit_breakers.update(breakers)
+        _restore_strategy(rotator.strategy, self.strategy_state)
+
+
+def write_warm_snapshot(
+    path: str | Path,
+    proxies: ProxyPool | ColumnarProxyPool | Iterable[Proxy],
+    *,
+    circuit_breakers: dict[str, CircuitBreaker] | None = None,
+    strategy: Any = None,
+    metadata: dict[str, Any] | None = None,
+    encryption_key: bytes | None = None,
+) -> Path:
+    """Write a warm-start snapshot atomically (temporary file, then rename).
+
+    Args:
+        path: Destination file
+        proxies: Pool or proxies to save
+        circuit_breakers: Circuit breakers by proxy ID (only non-initial ones are stored)
+        strategy: Rotation strategy whose configuration and state to save
+        metadata: JSON-serializable metadata to store with the snapshot
+        encryption_key: Fernet key to encrypt the sparse fields (credentials, tags, metadata)
+
+    Returns:
+        The snapshot path
+    """
+    path = Path(path)
+    with _gc_paused():
+        if isinstance(proxies, ColumnarProxyPool):
+            columns = proxies.export_columns()
+        elif isinstance(proxies, ProxyPool):
+            columns = PoolColumns.from_proxies(proxies.get_all_proxies())
+        else:
+            columns = PoolColumns.from_proxies(proxies)
+
+    sparse = json.dumps(
+        [
+            [row, {name: _encode_sparse_value(name, value) for name, value in fields.items()}]
+            for row, fields in columns.sparse.items()
+        ],
+        separators=(",", ":"),
+        default=str,
+    ).encode()
+    flags = 0
+    if encryption_key is not None:
+        sparse = Fernet(encryption_key).encrypt(sparse)
+        flags |= _FLAG_ENCRYPTED
+
+    breakers = _breaker_sections(circuit_breakers or {})
+    meta = {
+        "pool_name": getattr(proxies, "name", "default"),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "proxy_count": len(columns),
+        "breaker_count": len(breakers["breaker:state"]),
+        "countries": columns.countries,
+        "strategy": _capture_strategy(strategy),
+        "metadata": metadata or {},
+    }
+    sections: dict[str, Any] = {
+        "meta": json.dumps(meta, separators=(",", ":")).encode(),
+        "urls": _join_strings(columns.urls),
+        "ids": columns.ids,
+        "health": columns.health,
+        "source": columns.source,
+        "protocol": columns.protocol,
+        "country": columns.country,
+        **{f"counter:{name}": column for name, column in columns.counters.items()},
+        **{f"float:{name}": column for name, column in columns.floats.items()},
+        "sparse": sparse,
+        **breakers,
+    }
+    _write_sections(path, sections, flags)
+    return path
+
+
+def _write_sections(path: Path, sections: dict[str, Any], flags: int) -> None:
+    payloads = [
+        (name, _array_bytes(data) if isinstance(data, array) else memoryview(data))
+        for name, data in sections.items()
+    ]
+    offset = _HEADER.size + _SECTION.size * len(payloads)
+    table = []
+    for name, data in payloads:
+        offset += -offset % _ALIGNMENT
+        table.append(_SECTION.pack(name.encode(), offset, len(data), zlib.crc32(data)))
+        offset += len(data)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(_WARM_MAGIC, WARM_SNAPSHOT_VERSION, flags, len(payloads)))
+            f.writelines(table)
+            for _, data in payloads:
+                f.write(bytes(-f.tell() % _ALIGNMENT))
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_sections(buffer: memoryview, path: Path) -> tuple[int, dict[str, memoryview]]:
+    if len(buffer) < _HEADER.size:
+        raise SnapshotFormatError("File too short for a warm snapshot", path=str(path))
+    magic, version, flags, count = _HEADER.unpack_from(buffer)
+    if magic != _WARM_MAGIC:
+        raise SnapshotFormatError("Not a warm snapshot", path=str(path))
+    if version != WARM_SNAPSHOT_VERSION:
+        raise SnapshotFormatError(
+            f"Unsupported warm snapshot version {version} (expected {WARM_SNAPSHOT_VERSION})",
+            path=str(path),
+        )
+    if len(buffer) < _HEADER.size + _SECTION.size * count:
+        raise SnapshotFormatError("Truncated warm snapshot", path=str(path))
+
+    table = []
+    for index in range(count):
+        raw_name, offset, length, crc = _SECTION.unpack_from(
+            buffer, _HEADER.size + _SECTION.size * index
+        )
+        name = raw_name.rstrip(b"\0").decode(errors="replace")
+        if offset + length > len(buffer):
+            raise SnapshotFormatError(f"Truncated warm snapshot section {name}", path=str(path))
+        # Views are released right away so a memory-mapped file can always be closed
+        with buffer[offset : offset + length] as data:
+            if zlib.crc32(data) != crc:
+                raise SnapshotFormatError(f"Checksum mismatch in section {name}", path=str(path))
+        table.append((name, offset, length))
+    return flags, {name: buffer[offset : offset + length] for name, offset, length in table}
+
+
+def read_warm_snapshot(
+    path: str | Path,
+    *,
+    encryption_key: bytes | None = None,
+    use_mmap: bool = True,
+) -> WarmSnapshot:
+    """Read a snapshot written by :func:`write_warm_snapshot`.
+
+    Args:
+        path: Snapshot file
+        encryption_key: Fernet key the snapshot was written with, if any
+        use_mmap: Map the file into memory instead of reading it into a buffer
+
+    Returns:
+        The loaded snapshot
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        SnapshotFormatError: If the file is not a valid snapshot or cannot be decrypted
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        if use_mmap and os.fstat(f.fileno()).st_size:
+            mapped: mmap.mmap | None = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buffer = memoryview(mapped)
+        else:
+            mapped = None
+            buffer = memoryview(f.read())
+    try:
+        return _decode_snapshot(buffer, path, encryption_key)
+    finally:
+        buffer.release()
+        if mapped is not None:
+            mapped.close()
+
+
+def _decode_snapshot(buffer: memoryview, path: Path, encryption_key: bytes | None) -> WarmSnapshot:
+    flags, sections = _read_sections(buffer, path)
+    try:
+        meta = json.loads(bytes(sections["meta"]))
+        count = meta["proxy_count"]
+
+        sparse_data = bytes(sections["sparse"])
+        if flags & _FLAG_ENCRYPTED:
+            if encryption_key is None:
+                raise SnapshotFormatError(
+                    "Warm snapshot is encrypted; an encryption key is required", path=str(path)
+                )
+            try:
+                sparse_data = Fernet(encryption_key).decrypt(sparse_data)
+            except InvalidToken as e:
+                raise SnapshotFormatError(
+                    "Cannot decrypt warm snapshot (wrong encryption key?)", path=str(path)
+                ) from e
+
+        with _gc_paused():
+            sparse = {
+                row: {name: _decode_sparse_value(name, value) for name, value in fields.items()}
+                for row, fields in json.loads(sparse_data)
+            }
+            columns = PoolColumns(
+                urls=_split_strings(sections["urls"], count),
+                ids=bytearray(sections["ids"]),
+                health=bytearray(sections["health"]),
+                source=bytearray(sections["source"]),
+                protocol=bytearray(sections["protocol"]),
+                country=_read_array("H", sections["country"]),
+                countries=meta["countries"],
+                counters={
+                    name.partition(":")[2]: _read_array("I", data)
+                    for name, data in sections.items()
+                    if name.startswith("counter:")
+                },
+                floats={
+                    name.partition(":")[2]: _read_array("d", data)
+                    for name, data in sections.items()
+                    if name.startswith("float:")
+                },
+                sparse=sparse,
+            )
+            breakers = _read_breakers(sections, meta["breaker_count"])
+    except (KeyError, IndexError, ValueError) as e:
+        raise SnapshotFormatError(f"Malformed warm snapshot: {e}", path=str(path)) from e
+    finally:
+        for data in sections.values():
+            data.release()
+
+    return WarmSnapshot(
+        columns=columns,
+        circuit_breakers=breakers,
+        strategy_state=meta["strategy"],
+        pool_name=meta["pool_name"],
+        created_at=datetime.fromisoformat(meta["created_at"]),
+        metadata=meta["metadata"],
+    )
+
+
+class WarmSnapshotWriter:
+    """Background thread that saves a rotator's warm snapshot periodically.
+
+    A snapshot is only written when proxy or circuit breaker state changed
+    since the previous one. The thread holds a weak reference to the rotator
+    and exits once the rotator is garbage collected.
+    """
+
+    def __init__(
+        self,
+        manager: SnapshotManager,
+        rotator: ProxyRotatorBase,
+        name: str = "warm",
+        interval: float = 60.0,
+    ) -> None:
+        """Initialize the writer (call :meth:`start` to begin writing).
+
+        Args:
+            manager: Snapshot manager that writes the snapshots
+            rotator: Rotator to snapshot
+            name: Snapshot name
+            interval: Seconds between checks for changes
+
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.manager = manager
+        self.name = name
+        self.interval = interval
+        self._rotator = weakref.ref(rotator)
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._written_version: int | None = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"proxywhirl-warm-snapshot-{name}", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start the background thread."""
+        self._thread.start()
+
+    def write_now(self) -> bool:
+        """Write a snapshot if state changed since the last one.
+
+        Returns:
+            True if a snapshot was written
+        """
+        rotator = self._rotator()
+        if rotator is None:
+            return False
+        with self._write_lock:
+            version = rotator.pool.version + CIRCUIT_BREAKER_STATE_VERSION.value
+            if version == self._written_version:
+                return False
+            self.manager.save_warm_snapshot(rotator, self.name)
+            self._written_version = version
+            return True
+
+    def stop(self, final_write: bool = True) -> None:
+        """Stop the background thread, optionally writing a last snapshot.
+
+        Args:
+            final_write: Write pending changes before returning
+        """
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        if final_write:
+            self.write_now()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            if self._rotator() is None:
+                return
+            try:
+                self.write_now()
+            except Exception as e:
+                logger.error(f"Failed to write warm snapshot {self.name}: {e}")
+
+
 class SnapshotManager:
     """Manages creation and restoration of pool snapshots."""
 
-    def __init__(self, storage_dir: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        storage_dir: str | Path | None = None,
+        encryption_key: bytes | None = None,
+    ) -> None:
         """Initialize snapshot manager.
 
         Args:
             storage_dir: Directory for storing snapshot files
+            encryption_key: Optional Fernet key for the credentials and other sparse
+                fields of warm snapshots
         """
         self.storage_dir = Path(storage_dir) if storage_dir else Path.cwd() / ".snapshots"
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.snapshots: dict[str, PoolSnapshot] = {}
+        self.encryption_key = encryption_key
 
     def create_snapshot(
         self,
@@ -209,6 +822,100 @@ class SnapshotManager:
         logger.info(f"Cleaned up {deleted} old snapshots")
         return deleted
 
+    def warm_snapshot_path(self, name: str = "warm") -> Path:
+        """Path of the warm snapshot called ``name``."""
+        return self.storage_dir / f"{name}{WARM_SNAPSHOT_SUFFIX}"
+
+    def save_warm_snapshot(
+        self,
+        rotator: ProxyRotatorBase,
+        name: str = "warm",
+        metadata: dict[str, Any] | None = None,
+    ) -> Path:
+        """Save a rotator's pool, circuit breakers and strategy state.
+
+        Args:
+            rotator: ProxyWhirl or AsyncProxyWhirl instance
+            name: Snapshot name
+            metadata: Optional JSON-serializable metadata
+
+        Returns:
+            Path of the written snapshot
+        """
+        path = write_warm_snapshot(
+            self.warm_snapshot_path(name),
+            rotator.pool,
+            circuit_breakers=rotator.circuit_breakers,
+            strategy=rotator.strategy,
+            metadata=metadata,
+            encryption_key=self.encryption_key,
+        )
+        logger.debug(f"Saved warm snapshot to: {path}")
+        return path
+
+    def load_warm_snapshot(self, name: str = "warm", use_mmap: bool = True) -> WarmSnapshot | None:
+        """Load a warm snapshot without applying it.
+
+        Args:
+            name: Snapshot name
+            use_mmap: Memory-map the file instead of reading it into a buffer
+
+        Returns:
+            WarmSnapshot if the file exists, None otherwise
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid snapshot
+        """
+        path = self.warm_snapshot_path(name)
+        try:
+            return read_warm_snapshot(path, encryption_key=self.encryption_key, use_mmap=use_mmap)
+        except FileNotFoundError:
+            return None
+
+    def restore_warm_snapshot(self, rotator: ProxyRotatorBase, name: str = "warm") -> bool:
+        """Restore a rotator from its warm snapshot, if there is a usable one.
+
+        An unreadable snapshot is logged and ignored, so callers fall back to
+        a cold start.
+
+        Args:
+            rotator: ProxyWhirl or AsyncProxyWhirl instance
+            name: Snapshot name
+
+        Returns:
+            True if the rotator was restored
+        """
+        try:
+            snapshot = self.load_warm_snapshot(name)
+        except SnapshotFormatError as e:
+            logger.warning(f"Ignoring warm snapshot {name}: {e}")
+            return False
+        if snapshot is None:
+            return False
+        snapshot.restore(rotator)
+        logger.info(f"Restored warm snapshot {name} with {len(snapshot)} proxies")
+        return True
+
+    def start_warm_snapshots(
+        self,
+        rotator: ProxyRotatorBase,
+        name: str = "warm",
+        interval: float = 60.0,
+    ) -> WarmSnapshotWriter:
+        """Save a rotator's warm snapshot in the background every ``interval`` seconds.
+
+        Args:
+            rotator: ProxyWhirl or AsyncProxyWhirl instance
+            name: Snapshot name
+            interval: Seconds between checks for changes
+
+        Returns:
+            The started writer; call :meth:`WarmSnapshotWriter.stop` on shutdown
+        """
+        writer = WarmSnapshotWriter(self, rotator, name=name, interval=interval)
+        writer.start()
+        return writer
+
     def _save_snapshot(self, snapshot: PoolSnapshot) -> None:
         """Save snapshot to disk."""
         snapshot_file = self.storage_dir / f"{snapshot.snapshot_id}.json"
@@ -38,7 +38,8 @@ from tenacity import (
 
 from proxywhirl.circuit_breaker import CircuitBreaker, CircuitBreakerState
 from proxywhirl.exceptions import ProxyConnectionError
-from proxywhirl.models import Proxy
+from proxywhirl.models import Proxy, VersionCounter
+from proxywhirl.stage_timing import current_profiler
 
 
 class BackoffStrategy(str, Enum):
@@ -159,6 +160,7 @@ class RetryMetrics(BaseModel):
     _proxy_hourly_aggregates: dict[datetime, dict[str, dict[str, Any]]] = PrivateAttr(
         default_factory=dict
     )
+    _version: VersionCounter = PrivateAttr(default_factory=VersionCounter)
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -175,12 +177,18 @@ class RetryMetrics(BaseModel):
             self._record_attempt_aggregate(attempt)
         self._prune_aggregates()
 
+    @property
+    def version(self) -> int:
+        """Monotonically increasing version, advanced on every recorded attempt or event."""
+        return self._version.value
+
     def record_attempt(self, attempt: RetryAttempt) -> None:
         """Record a retry attempt."""
         with self._lock:
             self.current_attempts.append(attempt)
             self._record_attempt_aggregate(attempt)
             self._prune_aggregates()
+        self._version.bump()
 
     def record_circuit_breaker_event(self, event: CircuitBreakerEvent) -> None:
         """Record circuit breaker state change."""
@@ -188,6 +196,7 @@ class RetryMetrics(BaseModel):
             self.circuit_breaker_events.append(event)
             if len(self.circuit_breaker_events) > 1000:
                 self.circuit_breaker_events = self.circuit_breaker_events[-1000:]
+        self._version.bump()
 
     def aggregate_hourly(self) -> None:
         """Prune retained hourly summaries.
@@ -366,6 +375,28 @@ def _current_time() -> float:
     return time.time()
 
 
+def _sleep(seconds: float) -> None:
+    """Back off between attempts, timing the wait for a sampled request."""
+    profiler = current_profiler()
+    if profiler is None:
+        time.sleep(seconds)
+        return
+    started = time.perf_counter_ns()
+    time.sleep(seconds)
+    profiler.record_ns("retry_wait", time.perf_counter_ns() - started)
+
+
+async def _sleep_async(seconds: float) -> None:
+    """Async form of :func:`_sleep`."""
+    profiler = current_profiler()
+    if profiler is None:
+        await asyncio.sleep(seconds)
+        return
+    started = time.perf_counter_ns()
+    await asyncio.sleep(seconds)
+    profiler.record_ns("retry_wait", time.perf_counter_ns() - started)
+
+
 @dataclass
 class _RetryRunContext:
     """Mutable per-request state shared across tenacity attempts."""
@@ -529,7 +560,7 @@ class RetryExecutor:
             before_sleep=_make_before_sleep(self.retry_policy, ctx),
             retry_error_callback=_make_retry_error_callback(self.retry_policy, ctx),
             reraise=False,
-            sleep=time.sleep,
+            sleep=_sleep,
         )
 
         for attempt in retrying:
@@ -608,7 +639,7 @@ class RetryExecutor:
             before_sleep=_make_before_sleep(self.retry_policy, ctx),
             retry_error_callback=_make_retry_error_callback(self.retry_policy, ctx),
             reraise=False,
-            sleep=asyncio.sleep,
+            sleep=_sleep_async,
         )
 
         async for attempt in retrying:
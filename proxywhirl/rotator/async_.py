@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import asyncio
 import threading
+import time
 from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
@@ -28,6 +29,7 @@ from proxywhirl.retry import NonRetryableError, RetryExecutor, RetryMetrics, Ret
 from proxywhirl.rotator._bootstrap import bootstrap_pool_if_empty_async
 from proxywhirl.rotator.base import CircuitBreakerSnapshot, ProxyRotatorBase
 from proxywhirl.settings import ProxyConfiguration
+from proxywhirl.stage_timing import StageProfiler, with_stage_trace
 from proxywhirl.strategies import (
     RotationStrategy,
     resolve_builtin_strategy,
@@ -223,6 +225,7 @@ class AsyncProxyWhirl(ProxyRotatorBase):
         self.config = config or ProxyConfiguration()
         self._client: httpx.AsyncClient | None = None
         self._client_pool = LRUAsyncClientPool(maxsize=100)  # LRU cache with max 100 clients
+        self.stage_profiler = self._stage_profiler_from_config(self.config)
         # Coerce bool/None to BootstrapConfig
         if bootstrap is False:
             self._bootstrap_config = BootstrapConfig(enabled=False)
@@ -754,6 +757,9 @@ class AsyncProxyWhirl(ProxyRotatorBase):
             await self._ensure_request_bootstrap()
 
         active_proxy: Proxy | None = None
+        profiler = self.stage_profiler
+        if profiler is not None and not profiler.should_sample():
+            profiler = None
 
         async def on_proxy_selected_async(proxy: Proxy) -> None:
             nonlocal active_proxy
@@ -786,8 +792,18 @@ class AsyncProxyWhirl(ProxyRotatorBase):
             )
 
             async def request_fn() -> httpx.Response:
-                client = await self._get_or_create_client(proxy, proxy_dict)
-                response = await client.request(method, url, **kwargs)
+                if profiler is None:
+                    client = await self._get_or_create_client(proxy, proxy_dict)
+                    response = await client.request(method, url, **kwargs)
+                else:
+                    started = time.perf_counter_ns()
+                    client = await self._get_or_create_client(proxy, proxy_dict)
+                    profiler.record_ns("client_get", time.perf_counter_ns() - started)
+                    trace, traced_kwargs = with_stage_trace(profiler, kwargs, is_async=True)
+                    try:
+                        response = await client.request(method, url, **traced_kwargs)
+                    finally:
+                        trace.flush()
                 if response.status_code in (401, 407):
                     logger.error(
                         f"Proxy authentication failed: {masked_url}",
@@ -807,6 +823,7 @@ class AsyncProxyWhirl(ProxyRotatorBase):
 
             return request_fn
 
+        token = profiler.activate() if profiler is not None else None
         try:
             result = await self.orchestrator.execute_async(
                 method=method,
@@ -845,12 +862,18 @@ class AsyncProxyWhirl(ProxyRotatorBase):
             if active_proxy is not None:
                 self.strategy.record_result(active_proxy, success=False, response_time_ms=0.0)
             raise ProxyConnectionError(f"Request failed: {e}") from e
+        finally:
+            if token is not None:
+                StageProfiler.deactivate(token)
 
+        started = time.perf_counter_ns() if profiler is not None else 0
         self.strategy.record_result(
             result.proxy,
             success=True,
             response_time_ms=result.response_time_ms,
         )
+        if profiler is not None:
+            profiler.record_ns("record", time.perf_counter_ns() - started)
         logger.info(
             f"Request successful: {method} {url}",
             proxy_id=str(result.proxy.id),
@@ -7,6 +7,7 @@ reducing code duplication and ensuring consistent behavior.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -18,6 +19,7 @@ from proxywhirl.circuit_breaker import CircuitBreaker, CircuitBreakerState
 from proxywhirl.exceptions import ProxyPoolEmptyError
 from proxywhirl.models import Proxy, ProxyPool, SelectionContext
 from proxywhirl.retry import RetryMetrics, RetryPolicy
+from proxywhirl.stage_timing import StageProfiler, current_profiler
 from proxywhirl.strategies import RotationStrategy
 from proxywhirl.utils import mask_proxy_url
 
@@ -54,8 +56,11 @@ class ProxyRotatorBase:
         circuit_breakers: Circuit breaker instances per proxy
         retry_policy: Retry policy configuration
         retry_metrics: Retry metrics tracking
+        stage_profiler: Per-stage latency profiler, or None when profiling is off
     """
 
+    stage_profiler: StageProfiler | None = None
+
     def _init_common(
         self,
         pool: ProxyPool,
@@ -81,6 +86,13 @@ class ProxyRotatorBase:
         self.retry_policy = retry_policy
         self.circuit_breakers: dict[str, CircuitBreaker] = {}
         self.retry_metrics = RetryMetrics()
+        self.stage_profiler = self._stage_profiler_from_config(config)
+
+    @staticmethod
+    def _stage_profiler_from_config(config: Any) -> StageProfiler | None:
+        """Create a profiler when ``config.stage_timing_sample_rate`` enables one."""
+        sample_rate = getattr(config, "stage_timing_sample_rate", 0.0)
+        return StageProfiler(sample_rate=sample_rate) if sample_rate > 0 else None
 
     def _get_proxy_dict(self, proxy: Proxy) -> dict[str, str]:
         """
@@ -171,6 +183,9 @@ class ProxyRotatorBase:
             The method takes a snapshot of proxies to avoid race conditions
             during iteration in multi-threaded/async environments.
         """
+        profiler = current_profiler() if self.stage_profiler is not None else None
+        started = time.perf_counter_ns() if profiler is not None else 0
+
         # Take a snapshot to avoid race conditions during iteration
         # For sync rotator, use get_all_proxies(); for async, use proxies directly
         if hasattr(self.pool, "get_all_proxies"):
@@ -210,7 +225,13 @@ class ProxyRotatorBase:
         temp_pool = ProxyPool(name="temp", proxies=available_proxies)
 
         # Select from available proxies using strategy
-        return self.strategy.select(temp_pool, context)
+        if profiler is None:
+            return self.strategy.select(temp_pool, context)
+        filtered = time.perf_counter_ns()
+        profiler.record_ns("cb_filter", filtered - started)
+        proxy = self.strategy.select(temp_pool, context)
+        profiler.record_ns("select", time.perf_counter_ns() - filtered)
+        return proxy
 
     def _init_circuit_breakers_for_proxies(self, proxies: list[Proxy]) -> None:
         """
@@ -36,6 +36,7 @@ from proxywhirl.rotator.client_pool import (
     LRUClientPool,  # noqa: F401 - re-export for backward compatibility
 )
 from proxywhirl.settings import ProxyConfiguration
+from proxywhirl.stage_timing import StageProfiler, with_stage_trace
 from proxywhirl.strategies import (
     RotationStrategy,
     resolve_builtin_strategy,
@@ -121,6 +122,7 @@ class ProxyWhirl(ProxyRotatorBase):
         self.config = config or ProxyConfiguration()
         self._client: httpx.Client | None = None
         self._client_pool = LRUClientPool(maxsize=100)  # LRU cache with max 100 clients
+        self.stage_profiler = self._stage_profiler_from_config(self.config)
 
         # Retry and circuit breaker components
         self.retry_policy = retry_policy or RetryPolicy()
@@ -713,6 +715,82 @@ class ProxyWhirl(ProxyRotatorBase):
         """Return the proxy used for the most recent successful request."""
         return self._last_used_proxy
 
+    def _enforce_rate_limit(self, proxy: Proxy, allow_queue: bool = True) -> None:
+        """
+        Apply the rate limiter to a selected proxy.
+
+        Args:
+            proxy: Proxy selected for the request
+            allow_queue: Hand the request to the request queue when over the limit
+
+        Raises:
+            _QueueRequestForProxyError: If over the limit and the request can be queued
+            RateLimitExceededError: If over the limit otherwise
+        """
+        if self.rate_limiter is None:
+            return
+        proxy_id = str(proxy.id)
+        if self.rate_limiter.check_limit(proxy_id):
+            return
+        masked_url = mask_proxy_url(str(proxy.url))
+        logger.warning(
+            f"Rate limit exceeded for proxy {proxy_id}",
+            proxy_id=proxy_id,
+            proxy_url=masked_url,
+        )
+        if allow_queue and self.config.queue_enabled and self._request_queue is not None:
+            raise _QueueRequestForProxyError(proxy)
+        raise RateLimitExceededError(
+            f"Rate limit exceeded for proxy {proxy_id}. Please wait before making more requests."
+        )
+
+    def _select_proxy_for_request(self) -> Proxy:
+        """
+        Select a proxy for a request the caller sends itself (e.g. a streamed one).
+
+        Applies the same steps as :meth:`_make_request` before sending: lazy
+        bootstrap of an empty pool, circuit-breaker-aware selection (which
+        counts the request as started) and the rate limiter. Report the outcome
+        with :meth:`_record_request_result`.
+
+        Returns:
+            Selected proxy
+
+        Raises:
+            ProxyPoolEmptyError: If no proxy is available
+            RateLimitExceededError: If the selected proxy is over its rate limit
+        """
+        self._ensure_bootstrap_for_empty_pool()
+        proxy = self._select_proxy_with_circuit_breaker()
+        self._enforce_rate_limit(proxy, allow_queue=False)
+        return proxy
+
+    def _record_request_result(
+        self,
+        proxy: Proxy,
+        success: bool,
+        response_time_ms: float = 0.0,
+        circuit_breaker: bool = True,
+    ) -> None:
+        """
+        Record the outcome of a request sent with :meth:`_select_proxy_for_request`.
+
+        Args:
+            proxy: Proxy the request went through
+            success: Whether the request succeeded
+            response_time_ms: Time to the upstream response headers
+            circuit_breaker: Also update the proxy's circuit breaker
+        """
+        self.strategy.record_result(proxy, success=success, response_time_ms=response_time_ms)
+        breaker = self.circuit_breakers.get(str(proxy.id)) if circuit_breaker else None
+        if breaker is not None:
+            if success:
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+        if success:
+            self._last_used_proxy = proxy
+
     def _make_request(
         self,
         method: str,
@@ -739,27 +817,14 @@ class ProxyWhirl(ProxyRotatorBase):
         """
         self._ensure_bootstrap_for_empty_pool()
         active_proxy: Proxy | None = None
+        profiler = self.stage_profiler
+        if profiler is not None and not profiler.should_sample():
+            profiler = None
 
         def on_proxy_selected(proxy: Proxy) -> None:
             nonlocal active_proxy
             active_proxy = proxy
-            if self.rate_limiter is None:
-                return
-            proxy_id = str(proxy.id)
-            if self.rate_limiter.check_limit(proxy_id):
-                return
-            masked_url = mask_proxy_url(str(proxy.url))
-            logger.warning(
-                f"Rate limit exceeded for proxy {proxy_id}",
-                proxy_id=proxy_id,
-                proxy_url=masked_url,
-            )
-            if self.config.queue_enabled and self._request_queue is not None:
-                raise _QueueRequestForProxyError(proxy)
-            raise RateLimitExceededError(
-                f"Rate limit exceeded for proxy {proxy_id}. "
-                "Please wait before making more requests."
-            )
+            self._enforce_rate_limit(proxy)
 
         def request_fn_factory(proxy: Proxy) -> Callable[[], httpx.Response]:
             proxy_dict = self._get_proxy_dict(proxy)
@@ -769,10 +834,20 @@ class ProxyWhirl(ProxyRotatorBase):
                 proxy_id=str(proxy.id),
                 proxy_url=masked_url,
             )
+            started = time.perf_counter_ns() if profiler is not None else 0
             client = self._get_or_create_client(proxy, proxy_dict)
+            if profiler is not None:
+                profiler.record_ns("client_get", time.perf_counter_ns() - started)
 
             def request_fn() -> httpx.Response:
-                response = client.request(method, url, **kwargs)
+                if profiler is None:
+                    response = client.request(method, url, **kwargs)
+                else:
+                    trace, traced_kwargs = with_stage_trace(profiler, kwargs, is_async=False)
+                    try:
+                        response = client.request(method, url, **traced_kwargs)
+                    finally:
+                        trace.flush()
                 if response.status_code in (401, 407):
                     logger.error(
                         f"Proxy authentication failed: {masked_url}",
@@ -787,6 +862,7 @@ class ProxyWhirl(ProxyRotatorBase):
 
             return request_fn
 
+        token = profiler.activate() if profiler is not None else None
         try:
             result = self.orchestrator.execute_sync(
                 method=method,
@@ -832,12 +908,18 @@ class ProxyWhirl(ProxyRotatorBase):
             if active_proxy is not None:
                 self.strategy.record_result(active_proxy, success=False, response_time_ms=0.0)
             raise ProxyConnectionError(f"Request failed: {e}") from e
+        finally:
+            if token is not None:
+                StageProfiler.deactivate(token)
 
+        started = time.perf_counter_ns() if profiler is not None else 0
         self.strategy.record_result(
             result.proxy,
             success=True,
             response_time_ms=result.response_time_ms,
         )
+        if profiler is not None:
+            profiler.record_ns("record", time.perf_counter_ns() - started)
         logger.info(
             f"Request successful: {method} {url}",
             proxy_id=str(result.proxy.id),
@@ -7,8 +7,12 @@ Service (ReDoS) attacks.
 
 from __future__ import annotations
 
+import atexit
 import multiprocessing as mp
+import os
 import re
+import threading
+from collections import OrderedDict
 from re import Pattern
 from typing import Any, cast
 
@@ -23,6 +27,9 @@ MAX_PATTERN_LENGTH = 1000
 # Maximum number of repetition quantifiers to limit backtracking
 MAX_REPETITIONS = 10
 
+# Compiled patterns cached per worker process, keyed by (pattern, flags)
+WORKER_PATTERN_CACHE_SIZE = 256
+
 
 class RegexTimeoutError(Exception):
     """Raised when regex compilation or matching exceeds timeout."""
@@ -130,38 +137,64 @@ def _findall_limited(compiled_pattern: Pattern[str], text: str, max_results: int
     return matches
 
 
-def _regex_worker(
-    conn: Any,
+def _cached_compile(
+    cache: OrderedDict[tuple[str, int], Pattern[str]], pattern: str, flags: int
+) -> Pattern[str]:
+    """Compile a pattern through a worker-local LRU cache keyed by (pattern, flags)."""
+    key = (pattern, flags)
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = re.compile(pattern, flags)
+        cache[key] = compiled
+        if len(cache) > WORKER_PATTERN_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return compiled
+
+
+def _run_regex_request(
+    cache: OrderedDict[tuple[str, int], Pattern[str]],
     operation: str,
     pattern: str,
     flags: int,
-    text: str,
+    texts: list[str],
     max_results: int,
-) -> None:
-    """Run one regex operation in an isolated child process."""
-    try:
-        compiled_pattern = re.compile(pattern, flags)
-        if operation == "compile":
-            payload: Any = True
-        elif operation == "search":
-            payload = compiled_pattern.search(text) is not None
-        elif operation == "findall":
-            payload = _findall_limited(compiled_pattern, text, max_results)
-        else:
-            raise ValueError(f"Unsupported regex operation: {operation}")
-        conn.send(("ok", payload))
-    except re.error as exc:
-        conn.send(("re_error", str(exc)))
-    except ValueError as exc:
-        conn.send(("value_error", str(exc)))
-    except BaseException as exc:  # pragma: no cover - defensive child-process boundary
-        conn.send(("error", f"{type(exc).__name__}: {exc}"))
-    finally:
-        conn.close()
+) -> list[Any]:
+    """Run one operation for every text in a batch inside a worker process."""
+    compiled_pattern = _cached_compile(cache, pattern, flags)
+    if operation == "compile":
+        return [True]
+    if operation == "search":
+        return [compiled_pattern.search(text) is not None for text in texts]
+    if operation == "findall":
+        return [_findall_limited(compiled_pattern, text, max_results) for text in texts]
+    raise ValueError(f"Unsupported regex operation: {operation}")
+
+
+def _regex_worker_loop(conn: Any) -> None:
+    """Serve regex requests from the parent until the pipe closes or None is received."""
+    cache: OrderedDict[tuple[str, int], Pattern[str]] = OrderedDict()
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError, KeyboardInterrupt):
+            break
+        if request is None:
+            break
+        try:
+            conn.send(("ok", _run_regex_request(cache, *request)))
+        except re.error as exc:
+            conn.send(("re_error", str(exc)))
+        except ValueError as exc:
+            conn.send(("value_error", str(exc)))
+        except BaseException as exc:  # pragma: no cover - defensive child-process boundary
+            conn.send(("error", f"{type(exc).__name__}: {exc}"))
+    conn.close()
 
 
 def _regex_process_context() -> Any:
-    """Use fork when available to keep per-call isolation practical."""
+    """Use fork when available so replacement workers start in milliseconds."""
     if "fork" in mp.get_all_start_methods():
         return mp.get_context("fork")
     return mp.get_context()
@@ -176,6 +209,188 @@ def _stop_regex_process(process: Any) -> None:
         process.join()
 
 
+class _RegexWorker:
+    """A persistent worker process and the parent end of its pipe."""
+
+    __slots__ = ("conn", "process")
+
+    def __init__(self, ctx: Any) -> None:
+        self.conn, child_conn = ctx.Pipe(duplex=True)
+        self.process = ctx.Process(target=_regex_worker_loop, args=(child_conn,))
+        self.process.daemon = True
+        try:
+            self.process.start()
+        except OSError:
+            self.conn.close()
+            raise
+        finally:
+            child_conn.close()
+
+    def stop(self, graceful: bool = False) -> None:
+        """Stop the worker, asking it to exit first when ``graceful`` is set."""
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(0.2)
+        if self.process.is_alive():
+            _stop_regex_process(self.process)
+        self.conn.close()
+
+
+class RegexWorkerPool:
+    """Pool of persistent worker processes that run regex operations under a hard timeout.
+
+    Workers are started on demand (up to ``max_workers``) and reused across calls,
+    each keeping an LRU cache of compiled patterns. A worker that exceeds its
+    timeout is killed and replaced; the other workers keep running.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            max_workers: Maximum concurrent workers (default: CPU count, at most 4)
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._ctx = _regex_process_context()
+        self._idle: list[_RegexWorker] = []
+        self._started = 0
+        self._condition = threading.Condition()
+        self._pid = os.getpid()
+
+    def _acquire(self) -> _RegexWorker:
+        with self._condition:
+            while True:
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.process.is_alive():
+                        return worker
+                    worker.stop()
+                    self._started -= 1
+                if self._started < self.max_workers:
+                    self._started += 1
+                    break
+                self._condition.wait()
+        try:
+            return _RegexWorker(self._ctx)
+        except OSError:
+            self._discard()
+            raise
+
+    def _release(self, worker: _RegexWorker) -> None:
+        with self._condition:
+            self._idle.append(worker)
+            self._condition.notify()
+
+    def _kill(self, worker: _RegexWorker) -> None:
+        worker.stop()
+        self._discard()
+
+    def _discard(self) -> None:
+        with self._condition:
+            self._started -= 1
+            self._condition.notify()
+
+    def run(
+        self,
+        operation: str,
+        pattern: str,
+        flags: int,
+        texts: list[str],
+        timeout: float = DEFAULT_REGEX_TIMEOUT,
+        max_results: int = 0,
+    ) -> list[Any]:
+        """Run a regex operation against a batch of texts in one round trip.
+
+        Args:
+            operation: "compile", "search" or "findall"
+            pattern: Regex pattern string
+            flags: Regex flags
+            texts: Texts to apply the operation to
+            timeout: Hard time budget in seconds for the whole batch
+            max_results: Result cap per text for "findall"
+
+        Returns:
+            One result per text (a single ``True`` for "compile")
+
+        Raises:
+            RegexTimeoutError: If the batch exceeds ``timeout`` or the worker dies
+            re.error: If the pattern does not compile
+            ValueError: If the operation is unsupported
+        """
+        if timeout <= 0:
+            raise RegexTimeoutError(f"Regex {operation} timed out after {timeout}s")
+
+        try:
+            worker = self._acquire()
+        except OSError as exc:
+            raise RegexTimeoutError(f"Regex {operation} worker failed to start") from exc
+
+        try:
+            worker.conn.send((operation, pattern, flags, texts, max_results))
+            ready = worker.conn.poll(timeout)
+            if ready:
+                status, payload = worker.conn.recv()
+        except (EOFError, OSError) as exc:
+            exitcode = worker.process.exitcode
+            self._kill(worker)
+            raise RegexTimeoutError(
+                f"Regex {operation} worker exited without a result (exit code {exitcode})"
+            ) from exc
+        except BaseException:
+            # Interrupted mid-request: the worker's state is unknown, so replace it
+            self._kill(worker)
+            raise
+        if not ready:
+            self._kill(worker)
+            raise RegexTimeoutError(f"Regex {operation} timed out after {timeout}s")
+        self._release(worker)
+
+        if status == "ok":
+            return cast(list[Any], payload)
+        if status == "re_error":
+            raise re.error(payload)
+        if status == "value_error":
+            raise ValueError(payload)
+        raise RegexTimeoutError(f"Regex {operation} worker failed: {payload}")
+
+    def shutdown(self) -> None:
+        """Stop all idle workers."""
+        with self._condition:
+            workers, self._idle = self._idle, []
+            self._started -= len(workers)
+        for worker in workers:
+            worker.stop(graceful=True)
+
+
+_regex_pool: RegexWorkerPool | None = None
+_regex_pool_lock = threading.Lock()
+
+
+def get_regex_worker_pool() -> RegexWorkerPool:
+    """Return the process-wide regex worker pool, creating it on first use."""
+    global _regex_pool
+    with _regex_pool_lock:
+        # A forked child must not share its parent's worker pipes
+        if _regex_pool is None or _regex_pool._pid != os.getpid():
+            _regex_pool = RegexWorkerPool()
+        return _regex_pool
+
+
+def shutdown_regex_worker_pool() -> None:
+    """Stop the process-wide regex worker pool (restarted lazily on next use)."""
+    global _regex_pool
+    with _regex_pool_lock:
+        pool, _regex_pool = _regex_pool, None
+    if pool is not None and pool._pid == os.getpid():
+        pool.shutdown()
+
+
+atexit.register(shutdown_regex_worker_pool)
+
+
 def _run_regex_operation(
     operation: str,
     pattern: str,
@@ -184,48 +399,8 @@ def _run_regex_operation(
     timeout: float = DEFAULT_REGEX_TIMEOUT,
     max_results: int = 0,
 ) -> Any:
-    """Run a regex operation in a killable process with a hard timeout."""
-    if timeout <= 0:
-        raise RegexTimeoutError(f"Regex {operation} timed out after {timeout}s")
-
-    ctx = _regex_process_context()
-    parent_conn, child_conn = ctx.Pipe(duplex=False)
-    process = ctx.Process(
-        target=_regex_worker,
-        args=(child_conn, operation, pattern, flags, text, max_results),
-    )
-    process.daemon = True
-
-    try:
-        process.start()
-    except OSError as exc:
-        parent_conn.close()
-        child_conn.close()
-        raise RegexTimeoutError(f"Regex {operation} worker failed to start") from exc
-
-    child_conn.close()
-    process.join(timeout)
-    if process.is_alive():
-        _stop_regex_process(process)
-        parent_conn.close()
-        raise RegexTimeoutError(f"Regex {operation} timed out after {timeout}s")
-
-    try:
-        if not parent_conn.poll():
-            raise RegexTimeoutError(
-                f"Regex {operation} worker exited without a result (exit code {process.exitcode})"
-            )
-        status, payload = parent_conn.recv()
-    finally:
-        parent_conn.close()
-
-    if status == "ok":
-        return payload
-    if status == "re_error":
-        raise re.error(payload)
-    if status == "value_error":
-        raise ValueError(payload)
-    raise RegexTimeoutError(f"Regex {operation} worker failed: {payload}")
+    """Run a regex operation in a pooled, killable worker process with a hard timeout."""
+    return get_regex_worker_pool().run(operation, pattern, flags, [text], timeout, max_results)[0]
 
 
 def _compile_with_timeout(pattern: str, flags: int, timeout: float) -> Pattern[str]:
@@ -415,14 +590,7 @@ def safe_regex_findall(
         RegexTimeoutError: If searching exceeds timeout
         typer.Exit: If pattern is rejected during validation
     """
-    if isinstance(pattern, str):
-        if validate:
-            validate_regex_pattern(pattern)
-        pattern_text = pattern
-        pattern_flags = flags
-    else:
-        pattern_text = pattern.pattern
-        pattern_flags = pattern.flags
+    pattern_text, pattern_flags = _resolve_pattern(pattern, flags, validate)
 
     try:
         return cast(
@@ -448,3 +616,109 @@ def safe_regex_findall(
             fg="yellow",
         )
         raise typer.Exit(code=1) from e
+
+
+def _resolve_pattern(pattern: str | Pattern[str], flags: int, validate: bool) -> tuple[str, int]:
+    """Validate a string pattern and return the (pattern, flags) pair sent to workers."""
+    if isinstance(pattern, str):
+        if validate:
+            validate_regex_pattern(pattern)
+        return pattern, flags
+    return pattern.pattern, pattern.flags
+
+
+def safe_regex_match_many(
+    pattern: str | Pattern[str],
+    texts: list[str],
+    flags: int = 0,
+    timeout: float = DEFAULT_REGEX_TIMEOUT,
+    validate: bool = True,
+) -> list[bool]:
+    """Safely search many texts for a regex pattern in a single worker round trip.
+
+    Use this instead of calling ``safe_regex_match`` in a loop when filtering
+    large collections (e.g. proxy URLs) with a user-supplied pattern.
+
+    Args:
+        pattern: Regex pattern (string or compiled pattern)
+        texts: Texts to search
+        flags: Regex flags (only used if pattern is a string)
+        timeout: Maximum time allowed for the whole batch in seconds
+        validate: Whether to validate pattern complexity first (only for string patterns)
+
+    Returns:
+        One boolean per text, True where the pattern was found
+
+    Raises:
+        typer.Exit: If pattern is rejected during validation or the batch times out
+    """
+    pattern_text, pattern_flags = _resolve_pattern(pattern, flags, validate)
+    if not texts:
+        return []
+
+    try:
+        return cast(
+            list[bool],
+            get_regex_worker_pool().run("search", pattern_text, pattern_flags, texts, timeout),
+        )
+    except RegexTimeoutError as e:
+        typer.secho(
+            f"Error: Regex matching timed out after {timeout}s",
+            err=True,
+            fg="red",
+        )
+        typer.secho(
+            "The input text may trigger pathological backtracking",
+            err=True,
+            fg="yellow",
+        )
+        raise typer.Exit(code=1) from e
+
+
+def safe_regex_findall_many(
+    pattern: str | Pattern[str],
+    texts: list[str],
+    flags: int = 0,
+    timeout: float = DEFAULT_REGEX_TIMEOUT,
+    validate: bool = True,
+    max_results: int = 10000,
+) -> list[list[str]]:
+    """Safely find all matches of a regex pattern in many texts in a single round trip.
+
+    Args:
+        pattern: Regex pattern (string or compiled pattern)
+        texts: Texts to search
+        flags: Regex flags (only used if pattern is a string)
+        timeout: Maximum time allowed for the whole batch in seconds
+        validate: Whether to validate pattern complexity first (only for string patterns)
+        max_results: Maximum number of results per text (prevents DoS)
+
+    Returns:
+        One list of matches per text
+
+    Raises:
+        typer.Exit: If pattern is rejected during validation or the batch times out
+    """
+    pattern_text, pattern_flags = _resolve_pattern(pattern, flags, validate)
+    if not texts:
+        return []
+
+    try:
+        return cast(
+            list[list[str]],
+            get_regex_worker_pool().run(
+                "findall", pattern_text, pattern_flags, texts, timeout, max_results
+            ),
+        )
+    except RegexTimeoutError as e:
+        typer.secho(
+            f"Error: Regex findall timed out after {timeout}s",
+            err=True,
+            fg="red",
+        )
+        typer.secho(
+            "The input text may trigger pathological backtracking",
+            err=True,
+            fg="yellow",
+        )
+        raise typer.Exit(code=1) from e
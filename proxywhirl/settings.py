@@ -35,6 +35,12 @@ class ProxyConfiguration(BaseSettings):
     queue_size: int = Field(
         default=100, ge=1, le=10000, description="Maximum number of queued requests (1-10000)"
     )
+    stage_timing_sample_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests whose per-stage latencies are profiled (0 disables)",
+    )
 
     @field_validator("timeout", "max_retries", "pool_connections", "pool_timeout")
     @classmethod
@@ -88,6 +94,21 @@ class APISettings(BaseSettings):
     rate_limit: str = "100/minute"
     api_key_rate_limit: str | None = None
     audit_log: bool = True
+    stream_max_bytes: int = Field(
+        default=100 * 1024 * 1024,
+        ge=1,
+        description="Maximum upstream body size relayed by /api/request/stream",
+    )
+    stream_chunk_size: int = Field(
+        default=64 * 1024,
+        ge=1024,
+        description="Chunk size in bytes used when relaying streamed upstream bodies",
+    )
+    response_cache_ttl: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds a cached body for clock-dependent read endpoints stays fresh",
+    )
 
     @field_validator("cors_origins", mode="before")
     @classmethod
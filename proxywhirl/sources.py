@@ -1389,6 +1389,7 @@ async def fetch_all_sources(
     fetch_progress_callback: Any | None = None,
     validate_progress_callback: Any | None = None,
     test_url: str | None = None,
+    validation_filter: Any | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch proxies from all built-in sources.
 
@@ -1400,6 +1401,8 @@ async def fetch_all_sources(
         fetch_progress_callback: Optional callback(completed, total, proxies_found) for fetch progress
         validate_progress_callback: Optional callback(completed, total, valid_count) for validation progress
         test_url: Optional URL to validate against (defaults to http://www.gstatic.com/generate_204)
+        validation_filter: Optional async callable selecting which fetched proxies to validate
+            (see ``ProxyFetcher.fetch_all``)
 
     Returns:
         List of proxy dictionaries
@@ -1420,6 +1423,7 @@ async def fetch_all_sources(
             validate=validate,
             fetch_progress_callback=fetch_progress_callback,
             validate_progress_callback=validate_progress_callback,
+            validation_filter=validation_filter,
         )
     finally:
         await fetcher.close()
@@ -0,0 +1,322 @@
+"""Per-stage latency profiling for the rotators.
+
+:class:`StageProfiler` splits sampled requests into the stages listed in
+:data:`STAGES` and records each duration in a :class:`LatencyHistogram`, a
+fixed-size log-linear (HDR-style) histogram with ~1.6% relative error from
+nanoseconds to ~18 minutes. Recording is a bucket-index computation and a counter
+increment; percentiles and Prometheus buckets are only derived when read.
+
+Profiling is off unless ``ProxyConfiguration.stage_timing_sample_rate`` is above
+zero or a profiler is assigned to ``rotator.stage_profiler``. While it is off,
+the rotators only test ``stage_profiler is None``.
+
+Stages:
+- ``select``: strategy selection over the available proxies
+- ``cb_filter``: circuit breaker / expiry filtering before selection
+- ``client_get``: fetching or creating the pooled httpx client
+- ``connect``: TCP connect and TLS handshake (new connections only)
+- ``ttfb``: request headers sent until response headers received
+- ``body``: reading the response body
+- ``retry_wait``: backoff sleeps between retry attempts
+- ``record``: strategy bookkeeping after a successful request
+
+Example:
+    >>> profiler = StageProfiler(sample_rate=0.1)
+    >>> rotator.stage_profiler = profiler
+    >>> get_metrics_collector().register_stage_profiler(profiler)
+    >>> profiler.snapshot()["ttfb"]["p99"]
+    0.183
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import sys
+import time
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Final, Literal
+
+Stage = Literal[
+    "select", "cb_filter", "client_get", "connect", "ttfb", "body", "retry_wait", "record"
+]
+
+STAGES: Final[tuple[Stage, ...]] = (
+    "select",
+    "cb_filter",
+    "client_get",
+    "connect",
+    "ttfb",
+    "body",
+    "retry_wait",
+    "record",
+)
+
+# Log-linear buckets: values below 2**7 ns get one bucket each; every further
+# power of two is split into 64 buckets, up to 2**40 ns (~18 minutes).
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS // 2
+_MAX_BITS = 40
+_BUCKET_COUNT = _SUB_BUCKETS + (_MAX_BITS - _SUB_BUCKET_BITS) * _HALF_SUB_BUCKETS
+
+_ACTIVE_PROFILER: ContextVar[StageProfiler | None] = ContextVar(
+    "proxywhirl_stage_profiler", default=None
+)
+
+
+def _bucket_index(value_ns: int) -> int:
+    """Return the histogram bucket for a duration in nanoseconds."""
+    if value_ns < _SUB_BUCKETS:
+        return max(value_ns, 0)
+    shift = value_ns.bit_length() - _SUB_BUCKET_BITS
+    index = _SUB_BUCKETS + (shift - 1) * _HALF_SUB_BUCKETS + (value_ns >> shift) - _HALF_SUB_BUCKETS
+    return min(index, _BUCKET_COUNT - 1)
+
+
+def _bucket_upper_ns(index: int) -> int:
+    """Return the largest duration in nanoseconds that falls into ``index``."""
+    if index < _SUB_BUCKETS:
+        return index
+    if index == _BUCKET_COUNT - 1:
+        # The last bucket also holds everything beyond the range
+        return sys.maxsize
+    shift, offset = divmod(index - _SUB_BUCKETS, _HALF_SUB_BUCKETS)
+    return ((offset + _HALF_SUB_BUCKETS + 1) << (shift + 1)) - 1
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with a fixed memory footprint.
+
+    Recording takes no lock: two threads recording at the same instant can
+    lose an increment, which is acceptable for sampled latency data and keeps
+    the hot path at a few hundred nanoseconds.
+    """
+
+    __slots__ = ("_counts", "count", "max_ns", "min_ns", "sum_ns")
+
+    def __init__(self) -> None:
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.sum_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record_ns(self, value_ns: int) -> None:
+        """Record one duration in nanoseconds (negative values count as zero)."""
+        if value_ns < _SUB_BUCKETS:
+            value_ns = max(value_ns, 0)
+            index = value_ns
+        else:
+            # Inlined _bucket_index
+            shift = value_ns.bit_length() - _SUB_BUCKET_BITS
+            index = min(
+                _SUB_BUCKETS + (shift - 2) * _HALF_SUB_BUCKETS + (value_ns >> shift),
+                _BUCKET_COUNT - 1,
+            )
+        self._counts[index] += 1
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        if value_ns < self.min_ns or not self.count:
+            self.min_ns = value_ns
+        self.count += 1
+        self.sum_ns += value_ns
+
+    def record(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        self.record_ns(int(seconds * 1e9))
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        self._counts = [0] * _BUCKET_COUNT
+        self.count = self.sum_ns = self.min_ns = self.max_ns = 0
+
+    def _nonzero(self) -> list[tuple[int, int]]:
+        """Return ``(upper bound ns, count)`` for every non-empty bucket, in order."""
+        return [(_bucket_upper_ns(index), n) for index, n in enumerate(self._counts) if n]
+
+    def percentile(self, percent: float) -> float:
+        """Return the ``percent`` percentile in seconds (0.0 when empty).
+
+        The result is the upper bound of the bucket holding that rank, capped at
+        the largest recorded value, so it overstates by at most ~1.6%.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * min(max(percent, 0.0), 100.0) / 100))
+        seen = 0
+        for upper_ns, n in self._nonzero():
+            seen += n
+            if seen >= rank:
+                return min(upper_ns, self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def cumulative_counts(self, bounds: Sequence[float]) -> list[int]:
+        """Return how many values are ``<=`` each bound (seconds, ascending)."""
+        result = [0] * len(bounds)
+        limits = [int(bound * 1e9) for bound in bounds]
+        position = 0
+        seen = 0
+        for upper_ns, n in self._nonzero():
+            while position < len(limits) and upper_ns > limits[position]:
+                result[position] = seen
+                position += 1
+            seen += n
+        for remaining in range(position, len(limits)):
+            result[remaining] = seen
+        return result
+
+    @property
+    def sum_seconds(self) -> float:
+        """Total of all recorded durations in seconds."""
+        return self.sum_ns / 1e9
+
+
+class StageProfiler:
+    """Sampled per-stage latency histograms shared by one or more rotators.
+
+    Args:
+        sample_rate: Fraction of requests to profile, from 0.0 to 1.0.
+    """
+
+    def __init__(self, sample_rate: float = 1.0) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        self.sample_rate = sample_rate
+        self.histograms: dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in STAGES
+        }
+
+    def should_sample(self) -> bool:
+        """Decide whether the current request is profiled."""
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate  # noqa: S311
+
+    def record_ns(self, stage: Stage, value_ns: int) -> None:
+        """Record a stage duration in nanoseconds."""
+        self.histograms[stage].record_ns(value_ns)
+
+    def record(self, stage: Stage, seconds: float) -> None:
+        """Record a stage duration in seconds."""
+        self.histograms[stage].record(seconds)
+
+    @contextmanager
+    def stage(self, stage: Stage) -> Generator[None, None, None]:
+        """Time the enclosed block as ``stage``."""
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record_ns(stage, time.perf_counter_ns() - started)
+
+    def activate(self) -> Token[StageProfiler | None]:
+        """Make this profiler the active one for the current thread or task."""
+        return _ACTIVE_PROFILER.set(self)
+
+    @staticmethod
+    def deactivate(token: Token[StageProfiler | None]) -> None:
+        """Restore the profiler that was active before :meth:`activate`."""
+        _ACTIVE_PROFILER.reset(token)
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Return count, mean, min, max and p50/p90/p99/p99.9 (seconds) per stage."""
+        result: dict[str, dict[str, float]] = {}
+        for stage, histogram in self.histograms.items():
+            count = histogram.count
+            result[stage] = {
+                "count": count,
+                "mean": histogram.sum_seconds / count if count else 0.0,
+                "min": histogram.min_ns / 1e9,
+                "max": histogram.max_ns / 1e9,
+                "p50": histogram.percentile(50),
+                "p90": histogram.percentile(90),
+                "p99": histogram.percentile(99),
+                "p999": histogram.percentile(99.9),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+
+def current_profiler() -> StageProfiler | None:
+    """Return the profiler of the request being handled, if it is sampled."""
+    return _ACTIVE_PROFILER.get()
+
+
+class HTTPStageTrace:
+    """httpcore ``trace`` extension that records ``connect``, ``ttfb`` and ``body``.
+
+    One instance is used per request attempt. Pass it (sync clients) or
+    :meth:`async_trace` (async clients) as ``extensions={"trace": ...}``, then
+    call :meth:`flush` once the request has finished.
+    """
+
+    __slots__ = ("_body_ns", "_chained", "_connect_ns", "_profiler", "_started", "_ttfb_ns")
+
+    def __init__(self, profiler: StageProfiler, chained: Any = None) -> None:
+        self._profiler = profiler
+        self._chained = chained
+        self._started: dict[str, int] = {}
+        self._connect_ns = 0
+        self._ttfb_ns: int | None = None
+        self._body_ns: int | None = None
+
+    def _observe(self, event_name: str) -> None:
+        now = time.perf_counter_ns()
+        # Events look like "connection.connect_tcp.started" or
+        # "http2.receive_response_headers.complete"
+        step, _, phase = event_name.partition(".")[2].rpartition(".")
+        if phase == "started":
+            self._started[step] = now
+            return
+        if step == "receive_response_headers":
+            # Measured from the latest request headers, so a proxy CONNECT
+            # round trip does not count towards the tunnelled request
+            sent = self._started.get("send_request_headers")
+            if phase == "complete" and sent is not None:
+                self._ttfb_ns = now - sent
+            return
+        started = self._started.get(step)
+        if started is None:
+            return
+        if step in ("connect_tcp", "connect_unix_socket", "start_tls"):
+            self._connect_ns += now - started
+        elif step == "receive_response_body" and phase == "complete":
+            self._body_ns = now - started
+
+    def __call__(self, event_name: str, info: dict[str, Any]) -> None:
+        self._observe(event_name)
+        if self._chained is not None:
+            self._chained(event_name, info)
+
+    async def async_trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """Async form of the trace callback for ``httpx.AsyncClient``."""
+        self._observe(event_name)
+        if self._chained is not None:
+            await self._chained(event_name, info)
+
+    def flush(self) -> None:
+        """Record the stages observed so far."""
+        if self._connect_ns:
+            self._profiler.record_ns("connect", self._connect_ns)
+        if self._ttfb_ns is not None:
+            self._profiler.record_ns("ttfb", self._ttfb_ns)
+        if self._body_ns is not None:
+            self._profiler.record_ns("body", self._body_ns)
+
+
+def with_stage_trace(
+    profiler: StageProfiler, kwargs: dict[str, Any], *, is_async: bool
+) -> tuple[HTTPStageTrace, dict[str, Any]]:
+    """Return a trace and a copy of request ``kwargs`` with the trace installed.
+
+    A ``trace`` extension already in ``kwargs`` keeps receiving every event.
+    """
+    extensions = dict(kwargs.get("extensions") or {})
+    trace = HTTPStageTrace(profiler, chained=extensions.get("trace"))
+    extensions["trace"] = trace.async_trace if is_async else trace
+    return trace, {**kwargs, "extensions": extensions}
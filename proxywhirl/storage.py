@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 import json
 import time
+from collections.abc import AsyncIterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -15,9 +16,11 @@ from urllib.parse import urlparse
 import aiofiles
 from cryptography.fernet import Fernet
 from loguru import logger
-from pydantic import SecretStr
-from sqlalchemy import delete, event, text
+from pydantic import HttpUrl, SecretStr
+from sqlalchemy import String, delete, event, func, or_, text, type_coerce
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.operators import custom_op
 from sqlmodel import Field, SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -31,6 +34,69 @@ _ENCRYPTED_PREFIX = "encrypted:"
 # Consecutive failures before a proxy is marked dead (record_validation + batch)
 _CONSECUTIVE_FAILURES_DEAD_THRESHOLD = 3
 
+# URLs per IN (...) lookup during incremental ingestion (below SQLite's bound-parameter limit)
+_INGEST_LOOKUP_CHUNK = 500
+
+# Proxies per page when streaming revalidation candidates
+_REVALIDATION_CHUNK = 1000
+
+# Rows fetched per round trip when streaming dashboard exports
+_EXPORT_CHUNK = 5000
+
+# Rows per page (or per fetch, for unindexed orders) in iter_proxies
+_ITER_BATCH = 1000
+
+# Orders accepted by SQLiteStorage.iter_proxies
+_PROXY_ITER_ORDERS = ("url", "last_check", "response_time")
+
+# Bucket widths of the validation_results rollups
+_ROLLUP_PERIODS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+# Aggregate one bucket of validation_results per proxy. Rows are ranked by
+# response time (unknown last) so the nearest-rank percentile is the smallest
+# value whose rank reaches p * (number of known response times).
+_ROLLUP_BUCKET_SQL = """
+INSERT OR REPLACE INTO validation_rollups (
+    proxy_url, period, bucket_start, checks, successes, response_time_count,
+    avg_response_time_ms, min_response_time_ms, max_response_time_ms,
+    p50_response_time_ms, p90_response_time_ms, p99_response_time_ms
+)
+SELECT
+    proxy_url, :period, :bucket_start, COUNT(*), SUM(is_valid), COUNT(response_time_ms),
+    AVG(response_time_ms), MIN(response_time_ms), MAX(response_time_ms),
+    MIN(CASE WHEN latency_rank >= 0.5 * known THEN response_time_ms END),
+    MIN(CASE WHEN latency_rank >= 0.9 * known THEN response_time_ms END),
+    MIN(CASE WHEN latency_rank >= 0.99 * known THEN response_time_ms END)
+FROM (
+    SELECT
+        proxy_url, is_valid, response_time_ms,
+        ROW_NUMBER() OVER (
+            PARTITION BY proxy_url ORDER BY response_time_ms IS NULL, response_time_ms
+        ) AS latency_rank,
+        COUNT(response_time_ms) OVER (PARTITION BY proxy_url) AS known
+    FROM validation_results
+    WHERE validated_at >= :bucket_start AND validated_at < :bucket_end
+)
+GROUP BY proxy_url
+"""
+
+# Columns of the per-proxy rows produced by the dashboard export queries
+_EXPORT_COLUMNS = (
+    "url",
+    "protocol",
+    "host",
+    "port",
+    "source",
+    "country_code",
+    "discovered_at",
+    "health_status",
+    "last_success_at",
+    "last_failure_at",
+    "avg_response_time_ms",
+    "total_checks",
+    "total_successes",
+)
+
 
 def _decrypt_stored_credential(
     value: str | None,
@@ -73,17 +139,24 @@ def _decrypt_stored_credential(
         return None
 
 
-def dict_to_proxy(row: dict[str, Any]) -> Proxy:
+def dict_to_proxy(row: dict[str, Any], *, trusted: bool = False) -> Proxy:
     """Convert a storage row dictionary to a :class:`~proxywhirl.models.Proxy`.
 
     Handles rows with either a full ``url`` or ``host``/``port``/``protocol``,
     decrypts stored credentials, and maps health/status metadata from SQLite.
 
+    Rows are fully validated by default, including the local-address policy.
+    Rows read straight from :class:`SQLiteStorage` hold proxies that were
+    validated when they were saved; pass ``trusted=True`` for those to build
+    them with :meth:`Proxy.from_trusted` instead of running every validator again.
+
     Args:
         row: Proxy dictionary from :meth:`SQLiteStorage.load` or similar queries.
+        trusted: Skip model validation; only for correctly typed rows loaded from
+            SQLiteStorage (timestamps as datetimes)
 
     Returns:
-        Validated Proxy instance ready for the rotator pool.
+        Proxy instance ready for the rotator pool.
 
     Raises:
         ValueError: If the row lacks sufficient identity fields.
@@ -133,7 +206,9 @@ def dict_to_proxy(row: dict[str, Any]) -> Proxy:
     if row.get("country_code") is not None:
         proxy_kwargs["country_code"] = row["country_code"]
     if row.get("source_url") is not None:
-        proxy_kwargs["source_url"] = row["source_url"]
+        proxy_kwargs["source_url"] = (
+            HttpUrl(str(row["source_url"])) if trusted else row["source_url"]
+        )
     if row.get("discovered_at") is not None:
         proxy_kwargs["created_at"] = row["discovered_at"]
     if row.get("last_success_at") is not None:
@@ -151,9 +226,88 @@ def dict_to_proxy(row: dict[str, Any]) -> Proxy:
     if row.get("total_successes") is not None:
         proxy_kwargs["total_successes"] = row["total_successes"]
 
+    if trusted:
+        return Proxy.from_trusted(proxy_kwargs)
     return Proxy(**proxy_kwargs)
 
 
+def _sqlite_timestamp(value: datetime) -> str:
+    """Format a datetime the way SQLAlchemy stores it in SQLite (naive UTC text)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _rollup_bucket(value: datetime, period: str) -> datetime:
+    """Return the start (aware UTC) of the rollup bucket of ``period`` containing ``value``."""
+    value = value.astimezone(timezone.utc)
+    if period == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _parse_sqlite_timestamp(value: str | None) -> datetime | None:
+    """Parse a timestamp column read through raw SQL into an aware UTC datetime."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _export_scope(max_age_hours: int) -> tuple[str, dict[str, Any]]:
+    """Build the ``scoped`` CTE shared by the dashboard export queries.
+
+    Selects the same rows as ``load`` (``max_age_hours <= 0``) or
+    ``load_validated`` and drops identities without a usable host and port.
+    """
+    conditions = ["i.host != ''", "i.port > 0"]
+    params: dict[str, Any] = {}
+    if max_age_hours > 0:
+        conditions += ["s.health_status = 'healthy'", "s.last_success_at >= :cutoff"]
+        params["cutoff"] = _sqlite_timestamp(
+            datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        )
+    cte = f"""
+        scoped AS (
+            SELECT i.url, COALESCE(NULLIF(i.protocol, ''), 'http') AS protocol, i.host, i.port,
+                i.source, i.country_code, i.discovered_at, s.health_status, s.last_success_at,
+                s.last_failure_at, s.avg_response_time_ms, s.total_checks, s.total_successes
+            FROM proxy_identities i
+            JOIN proxy_statuses s ON s.proxy_url = i.url
+            WHERE {" AND ".join(conditions)}
+        )"""
+    return cte, params
+
+
+def _protocol_rank(protocols: Sequence[str], params: dict[str, Any]) -> str:
+    """Return a SQL expression ranking ``protocol`` by its position in ``protocols``."""
+    cases = []
+    for index, protocol in enumerate(protocols):
+        params[f"protocol_{index}"] = protocol
+        cases.append(f"WHEN :protocol_{index} THEN {index}")
+    if not cases:
+        return "0"
+    return f"CASE protocol {' '.join(cases)} ELSE {len(protocols)} END"
+
+
+def _proxy_list_entries(protocols: Sequence[str], params: dict[str, Any]) -> str:
+    """Build the ``entries`` CTE: one row per (protocol, host, port) with its best time."""
+    placeholders = []
+    for index, protocol in enumerate(protocols):
+        params[f"list_protocol_{index}"] = protocol
+        placeholders.append(f":list_protocol_{index}")
+    return f"""
+        entries AS (
+            SELECT LOWER(protocol) AS protocol, host, port,
+                MIN(avg_response_time_ms) AS best_ms
+            FROM scoped
+            WHERE LOWER(protocol) IN ({", ".join(placeholders) or "NULL"})
+            GROUP BY LOWER(protocol), host, port
+        )"""
+
+
 class ProxyIdentityTable(SQLModel, table=True):
     """Immutable proxy identity table (normalized schema).
 
@@ -204,7 +358,9 @@ class ValidationResultTable(SQLModel, table=True):
     """Individual validation result table (append-only).
 
     Stores each validation attempt as an immutable record.
-    This enables historical analysis and trend tracking.
+    This enables historical analysis and trend tracking. Raw rows are kept
+    for a bounded horizon; older history lives in ``validation_rollups``
+    (see ``SQLiteStorage.apply_validation_retention``).
 
     Indexes:
         - proxy_url + validated_at: Fast lookup of recent validations
@@ -226,6 +382,36 @@ class ValidationResultTable(SQLModel, table=True):
     error_message: str | None = None
 
 
+class ValidationRollupTable(SQLModel, table=True):
+    """Per-proxy hourly/daily aggregates of ``validation_results``.
+
+    Written by ``SQLiteStorage.rollup_validations`` for complete buckets only,
+    so raw rows can be deleted once rolled up. Rollups are not tied to
+    ``proxy_identities`` and outlive removed proxies until they age out.
+
+    Primary Key:
+        proxy_url + period ("hour" or "day") + bucket_start (UTC)
+
+    Latency columns cover results with a response time; percentiles are
+    nearest-rank.
+    """
+
+    __tablename__: str = "validation_rollups"  # type: ignore[misc]
+
+    proxy_url: str = Field(primary_key=True)
+    period: str = Field(primary_key=True)
+    bucket_start: datetime = Field(primary_key=True)
+    checks: int = 0
+    successes: int = 0
+    response_time_count: int = 0
+    avg_response_time_ms: float | None = None
+    min_response_time_ms: float | None = None
+    max_response_time_ms: float | None = None
+    p50_response_time_ms: float | None = None
+    p90_response_time_ms: float | None = None
+    p99_response_time_ms: float | None = None
+
+
 class ProxyStatusTable(SQLModel, table=True):
     """Current computed status table (normalized schema).
 
@@ -239,6 +425,8 @@ class ProxyStatusTable(SQLModel, table=True):
         - health_status: Filter by current health
         - last_success_at: Find recently working proxies
         - success_rate_7d: Performance-based sorting
+        - Composite/covering indexes for healthy-proxy selection, revalidation
+          order and cleanup (see ``_HOT_QUERY_INDEXES``)
     """
 
     __tablename__: str = "proxy_statuses"  # type: ignore[misc]
@@ -280,6 +468,127 @@ class ProxyAuditTable(SQLModel, table=True):
     )
 
 
+# Columns of the canonical proxy row dicts returned by SQLiteStorage read paths
+_PROXY_ROW_COLUMNS = (
+    ProxyIdentityTable.url,
+    ProxyIdentityTable.protocol,
+    ProxyIdentityTable.host,
+    ProxyIdentityTable.port,
+    ProxyIdentityTable.username,
+    ProxyIdentityTable.password,
+    ProxyIdentityTable.country_code,
+    ProxyIdentityTable.source,
+    ProxyIdentityTable.source_url,
+    ProxyIdentityTable.discovered_at,
+    ProxyIdentityTable.expires_at,
+    ProxyStatusTable.health_status,
+    ProxyStatusTable.last_check_at,
+    ProxyStatusTable.last_success_at,
+    ProxyStatusTable.last_failure_at,
+    ProxyStatusTable.avg_response_time_ms,
+    ProxyStatusTable.total_checks,
+    ProxyStatusTable.total_successes,
+)
+
+# Equality (or IN, for collections) filters accepted by SQLiteStorage.iter_proxies
+_PROXY_FILTER_COLUMNS = {
+    "source": ProxyIdentityTable.source,
+    "protocol": ProxyIdentityTable.protocol,
+    "country_code": ProxyIdentityTable.country_code,
+    "health_status": ProxyStatusTable.health_status,
+}
+
+# Composite/covering indexes for the hot proxy_statuses access paths, created by
+# SQLiteStorage.initialize and by alembic revision d5e8a2f47b1c (keep in sync).
+# The health_status-leading index replaces idx_proxy_status_health.
+_HOT_QUERY_INDEXES = {
+    # get_healthy_proxies*: health_status = ?, ordered by latency with unknown last,
+    # last_success_at checked and proxy_url joined straight from the index
+    "idx_proxy_status_health_latency": (
+        "proxy_statuses(health_status, avg_response_time_ms IS NULL, "
+        "avg_response_time_ms, last_success_at, proxy_url)"
+    ),
+    # load_revalidation_candidates order; covers the cleanup staleness scan
+    "idx_proxy_status_check_order": "proxy_statuses(last_check_at, updated_at, proxy_url)",
+    # cleanup of never-validated proxies (total_checks = 0)
+    "idx_proxy_status_checks": "proxy_statuses(total_checks, proxy_url)",
+}
+
+
+def _unindexed(column: Any) -> Any:
+    """Wrap ``column`` in SQLite's no-op unary ``+`` so the planner ignores its index.
+
+    An equality filter on an indexed identity column (e.g. ``country_code``)
+    otherwise tempts SQLite into reading every match and sorting them, instead
+    of walking ``idx_proxy_status_health_latency`` in order and stopping at the
+    limit.
+    """
+    return UnaryExpression(column, operator=custom_op("+"), type_=column.type)
+
+
+@dataclass
+class IngestionDiff:
+    """Incoming proxy URLs partitioned against what is already stored.
+
+    Attributes:
+        new: URLs not in the database
+        stale: Stored URLs never checked or last checked before the freshness cutoff
+        fresh: Stored URLs checked within the freshness window
+    """
+
+    new: list[str]
+    stale: list[str]
+    fresh: list[str]
+
+
+@dataclass(frozen=True)
+class RevalidationCursor:
+    """Keyset position in the oldest-first revalidation order.
+
+    Attributes:
+        last_check_at: Stored ``last_check_at`` of the last yielded proxy, kept as
+            the raw text SQLite compares (rows written by the ORM and by raw SQL
+            use different timestamp formats), or None while never-checked proxies
+            are still being walked
+        url: URL of the last yielded proxy
+    """
+
+    last_check_at: str | None
+    url: str
+
+
+@dataclass(frozen=True)
+class ValidationRetention:
+    """Retention policy for validation history.
+
+    Attributes:
+        raw: How long raw ``validation_results`` rows are kept. Rows are only
+            deleted once rolled up, and ``get_stats`` reads the last 24 hours of
+            raw rows, so shorter horizons make its validation counts partial.
+        hourly: How long hourly rollups are kept. Hourly rollups hold one row
+            per proxy per hour, so with hourly revalidation they are as many
+            rows as the raw results they replace; keep this horizon short.
+        daily: How long daily rollups are kept
+        batch_size: Rows deleted per transaction, bounding how long each delete
+            holds the write lock
+        incremental_vacuum: Reclaim space with ``PRAGMA incremental_vacuum``
+            (proportional to the pages freed) instead of a full ``VACUUM``
+            (proportional to the database size)
+    """
+
+    raw: timedelta = timedelta(days=1)
+    hourly: timedelta = timedelta(days=7)
+    daily: timedelta = timedelta(days=90)
+    batch_size: int = 10_000
+    incremental_vacuum: bool = True
+
+    def __post_init__(self) -> None:
+        if min(self.raw, self.hourly, self.daily) <= timedelta(0):
+            raise ValueError("Retention horizons must be positive")
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+
 class FileStorage:
     """File-based storage backend using JSON with optional encryption.
 
@@ -630,10 +939,15 @@ class SQLiteStorage:
             logger.warning(f"Slow query ({elapsed_ms:.1f}ms): {str(statement)[:200]}")
         return result
 
-    async def _timed_conn_execute(self, conn: Any, statement: Any) -> Any:
-        """Execute a connection statement with slow query logging."""
+    async def _timed_conn_execute(
+        self, conn: Any, statement: Any, parameters: Any | None = None
+    ) -> Any:
+        """Execute a connection statement with slow query logging.
+
+        A list of parameter dicts in ``parameters`` runs the statement as an executemany.
+        """
         start = time.monotonic()
-        result = await conn.execute(statement)
+        result = await conn.execute(statement, parameters)
         elapsed_ms = (time.monotonic() - start) * 1000
         if elapsed_ms > self._slow_query_threshold_ms:
             logger.warning(f"Slow query ({elapsed_ms:.1f}ms): {str(statement)[:200]}")
@@ -679,37 +993,62 @@ class SQLiteStorage:
         """
         return _decrypt_stored_credential(value, self._encryptor)
 
-    def _identity_status_row_dict(
-        self,
-        identity: ProxyIdentityTable,
-        status: ProxyStatusTable,
-        *,
-        include_updated_at: bool = False,
-    ) -> dict[str, Any]:
-        """Build a canonical proxy row dict from normalized identity/status tables."""
-        row: dict[str, Any] = {
-            "url": identity.url,
-            "protocol": identity.protocol,
-            "host": identity.host,
-            "port": identity.port,
-            "username": self._decrypt_credential(identity.username),
-            "password": self._decrypt_credential(identity.password),
-            "country_code": identity.country_code,
-            "source": identity.source,
-            "source_url": identity.source_url,
-            "discovered_at": identity.discovered_at,
-            "expires_at": identity.expires_at,
-            "health_status": status.health_status,
-            "last_check_at": status.last_check_at,
-            "last_success_at": status.last_success_at,
-            "last_failure_at": status.last_failure_at,
-            "avg_response_time_ms": status.avg_response_time_ms,
-            "total_checks": status.total_checks,
-            "total_successes": status.total_successes,
-        }
+    @staticmethod
+    def _proxy_row_select(*extra: Any, include_updated_at: bool = False) -> Any:
+        """Select the canonical proxy row columns from the identity/status join.
+
+        Selects plain columns rather than ORM entities, so rows are lightweight
+        tuples instead of two hydrated SQLModel objects each.
+
+        Args:
+            *extra: Additional labeled columns to select
+            include_updated_at: Also select ``proxy_statuses.updated_at``
+        """
+        columns = [*_PROXY_ROW_COLUMNS]
         if include_updated_at:
-            row["updated_at"] = status.updated_at
-        return row
+            columns.append(ProxyStatusTable.updated_at)
+        return select(*columns, *extra).join_from(
+            ProxyIdentityTable,
+            ProxyStatusTable,
+            ProxyIdentityTable.url == ProxyStatusTable.proxy_url,  # type: ignore[arg-type]
+        )
+
+    def _proxy_row_dict(self, row: Any) -> dict[str, Any]:
+        """Build a canonical proxy row dict from a ``_proxy_row_select`` row."""
+        data = dict(row._mapping)
+        data["username"] = self._decrypt_credential(data["username"])
+        data["password"] = self._decrypt_credential(data["password"])
+        return data
+
+    async def _fetch_proxy_rows(self, statement: Any) -> list[dict[str, Any]]:
+        """Run a ``_proxy_row_select`` statement and return its rows as dicts."""
+        async with self.engine.connect() as conn:
+            result = await self._timed_conn_execute(conn, statement)
+            return [self._proxy_row_dict(row) for row in result]
+
+    @staticmethod
+    def _proxy_filter_conditions(filters: Mapping[str, Any] | None) -> list[Any]:
+        """Translate ``iter_proxies`` filters into SQL conditions.
+
+        Raises:
+            ValueError: If a filter name is not supported
+        """
+        conditions: list[Any] = []
+        for name, value in (filters or {}).items():
+            if name in _PROXY_FILTER_COLUMNS:
+                column = cast(Any, _PROXY_FILTER_COLUMNS[name])
+                if isinstance(value, (list, tuple, set, frozenset)):
+                    conditions.append(column.in_(value))
+                else:
+                    conditions.append(column == value)
+            elif name == "succeeded_since":
+                conditions.append(cast(Any, ProxyStatusTable.last_success_at) >= value)
+            elif name == "checked_before":
+                last_check = cast(Any, ProxyStatusTable.last_check_at)
+                conditions.append(or_(last_check.is_(None), last_check < value))
+            else:
+                raise ValueError(f"Unsupported proxy filter: {name!r}")
+        return conditions
 
     async def initialize(self) -> None:
         """Create normalized database tables if they don't exist.
@@ -720,6 +1059,7 @@ class SQLiteStorage:
 
         Optimizations:
             - Enable WAL mode for concurrent read/write access
+            - Incremental auto-vacuum on new databases (see ``vacuum``)
             - Enable FOREIGN_KEYS for referential integrity
             - Optimize PRAGMA settings (synchronous, cache_size, temp_store)
             - Create composite and single-column indexes for hot queries
@@ -730,6 +1070,11 @@ class SQLiteStorage:
         from sqlmodel import SQLModel
 
         async with self.engine.begin() as conn:
+            # Let retention reclaim space with PRAGMA incremental_vacuum. Only takes
+            # effect on a new database, so it must precede the first write (WAL
+            # mode included); existing files are converted by vacuum(incremental=True).
+            await self._timed_conn_execute(conn, text("PRAGMA auto_vacuum = INCREMENTAL"))
+
             # Enable WAL mode for concurrent reads/writes
             await self._timed_conn_execute(conn, text("PRAGMA journal_mode = WAL"))
 
@@ -764,13 +1109,10 @@ class SQLiteStorage:
             # Index on cache expiration for TTL cleanup
             # This is for future cache TTL table if implemented
 
-            # Index on health_status for filtering healthy/unhealthy proxies
+            # Superseded by idx_proxy_status_health_latency and dropped, because SQLite
+            # would keep choosing it for healthy-proxy queries and then sort every match
             await self._timed_conn_execute(
-                conn,
-                text(
-                    "CREATE INDEX IF NOT EXISTS idx_proxy_status_health "
-                    "ON proxy_statuses(health_status, last_success_at DESC)"
-                ),
+                conn, text("DROP INDEX IF EXISTS idx_proxy_status_health")
             )
 
             # Index on URL for duplicate detection
@@ -809,6 +1151,22 @@ class SQLiteStorage:
                 ),
             )
 
+            # Rollup retention deletes and watermark lookups by period and age
+            await self._timed_conn_execute(
+                conn,
+                text(
+                    "CREATE INDEX IF NOT EXISTS idx_validation_rollups_bucket "
+                    "ON validation_rollups(period, bucket_start)"
+                ),
+            )
+
+            # Composite/covering indexes shaped for the healthy-proxy (also status
+            # filters), revalidation and cleanup queries
+            for name, target in _HOT_QUERY_INDEXES.items():
+                await self._timed_conn_execute(
+                    conn, text(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+                )
+
             logger.info("Database initialized with WAL mode and optimized indexes")
 
     async def _migrate_normalized_schema(self, conn: Any) -> None:
@@ -1038,8 +1396,9 @@ class SQLiteStorage:
     async def clear(self) -> None:
         """Clear all proxies from database."""
         async with AsyncSession(self.engine) as session:
-            # Delete all validation results
+            # Delete all validation results and their rollups
             await session.exec(delete(ValidationResultTable))  # type: ignore[arg-type]
+            await session.exec(delete(ValidationRollupTable))  # type: ignore[arg-type]
             # Delete all statuses
             await session.exec(delete(ProxyStatusTable))  # type: ignore[arg-type]
             # Delete all identities
@@ -1056,23 +1415,14 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries matching criteria
         """
-        stmt = select(ProxyIdentityTable, ProxyStatusTable).join(
-            ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url
-        )
+        stmt = self._proxy_row_select()
 
         if "source" in filters:
             stmt = stmt.where(ProxyIdentityTable.source == filters["source"])
         if "health_status" in filters:
             stmt = stmt.where(ProxyStatusTable.health_status == filters["health_status"])
 
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
-
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+        return await self._fetch_proxy_rows(stmt)
 
     async def record_validation(
         self,
@@ -1234,33 +1584,48 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries with identity and status fields
         """
+        stmt = self._healthy_proxies_select(
+            max_age_hours,
+            [protocol] if protocol else None,
+            [country_code] if country_code else None,
+            limit,
+        )
+        return await self._fetch_proxy_rows(stmt)
+
+    @staticmethod
+    def _healthy_proxies_select(
+        max_age_hours: int,
+        protocols: Sequence[str] | None,
+        country_codes: Sequence[str] | None,
+        limit: int | None,
+    ) -> Any:
+        """Build the fastest-first healthy proxy query.
+
+        Ordered by ``avg_response_time_ms IS NULL, avg_response_time_ms`` (the
+        ``NULLS LAST`` order spelled the way ``idx_proxy_status_health_latency``
+        stores it), so SQLite walks that index and stops after ``limit`` rows
+        instead of sorting every healthy proxy.
+        """
         cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
+        avg = cast(Any, ProxyStatusTable.avg_response_time_ms)
 
         stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
+            SQLiteStorage._proxy_row_select()
             .where(ProxyStatusTable.health_status == "healthy")
             .where(cast(Any, ProxyStatusTable.last_success_at) >= cutoff)
         )
 
-        if protocol:
-            stmt = stmt.where(ProxyIdentityTable.protocol == protocol)
-        if country_code:
-            stmt = stmt.where(ProxyIdentityTable.country_code == country_code)
+        if protocols:
+            stmt = stmt.where(_unindexed(ProxyIdentityTable.protocol).in_(protocols))
+        if country_codes:
+            stmt = stmt.where(_unindexed(ProxyIdentityTable.country_code).in_(country_codes))
 
-        stmt = stmt.order_by(ProxyStatusTable.avg_response_time_ms.asc().nullslast())
+        stmt = stmt.order_by(avg.is_(None), avg.asc())
 
         if limit:
             stmt = stmt.limit(limit)
 
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
-
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+        return stmt
 
     async def get_proxies_by_status(
         self,
@@ -1274,20 +1639,8 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries
         """
-        stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
-            .where(ProxyStatusTable.health_status == health_status)
-        )
-
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
-
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+        stmt = self._proxy_row_select().where(ProxyStatusTable.health_status == health_status)
+        return await self._fetch_proxy_rows(stmt)
 
     async def load(self) -> list[dict[str, Any]]:
         """Load all proxies from the database.
@@ -1295,18 +1648,114 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries with identity and status fields
         """
-        stmt = select(ProxyIdentityTable, ProxyStatusTable).join(
-            ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url
-        )
+        return await self._fetch_proxy_rows(self._proxy_row_select())
 
-        async with AsyncSession(self.engine) as session:
-            result = await self._timed_exec(session, stmt)  # type: ignore[arg-type]
-            rows = result.all()
+    async def iter_proxies(
+        self,
+        filters: Mapping[str, Any] | None = None,
+        order: str = "url",
+        batch_size: int = _ITER_BATCH,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream proxy rows with constant memory.
+
+        Rows have the same keys as ``load`` plus ``updated_at``. They are
+        selected as plain columns (no ORM objects) and fetched ``batch_size``
+        at a time:
+
+        - ``"url"`` and ``"last_check"`` use keyset pagination over indexed
+          columns: each page is its own short query that seeks past the last
+          row yielded, so no read transaction stays open while the caller
+          works and rows written between pages do not shift later pages.
+          ``"last_check"`` yields never-checked proxies first (by URL), then
+          by ``(last_check_at, url)``, like ``iter_revalidation_candidates``.
+        - ``"response_time"`` (fastest first, unknown last, then URL) has no
+          index to seek on, so it is read from a single streamed cursor in
+          ``batch_size`` partitions; the read transaction stays open until the
+          iteration finishes.
 
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+        Args:
+            filters: Equality filters on ``source``, ``protocol``, ``country_code``
+                and ``health_status`` (a list/tuple/set value matches any of its
+                items), ``succeeded_since`` (``last_success_at`` at or after a
+                datetime) and ``checked_before`` (never checked or last checked
+                before a datetime)
+            order: One of ``"url"``, ``"last_check"`` or ``"response_time"``
+            batch_size: Rows per page or fetch
+            limit: Maximum rows to yield in total (None for all)
+
+        Yields:
+            Proxy dictionaries with identity and status fields
+
+        Raises:
+            ValueError: If ``order`` or a filter name is not supported
+
+        Example::
+
+            async for row in storage.iter_proxies({"health_status": "healthy"}):
+                pool.add_proxy(dict_to_proxy(row, trusted=True))
+        """
+        if order not in _PROXY_ITER_ORDERS:
+            raise ValueError(f"Unsupported order {order!r}; expected one of {_PROXY_ITER_ORDERS}")
+        conditions = self._proxy_filter_conditions(filters)
+        remaining = limit if limit is not None and limit > 0 else None
+        url = cast(Any, ProxyIdentityTable.url)
+
+        if order == "response_time":
+            avg = cast(Any, ProxyStatusTable.avg_response_time_ms)
+            stmt = (
+                self._proxy_row_select(include_updated_at=True)
+                .where(*conditions)
+                .order_by(avg.is_(None), avg, url)
+            )
+            if remaining is not None:
+                stmt = stmt.limit(remaining)
+            async with self.engine.connect() as conn:
+                result = await conn.stream(stmt)
+                async for partition in result.partitions(batch_size):
+                    for row in partition:
+                        yield self._proxy_row_dict(row)
+            return
+
+        # Keyset phases: (extra conditions, sort key before url or None)
+        last_check = cast(Any, ProxyStatusTable.last_check_at)
+        raw_last_check = type_coerce(last_check, String)
+        phases: list[tuple[tuple[Any, ...], Any]] = [((), None)]
+        if order == "last_check":
+            phases = [((last_check.is_(None),), None), ((last_check.is_not(None),), raw_last_check)]
+
+        for phase_conditions, sort_key in phases:
+            after: tuple[Any, str] | None = None
+            while remaining is None or remaining > 0:
+                page_size = batch_size if remaining is None else min(batch_size, remaining)
+                if sort_key is None:
+                    stmt = self._proxy_row_select(include_updated_at=True).order_by(url)
+                    if after is not None:
+                        stmt = stmt.where(url > after[1])
+                else:
+                    stmt = self._proxy_row_select(
+                        sort_key.label("_sort_key"), include_updated_at=True
+                    ).order_by(sort_key, url)
+                    if after is not None:
+                        # Range-seek form so SQLite walks the sort key's index in order
+                        stmt = stmt.where(
+                            sort_key >= after[0], or_(sort_key > after[0], url > after[1])
+                        )
+                stmt = stmt.where(*conditions, *phase_conditions).limit(page_size)
+
+                async with self.engine.connect() as conn:
+                    result = await self._timed_conn_execute(conn, stmt)
+                    rows = [self._proxy_row_dict(row) for row in result]
+
+                if rows:
+                    after = (rows[-1].pop("_sort_key", None), rows[-1]["url"])
+                    if remaining is not None:
+                        remaining -= len(rows)
+                for row in rows:
+                    row.pop("_sort_key", None)
+                    yield row
+                if len(rows) < page_size:
+                    break
 
     async def load_revalidation_candidates(self, limit: int | None = None) -> list[dict[str, Any]]:
         """Load proxies for oldest-first revalidation.
@@ -1323,30 +1772,189 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries with identity and status fields.
         """
-        stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
-            .order_by(
-                ProxyStatusTable.last_check_at.is_(None).desc(),
-                ProxyStatusTable.last_check_at.asc().nullslast(),
-                ProxyStatusTable.updated_at.asc(),
-                ProxyIdentityTable.url.asc(),
-            )
+        # Matches idx_proxy_status_check_order (SQLite sorts NULLs first in ASC)
+        stmt = self._proxy_row_select(include_updated_at=True).order_by(
+            ProxyStatusTable.last_check_at.asc().nullsfirst(),
+            ProxyStatusTable.updated_at.asc(),
+            ProxyStatusTable.proxy_url.asc(),
         )
 
         if limit is not None and limit > 0:
             stmt = stmt.limit(limit)
 
+        return await self._fetch_proxy_rows(stmt)
+
+    async def count_revalidation_candidates(self, checked_before: datetime) -> int:
+        """Count proxies never checked or last checked before ``checked_before``.
+
+        Args:
+            checked_before: Revalidation run start time
+
+        Returns:
+            Number of proxies a streaming revalidation run still has to visit
+        """
+        last_check = cast(Any, ProxyStatusTable.last_check_at)
+        stmt = (
+            select(func.count())
+            .select_from(ProxyStatusTable)
+            .where(or_(last_check.is_(None), last_check < checked_before))
+        )
         async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
+            result = await session.exec(stmt)  # type: ignore[call-overload]
+            return int(result.one())
+
+    async def iter_revalidation_candidates(
+        self,
+        checked_before: datetime,
+        after: RevalidationCursor | None = None,
+        chunk_size: int = _REVALIDATION_CHUNK,
+        limit: int | None = None,
+    ) -> AsyncIterator[tuple[list[dict[str, Any]], RevalidationCursor]]:
+        """Stream revalidation candidates oldest-first in keyset-paginated chunks.
+
+        Never-checked proxies come first (by URL), then proxies last checked
+        before ``checked_before`` by ``(last_check_at, url)``. Each chunk is read
+        in its own short session, so results recorded between chunks are
+        committed immediately; recording a result moves a proxy past
+        ``checked_before``, so it is not visited twice. Pass the cursor of the
+        last processed chunk as ``after`` (with the same ``checked_before``) to
+        resume an interrupted run.
+
+        Unlike ``load_revalidation_candidates``, ties on ``last_check_at`` are
+        broken by URL only, since keyset pagination needs a unique sort key.
+
+        Args:
+            checked_before: Run start time; proxies checked at or after it are skipped
+            after: Resume after this position
+            chunk_size: Proxies per chunk
+            limit: Maximum proxies to yield in total (None for all)
+
+        Yields:
+            Tuples of (proxy dictionaries, cursor after the chunk)
+        """
+        last_check = cast(Any, ProxyStatusTable.last_check_at)
+        raw_last_check = type_coerce(last_check, String)
+        url = cast(Any, ProxyIdentityTable.url)
+        cursor = after
+        never_checked = cursor is None or cursor.last_check_at is None
+        remaining = limit if limit is not None and limit > 0 else None
+
+        while remaining is None or remaining > 0:
+            page_size = chunk_size if remaining is None else min(chunk_size, remaining)
+            stmt = self._proxy_row_select(
+                raw_last_check.label("raw_last_check_at"), include_updated_at=True
+            )
+            if never_checked:
+                stmt = stmt.where(last_check.is_(None)).order_by(url)
+                if cursor is not None:
+                    stmt = stmt.where(url > cursor.url)
+            else:
+                stmt = stmt.where(last_check < checked_before).order_by(last_check, url)
+                if cursor is not None and cursor.last_check_at is not None:
+                    # Range-seek form so SQLite walks the last_check_at index in order
+                    stmt = stmt.where(
+                        raw_last_check >= cursor.last_check_at,
+                        or_(raw_last_check > cursor.last_check_at, url > cursor.url),
+                    )
+
+            async with self.engine.connect() as conn:
+                result = await self._timed_conn_execute(conn, stmt.limit(page_size))
+                rows = [self._proxy_row_dict(row) for row in result]
+
+            if rows:
+                cursor = RevalidationCursor(rows[-1]["raw_last_check_at"], rows[-1]["url"])
+                for row in rows:
+                    del row["raw_last_check_at"]
+                if remaining is not None:
+                    remaining -= len(rows)
+                yield rows, cursor
+            if len(rows) < page_size:
+                if not never_checked:
+                    return
+                never_checked = False
+
+    async def diff_for_ingestion(
+        self,
+        urls: list[str],
+        fresh_within: timedelta,
+        chunk_size: int = _INGEST_LOOKUP_CHUNK,
+    ) -> IngestionDiff:
+        """Partition incoming proxy URLs into new, stale and fresh ones.
+
+        Looks the URLs up in chunks against ``proxy_identities`` and
+        ``proxy_statuses`` so only brand-new proxies and ones whose last check
+        is older than ``fresh_within`` need validating.
+
+        Args:
+            urls: Incoming proxy URLs (order is preserved in each partition)
+            fresh_within: Proxies checked more recently than this are fresh
+            chunk_size: URLs per lookup query
+
+        Returns:
+            IngestionDiff with the new, stale and fresh URLs
+        """
+        cutoff = datetime.now(timezone.utc) - fresh_within
+        freshness: dict[str, bool] = {}
 
-            proxies = []
-            for identity, status in rows:
-                proxies.append(
-                    self._identity_status_row_dict(identity, status, include_updated_at=True)
+        async with AsyncSession(self.engine) as session:
+            for start in range(0, len(urls), chunk_size):
+                chunk = urls[start : start + chunk_size]
+                stmt = (
+                    select(
+                        ProxyIdentityTable.url,
+                        cast(Any, ProxyStatusTable.last_check_at) >= cutoff,
+                    )
+                    .outerjoin(
+                        ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url
+                    )
+                    .where(cast(Any, ProxyIdentityTable.url).in_(chunk))
                 )
-            return proxies
+                result = await session.exec(stmt)  # type: ignore[call-overload]
+                for url, is_fresh in result.all():
+                    freshness[url] = bool(is_fresh)
+
+        diff = IngestionDiff(new=[], stale=[], fresh=[])
+        for url in urls:
+            is_fresh = freshness.get(url)
+            if is_fresh is None:
+                diff.new.append(url)
+            elif is_fresh:
+                diff.fresh.append(url)
+            else:
+                diff.stale.append(url)
+        return diff
+
+    async def touch_discovered(self, sightings: list[tuple[str, str | None]]) -> int:
+        """Bump ``discovered_at`` (and source attribution) for proxies seen again.
+
+        Args:
+            sightings: ``(proxy_url, source_url)`` pairs; a None source URL keeps
+                the stored attribution
+
+        Returns:
+            Number of sightings applied
+        """
+        if not sightings:
+            return 0
+
+        # Bound as the ORM's naive UTC text so the column sorts and compares consistently
+        now = _sqlite_timestamp(datetime.now(timezone.utc))
+        statement = text(
+            """
+            UPDATE proxy_identities SET
+                discovered_at = :now,
+                source_url = COALESCE(:source_url, source_url)
+            WHERE url = :url
+            """
+        )
+        async with self.engine.begin() as conn:
+            for start in range(0, len(sightings), _INGEST_LOOKUP_CHUNK):
+                params = [
+                    {"now": now, "url": url, "source_url": source_url}
+                    for url, source_url in sightings[start : start + _INGEST_LOOKUP_CHUNK]
+                ]
+                await self._timed_conn_execute(conn, statement, params)
+        return len(sightings)
 
     async def load_validated(self, max_age_hours: int = 48) -> list[dict[str, Any]]:
         """Load proxies validated within the given time window, excluding dead proxies.
@@ -1361,21 +1969,406 @@ class SQLiteStorage:
         cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
         stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
+            self._proxy_row_select()
             .where(ProxyStatusTable.last_success_at.isnot(None))  # type: ignore[union-attr]
             .where(cast(Any, ProxyStatusTable.last_success_at) >= cutoff)
             .where(ProxyStatusTable.health_status == "healthy")
         )
 
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
+        return await self._fetch_proxy_rows(stmt)
 
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+    async def iter_export_proxies(
+        self,
+        max_age_hours: int = 0,
+        protocols: Sequence[str] = (),
+        chunk_size: int = _EXPORT_CHUNK,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream proxies deduplicated by address for the dashboard export.
+
+        Deduplication runs in SQL: for each ``host:port`` only the fastest row
+        (unknown response times last, then by URL) is kept. Rows come ordered
+        by protocol, in the order of ``protocols`` with others last, then
+        fastest first, and are fetched ``chunk_size`` at a time from a single
+        cursor, so memory stays flat regardless of pool size.
+
+        Args:
+            max_age_hours: Only include healthy proxies with a success within this
+                window, like ``load_validated``; 0 includes all proxies like ``load``
+            protocols: Preferred protocol order
+            chunk_size: Rows per fetch
+
+        Yields:
+            Lists of proxy dictionaries with identity and status fields
+            (timestamps as aware UTC datetimes)
+        """
+        scope, params = _export_scope(max_age_hours)
+        rank = _protocol_rank(protocols, params)
+        statement = text(
+            f"""
+            WITH {scope},
+            ranked AS (
+                SELECT scoped.*, ROW_NUMBER() OVER (
+                    PARTITION BY host, port
+                    ORDER BY avg_response_time_ms IS NULL, avg_response_time_ms, url
+                ) AS address_rank
+                FROM scoped
+            )
+            SELECT {", ".join(_EXPORT_COLUMNS)}
+            FROM ranked
+            WHERE address_rank = 1
+            ORDER BY {rank}, protocol, avg_response_time_ms IS NULL, avg_response_time_ms,
+                host, port
+            """
+        )
+        async with self.engine.connect() as conn:
+            result = await conn.stream(statement, params)
+            async for partition in result.partitions(chunk_size):
+                rows = []
+                for values in partition:
+                    row = dict(values._mapping)
+                    for key in ("discovered_at", "last_success_at", "last_failure_at"):
+                        row[key] = _parse_sqlite_timestamp(row[key])
+                    rows.append(row)
+                yield rows
+
+    async def count_proxy_list_entries(
+        self, protocols: Sequence[str], max_age_hours: int = 0
+    ) -> dict[str, int]:
+        """Count distinct addresses per protocol for the plain-text proxy lists.
+
+        Args:
+            protocols: Protocols to count (compared case-insensitively)
+            max_age_hours: Recency window as in ``iter_export_proxies``
+
+        Returns:
+            Mapping of every protocol in ``protocols`` to its address count
+        """
+        scope, params = _export_scope(max_age_hours)
+        entries = _proxy_list_entries(protocols, params)
+        statement = text(
+            f"""
+            WITH {scope}, {entries}
+            SELECT protocol, COUNT(*) FROM entries GROUP BY protocol
+            """
+        )
+        async with self.engine.connect() as conn:
+            result = await self._timed_conn_execute(conn, statement.bindparams(**params))
+            counts = dict(result.all())
+        return {protocol: counts.get(protocol, 0) for protocol in protocols}
+
+    async def iter_proxy_list_entries(
+        self,
+        protocols: Sequence[str],
+        max_age_hours: int = 0,
+        chunk_size: int = _EXPORT_CHUNK,
+    ) -> AsyncIterator[list[tuple[str, str]]]:
+        """Stream ``(protocol, "host:port")`` entries for the plain-text proxy lists.
+
+        Addresses are deduplicated per protocol in SQL, keeping the best response
+        time, and come ordered by ``protocols`` then fastest first (unknown
+        response times last).
+
+        Args:
+            protocols: Protocols to include, in output order (lowercase)
+            max_age_hours: Recency window as in ``iter_export_proxies``
+            chunk_size: Rows per fetch
+
+        Yields:
+            Lists of ``(protocol, address)`` tuples
+        """
+        scope, params = _export_scope(max_age_hours)
+        entries = _proxy_list_entries(protocols, params)
+        rank = _protocol_rank(protocols, params)
+        statement = text(
+            f"""
+            WITH {scope}, {entries}
+            SELECT protocol, host, port
+            FROM entries
+            ORDER BY {rank}, best_ms IS NULL, best_ms, host, port
+            """
+        )
+        async with self.engine.connect() as conn:
+            result = await conn.stream(statement, params)
+            async for partition in result.partitions(chunk_size):
+                yield [(protocol, f"{host}:{port}") for protocol, host, port in partition]
+
+    async def export_watermark(self, max_age_hours: int = 0) -> dict[str, Any]:
+        """Return a change watermark for dashboard exports.
+
+        Any insert, delete, status update or recorded validation moves at least
+        one component, so two equal watermarks mean the exported rows are
+        unchanged. With a recency window, membership also changes as time
+        passes; ``valid_until`` is when the oldest included proxy ages out.
+
+        Args:
+            max_age_hours: Recency window as in ``iter_export_proxies``
+
+        Returns:
+            dict[str, Any]: JSON-serializable ``watermark`` components and
+            ``valid_until`` (ISO timestamp, or None without a window or rows).
+        """
+        statement = text(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM proxy_identities),
+                (SELECT MAX(discovered_at) FROM proxy_identities),
+                (SELECT COUNT(*) FROM proxy_statuses),
+                (SELECT MAX(updated_at) FROM proxy_statuses),
+                (SELECT MAX(id) FROM validation_results)
+            """
+        )
+        async with self.engine.connect() as conn:
+            row = (await self._timed_conn_execute(conn, statement)).one()
+            valid_until = None
+            if max_age_hours > 0:
+                window = timedelta(hours=max_age_hours)
+                oldest = (
+                    await self._timed_conn_execute(
+                        conn,
+                        text(
+                            """
+                            SELECT MIN(last_success_at) FROM proxy_statuses
+                            WHERE health_status = 'healthy' AND last_success_at >= :cutoff
+                            """
+                        ).bindparams(cutoff=_sqlite_timestamp(datetime.now(timezone.utc) - window)),
+                    )
+                ).scalar()
+                oldest_at = _parse_sqlite_timestamp(oldest)
+                if oldest_at is not None:
+                    valid_until = (oldest_at + window).isoformat()
+        identities, discovered, statuses, updated, validation_id = row
+        return {
+            "watermark": {
+                "identities": identities,
+                "max_discovered_at": discovered,
+                "statuses": statuses,
+                "max_updated_at": updated,
+                "max_validation_id": validation_id,
+            },
+            "valid_until": valid_until,
+        }
+
+    async def export_aggregates(
+        self,
+        max_age_hours: int = 0,
+        response_time_bins: Sequence[tuple[float, float]] = (),
+        top_ports: int = 15,
+        discovered_since: datetime | None = None,
+    ) -> dict[str, Any]:
+        """Compute dashboard aggregations over proxies deduplicated by address.
+
+        The deduplicated set (same rows as ``iter_export_proxies``) is
+        materialized once in a temporary table and every grouping, count,
+        average and percentile is computed by SQLite, so only the small
+        aggregate results reach Python.
+
+        Args:
+            max_age_hours: Recency window as in ``iter_export_proxies``
+            response_time_bins: ``(min, max)`` ranges in ms, max exclusive (may be inf)
+            top_ports: Number of most common ports to report individually
+            discovered_since: Only count discoveries after this time in
+                ``discovery_by_date`` (None counts all up to now)
+
+        Returns:
+            dict[str, Any]: ``total``; ``by_protocol``/``by_status``/``by_source``
+            counts; ``top_ports`` ``(port, count)`` pairs and ``other_ports``;
+            ``response_times`` (samples, avg, median, p95, min, max over positive
+            response times, plus per-bin ``bins`` counts); ``success_rates``
+            mapping success rate rounded to 0.1 (None if never checked) to counts;
+            ``sources`` and ``countries`` detail rows ordered by count; and
+            ``discovery_by_date`` counts keyed by ISO date.
+        """
+        scope, params = _export_scope(max_age_hours)
+        table = "temp.export_addresses"
+        async with self.engine.connect() as conn:
+            await self._timed_conn_execute(conn, text(f"DROP TABLE IF EXISTS {table}"))
+            await self._timed_conn_execute(
+                conn,
+                text(
+                    f"""
+                    CREATE TEMP TABLE export_addresses AS
+                    WITH {scope},
+                    ranked AS (
+                        SELECT scoped.*, ROW_NUMBER() OVER (
+                            PARTITION BY host, port
+                            ORDER BY avg_response_time_ms IS NULL, avg_response_time_ms, url
+                        ) AS address_rank
+                        FROM scoped
+                    )
+                    SELECT {", ".join(_EXPORT_COLUMNS)} FROM ranked WHERE address_rank = 1
+                    """
+                ).bindparams(**params),
+            )
+            try:
+                return await self._export_aggregates(
+                    conn, table, response_time_bins, top_ports, discovered_since
+                )
+            finally:
+                await self._timed_conn_execute(conn, text(f"DROP TABLE IF EXISTS {table}"))
+                await conn.commit()
+
+    async def _export_aggregates(
+        self,
+        conn: Any,
+        table: str,
+        response_time_bins: Sequence[tuple[float, float]],
+        top_ports: int,
+        discovered_since: datetime | None,
+    ) -> dict[str, Any]:
+        """Run the aggregate queries of ``export_aggregates`` against ``table``."""
+
+        async def fetch(sql: str, **params: Any) -> list[Any]:
+            result = await self._timed_conn_execute(conn, text(sql).bindparams(**params))
+            return list(result.all())
+
+        by_protocol: dict[str, int] = {}
+        by_status: dict[str, int] = {}
+        by_source: dict[str, int] = {}
+        for protocol, status, source, count in await fetch(
+            f"""
+            SELECT protocol, health_status, source, COUNT(*) AS n
+            FROM {table}
+            GROUP BY protocol, health_status, source
+            ORDER BY n DESC
+            """
+        ):
+            by_protocol[protocol] = by_protocol.get(protocol, 0) + count
+            by_status[status] = by_status.get(status, 0) + count
+            by_source[source] = by_source.get(source, 0) + count
+        total = sum(by_protocol.values())
+
+        ports = [
+            (port, count)
+            for port, count in await fetch(
+                f"""
+                SELECT port, COUNT(*) AS n FROM {table}
+                GROUP BY port ORDER BY n DESC, port LIMIT :top_ports
+                """,
+                top_ports=top_ports,
+            )
+        ]
+
+        bin_params: dict[str, Any] = {}
+        bin_columns = []
+        for index, (low, high) in enumerate(response_time_bins):
+            bin_params[f"bin_low_{index}"] = low
+            condition = f"v >= :bin_low_{index}"
+            if high != float("inf"):
+                bin_params[f"bin_high_{index}"] = high
+                condition += f" AND v < :bin_high_{index}"
+            bin_columns.append(f", SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)")
+        stats = (
+            await fetch(
+                f"""
+                WITH ranked AS (
+                    SELECT avg_response_time_ms AS v,
+                        ROW_NUMBER() OVER (ORDER BY avg_response_time_ms) AS rn,
+                        COUNT(*) OVER () AS n
+                    FROM {table}
+                    WHERE avg_response_time_ms > 0
+                )
+                SELECT COUNT(*), AVG(v),
+                    AVG(CASE WHEN rn IN ((n + 1) / 2, (n + 2) / 2) THEN v END),
+                    MAX(CASE WHEN rn = MIN(CAST(n * 0.95 AS INTEGER) + 1, n) THEN v END),
+                    MIN(v), MAX(v) {"".join(bin_columns)}
+                FROM ranked
+                """,
+                **bin_params,
+            )
+        )[0]
+        samples, avg, median, p95, minimum, maximum = stats[:6]
+        response_times = {
+            "samples": samples,
+            "avg": avg,
+            "median": median,
+            "p95": p95,
+            "min": minimum,
+            "max": maximum,
+            "bins": [count or 0 for count in stats[6:]],
+        }
+
+        success_rates = dict(
+            await fetch(
+                f"""
+                SELECT CASE WHEN total_checks > 0
+                    THEN ROUND(total_successes * 100.0 / total_checks, 1) END AS rate,
+                    COUNT(*)
+                FROM {table}
+                GROUP BY rate
+                """
+            )
+        )
+
+        sources = [
+            {
+                "name": name,
+                "count": count,
+                "total_checks": checks or 0,
+                "successful_checks": successes or 0,
+                "avg_response_ms": avg_response,
+                "country_count": country_count,
+                "latest_check": _parse_sqlite_timestamp(latest_check),
+            }
+            for name, count, checks, successes, avg_response, country_count, latest_check in (
+                await fetch(
+                    f"""
+                    SELECT COALESCE(NULLIF(source, ''), 'unknown') AS name, COUNT(*) AS n,
+                        SUM(total_checks),
+                        SUM(CASE WHEN total_checks > 0 THEN total_successes ELSE 0 END),
+                        AVG(CASE WHEN avg_response_time_ms > 0 THEN avg_response_time_ms END),
+                        COUNT(DISTINCT NULLIF(country_code, '')),
+                        MAX(COALESCE(last_success_at, last_failure_at))
+                    FROM {table}
+                    GROUP BY name
+                    ORDER BY n DESC, name
+                    """
+                )
+            )
+        ]
+
+        countries = [
+            {"code": code, "count": count, "avg_response_ms": avg_response}
+            for code, count, avg_response in await fetch(
+                f"""
+                SELECT country_code, COUNT(*) AS n,
+                    AVG(CASE WHEN avg_response_time_ms > 0 THEN avg_response_time_ms END)
+                FROM {table}
+                WHERE country_code IS NOT NULL AND country_code != ''
+                GROUP BY country_code
+                ORDER BY n DESC, country_code
+                """
+            )
+        ]
+
+        now = datetime.now(timezone.utc)
+        since = discovered_since or datetime.min.replace(tzinfo=timezone.utc)
+        discovery_by_date = dict(
+            await fetch(
+                f"""
+                SELECT date(discovered_at) AS day, COUNT(*)
+                FROM {table}
+                WHERE discovered_at > :since AND discovered_at <= :now
+                GROUP BY day
+                ORDER BY day
+                """,
+                since=_sqlite_timestamp(since),
+                now=_sqlite_timestamp(now),
+            )
+        )
+
+        return {
+            "total": total,
+            "by_protocol": by_protocol,
+            "by_status": by_status,
+            "by_source": by_source,
+            "top_ports": ports,
+            "other_ports": total - sum(count for _, count in ports),
+            "response_times": response_times,
+            "success_rates": success_rates,
+            "sources": sources,
+            "countries": countries,
+            "discovery_by_date": discovery_by_date,
+        }
 
     async def cleanup(
         self,
@@ -1383,18 +2376,27 @@ class SQLiteStorage:
         remove_stale_days: int = 7,
         remove_never_validated: bool = True,
         vacuum: bool = True,
+        retention: ValidationRetention | None = None,
     ) -> dict[str, int]:
         """Clean up stale and dead proxies.
 
+        Validation history is rolled up and trimmed first (see
+        ``apply_validation_retention``), so completed buckets of removed
+        proxies are kept as rollups.
+
         Args:
             remove_dead: Remove proxies with health_status='dead'
             remove_stale_days: Remove proxies not validated in N days (0 to skip)
             remove_never_validated: Remove proxies that have never been validated
-            vacuum: Run VACUUM after cleanup to reclaim space
+            vacuum: Reclaim space after cleanup (incremental or full, per ``retention``)
+            retention: Validation history policy (default ``ValidationRetention()``)
 
         Returns:
-            dict[str, int]: Counts of removed items by category (dead, stale, never_validated).
+            dict[str, int]: Counts of removed items by category (dead, stale,
+            never_validated, old_validations, expired_rollups).
         """
+        retention = retention or ValidationRetention()
+        history = await self.apply_validation_retention(retention)
         counts: dict[str, int] = {}
 
         async with AsyncSession(self.engine) as session:
@@ -1488,24 +2490,210 @@ class SQLiteStorage:
                 else:
                     counts["never_validated"] = 0
 
-            # Clean old validation history (keep 1 day)
-            history_cutoff = datetime.now(timezone.utc) - timedelta(days=1)
-            del_history = delete(ValidationResultTable).where(
-                ValidationResultTable.validated_at < history_cutoff
-            )
-            result = await session.exec(del_history)  # type: ignore[arg-type]
-            counts["old_validations"] = result.rowcount if hasattr(result, "rowcount") else 0
-
             await session.commit()
             self._invalidate_stats_cache()
 
+        counts["old_validations"] = history["raw_deleted"]
+        counts["expired_rollups"] = history["rollups_deleted"]
+
         # Vacuum to reclaim space
         if vacuum:
-            async with self.engine.begin() as conn:
-                await conn.execute(text("VACUUM"))
+            await self.vacuum(incremental=retention.incremental_vacuum)
 
         return counts
 
+    async def rollup_validations(self, now: datetime | None = None) -> dict[str, int]:
+        """Aggregate complete hour/day buckets of ``validation_results``.
+
+        Each period resumes after its newest stored bucket (or at the oldest
+        raw row) and stops at the bucket containing ``now``, since results are
+        recorded with the current time and earlier buckets no longer change.
+        Each bucket is recomputed from raw rows and upserted, so re-running
+        over a range is harmless. Hourly buckets are written one day per
+        transaction.
+
+        Args:
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            dict[str, int]: Rollup rows written per period (``hour``, ``day``)
+        """
+        now = now or datetime.now(timezone.utc)
+        written: dict[str, int] = {}
+        for period, width in _ROLLUP_PERIODS.items():
+            written[period] = 0
+            start = await self._rollup_resume_point(period)
+            end = _rollup_bucket(now, period)
+            if start is None:
+                continue
+            statement = text(_ROLLUP_BUCKET_SQL)
+            while start < end:
+                chunk_end = min(start + timedelta(days=1), end)
+                async with self.engine.begin() as conn:
+                    while start < chunk_end:
+                        result = await self._timed_conn_execute(
+                            conn,
+                            statement.bindparams(
+                                period=period,
+                                bucket_start=_sqlite_timestamp(start),
+                                bucket_end=_sqlite_timestamp(start + width),
+                            ),
+                        )
+                        written[period] += max(result.rowcount, 0)
+                        start += width
+        return written
+
+    async def _rollup_resume_point(self, period: str) -> datetime | None:
+        """Return the first bucket of ``period`` not rolled up yet (None if no raw rows)."""
+        async with self.engine.connect() as conn:
+            result = await self._timed_conn_execute(
+                conn,
+                text(
+                    "SELECT MAX(bucket_start) FROM validation_rollups WHERE period = :period"
+                ).bindparams(period=period),
+            )
+            newest = _parse_sqlite_timestamp(result.scalar())
+            if newest is not None:
+                return newest + _ROLLUP_PERIODS[period]
+            result = await self._timed_conn_execute(
+                conn, text("SELECT MIN(validated_at) FROM validation_results")
+            )
+            oldest = _parse_sqlite_timestamp(result.scalar())
+        return _rollup_bucket(oldest, period) if oldest is not None else None
+
+    async def apply_validation_retention(
+        self,
+        retention: ValidationRetention | None = None,
+        now: datetime | None = None,
+        vacuum: bool = False,
+    ) -> dict[str, int]:
+        """Roll up validation history, then delete what is past its horizon.
+
+        Raw rows are deleted only before the start of the current day, which
+        ``rollup_validations`` has just covered for both periods, so no result
+        is dropped without being aggregated. Deletes run in ``batch_size``
+        chunks, each in its own short transaction, so concurrent writers are
+        never blocked for the whole purge.
+
+        Args:
+            retention: Horizons and batch size (default ``ValidationRetention()``)
+            now: Reference time (default: current UTC time)
+            vacuum: Reclaim the freed pages afterwards (see ``vacuum``)
+
+        Returns:
+            dict[str, int]: ``hourly_rollups`` and ``daily_rollups`` written,
+            ``raw_deleted`` and ``rollups_deleted`` rows
+        """
+        retention = retention or ValidationRetention()
+        now = now or datetime.now(timezone.utc)
+        written = await self.rollup_validations(now)
+
+        raw_cutoff = min(now - retention.raw, _rollup_bucket(now, "day"))
+        raw_deleted = await self._delete_in_batches(
+            "validation_results",
+            "validated_at < :cutoff",
+            {"cutoff": _sqlite_timestamp(raw_cutoff)},
+            retention.batch_size,
+        )
+        rollups_deleted = 0
+        for period, horizon in (("hour", retention.hourly), ("day", retention.daily)):
+            rollups_deleted += await self._delete_in_batches(
+                "validation_rollups",
+                "period = :period AND bucket_start < :cutoff",
+                {"period": period, "cutoff": _sqlite_timestamp(now - horizon)},
+                retention.batch_size,
+            )
+
+        if raw_deleted:
+            self._invalidate_stats_cache()
+        if vacuum and (raw_deleted or rollups_deleted):
+            await self.vacuum(incremental=retention.incremental_vacuum)
+
+        return {
+            "hourly_rollups": written["hour"],
+            "daily_rollups": written["day"],
+            "raw_deleted": raw_deleted,
+            "rollups_deleted": rollups_deleted,
+        }
+
+    async def _delete_in_batches(
+        self, table: str, condition: str, params: dict[str, Any], batch_size: int
+    ) -> int:
+        """Delete rows of ``table`` matching ``condition``, ``batch_size`` per transaction."""
+        statement = text(
+            f"DELETE FROM {table} WHERE rowid IN "
+            f"(SELECT rowid FROM {table} WHERE {condition} LIMIT :batch_size)"
+        ).bindparams(batch_size=batch_size, **params)
+        deleted = 0
+        while True:
+            async with self.engine.begin() as conn:
+                result = await self._timed_conn_execute(conn, statement)
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
+
+    async def vacuum(self, incremental: bool = False, max_pages: int = 0) -> None:
+        """Reclaim free pages from the database file.
+
+        A full ``VACUUM`` rewrites the whole database. With ``incremental``,
+        databases in incremental auto-vacuum mode (the default for databases
+        created by ``initialize``) only release their free pages, which takes
+        time proportional to what was deleted; older databases are converted
+        by one full ``VACUUM`` first.
+
+        Args:
+            incremental: Use ``PRAGMA incremental_vacuum`` where possible
+            max_pages: Release at most this many pages (0 for all); incremental only
+        """
+        async with self.engine.connect() as conn:
+            mode = (await self._timed_conn_execute(conn, text("PRAGMA auto_vacuum"))).scalar()
+            if incremental and mode == 2:
+                raw = await conn.get_raw_connection()
+                # executescript steps the pragma to completion; a plain execute
+                # frees a single page
+                await raw.driver_connection.executescript(  # type: ignore[union-attr]
+                    f"PRAGMA incremental_vacuum({int(max_pages)});"
+                )
+                return
+        async with self.engine.begin() as conn:
+            if incremental:
+                await conn.execute(text("PRAGMA auto_vacuum = INCREMENTAL"))
+            await conn.execute(text("VACUUM"))
+
+    async def load_validation_rollups(
+        self,
+        period: str = "hour",
+        proxy_url: str | None = None,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Load validation rollups, oldest bucket first.
+
+        Args:
+            period: ``"hour"`` or ``"day"``
+            proxy_url: Only this proxy's buckets
+            since: Only buckets starting at or after this time
+
+        Returns:
+            List of rollup dictionaries (``ValidationRollupTable`` columns)
+
+        Raises:
+            ValueError: If ``period`` is not supported
+        """
+        if period not in _ROLLUP_PERIODS:
+            raise ValueError(f"Unsupported rollup period {period!r}")
+        stmt = select(ValidationRollupTable).where(ValidationRollupTable.period == period)
+        if proxy_url is not None:
+            stmt = stmt.where(ValidationRollupTable.proxy_url == proxy_url)
+        if since is not None:
+            stmt = stmt.where(ValidationRollupTable.bucket_start >= since)
+        stmt = stmt.order_by(
+            ValidationRollupTable.bucket_start,  # type: ignore[arg-type]
+            ValidationRollupTable.proxy_url,  # type: ignore[arg-type]
+        )
+        async with AsyncSession(self.engine) as session:
+            result = await self._timed_exec(session, stmt)
+            return [rollup.model_dump() for rollup in result.all()]
+
     async def get_stats(self) -> dict[str, Any]:
         """Get database statistics.
 
@@ -1610,37 +2798,10 @@ class SQLiteStorage:
         if not proxy_urls:
             return {}
 
-        stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
-            .where(ProxyIdentityTable.url.in_(proxy_urls))  # type: ignore[attr-defined]
+        stmt = self._proxy_row_select().where(
+            ProxyIdentityTable.url.in_(proxy_urls)  # type: ignore[attr-defined]
         )
-
-        result_map: dict[str, dict[str, Any]] = {}
-
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
-
-            for identity, status in rows:
-                result_map[identity.url] = {
-                    "url": identity.url,
-                    "protocol": identity.protocol,
-                    "host": identity.host,
-                    "port": identity.port,
-                    "username": self._decrypt_credential(identity.username),
-                    "password": self._decrypt_credential(identity.password),
-                    "country_code": identity.country_code,
-                    "source": identity.source,
-                    "source_url": identity.source_url,
-                    "health_status": status.health_status,
-                    "last_success_at": status.last_success_at,
-                    "avg_response_time_ms": status.avg_response_time_ms,
-                    "total_checks": status.total_checks,
-                    "total_successes": status.total_successes,
-                }
-
-        return result_map
+        return {row["url"]: row for row in await self._fetch_proxy_rows(stmt)}
 
     async def get_healthy_proxies_batch(
         self,
@@ -1662,33 +2823,8 @@ class SQLiteStorage:
         Returns:
             List of proxy dictionaries
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-
-        stmt = (
-            select(ProxyIdentityTable, ProxyStatusTable)
-            .join(ProxyStatusTable, ProxyIdentityTable.url == ProxyStatusTable.proxy_url)
-            .where(ProxyStatusTable.health_status == "healthy")
-            .where(cast(Any, ProxyStatusTable.last_success_at) >= cutoff)
-        )
-
-        if protocols:
-            stmt = stmt.where(ProxyIdentityTable.protocol.in_(protocols))  # type: ignore[attr-defined]
-        if country_codes:
-            stmt = stmt.where(ProxyIdentityTable.country_code.in_(country_codes))  # type: ignore[attr-defined]
-
-        stmt = stmt.order_by(ProxyStatusTable.avg_response_time_ms.asc().nullslast())
-
-        if limit:
-            stmt = stmt.limit(limit)
-
-        async with AsyncSession(self.engine) as session:
-            result = await session.exec(stmt)  # type: ignore[arg-type]
-            rows = result.all()
-
-            proxies = []
-            for identity, status in rows:
-                proxies.append(self._identity_status_row_dict(identity, status))
-            return proxies
+        stmt = self._healthy_proxies_select(max_age_hours, protocols, country_codes, limit)
+        return await self._fetch_proxy_rows(stmt)
 
     async def audit_log_change(
         self,
@@ -1721,6 +2857,54 @@ class SQLiteStorage:
 # ============================================================================
 
 
+class IncrementalIngestFilter:
+    """Validation filter that only lets new or stale proxies through to validation.
+
+    Pass an instance as ``validation_filter`` to ``ProxyFetcher.fetch_all`` (or
+    ``fetch_all_sources``). Proxies already stored and checked within
+    ``fresh_within`` are dropped and get their ``discovered_at`` / source
+    attribution bumped instead, so a run's validation load scales with churn
+    rather than with total list size.
+
+    Attributes:
+        storage: Initialized storage to diff against
+        fresh_within: Freshness window for the last check
+        diff: Partition of the most recent batch (None until called)
+    """
+
+    def __init__(self, storage: SQLiteStorage, fresh_within: timedelta) -> None:
+        """Initialize the filter.
+
+        Args:
+            storage: Initialized SQLiteStorage holding the current inventory
+            fresh_within: Proxies checked more recently than this are skipped
+        """
+        self.storage = storage
+        self.fresh_within = fresh_within
+        self.diff: IngestionDiff | None = None
+
+    async def __call__(self, proxies: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the proxies that need validation and touch the fresh ones."""
+        self.diff = await self.storage.diff_for_ingestion(
+            [proxy["url"] for proxy in proxies], self.fresh_within
+        )
+        fresh = set(self.diff.fresh)
+        await self.storage.touch_discovered(
+            [
+                (proxy["url"], str(proxy["source_url"]) if proxy.get("source_url") else None)
+                for proxy in proxies
+                if proxy["url"] in fresh
+            ]
+        )
+        logger.info(
+            "Incremental ingestion: {} new, {} stale, {} fresh (skipped)",
+            len(self.diff.new),
+            len(self.diff.stale),
+            len(self.diff.fresh),
+        )
+        return [proxy for proxy in proxies if proxy["url"] not in fresh]
+
+
 class MigrationStatus(str, Enum):
     """Status of a schema migration."""
 
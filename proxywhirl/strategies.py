@@ -7,7 +7,7 @@ from __future__ import annotations
 import random
 import threading
 from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Any, Literal, Protocol, TypeAlias, runtime_checkable
 from uuid import UUID
@@ -204,6 +204,41 @@ class StrategyState:
         with self._lock:
             self._metrics.clear()
 
+    def snapshot_state(self) -> dict[str, Any]:
+        """Return all tracked metrics in a JSON-compatible form.
+
+        Returns:
+            Mapping of proxy UUID string to metric fields (datetimes as ISO strings)
+        """
+        with self._lock:
+            return {
+                str(proxy_id): {
+                    **asdict(metrics),
+                    "window_start": metrics.window_start.isoformat()
+                    if metrics.window_start
+                    else None,
+                }
+                for proxy_id, metrics in self._metrics.items()
+            }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Replace all tracked metrics with a :meth:`snapshot_state` result.
+
+        Args:
+            state: Mapping of proxy UUID string to metric fields
+        """
+        metrics: dict[UUID, ProxyMetrics] = {}
+        for proxy_id, fields in state.items():
+            window_start = fields.get("window_start")
+            metrics[UUID(proxy_id)] = ProxyMetrics(
+                **{
+                    **fields,
+                    "window_start": datetime.fromisoformat(window_start) if window_start else None,
+                }
+            )
+        with self._lock:
+            self._metrics = metrics
+
 
 class StrategyRegistry:
     """
@@ -526,6 +561,16 @@ class RoundRobinStrategy:
         """
         self.config = config
 
+    def snapshot_state(self) -> dict[str, Any]:
+        """Return the rotation position for a warm-start snapshot."""
+        with self._lock:
+            return {"current_index": self._current_index}
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Continue the rotation from a :meth:`snapshot_state` result."""
+        with self._lock:
+            self._current_index = int(state.get("current_index", 0))
+
     def validate_metadata(self, pool: ProxyPool) -> bool:
         """
         Validate that pool has required metadata for this strategy.
@@ -2020,7 +2065,9 @@ class CompositeStrategy:
         # Apply filters sequentially
         for filter_strategy in self.filters:
             # Create temporary pool with filtered proxies
-            temp_pool = pool.__class__(name=f"{pool.name}-filtered")
+            temp_pool = pool.__class__(
+                name=f"{pool.name}-filtered", max_pool_size=len(filtered_proxies)
+            )
             for proxy in filtered_proxies:
                 temp_pool.add_proxy(proxy)
 
@@ -2046,7 +2093,7 @@ class CompositeStrategy:
                 raise ProxyPoolEmptyError("All proxies filtered out")
 
         # Apply selector to filtered pool
-        final_pool = pool.__class__(name=f"{pool.name}-final")
+        final_pool = pool.__class__(name=f"{pool.name}-final", max_pool_size=len(filtered_proxies))
         for proxy in filtered_proxies:
             final_pool.add_proxy(proxy)
 
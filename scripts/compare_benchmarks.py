@@ -0,0 +1,119 @@
+"""Check pytest-benchmark results for super-linear growth and regressions.
+
+Reads the JSON written by ``pytest --benchmark-json`` (see
+tests/benchmarks/test_scaling.py). Benchmarks that record
+``extra_info["pool_size"]`` are grouped by benchmark group. The command fails
+when the median time grows faster than ``size ** max_exponent`` between two
+consecutive sizes. It also fails when a median is more than
+``max_regression`` percent slower than in the baseline file.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import typer
+
+app = typer.Typer(help="Compare ProxyWhirl benchmark results")
+
+
+class Measurement(NamedTuple):
+    """Median time of one benchmark at one pool size."""
+
+    group: str
+    size: int | None
+    median: float
+
+
+def load_measurements(path: Path) -> dict[str, Measurement]:
+    """Load medians keyed by benchmark fullname."""
+    data: dict[str, Any] = json.loads(path.read_text())
+    return {
+        bench["fullname"]: Measurement(
+            group=bench.get("group") or bench["fullname"].split("[", 1)[0],
+            size=bench.get("extra_info", {}).get("pool_size"),
+            median=bench["stats"]["median"],
+        )
+        for bench in data["benchmarks"]
+    }
+
+
+def growth_violations(
+    measurements: dict[str, Measurement], max_exponent: float
+) -> list[tuple[str, int, int, float]]:
+    """Return (group, smaller size, larger size, exponent) above ``max_exponent``.
+
+    The exponent is the slope of median time against size on a log-log scale:
+    about 0 for O(1), 1 for O(n) and 2 for O(n^2). Linear scans can reach ~1.4
+    when the working set outgrows the CPU caches, hence the default of 1.5.
+    """
+    by_group: dict[str, dict[int, float]] = {}
+    for measurement in measurements.values():
+        if measurement.size:
+            by_group.setdefault(measurement.group, {})[measurement.size] = measurement.median
+
+    violations = []
+    for group, medians in sorted(by_group.items()):
+        sizes = sorted(medians)
+        for small, large in zip(sizes, sizes[1:], strict=False):
+            exponent = math.log(medians[large] / medians[small]) / math.log(large / small)
+            if exponent > max_exponent:
+                violations.append((group, small, large, exponent))
+    return violations
+
+
+def regressions(
+    current: dict[str, Measurement],
+    baseline: dict[str, Measurement],
+    max_regression: float,
+) -> list[tuple[str, float, float]]:
+    """Return (fullname, baseline median, current median) slower than allowed."""
+    limit = 1 + max_regression / 100
+    return [
+        (name, baseline[name].median, measurement.median)
+        for name, measurement in sorted(current.items())
+        if name in baseline and measurement.median > baseline[name].median * limit
+    ]
+
+
+@app.command()
+def compare(
+    results: str = typer.Argument(..., help="pytest-benchmark JSON results"),
+    baseline: str | None = typer.Option(
+        None, "--baseline", "-b", help="Baseline JSON to compare against"
+    ),
+    max_regression: float = typer.Option(
+        20.0, help="Allowed slowdown against the baseline, in percent"
+    ),
+    max_exponent: float = typer.Option(
+        1.5, help="Allowed growth exponent between consecutive pool sizes (1.0 = linear)"
+    ),
+) -> None:
+    """Fail on super-linear scaling or regressions against a baseline."""
+    current = load_measurements(Path(results))
+    failed = False
+
+    for group, small, large, exponent in growth_violations(current, max_exponent):
+        failed = True
+        typer.echo(f"SUPER-LINEAR {group}: n={small:,} -> n={large:,} grows as n^{exponent:.2f}")
+
+    if baseline is not None:
+        for name, before, after in regressions(
+            current, load_measurements(Path(baseline)), max_regression
+        ):
+            failed = True
+            change = (after / before - 1) * 100
+            typer.echo(
+                f"REGRESSION {name}: {before * 1e3:.3f}ms -> {after * 1e3:.3f}ms (+{change:.0f}%)"
+            )
+
+    if failed:
+        raise typer.Exit(code=1)
+    typer.echo(f"OK: {len(current)} benchmarks within limits")
+
+
+if __name__ == "__main__":
+    app()
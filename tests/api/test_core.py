@@ -31,6 +31,7 @@ EXPECTED_OPENAPI_ROUTE_METHODS = {
     "/api/proxies/{proxy_id}": ["DELETE", "GET"],
     "/api/ready": ["GET"],
     "/api/request": ["POST"],
+    "/api/request/stream": ["POST"],
     "/api/retry/policy": ["GET", "PUT"],
     "/api/rotate": ["GET"],
     "/api/stats": ["GET"],
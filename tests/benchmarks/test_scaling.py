@@ -0,0 +1,353 @@
+"""Scaling benchmarks: hot paths measured at growing pool sizes.
+
+Each benchmark runs once per pool size and records the size in
+``extra_info["pool_size"]``, so results can be checked for super-linear
+growth. Sizes default to 1k and 10k; large sizes are opt-in:
+
+    PROXYWHIRL_BENCH_SIZES=1000,10000,100000,1000000 \\
+        pytest tests/benchmarks/test_scaling.py --benchmark-only \\
+        --benchmark-json=.benchmarks/scaling.json
+
+    python scripts/compare_benchmarks.py .benchmarks/scaling.json \\
+        --baseline .benchmarks/scaling-baseline.json
+
+Fetch benchmarks download from a loopback stand-in server instead of real
+sources, so results only depend on this machine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import threading
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from proxywhirl import utils
+from proxywhirl._proxy_views import ProxyListQuery, list_proxy_result
+from proxywhirl.cache import CacheManager
+from proxywhirl.cache.models import CacheConfig, CacheEntry, CacheTierConfig
+from proxywhirl.cache.models import HealthStatus as CacheHealthStatus
+from proxywhirl.fetchers import ProxyFetcher
+from proxywhirl.models import (
+    HealthStatus,
+    Proxy,
+    ProxyFormat,
+    ProxyPool,
+    ProxySource,
+    ProxySourceConfig,
+    SelectionContext,
+)
+from proxywhirl.rotator import ProxyWhirl
+from proxywhirl.storage import SQLiteStorage
+from proxywhirl.strategies import (
+    CompositeStrategy,
+    CostAwareStrategy,
+    GeoTargetedStrategy,
+    LeastUsedStrategy,
+    PerformanceBasedStrategy,
+    RandomStrategy,
+    RotationStrategy,
+    RoundRobinStrategy,
+    SessionPersistenceStrategy,
+    WeightedStrategy,
+)
+
+SIZES = [int(size) for size in os.environ.get("PROXYWHIRL_BENCH_SIZES", "1000,10000").split(",")]
+
+pytestmark = [pytest.mark.slow, pytest.mark.timeout(3600)]
+
+# 60% healthy, the rest spread over the other states
+_STATUSES = (
+    *(HealthStatus.HEALTHY,) * 6,
+    HealthStatus.UNKNOWN,
+    HealthStatus.DEGRADED,
+    HealthStatus.UNHEALTHY,
+    HealthStatus.DEAD,
+)
+_COUNTRIES = ("US", "DE", "FR", "GB", "BR", "IN", "JP", "NL")
+_PUBLIC_OCTETS = (23, 45, 51, 66, 89, 103, 154, 185)
+_STORAGE_CHUNK = 5_000
+_RECORD_BATCH = 100
+
+
+def _proxy_url(i: int) -> str:
+    first = _PUBLIC_OCTETS[i % len(_PUBLIC_OCTETS)]
+    return f"http://{first}.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}:8080"
+
+
+def _make_proxies(size: int) -> list[Proxy]:
+    """Deterministic proxies with varied health, geography, usage and latency."""
+    return Proxy.from_trusted_rows(
+        {
+            "url": _proxy_url(i),
+            "health_status": _STATUSES[i % len(_STATUSES)],
+            "source": ProxySource.FETCHED,
+            "country_code": _COUNTRIES[i % len(_COUNTRIES)],
+            "total_requests": 20,
+            "total_successes": 10 + i % 11,
+            "requests_started": i % 50,
+            "average_response_time_ms": 50.0 + (i * 7919) % 2000,
+            "ema_response_time_ms": 50.0 + (i * 7919) % 2000,
+            "cost_per_request": (i % 10) / 10,
+        }
+        for i in range(size)
+    )
+
+
+def _strategies() -> dict[str, Callable[[], tuple[RotationStrategy, SelectionContext | None]]]:
+    return {
+        "round-robin": lambda: (RoundRobinStrategy(), None),
+        "random": lambda: (RandomStrategy(), None),
+        "weighted": lambda: (WeightedStrategy(), None),
+        "least-used": lambda: (LeastUsedStrategy(), None),
+        "performance-based": lambda: (PerformanceBasedStrategy(), None),
+        "session": lambda: (
+            SessionPersistenceStrategy(),
+            SelectionContext(session_id="bench-session"),
+        ),
+        "geo-targeted": lambda: (GeoTargetedStrategy(), SelectionContext(target_country="DE")),
+        "cost-aware": lambda: (CostAwareStrategy(), None),
+        "composite": lambda: (
+            CompositeStrategy(filters=[GeoTargetedStrategy()], selector=PerformanceBasedStrategy()),
+            SelectionContext(target_country="DE"),
+        ),
+    }
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"n={size}")
+def size(request: pytest.FixtureRequest) -> int:
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def proxies(size: int) -> list[Proxy]:
+    return _make_proxies(size)
+
+
+@pytest.fixture(scope="module")
+def pool(proxies: list[Proxy]) -> ProxyPool:
+    return ProxyPool(name="scaling", proxies=proxies, max_pool_size=len(proxies))
+
+
+@pytest.fixture(scope="module")
+def rotator(proxies: list[Proxy]) -> ProxyWhirl:
+    rotator = ProxyWhirl(bootstrap=False)
+    rotator.pool.max_pool_size = len(proxies)
+    for proxy in proxies:
+        rotator.pool.add_proxy(proxy)
+    rotator._init_circuit_breakers_for_proxies(proxies)
+    return rotator
+
+
+@pytest.fixture(scope="module")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="module")
+def storage(
+    proxies: list[Proxy],
+    loop: asyncio.AbstractEventLoop,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Iterator[SQLiteStorage]:
+    """A database holding every proxy of the pool (schema from SQLiteStorage)."""
+    storage = SQLiteStorage(tmp_path_factory.mktemp("scaling-storage") / "proxies.db")
+
+    async def fill() -> None:
+        await storage.initialize()
+        for start in range(0, len(proxies), _STORAGE_CHUNK):
+            await storage.add_proxies_batch(proxies[start : start + _STORAGE_CHUNK])
+
+    loop.run_until_complete(fill())
+    yield storage
+    loop.run_until_complete(storage.close())
+
+
+@pytest.fixture(scope="module")
+def cache(size: int, tmp_path_factory: pytest.TempPathFactory) -> Iterator[CacheManager]:
+    """A cache whose L1 and L3 tiers hold ``size`` entries (L1 at capacity)."""
+    cache_dir = tmp_path_factory.mktemp("scaling-cache")
+    manager = CacheManager(
+        CacheConfig(
+            l1_config=CacheTierConfig(max_entries=size),
+            l2_config=CacheTierConfig(enabled=False),
+            l2_cache_dir=str(cache_dir / "l2"),
+            l3_database_path=str(cache_dir / "cache.db"),
+            enable_background_cleanup=False,
+        )
+    )
+    entries = [_cache_entry(f"bench-{i}", _proxy_url(i)) for i in range(size)]
+    manager.l3_tier.put_many(entries)
+    for entry in entries:
+        manager.l1_tier.put(entry.key, entry)
+    yield manager
+    manager.l3_tier.close()
+
+
+def _cache_entry(key: str, proxy_url: str) -> CacheEntry:
+    now = datetime.now(timezone.utc)
+    return CacheEntry(
+        key=key,
+        proxy_url=proxy_url,
+        username=None,
+        password=None,
+        source="bench",
+        fetch_time=now,
+        last_accessed=now,
+        ttl_seconds=3600,
+        expires_at=now + timedelta(hours=1),
+        health_status=CacheHealthStatus.HEALTHY,
+    )
+
+
+class _ProxyListHandler(BaseHTTPRequestHandler):
+    """Serves ``/<n>.txt`` as a plain-text list of ``n`` proxies."""
+
+    bodies: dict[int, bytes] = {}
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
+        size = int(self.path.strip("/").removesuffix(".txt"))
+        if size not in self.bodies:
+            self.bodies[size] = "".join(
+                f"{_proxy_url(i).removeprefix('http://')}\n" for i in range(size)
+            ).encode()
+        body = self.bodies[size]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def source_server() -> Iterator[str]:
+    """Loopback stand-in for a proxy list source; yields its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyListHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _record(benchmark: Any, group: str, size: int) -> None:
+    benchmark.group = f"scaling-{group}"
+    benchmark.extra_info["pool_size"] = size
+
+
+@pytest.mark.parametrize("name", list(_strategies()))
+def test_strategy_select(benchmark: Any, pool: ProxyPool, size: int, name: str) -> None:
+    """Strategy.select on a pool of ``size`` proxies."""
+    strategy, context = _strategies()[name]()
+    _record(benchmark, f"select-{name}", size)
+
+    assert isinstance(benchmark(strategy.select, pool, context), Proxy)
+
+
+def test_select_with_circuit_breaker(benchmark: Any, rotator: ProxyWhirl, size: int) -> None:
+    """Rotator selection including the per-proxy circuit breaker filter."""
+    _record(benchmark, "select-circuit-breaker", size)
+
+    assert isinstance(benchmark(rotator._select_proxy_with_circuit_breaker), Proxy)
+
+
+def test_get_healthy_proxies(benchmark: Any, pool: ProxyPool, size: int) -> None:
+    _record(benchmark, "get-healthy-proxies", size)
+
+    assert benchmark(pool.get_healthy_proxies)
+
+
+def test_list_proxy_views(benchmark: Any, rotator: ProxyWhirl, size: int) -> None:
+    """First API page of proxies filtered by country."""
+    query = ProxyListQuery(country_code="DE", limit=100)
+    _record(benchmark, "list-proxy-views", size)
+
+    result = benchmark(list_proxy_result, rotator, query)
+
+    assert result.total == size // len(_COUNTRIES)
+
+
+def test_storage_load(
+    benchmark: Any, storage: SQLiteStorage, loop: asyncio.AbstractEventLoop, size: int
+) -> None:
+    _record(benchmark, "storage-load", size)
+
+    rows = benchmark.pedantic(
+        lambda: loop.run_until_complete(storage.load()), rounds=3, warmup_rounds=1
+    )
+
+    assert len(rows) == size
+
+
+def test_storage_record_validations(
+    benchmark: Any, storage: SQLiteStorage, loop: asyncio.AbstractEventLoop, size: int
+) -> None:
+    """Recording a fixed batch of results should not depend on the table size."""
+    step = max(size // _RECORD_BATCH, 1)
+    results = [(_proxy_url(i), i % 3 != 0, 120.0, None) for i in range(0, size, step)]
+    _record(benchmark, "storage-record-validations", size)
+
+    recorded = benchmark.pedantic(
+        lambda: loop.run_until_complete(storage.record_validations_batch(results)),
+        rounds=10,
+        warmup_rounds=1,
+    )
+
+    assert recorded == len(results)
+
+
+def test_cache_get(benchmark: Any, cache: CacheManager, size: int) -> None:
+    _record(benchmark, "cache-get", size)
+
+    assert benchmark(cache.get, f"bench-{size // 2}") is not None
+
+
+def test_cache_put(benchmark: Any, cache: CacheManager, size: int) -> None:
+    """Insert into a full cache: every put also evicts from L1."""
+    keys = (f"bench-new-{i}" for i in itertools.count())
+    _record(benchmark, "cache-put", size)
+
+    def put() -> bool:
+        key = next(keys)
+        return cache.put(key, _cache_entry(key, "http://203.0.113.7:8080"))
+
+    assert benchmark.pedantic(put, rounds=200, warmup_rounds=5)
+
+
+def test_fetch_and_parse(
+    benchmark: Any, source_server: str, loop: asyncio.AbstractEventLoop, size: int
+) -> None:
+    """Download and parse a plain-text source listing ``size`` proxies."""
+    fetcher = ProxyFetcher(dedup_cache_ttl=0)
+    source = ProxySourceConfig(url=f"{source_server}/{size}.txt", format=ProxyFormat.PLAIN_TEXT)
+    _record(benchmark, "fetch-parse", size)
+
+    def clear_url_caches() -> None:
+        # Real fetch cycles see far more distinct proxies than these 2048-entry
+        # caches hold; without clearing, small sizes would be measured warm.
+        utils._is_valid_proxy_url_cached.cache_clear()
+        utils._parse_proxy_url_cached.cache_clear()
+        utils._redact_url_credentials_cached.cache_clear()
+
+    try:
+        proxies = benchmark.pedantic(
+            lambda: loop.run_until_complete(fetcher.fetch_from_source(source)),
+            setup=clear_url_caches,
+            rounds=5,
+            warmup_rounds=1,
+        )
+    finally:
+        loop.run_until_complete(fetcher.close())
+
+    assert len(proxies) == size
@@ -0,0 +1,146 @@
+"""Benchmarks for hot SQLiteStorage queries on a synthetic 1M-proxy database.
+
+Run with: pytest tests/benchmarks/test_storage_query_performance.py -m slow -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import statistics
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from proxywhirl.storage import SQLiteStorage
+
+ROWS = 1_000_000
+RUNS = 20
+
+# Deterministic pseudo-random columns derived from the row number i:
+# 30% healthy, 30% unhealthy, 20% dead, 20% unknown; successes spread over 10 days
+# (~20% of healthy proxies inside the default 48h window); ~10% unknown latency.
+_FILL_IDENTITIES = f"""
+WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < {ROWS - 1})
+INSERT INTO proxy_identities (
+    url, protocol, host, port, country_code, source, discovered_at,
+    is_residential, is_datacenter
+)
+SELECT
+    (CASE i % 4 WHEN 0 THEN 'http' WHEN 1 THEN 'https' WHEN 2 THEN 'socks4' ELSE 'socks5' END)
+        || '://10.' || (i >> 16 & 255) || '.' || (i >> 8 & 255) || '.' || (i & 255) || ':8080',
+    CASE i % 4 WHEN 0 THEN 'http' WHEN 1 THEN 'https' WHEN 2 THEN 'socks4' ELSE 'socks5' END,
+    '10.' || (i >> 16 & 255) || '.' || (i >> 8 & 255) || '.' || (i & 255),
+    8080,
+    CASE (i / 4) % 8 WHEN 0 THEN 'US' WHEN 1 THEN 'DE' WHEN 2 THEN 'FR' WHEN 3 THEN 'CN'
+        WHEN 4 THEN 'BR' WHEN 5 THEN 'RU' WHEN 6 THEN 'IN' END,
+    'fetched',
+    datetime('now', '-' || ((i * 7919) % 2592000) || ' seconds'),
+    0,
+    0
+FROM n
+"""
+
+_FILL_STATUSES = """
+INSERT INTO proxy_statuses (
+    proxy_url, health_status, last_success_at, last_check_at, total_checks,
+    total_successes, avg_response_time_ms, updated_at,
+    consecutive_successes, consecutive_failures
+)
+SELECT
+    url,
+    CASE WHEN h < 3 THEN 'healthy' WHEN h < 6 THEN 'unhealthy' WHEN h < 8 THEN 'dead'
+        ELSE 'unknown' END,
+    CASE WHEN h < 3 OR h = 6
+        THEN datetime('now', '-' || ((r * 31) % 864000) || ' seconds') END,
+    CASE WHEN h < 9 THEN datetime('now', '-' || ((r * 17) % 1209600) || ' seconds') END,
+    CASE WHEN h < 9 THEN 1 + r % 50 ELSE 0 END,
+    CASE WHEN h < 9 THEN (1 + r % 50) / 2 ELSE 0 END,
+    CASE WHEN h < 9 AND r % 10 != 0 THEN 50.0 + (r * 13) % 4950 END,
+    datetime('now', '-' || ((r * 23) % 1209600) || ' seconds'),
+    0,
+    0
+FROM (SELECT url, rowid % 10 AS h, (rowid * 2654435761) % 4294967296 AS r FROM proxy_identities)
+"""
+
+
+@pytest.fixture(scope="module")
+def million_proxy_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the synthetic database once per module (schema from SQLiteStorage)."""
+    db_path = tmp_path_factory.mktemp("storage-bench") / "proxies.db"
+
+    async def create_schema() -> None:
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+        await storage.close()
+
+    asyncio.run(create_schema())
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(_FILL_IDENTITIES)
+        conn.execute(_FILL_STATUSES)
+    return db_path
+
+
+@pytest.fixture
+async def storage(million_proxy_db: Path) -> AsyncGenerator[SQLiteStorage, None]:
+    storage = SQLiteStorage(million_proxy_db)
+    yield storage
+    await storage.close()
+
+
+async def _median_ms(query: Callable[[], Awaitable[list[dict[str, Any]]]]) -> float:
+    """Median wall time of RUNS calls after one warm-up call."""
+    assert await query()
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await query()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(600)
+class TestHotStorageQueries:
+    """Latency targets for index-backed queries at 1M proxies."""
+
+    @pytest.mark.benchmark(group="db-indexes")
+    async def test_healthy_proxy_selection_under_10ms(self, storage: SQLiteStorage) -> None:
+        """Fastest-first healthy selection walks idx_proxy_status_health_latency."""
+        median = await _median_ms(lambda: storage.get_healthy_proxies(limit=100))
+        print(f"\nget_healthy_proxies(limit=100) @ {ROWS:,} rows: {median:.2f}ms median")
+        assert median < 10.0
+
+    @pytest.mark.benchmark(group="db-indexes")
+    async def test_protocol_filtered_selection_under_10ms(self, storage: SQLiteStorage) -> None:
+        """Protocol filters are checked while walking the same index."""
+        median = await _median_ms(
+            lambda: storage.get_healthy_proxies_batch(protocols=["http", "https"], limit=100)
+        )
+        print(f"\nget_healthy_proxies_batch(http/https) @ {ROWS:,} rows: {median:.2f}ms median")
+        assert median < 10.0
+
+    @pytest.mark.benchmark(group="db-indexes")
+    async def test_narrow_filters_never_sort_every_healthy_proxy(
+        self, storage: SQLiteStorage
+    ) -> None:
+        """Narrow protocol+country filters (~1/32 of rows) still avoid a full sort.
+
+        The index walk visits about 32x more rows than it returns here; the
+        previous plan read every fresh healthy proxy and sorted them (~0.5s).
+        """
+        median = await _median_ms(
+            lambda: storage.get_healthy_proxies(protocol="http", country_code="US", limit=100)
+        )
+        print(f"\nget_healthy_proxies(http, US) @ {ROWS:,} rows: {median:.2f}ms median")
+        assert median < 100.0
+
+    @pytest.mark.benchmark(group="db-indexes")
+    async def test_revalidation_page_under_10ms(self, storage: SQLiteStorage) -> None:
+        """Oldest-first revalidation pages read idx_proxy_status_check_order in order."""
+        median = await _median_ms(lambda: storage.load_revalidation_candidates(limit=100))
+        print(f"\nload_revalidation_candidates(limit=100) @ {ROWS:,} rows: {median:.2f}ms median")
+        assert median < 10.0
@@ -236,3 +236,162 @@ async def test_proxied_request_uses_rotator_path(api_client: AsyncClient, setup_
     assert response.status_code == 200
     mock_make.assert_called_once()
     assert rotator.last_used_proxy is not None
+
+
+@respx.mock
+async def test_streamed_request_relays_status_headers_and_body(
+    api_client: AsyncClient, setup_test_proxies
+):
+    """POST /api/request/stream relays the raw upstream response without an envelope."""
+    payload = b"x" * (256 * 1024)
+    respx.get("https://httpbin.org/bytes").mock(
+        return_value=Response(
+            206,
+            content=payload,
+            headers=[
+                ("Content-Type", "application/octet-stream"),
+                ("Set-Cookie", "a=1"),
+                ("Set-Cookie", "b=2"),
+                ("Connection", "keep-alive"),
+            ],
+        )
+    )
+
+    response = await api_client.post(
+        "/api/request/stream",
+        json={"url": "https://httpbin.org/bytes", "method": "GET", "timeout": 30},
+    )
+
+    assert response.status_code == 206
+    assert response.content == payload
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.headers.get_list("set-cookie") == ["a=1", "b=2"]
+    assert "connection" not in response.headers
+    assert response.headers["x-proxywhirl-proxy-used"].startswith("http://proxy")
+    assert int(response.headers["x-proxywhirl-elapsed-ms"]) >= 0
+
+
+@respx.mock
+async def test_streamed_request_rejects_oversized_upstream(
+    api_client: AsyncClient, setup_test_proxies, monkeypatch
+):
+    """Upstream bodies announced larger than the limit are rejected with 502."""
+    monkeypatch.setenv("PROXYWHIRL_STREAM_MAX_BYTES", "1024")
+    respx.get("https://httpbin.org/bytes").mock(return_value=Response(200, content=b"x" * 4096))
+
+    response = await api_client.post(
+        "/api/request/stream",
+        json={"url": "https://httpbin.org/bytes", "method": "GET", "timeout": 30},
+    )
+
+    assert response.status_code == 502
+    assert response.json()["status"] == "error"
+
+
+@respx.mock
+async def test_streamed_request_aborts_unannounced_oversized_upstream(
+    api_client: AsyncClient, setup_test_proxies, monkeypatch
+):
+    """Bodies without Content-Length abort mid-stream instead of ending truncated."""
+    import httpx
+
+    from proxywhirl.api.routes.proxies import _UpstreamBodyTooLargeError
+
+    monkeypatch.setenv("PROXYWHIRL_STREAM_MAX_BYTES", "1024")
+    respx.get("https://httpbin.org/stream-bytes").mock(
+        return_value=Response(200, stream=httpx.ByteStream(b"x" * 4096))
+    )
+
+    with pytest.raises(_UpstreamBodyTooLargeError):
+        await api_client.post(
+            "/api/request/stream",
+            json={"url": "https://httpbin.org/stream-bytes", "method": "GET", "timeout": 30},
+        )
+
+
+@respx.mock
+async def test_streamed_request_upstream_failure_returns_502(
+    api_client: AsyncClient, setup_test_proxies
+):
+    """Upstream connection errors surface as 502 without leaking proxy details."""
+    import httpx
+
+    respx.get("https://httpbin.org/get").mock(side_effect=httpx.ConnectError("refused"))
+
+    response = await api_client.post(
+        "/api/request/stream",
+        json={"url": "https://httpbin.org/get", "method": "GET", "timeout": 30},
+    )
+
+    assert response.status_code == 502
+    assert "proxy1.example.com" not in response.text
+
+
+async def test_streamed_request_empty_pool_returns_503(api_client: AsyncClient):
+    """An empty pool maps to 503 like the buffered endpoint."""
+    from proxywhirl import ProxyWhirl
+    from proxywhirl.models import BootstrapConfig
+
+    api_runtime.set_rotator(ProxyWhirl(bootstrap=BootstrapConfig(enabled=False)))
+    try:
+        response = await api_client.post(
+            "/api/request/stream",
+            json={"url": "https://httpbin.org/get", "method": "GET", "timeout": 30},
+        )
+    finally:
+        api_runtime.set_rotator(None)
+
+    assert response.status_code == 503
+
+
+@respx.mock
+async def test_streamed_request_applies_rate_limiter(api_client: AsyncClient):
+    """A rate-limited proxy is rejected before any upstream request is sent."""
+    from unittest.mock import MagicMock
+
+    from proxywhirl import ProxyWhirl
+    from proxywhirl.rate_limiting import SyncRateLimiter
+
+    rate_limiter = MagicMock(spec=SyncRateLimiter)
+    rate_limiter.check_limit.return_value = False
+    api_runtime.set_rotator(
+        ProxyWhirl(
+            proxies=[Proxy(url="http://proxy1.example.com:8080")],
+            rate_limiter=rate_limiter,
+        )
+    )
+    upstream = respx.get("https://httpbin.org/get").mock(return_value=Response(200))
+    try:
+        response = await api_client.post(
+            "/api/request/stream",
+            json={"url": "https://httpbin.org/get", "method": "GET", "timeout": 30},
+        )
+    finally:
+        api_runtime.set_rotator(None)
+
+    assert response.status_code == 503
+    rate_limiter.check_limit.assert_called_once()
+    assert not upstream.called
+
+
+@respx.mock
+async def test_streamed_request_records_last_used_proxy(api_client: AsyncClient):
+    """Streamed requests update the rotator's accounting like buffered ones."""
+    from proxywhirl import ProxyWhirl
+
+    proxy = Proxy(url="http://proxy1.example.com:8080")
+    rotator = ProxyWhirl(proxies=[proxy])
+    api_runtime.set_rotator(rotator)
+    respx.get("https://httpbin.org/get").mock(return_value=Response(200, content=b"ok"))
+    try:
+        response = await api_client.post(
+            "/api/request/stream",
+            json={"url": "https://httpbin.org/get", "method": "GET", "timeout": 30},
+        )
+    finally:
+        api_runtime.set_rotator(None)
+
+    assert response.status_code == 200
+    assert rotator.last_used_proxy is not None
+    assert rotator.last_used_proxy.id == proxy.id
+    assert rotator.last_used_proxy.total_successes == 1
@@ -1,5 +1,7 @@
 """Integration tests for browser-based proxy fetching."""
 
+import asyncio
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -186,3 +188,141 @@ class TestBrowserFetching:
                 urls = {p["url"] for p in proxies}
                 assert "http://1.2.3.4:8080" in urls
                 assert "http://5.6.7.8:3128" in urls
+
+
+class TestSharedBrowser:
+    """ProxyFetcher keeps one browser alive across BROWSER sources."""
+
+    @staticmethod
+    def _browser_module(html: str = "[]") -> tuple[MagicMock, AsyncMock]:
+        renderer = AsyncMock()
+        renderer.render = AsyncMock(return_value=html)
+        renderer.__aenter__ = AsyncMock(return_value=renderer)
+        renderer.__aexit__ = AsyncMock(return_value=None)
+        renderer.is_healthy = True
+        module = MagicMock()
+        module.BrowserRenderer = MagicMock(return_value=renderer)
+        return module, renderer
+
+    @staticmethod
+    def _source(path: str) -> ProxySourceConfig:
+        return ProxySourceConfig(
+            url=f"https://js-site.com/{path}", format="json", render_mode=RenderMode.BROWSER
+        )
+
+    async def test_renderer_is_shared_across_sources(self) -> None:
+        """Multiple sources reuse a single launched browser."""
+        module, renderer = self._browser_module()
+        fetcher = ProxyFetcher(sources=[self._source("a"), self._source("b")])
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            await fetcher.fetch_all(validate=False)
+            await fetcher.fetch_from_source(self._source("c"))
+            assert module.BrowserRenderer.call_count == 1
+            assert renderer.render.await_count == 3
+            renderer.__aexit__.assert_not_awaited()
+
+            await fetcher.close()
+
+        renderer.__aexit__.assert_awaited_once()
+
+    async def test_renderer_options(self) -> None:
+        """The shared browser gets the pool size and resource blocking settings."""
+        module, _ = self._browser_module()
+        fetcher = ProxyFetcher(browser_max_contexts=5, browser_block_resources=False)
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            await fetcher.fetch_from_source(self._source("a"))
+            await fetcher.close()
+
+        module.BrowserRenderer.assert_called_once_with(max_contexts=5, block_resource_types=None)
+
+    async def test_idle_browser_is_closed_and_relaunched(self) -> None:
+        """The browser shuts down after the idle timeout and relaunches on demand."""
+        module, renderer = self._browser_module()
+        fetcher = ProxyFetcher(browser_idle_timeout=0.05)
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            await fetcher.fetch_from_source(self._source("a"))
+            await asyncio.sleep(0.2)
+            renderer.__aexit__.assert_awaited_once()
+            assert fetcher._browser_renderer is None
+
+            await fetcher.fetch_from_source(self._source("b"))
+            assert module.BrowserRenderer.call_count == 2
+            await fetcher.close()
+
+    async def test_acquired_browser_is_not_closed_as_idle(self) -> None:
+        """A renderer handed out for a render counts as in flight before it is used."""
+        module, renderer = self._browser_module()
+        fetcher = ProxyFetcher(browser_idle_timeout=0.01)
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            acquired = await fetcher._acquire_browser_renderer()
+            fetcher._browser_last_used = 0.0
+            await fetcher._close_browser_renderer(only_if_idle=True)
+
+            assert fetcher._browser_renderer is acquired
+            renderer.__aexit__.assert_not_awaited()
+
+            fetcher._browser_in_flight -= 1
+            await fetcher.close()
+
+    async def test_disconnected_browser_is_relaunched(self) -> None:
+        """A crashed browser is replaced on the next render."""
+        module, renderer = self._browser_module()
+        fetcher = ProxyFetcher(browser_idle_timeout=None)
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            await fetcher.fetch_from_source(self._source("a"))
+            renderer.is_healthy = False
+            await fetcher.fetch_from_source(self._source("b"))
+            await fetcher.close()
+
+        assert module.BrowserRenderer.call_count == 2
+
+    def test_browser_of_stopped_loop_is_terminated(self) -> None:
+        """A browser left behind by a finished event loop is killed, not leaked."""
+        module, first = self._browser_module()
+        _, second = self._browser_module()
+        first.terminate = MagicMock()
+        second.terminate = MagicMock()
+        module.BrowserRenderer.side_effect = [first, second]
+        fetcher = ProxyFetcher(browser_idle_timeout=None)
+
+        with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+            asyncio.run(fetcher.fetch_from_source(self._source("a")))
+            asyncio.run(fetcher.fetch_from_source(self._source("b")))
+            first.terminate.assert_called_once()
+            second.terminate.assert_not_called()
+
+            asyncio.run(fetcher.close())
+
+        second.terminate.assert_called_once()
+        assert fetcher._browser_renderer is None
+
+    async def test_browser_of_running_loop_is_closed_there(self) -> None:
+        """A browser owned by a loop in another thread is closed on that loop."""
+        module, renderer = self._browser_module()
+        renderer.terminate = MagicMock()
+        fetcher = ProxyFetcher(browser_idle_timeout=None)
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            with patch.dict("sys.modules", {"proxywhirl.browser": module}):
+                asyncio.run_coroutine_threadsafe(
+                    fetcher.fetch_from_source(self._source("a")), other_loop
+                ).result(timeout=5)
+                await fetcher.close()
+
+            for _ in range(100):
+                if renderer.__aexit__.await_count:
+                    break
+                await asyncio.sleep(0.01)
+            renderer.__aexit__.assert_awaited_once()
+            renderer.terminate.assert_not_called()
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join(timeout=5)
+            other_loop.close()
@@ -6,10 +6,18 @@ least recently used and least frequently used eviction strategies.
 
 from __future__ import annotations
 
+import pytest
+
 from proxywhirl.cache import CacheManager
 from proxywhirl.cache.models import CacheConfig, CacheTierConfig
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cache_files(tmp_path, monkeypatch):
+    """Keep the default relative L2/L3 cache paths out of the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestCacheEvictionOrder:
     """Test suite for cache eviction policies."""
 
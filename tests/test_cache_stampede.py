@@ -19,6 +19,12 @@ from proxywhirl.cache.manager import CacheManager
 from proxywhirl.cache.models import CacheConfig, CacheTierConfig
 
 
+@pytest.fixture(autouse=True)
+def _isolate_cache_files(tmp_path, monkeypatch):
+    """Keep the default relative L2/L3 cache paths out of the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestCacheStampedePrevention:
     """Test cache stampede prevention strategies."""
 
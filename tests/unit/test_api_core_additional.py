@@ -12,6 +12,7 @@ import httpx
 import pytest
 from fastapi import HTTPException, Request, Response
 from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
 
 from proxywhirl.api import app
 from proxywhirl.api import core as api_core
@@ -183,9 +184,13 @@ async def test_lifespan_initializes_and_saves(tmp_path, monkeypatch) -> None:
         "host": "proxy.example.com",
         "port": 8080,
     }
+
+    async def iter_proxies(*args, **kwargs):
+        yield proxy_row
+
     with patch.object(api_core.SQLiteStorage, "initialize", AsyncMock()) as initialize_mock:
         with patch.object(
-            api_core.SQLiteStorage, "load", AsyncMock(return_value=[proxy_row])
+            api_core.SQLiteStorage, "iter_proxies", MagicMock(side_effect=iter_proxies)
         ) as load_mock:
             with patch.object(api_core.SQLiteStorage, "save", AsyncMock()) as save_mock:
                 async with api_core.lifespan(app):
@@ -195,7 +200,7 @@ async def test_lifespan_initializes_and_saves(tmp_path, monkeypatch) -> None:
                     assert rotator.pool.size == 1
                     assert api_runtime.get_config()["cors_origins"] == ["http://example.com"]
                 initialize_mock.assert_awaited_once()
-                load_mock.assert_awaited_once()
+                load_mock.assert_called_once()
                 save_mock.assert_awaited_once()
 
 
@@ -256,7 +261,7 @@ async def test_lifespan_handles_load_failure(tmp_path, monkeypatch) -> None:
 
     with patch.object(api_core.SQLiteStorage, "initialize", AsyncMock()):
         with patch.object(
-            api_core.SQLiteStorage, "load", AsyncMock(side_effect=RuntimeError("boom"))
+            api_core.SQLiteStorage, "iter_proxies", MagicMock(side_effect=RuntimeError("boom"))
         ):
             async with api_core.lifespan(app):
                 assert api_runtime.get_current_rotator() is not None
@@ -552,44 +557,94 @@ def test_get_rotator_raises_when_uninitialized() -> None:
     assert exc_info.value.status_code == 503
 
 
+async def _call_middleware(middleware, request: Request) -> Headers:
+    """Drive an ASGI middleware with ``request`` and return the response headers."""
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await middleware(request.scope, receive, send)
+    start = next(message for message in messages if message["type"] == "http.response.start")
+    return Headers(raw=start["headers"])
+
+
 @pytest.mark.asyncio
 async def test_request_id_middleware_sets_header() -> None:
     """Request ID middleware should preserve provided request ID."""
-    middleware = api_core.RequestIDMiddleware(app)
+    middleware = api_core.RequestIDMiddleware(Response("ok"))
     request = _make_request(headers={"X-Request-ID": "req-123"})
 
-    async def call_next(_: Request) -> Response:
-        return Response("ok")
+    headers = await _call_middleware(middleware, request)
+    assert headers["X-Request-ID"] == "req-123"
 
-    response = await middleware.dispatch(request, call_next)
-    assert response.headers["X-Request-ID"] == "req-123"
+
+@pytest.mark.asyncio
+async def test_request_id_middleware_replaces_unsafe_header() -> None:
+    """Request ID middleware should not echo IDs that could inject log lines."""
+    middleware = api_core.RequestIDMiddleware(Response("ok"))
+    request = _make_request(headers={"X-Request-ID": "bad\tid"})
+
+    headers = await _call_middleware(middleware, request)
+    assert headers["X-Request-ID"] != "bad\tid"
+    assert len(headers.getlist("X-Request-ID")) == 1
 
 
 @pytest.mark.asyncio
 async def test_security_headers_middleware_adds_headers() -> None:
     """Security headers middleware should add expected headers."""
-    middleware = api_core.SecurityHeadersMiddleware(app)
+    middleware = api_core.SecurityHeadersMiddleware(
+        Response("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+    )
     request = _make_request()
 
-    async def call_next(_: Request) -> Response:
-        return Response("ok")
-
-    response = await middleware.dispatch(request, call_next)
-    assert response.headers["X-Content-Type-Options"] == "nosniff"
-    assert response.headers["X-Frame-Options"] == "DENY"
+    headers = await _call_middleware(middleware, request)
+    assert headers["X-Content-Type-Options"] == "nosniff"
+    assert headers.getlist("X-Frame-Options") == ["DENY"]
 
 
 @pytest.mark.asyncio
 async def test_request_logging_middleware_exception_path() -> None:
     """Request logging middleware should re-raise exceptions."""
-    middleware = api_core.RequestLoggingMiddleware(app)
-    request = _make_request(path="/boom", query_string="token=secret")
 
-    async def call_next(_: Request) -> Response:
+    async def failing_app(scope, receive, send) -> None:
         raise RuntimeError("boom")
 
+    middleware = api_core.RequestLoggingMiddleware(failing_app)
+    request = _make_request(path="/boom", query_string="token=secret")
+
     with pytest.raises(RuntimeError):
-        await middleware.dispatch(request, call_next)
+        await _call_middleware(middleware, request)
+
+
+@pytest.mark.asyncio
+async def test_audit_logging_middleware_replays_request_body() -> None:
+    """Audit middleware must hand the consumed request body on to the app."""
+    received: list[bytes] = []
+
+    async def echo_app(scope, receive, send) -> None:
+        message = await receive()
+        received.append(message["body"])
+        await Response("ok")(scope, receive, send)
+
+    middleware = api_core.AuditLoggingMiddleware(echo_app, audit_log=True)
+    request = _make_request(path="/api/proxies", method="POST")
+    chunks = [
+        {"type": "http.request", "body": b'{"url": "http://p', "more_body": True},
+        {"type": "http.request", "body": b'.example.com:80"}', "more_body": False},
+    ]
+
+    async def receive() -> dict:
+        return chunks.pop(0)
+
+    async def send(message: dict) -> None:
+        pass
+
+    await middleware(request.scope, receive, send)
+    assert received == [b'{"url": "http://p.example.com:80"}']
 
 
 @pytest.mark.asyncio
@@ -833,9 +888,10 @@ async def test_get_status_and_stats() -> None:
     assert status_response.status == "success"
     assert status_response.data.pool_stats.failed == 1
 
-    stats_response = await get_stats(rotator)
-    assert stats_response.status == "success"
-    assert stats_response.data.requests_total == 5
+    stats_response = await get_stats(_make_request(), rotator)
+    stats_body = json.loads(stats_response.body)
+    assert stats_body["status"] == "success"
+    assert stats_body["data"]["requests_total"] == 5
 
 
 @pytest.mark.asyncio
@@ -931,11 +987,11 @@ async def test_circuit_breaker_endpoints() -> None:
     rotator.reset_circuit_breaker = MagicMock()
     api_runtime.set_rotator(rotator)
 
-    list_response = await list_circuit_breakers(None)
-    assert list_response.status == "success"
+    list_response = await list_circuit_breakers(_make_request(), None)
+    assert json.loads(list_response.body)["status"] == "success"
 
-    metrics_response = await get_circuit_breaker_metrics(24, None)
-    assert metrics_response.status == "success"
+    metrics_response = await get_circuit_breaker_metrics(_make_request(), 24, None)
+    assert json.loads(metrics_response.body)["status"] == "success"
 
     get_response = await get_circuit_breaker("proxy-1", None)
     assert get_response.status == "success"
@@ -983,14 +1039,14 @@ async def test_retry_metrics_endpoints() -> None:
     rotator.get_retry_metrics.return_value = metrics
     api_runtime.set_rotator(rotator)
 
-    summary_response = await get_retry_metrics(None)
-    assert summary_response.status == "success"
+    summary_response = await get_retry_metrics(_make_request(), None)
+    assert json.loads(summary_response.body)["status"] == "success"
 
-    timeseries_response = await get_retry_timeseries(24, None)
-    assert timeseries_response.status == "success"
+    timeseries_response = await get_retry_timeseries(_make_request(), 24, None)
+    assert json.loads(timeseries_response.body)["status"] == "success"
 
-    by_proxy_response = await get_retry_stats_by_proxy(24, None)
-    assert by_proxy_response.status == "success"
+    by_proxy_response = await get_retry_stats_by_proxy(_make_request(), 24, None)
+    assert json.loads(by_proxy_response.body)["status"] == "success"
 
 
 @pytest.mark.asyncio
@@ -1029,6 +1085,7 @@ async def test_circuit_breaker_metrics_endpoint() -> None:
     rotator.get_retry_metrics.return_value = metrics
     api_runtime.set_rotator(rotator)
 
-    response = await get_circuit_breaker_metrics(24, None)
-    assert response.status == "success"
-    assert response.data is not None
+    response = await get_circuit_breaker_metrics(_make_request(), 24, None)
+    body = json.loads(response.body)
+    assert body["status"] == "success"
+    assert body["data"] is not None
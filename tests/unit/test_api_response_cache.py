@@ -0,0 +1,211 @@
+"""Unit tests for version-keyed API response caching and ETags."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from proxywhirl.api import app
+from proxywhirl.api import runtime as api_runtime
+from proxywhirl.api.models import APIResponse
+from proxywhirl.api.response_cache import (
+    ResponseCache,
+    cache_key,
+    compute_etag,
+    etag_matches,
+    rotator_version_key,
+)
+from proxywhirl.circuit_breaker import (
+    CIRCUIT_BREAKER_STATE_VERSION,
+    CircuitBreaker,
+    CircuitBreakerState,
+)
+from proxywhirl.models import HealthStatus, Proxy
+from proxywhirl.retry import CircuitBreakerEvent, RetryMetrics
+from proxywhirl.rotator import ProxyWhirl
+
+
+@pytest.fixture
+def rotator() -> ProxyWhirl:
+    """Install a rotator with two proxies as the API singleton."""
+    api_runtime.reset_api_state()
+    rotator = ProxyWhirl()
+    rotator.add_proxy(Proxy(url="http://proxy1.example.com:8080"))
+    rotator.add_proxy(Proxy(url="http://proxy2.example.com:8080"))
+    api_runtime.set_rotator(rotator)
+    yield rotator
+    api_runtime.reset_api_state()
+
+
+@pytest.fixture
+def client(rotator: ProxyWhirl) -> TestClient:
+    """Create a test client for the FastAPI app."""
+    return TestClient(app)
+
+
+class TestEtagMatching:
+    """Tests for If-None-Match evaluation."""
+
+    def test_exact_match(self) -> None:
+        etag = compute_etag(b"body")
+        assert etag_matches(etag, etag)
+
+    def test_list_and_weak_prefix(self) -> None:
+        etag = compute_etag(b"body")
+        assert etag_matches(f'"other", W/{etag}', etag)
+
+    def test_wildcard(self) -> None:
+        assert etag_matches("*", compute_etag(b"body"))
+
+    def test_mismatch_or_missing(self) -> None:
+        etag = compute_etag(b"body")
+        assert not etag_matches(compute_etag(b"other"), etag)
+        assert not etag_matches(None, etag)
+
+
+class TestResponseCache:
+    """Tests for the LRU response cache."""
+
+    def test_put_then_get(self) -> None:
+        cache = ResponseCache()
+        stored = cache.put(("k",), APIResponse.success(data={"a": 1}))
+
+        assert cache.get(("k",)) is stored
+        assert stored.etag == compute_etag(stored.body)
+
+    def test_none_key_is_never_stored(self) -> None:
+        cache = ResponseCache()
+        cache.put(None, APIResponse.success(data={"a": 1}))
+
+        assert len(cache) == 0
+        assert cache.get(None) is None
+
+    def test_max_age_expires_entries(self) -> None:
+        cache = ResponseCache()
+        cache.put(("k",), APIResponse.success(data={"a": 1}))
+
+        assert cache.get(("k",), max_age=60) is not None
+        assert cache.get(("k",), max_age=0) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        cache.put(("a",), APIResponse.success(data=1))
+        cache.put(("b",), APIResponse.success(data=2))
+        cache.get(("a",))
+        cache.put(("c",), APIResponse.success(data=3))
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+
+    def test_cache_key_requires_versions(self) -> None:
+        assert cache_key("proxies", (None,), 1) is None
+        assert cache_key("proxies", ((1, 2, 3),), 1, None) == ("proxies", ((1, 2, 3),), (1, None))
+
+
+class TestVersionCounters:
+    """Tests for the version counters that key cached responses."""
+
+    def test_rotator_version_changes_with_proxy_stats(self, rotator: ProxyWhirl) -> None:
+        before = rotator_version_key(rotator)
+        rotator.pool.get_all_proxies()[0].record_success(50.0)
+
+        assert rotator_version_key(rotator) != before
+
+    def test_rotator_version_key_skips_unversioned_pools(self) -> None:
+        class Unversioned:
+            pool = object()
+
+        assert rotator_version_key(Unversioned()) is None
+
+    def test_circuit_breaker_transitions_bump_version(self) -> None:
+        breaker = CircuitBreaker(proxy_id="p", failure_threshold=1)
+        before = CIRCUIT_BREAKER_STATE_VERSION.value
+        breaker.record_failure()
+        after_open = CIRCUIT_BREAKER_STATE_VERSION.value
+        breaker.reset()
+
+        assert before < after_open < CIRCUIT_BREAKER_STATE_VERSION.value
+
+    def test_retry_metrics_version_bumps_on_events(self) -> None:
+        metrics = RetryMetrics()
+        assert metrics.version == 0
+        metrics.record_circuit_breaker_event(
+            CircuitBreakerEvent(
+                proxy_id="p",
+                from_state=CircuitBreakerState.CLOSED,
+                to_state=CircuitBreakerState.OPEN,
+                timestamp=datetime.now(timezone.utc),
+                failure_count=5,
+            )
+        )
+        assert metrics.version == 1
+
+
+class TestCachedEndpoints:
+    """End-to-end ETag behaviour of cached read endpoints."""
+
+    def test_list_proxies_returns_etag_and_304(self, client: TestClient) -> None:
+        first = client.get("/api/proxies")
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        assert first.json()["data"]["total"] == 2
+
+        second = client.get("/api/proxies", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    def test_list_proxies_serves_cached_body_until_pool_changes(
+        self, client: TestClient, rotator: ProxyWhirl
+    ) -> None:
+        first = client.get("/api/proxies")
+        assert client.get("/api/proxies").content == first.content
+
+        rotator.add_proxy(Proxy(url="http://proxy3.example.com:8080"))
+        changed = client.get("/api/proxies", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != first.headers["ETag"]
+        assert changed.json()["data"]["total"] == 3
+
+    def test_list_proxies_cache_is_keyed_by_query(self, client: TestClient) -> None:
+        page_one = client.get("/api/proxies", params={"page_size": 1})
+        page_two = client.get("/api/proxies", params={"page_size": 1, "page": 2})
+
+        assert page_one.headers["ETag"] != page_two.headers["ETag"]
+
+    def test_list_proxies_reflects_health_check_writes(
+        self, client: TestClient, rotator: ProxyWhirl
+    ) -> None:
+        from proxywhirl.cli import _record_health_check
+
+        first = client.get("/api/proxies")
+        _record_health_check(rotator.pool.get_all_proxies()[0], None, 0.0)
+        changed = client.get("/api/proxies", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert changed.status_code == 200
+        health = [item["health"] for item in changed.json()["data"]["items"]]
+        assert HealthStatus.UNHEALTHY.value in health
+
+    def test_list_proxies_expires_after_ttl(
+        self, client: TestClient, rotator: ProxyWhirl, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(api_runtime, "_response_cache_ttl", 0.0)
+        first = client.get("/api/proxies")
+        # An unversioned write still shows up once the entry expires
+        rotator.pool.get_all_proxies()[0].health_status = HealthStatus.DEAD
+        changed = client.get("/api/proxies", headers={"If-None-Match": first.headers["ETag"]})
+
+        assert changed.status_code == 200
+        health = [item["health"] for item in changed.json()["data"]["items"]]
+        assert HealthStatus.DEAD.value in health
+
+    def test_stats_and_retry_metrics_support_conditional_requests(self, client: TestClient) -> None:
+        for path in ("/api/stats", "/api/metrics/retries", "/api/circuit-breakers"):
+            first = client.get(path)
+            assert first.status_code == 200, path
+            repeat = client.get(path, headers={"If-None-Match": first.headers["ETag"]})
+            assert repeat.status_code == 304, path
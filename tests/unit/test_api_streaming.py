@@ -0,0 +1,92 @@
+"""Unit tests for streaming response helpers in proxywhirl.api.streaming."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from proxywhirl.api.streaming import (
+    stream_csv_lines,
+    stream_json_lines,
+    stream_proxies_as_jsonl,
+    stream_text_lines,
+)
+
+
+async def _collect(generator: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in generator]
+
+
+async def _aiter(items: list[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+class TestStreamJsonLines:
+    """Tests for stream_json_lines."""
+
+    async def test_yields_bytes_with_one_object_per_line(self) -> None:
+        """Test output is bytes and each line decodes to the original row."""
+        rows = [{"id": i, "name": f"proxy{i}"} for i in range(10)]
+
+        chunks = await _collect(stream_json_lines(rows))
+
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == rows
+
+    async def test_coalesces_rows_into_chunks(self) -> None:
+        """Test rows are buffered into chunks of roughly chunk_size bytes."""
+        rows = [{"id": i} for i in range(1000)]
+
+        chunks = await _collect(stream_json_lines(rows, chunk_size=1024, batch_size=100))
+
+        assert 1 < len(chunks) < len(rows)
+        # Every chunk ends on a line boundary
+        assert all(chunk.endswith(b"\n") for chunk in chunks)
+        assert len(b"".join(chunks).splitlines()) == 1000
+
+    async def test_accepts_async_iterable(self) -> None:
+        """Test async iterables are consumed like sync ones."""
+        rows = [{"id": i} for i in range(3)]
+
+        chunks = await _collect(stream_json_lines(_aiter(rows)))
+
+        assert b"".join(chunks) == b'{"id":0}\n{"id":1}\n{"id":2}\n'
+
+    async def test_empty_input_yields_nothing(self) -> None:
+        """Test empty input produces no chunks."""
+        assert await _collect(stream_json_lines([])) == []
+
+
+class TestStreamProxiesAsJsonl:
+    """Tests for stream_proxies_as_jsonl."""
+
+    async def test_skips_unserializable_rows(self) -> None:
+        """Test rows that fail JSON encoding are skipped."""
+        rows = [{"url": "http://a:1"}, {"url": object()}, {"url": "http://b:2"}]
+
+        chunks = await _collect(stream_proxies_as_jsonl(rows))
+
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line)["url"] for line in lines] == ["http://a:1", "http://b:2"]
+
+
+class TestStreamTextAndCsv:
+    """Tests for stream_text_lines and stream_csv_lines."""
+
+    async def test_text_lines_newline_terminated(self) -> None:
+        """Test each string becomes one newline-terminated line."""
+        chunks = await _collect(stream_text_lines(["a", "b", "c"]))
+
+        assert b"".join(chunks) == b"a\nb\nc\n"
+
+    async def test_csv_header_then_rows(self) -> None:
+        """Test CSV output starts with the header followed by each row."""
+        rows = [{"host": f"h{i}", "port": 8000 + i} for i in range(3)]
+
+        chunks = await _collect(stream_csv_lines(rows, fieldnames=["host", "port"]))
+
+        lines = b"".join(chunks).decode().splitlines()
+        assert lines == ["host,port", "h0,8000", "h1,8001", "h2,8002"]
@@ -820,3 +820,146 @@ class TestBrowserRendererPooledVsUnpooledBenchmark:
         # Without pooling: 10 contexts were created for 10 pages
         assert context_creation_count == 10
         assert unpooled_duration >= 0  # Just verify it ran
+
+
+class TestBrowserRendererResourceBlocking:
+    """Test request interception for blocked resource types."""
+
+    async def test_start_routes_contexts_when_blocking(self) -> None:
+        """Every pooled context gets a route handler when resource types are blocked."""
+        from proxywhirl.browser import DEFAULT_BLOCKED_RESOURCE_TYPES, BrowserRenderer
+
+        renderer = BrowserRenderer(
+            max_contexts=2, block_resource_types=DEFAULT_BLOCKED_RESOURCE_TYPES
+        )
+
+        mock_playwright = MagicMock()
+        mock_browser = AsyncMock()
+        contexts = [AsyncMock(), AsyncMock()]
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_playwright.stop = AsyncMock()
+        mock_browser.new_context = AsyncMock(side_effect=contexts)
+        mock_playwright_cm = MagicMock()
+        mock_playwright_cm.start = AsyncMock(return_value=mock_playwright)
+        mock_module = MagicMock()
+        mock_module.async_playwright = lambda: mock_playwright_cm
+
+        with patch.dict("sys.modules", {"playwright.async_api": mock_module}):
+            await renderer.start()
+            await renderer.close()
+
+        for context in contexts:
+            context.route.assert_awaited_once_with("**/*", renderer._route_request)
+
+    async def test_no_routes_without_blocking(self) -> None:
+        """Contexts are not intercepted by default."""
+        from proxywhirl.browser import BrowserRenderer
+
+        renderer = BrowserRenderer(max_contexts=1)
+        mock_playwright = MagicMock()
+        mock_browser = AsyncMock()
+        context = AsyncMock()
+        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_playwright.stop = AsyncMock()
+        mock_browser.new_context = AsyncMock(return_value=context)
+        mock_playwright_cm = MagicMock()
+        mock_playwright_cm.start = AsyncMock(return_value=mock_playwright)
+        mock_module = MagicMock()
+        mock_module.async_playwright = lambda: mock_playwright_cm
+
+        with patch.dict("sys.modules", {"playwright.async_api": mock_module}):
+            await renderer.start()
+            await renderer.close()
+
+        context.route.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        ("resource_type", "aborted"),
+        [
+            ("image", True),
+            ("font", True),
+            ("stylesheet", True),
+            ("document", False),
+            ("xhr", False),
+        ],
+    )
+    async def test_route_request(self, resource_type: str, aborted: bool) -> None:
+        """Blocked resource types are aborted, everything else continues."""
+        from proxywhirl.browser import DEFAULT_BLOCKED_RESOURCE_TYPES, BrowserRenderer
+
+        renderer = BrowserRenderer(block_resource_types=DEFAULT_BLOCKED_RESOURCE_TYPES)
+        route = AsyncMock()
+        route.request = MagicMock(resource_type=resource_type)
+
+        await renderer._route_request(route)
+
+        assert route.abort.await_count == int(aborted)
+        assert route.continue_.await_count == int(not aborted)
+
+    async def test_render_updates_idle_clock(self) -> None:
+        """render() resets idle_seconds."""
+        from proxywhirl.browser import BrowserRenderer
+
+        renderer = BrowserRenderer(max_contexts=1)
+        mock_page = AsyncMock()
+        mock_page.content = AsyncMock(return_value="<html></html>")
+        mock_context = AsyncMock()
+        mock_context.new_page = AsyncMock(return_value=mock_page)
+        renderer._is_started = True
+        renderer._context_pool = asyncio.Queue(maxsize=1)
+        renderer._all_contexts = [mock_context]
+        await renderer._context_pool.put(mock_context)
+        renderer._last_used = time.monotonic() - 100
+
+        await renderer.render("https://example.com")
+
+        assert renderer.idle_seconds < 100
+
+    @pytest.mark.parametrize("returncode", [None, 0])
+    def test_terminate_signals_running_driver(self, returncode: int | None) -> None:
+        """terminate() kills a still-running Playwright driver without awaiting."""
+        import signal
+
+        from proxywhirl.browser import BrowserRenderer
+
+        renderer = BrowserRenderer()
+        process = MagicMock(pid=4321, returncode=returncode)
+        renderer._playwright = MagicMock()
+        renderer._playwright._impl_obj._connection._transport._proc = process
+        renderer._browser = MagicMock()
+        renderer._is_started = True
+
+        with patch("proxywhirl.browser.os.kill") as kill:
+            renderer.terminate()
+            renderer.terminate()
+
+        if returncode is None:
+            kill.assert_called_once_with(process.pid, signal.SIGTERM)
+        else:
+            kill.assert_not_called()
+        assert renderer._browser is None
+        assert renderer._playwright is None
+        assert renderer._is_started is False
+
+    def test_terminate_warns_when_driver_is_not_found(self) -> None:
+        """terminate() logs instead of silently leaking when Playwright internals change."""
+        from types import SimpleNamespace
+
+        from loguru import logger
+
+        from proxywhirl.browser import BrowserRenderer
+
+        renderer = BrowserRenderer()
+        renderer._playwright = SimpleNamespace(_impl_obj=SimpleNamespace())  # type: ignore[assignment]
+        renderer._is_started = True
+        messages: list[str] = []
+        sink_id = logger.add(messages.append, level="WARNING", format="{message}")
+        try:
+            with patch("proxywhirl.browser.os.kill") as kill:
+                renderer.terminate()
+        finally:
+            logger.remove(sink_id)
+
+        kill.assert_not_called()
+        assert any("Playwright driver process" in message for message in messages)
+        assert renderer._playwright is None
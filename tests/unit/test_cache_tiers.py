@@ -6,6 +6,7 @@ Tests for MemoryCacheTier, JsonlCacheTier, DiskCacheTier, and SQLiteCacheTier.
 import json
 import sqlite3
 import threading
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -387,10 +388,11 @@ class TestJsonlCacheTier:
 
         # Remove index entry to force file read, then mock Lock to raise exception
         tier._index.clear()
-        tier._index[sample_entry.key] = 0  # Re-add to index to trigger read
+        # Re-add to index at a stale offset to force a shard re-scan
+        tier._index[sample_entry.key] = (tier._get_shard_id(sample_entry.key), 10**6)
         with patch("proxywhirl.cache.tiers.portalocker.Lock", side_effect=Exception("Lock error")):
             result = tier.get(sample_entry.key)
-            # Result is None because _read_shard fails silently and returns empty dict
+            # Result is None because re-scanning the shard fails to take its lock
             assert result is None
 
     def test_put_exception_handling(
@@ -399,8 +401,8 @@ class TestJsonlCacheTier:
         """Test put handles exceptions gracefully."""
         tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path)
 
-        # Force exception during read or write by mocking Lock
-        with patch.object(tier, "_read_shard", side_effect=Exception("Read error")):
+        # Force exception during the append
+        with patch.object(tier, "_append_records", side_effect=Exception("Write error")):
             result = tier.put(sample_entry.key, sample_entry)
             assert result is False
             assert tier.failure_count == 1
@@ -429,8 +431,8 @@ class TestJsonlCacheTier:
         tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path)
         tier.put(sample_entry.key, sample_entry)
 
-        # Force exception during read by mocking _read_shard
-        with patch.object(tier, "_read_shard", side_effect=Exception("Read error")):
+        # Force exception while appending the tombstone
+        with patch.object(tier, "_append_records", side_effect=Exception("Write error")):
             result = tier.delete(sample_entry.key)
             assert result is False
             assert tier.failure_count == 1
@@ -529,6 +531,7 @@ class TestJsonlCacheTier:
         for thread in threads:
             thread.join()
 
+        tier.compact()
         shard_rows = [
             json.loads(line)
             for line in tier._get_shard_path(0).read_text().splitlines()
@@ -759,6 +762,174 @@ class TestJsonlCacheTier:
             assert result.key == f"concurrent-{i}"
             assert result.proxy_url == f"http://proxy{i}.example.com:8080"
 
+    def test_put_appends_instead_of_rewriting(
+        self, tier_config: CacheTierConfig, tmp_path: Path, sample_entry: CacheEntry
+    ) -> None:
+        """Overwriting a key appends a record and reads return the latest one."""
+        tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        tier.put(sample_entry.key, sample_entry)
+        first_line = tier._get_shard_path(0).read_text().splitlines()[0]
+
+        updated = sample_entry.model_copy(update={"proxy_url": "http://updated.com:8080"})
+        with patch.object(tier, "_read_shard", side_effect=AssertionError("shard re-read")):
+            assert tier.put(updated.key, updated) is True
+
+        lines = tier._get_shard_path(0).read_text().splitlines()
+        assert lines[0] == first_line
+        assert len(lines) == 2
+        result = tier.get(sample_entry.key)
+        assert result is not None
+        assert result.proxy_url == "http://updated.com:8080"
+
+    def test_delete_appends_tombstone_that_survives_reload(
+        self, tier_config: CacheTierConfig, tmp_path: Path, sample_entry: CacheEntry
+    ) -> None:
+        """Deletes are tombstones, so a rebuilt index does not resurrect the key."""
+        tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        tier.put(sample_entry.key, sample_entry)
+        assert tier.delete(sample_entry.key) is True
+
+        last = json.loads(tier._get_shard_path(0).read_text().splitlines()[-1])
+        assert last == {"key": sample_entry.key, "deleted": True}
+
+        reloaded = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        assert reloaded.size() == 0
+        assert reloaded.get(sample_entry.key) is None
+
+    def test_get_seeks_to_indexed_line(self, tier_config: CacheTierConfig, tmp_path: Path) -> None:
+        """Reads use the offset index instead of replaying the shard."""
+        tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        now = datetime.now(timezone.utc)
+        for i in range(20):
+            entry = CacheEntry(
+                key=f"key-{i}",
+                proxy_url=f"http://proxy{i}.example.com:8080",
+                source="test",
+                fetch_time=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                expires_at=now + timedelta(hours=1),
+            )
+            tier.put(entry.key, entry)
+
+        with patch.object(tier, "_scan_shard", side_effect=AssertionError("shard replayed")):
+            result = tier.get("key-13")
+        assert result is not None
+        assert result.proxy_url == "http://proxy13.example.com:8080"
+
+    def test_compaction_reclaims_dead_records(
+        self, tier_config: CacheTierConfig, tmp_path: Path, sample_entry: CacheEntry
+    ) -> None:
+        """Crossing the garbage threshold rewrites the shard with live records only."""
+        tier = JsonlCacheTier(
+            tier_config,
+            TierType.L2_FILE,
+            tmp_path,
+            num_shards=1,
+            compaction_ratio=0.5,
+            compaction_min_garbage=5,
+        )
+        compacted = threading.Event()
+        original = tier._compact_shard
+
+        def compact_and_signal(shard_id: int, expired_before: datetime | None = None) -> int:
+            removed = original(shard_id, expired_before)
+            compacted.set()
+            return removed
+
+        with patch.object(tier, "_compact_shard", side_effect=compact_and_signal):
+            for i in range(10):
+                updated = sample_entry.model_copy(update={"access_count": i})
+                tier.put(updated.key, updated)
+            assert compacted.wait(timeout=5)
+
+        tier.compact()
+        lines = tier._get_shard_path(0).read_text().splitlines()
+        assert len(lines) == 1
+        result = tier.get(sample_entry.key)
+        assert result is not None
+        assert result.access_count == 9
+
+    def test_compaction_does_not_block_writes_during_rewrite(
+        self, tier_config: CacheTierConfig, tmp_path: Path
+    ) -> None:
+        """Writes made while a shard is rewritten proceed and survive the swap."""
+        now = datetime.now(timezone.utc)
+
+        def make_entry(key: str, url: str) -> CacheEntry:
+            return CacheEntry(
+                key=key,
+                proxy_url=url,
+                source="test",
+                fetch_time=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                expires_at=now + timedelta(hours=1),
+            )
+
+        tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        for i in range(3):
+            tier.put(f"key-{i}", make_entry(f"key-{i}", f"http://proxy{i}.example.com:8080"))
+        tier.delete("key-2")
+        original = tier._write_temp_shard
+
+        def write_with_concurrent_writes(
+            shard_id: int, entries: dict[str, dict]
+        ) -> tuple[Path, dict[str, int]] | None:
+            def write() -> None:
+                tier.put("key-0", make_entry("key-0", "http://updated.example.com:8080"))
+                tier.put("key-3", make_entry("key-3", "http://proxy3.example.com:8080"))
+                tier.delete("key-1")
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            writer.join(timeout=5)
+            assert not writer.is_alive(), "write blocked by compaction"
+            return original(shard_id, entries)
+
+        with patch.object(tier, "_write_temp_shard", side_effect=write_with_concurrent_writes):
+            assert tier.compact() == 2
+
+        assert sorted(tier.keys()) == ["key-0", "key-3"]
+        result = tier.get("key-0")
+        assert result is not None
+        assert result.proxy_url == "http://updated.example.com:8080"
+        assert tier.get("key-1") is None
+        reloaded = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        assert sorted(reloaded.keys()) == ["key-0", "key-3"]
+        assert reloaded._shard_records[0] == tier._shard_records[0]
+
+    def test_get_recovers_after_external_rewrite(
+        self, tier_config: CacheTierConfig, tmp_path: Path
+    ) -> None:
+        """A shard compacted by another process is re-scanned on a stale offset."""
+        now = datetime.now(timezone.utc)
+        entries = [
+            CacheEntry(
+                key=f"key-{i}",
+                proxy_url=f"http://proxy{i}.example.com:8080",
+                source="test",
+                fetch_time=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                expires_at=now + timedelta(hours=1),
+            )
+            for i in range(3)
+        ]
+        tier = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        other = JsonlCacheTier(tier_config, TierType.L2_FILE, tmp_path, num_shards=1)
+        for entry in entries:
+            tier.put(entry.key, entry)
+        other._rebuild_index()
+        other.delete("key-0")
+        other.compact()
+
+        result = tier.get("key-2")
+        assert result is not None
+        assert result.proxy_url == "http://proxy2.example.com:8080"
+        assert tier.get("key-0") is None
+        assert "key-0" not in tier.keys()
+
 
 class TestDiskCacheTier:
     """Tests for DiskCacheTier (SQLite-based L2 cache)."""
@@ -1157,6 +1328,9 @@ class TestSQLiteCacheTier:
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
         tier.put(sample_entry.key, sample_entry)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             result = tier.get(sample_entry.key)
@@ -1170,6 +1344,9 @@ class TestSQLiteCacheTier:
         db_path = tmp_path / "cache.db"
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             result = tier.put(sample_entry.key, sample_entry)
@@ -1204,6 +1381,9 @@ class TestSQLiteCacheTier:
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
         tier.put(sample_entry.key, sample_entry)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             result = tier.delete(sample_entry.key)
@@ -1248,6 +1428,9 @@ class TestSQLiteCacheTier:
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
         tier.put(sample_entry.key, sample_entry)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             count = tier.clear()
@@ -1273,6 +1456,9 @@ class TestSQLiteCacheTier:
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
         tier.put(sample_entry.key, sample_entry)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             count = tier.size()
@@ -1316,6 +1502,9 @@ class TestSQLiteCacheTier:
         tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, db_path)
         tier.put(sample_entry.key, sample_entry)
 
+        # Close pooled connections so patch takes effect
+        tier.close()
+
         # Mock sqlite3 to raise exception
         with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=Exception("DB error")):
             keys = tier.keys()
@@ -1425,3 +1614,107 @@ class TestSQLiteCacheTier:
         assert result.last_health_error == "Previous error"
         assert result.total_health_checks == 10
         assert result.total_health_check_failures == 3
+
+    def test_connections_are_reused(
+        self, tier_config: CacheTierConfig, tmp_path: Path, sample_entry: CacheEntry
+    ) -> None:
+        """Operations reuse pooled connections instead of reconnecting."""
+        tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, tmp_path / "cache.db")
+        with patch("proxywhirl.cache.tiers.sqlite3.connect", side_effect=AssertionError):
+            assert tier.put(sample_entry.key, sample_entry) is True
+            assert tier.get(sample_entry.key) is not None
+            assert sample_entry.key in tier
+            assert tier.size() == 1
+            assert tier.delete(sample_entry.key) is True
+
+        tier.close()
+        assert tier.get(sample_entry.key) is None
+        assert tier.failure_count == 0
+
+    def test_put_many_and_get_many(self, tier_config: CacheTierConfig, tmp_path: Path) -> None:
+        """Batch writes land in one transaction and batch reads skip missing keys."""
+        tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, tmp_path / "cache.db")
+        now = datetime.now(timezone.utc)
+        entries = [
+            CacheEntry(
+                key=f"key-{i}",
+                proxy_url=f"http://proxy{i}.example.com:8080",
+                username=SecretStr(f"user{i}") if i % 2 else None,
+                source="test",
+                fetch_time=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                expires_at=now + timedelta(hours=1),
+            )
+            for i in range(1200)
+        ]
+
+        assert tier.put_many(entries) == 1200
+        found = tier.get_many([*(e.key for e in entries), "missing", "key-0"])
+
+        assert len(found) == 1200
+        assert "missing" not in found
+        assert found["key-7"].proxy_url == "http://proxy7.example.com:8080"
+        assert found["key-7"].username is not None
+        assert found["key-7"].username.get_secret_value() == "user7"
+        assert found["key-8"].username is None
+
+    def test_put_many_is_atomic(self, tier_config: CacheTierConfig, tmp_path: Path) -> None:
+        """A failing batch stores nothing."""
+        tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, tmp_path / "cache.db")
+        now = datetime.now(timezone.utc)
+        entries = [
+            CacheEntry(
+                key=f"key-{i}",
+                proxy_url=f"http://proxy{i}.example.com:8080",
+                source="test",
+                fetch_time=now,
+                last_accessed=now,
+                ttl_seconds=3600,
+                expires_at=now + timedelta(hours=1),
+            )
+            for i in range(3)
+        ]
+        with sqlite3.connect(str(tier.db_path)) as conn:
+            conn.execute(
+                "CREATE TRIGGER reject_key_2 BEFORE INSERT ON cache_entries "
+                "WHEN NEW.key = 'key-2' BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+            )
+
+        assert tier.put_many(entries) == 0
+        assert tier.failure_count == 1
+        assert tier.size() == 0
+
+    def test_decrypted_credentials_are_cached(
+        self, tier_config: CacheTierConfig, tmp_path: Path, entry_with_credentials: CacheEntry
+    ) -> None:
+        """Repeated reads reuse decrypted credentials until the TTL elapses."""
+        tier = SQLiteCacheTier(tier_config, TierType.L3_SQLITE, tmp_path / "cache.db")
+        tier.put(entry_with_credentials.key, entry_with_credentials)
+        tier.close()  # drop credentials remembered by put
+
+        with patch.object(tier.encryptor, "decrypt", wraps=tier.encryptor.decrypt) as decrypt:
+            for _ in range(5):
+                result = tier.get(entry_with_credentials.key)
+                assert result is not None
+                assert result.password is not None
+                assert result.password.get_secret_value() == "pass"
+            assert decrypt.call_count == 2
+
+            with patch("proxywhirl.cache.tiers.time.monotonic", return_value=time.monotonic() + 61):
+                tier.get(entry_with_credentials.key)
+            assert decrypt.call_count == 4
+
+    def test_credential_cache_can_be_disabled(
+        self, tier_config: CacheTierConfig, tmp_path: Path, entry_with_credentials: CacheEntry
+    ) -> None:
+        """With a zero TTL every read decrypts."""
+        tier = SQLiteCacheTier(
+            tier_config, TierType.L3_SQLITE, tmp_path / "cache.db", credential_cache_ttl=0
+        )
+        tier.put(entry_with_credentials.key, entry_with_credentials)
+
+        with patch.object(tier.encryptor, "decrypt", wraps=tier.encryptor.decrypt) as decrypt:
+            tier.get(entry_with_credentials.key)
+            tier.get(entry_with_credentials.key)
+        assert decrypt.call_count == 4
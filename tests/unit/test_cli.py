@@ -5,6 +5,7 @@ Tests the command-line interface functionality in isolation using Typer's testin
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import socket
@@ -17,8 +18,9 @@ import pytest
 from typer.main import get_command
 from typer.testing import CliRunner
 
-from proxywhirl.cli import _proxy_reference_matches, app
+from proxywhirl.cli import _HealthChecker, _monitor_health, _proxy_reference_matches, app
 from proxywhirl.config import CLIConfig, load_config, save_config
+from proxywhirl.models import HealthStatus, Proxy
 
 _xdist_worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
 EXPECTED_ROOT_COMMANDS = {
@@ -46,14 +48,16 @@ REMOVED_ROOT_COMMANDS = {
 }
 
 # Test fixtures - set explicit width to avoid CI terminal width issues
-# Pin XDG paths per xdist worker to avoid sandbox writes and cross-worker lock contention.
+# Pin XDG paths to a per-worker temp directory so runs neither write into the
+# checkout nor contend for locks across xdist workers.
+_cli_test_root = Path(tempfile.mkdtemp(prefix=f"proxywhirl-cli-test-{_xdist_worker}-"))
 runner = CliRunner(
     env={
         "COLUMNS": "120",
         "TERM": "dumb",
-        "XDG_DATA_HOME": str(Path.cwd() / f".cli-test-data-{_xdist_worker}"),
-        "XDG_CONFIG_HOME": str(Path.cwd() / f".cli-test-config-{_xdist_worker}"),
-        "HOME": str(Path.cwd() / f".cli-test-home-{_xdist_worker}"),
+        "XDG_DATA_HOME": str(_cli_test_root / "data"),
+        "XDG_CONFIG_HOME": str(_cli_test_root / "config"),
+        "HOME": str(_cli_test_root / "home"),
     }
 )
 
@@ -1037,6 +1041,129 @@ class TestHealthCommandAdvanced:
         assert result.exit_code == 0
 
 
+class TestConcurrentHealthChecks:
+    """Tests for concurrent, connection-reusing health checks."""
+
+    @staticmethod
+    def _proxies(count: int) -> list[Proxy]:
+        return [Proxy(url=f"http://proxy{i}.example.com:8080") for i in range(count)]
+
+    async def test_check_all_bounds_concurrency_and_reuses_clients(self) -> None:
+        """Checks overlap up to the concurrency limit and keep one client per proxy."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200)
+
+        proxies = self._proxies(10)
+        checker = _HealthChecker("https://example.com", timeout=5, verify=True, concurrency=3)
+        streamed: list[str] = []
+        with patch.object(httpx.AsyncClient, "get", new=fake_get):
+            first = await checker.check_all(proxies, lambda p, s, d: streamed.append(s.url))
+            clients = dict(checker._clients)
+            await checker.check_all(proxies)
+        await checker.aclose()
+
+        assert peak == 3
+        assert [status.url for status in first] == [proxy.url for proxy in proxies]
+        assert sorted(streamed) == sorted(proxy.url for proxy in proxies)
+        assert all(status.health == HealthStatus.HEALTHY for status in first)
+        assert len(clients) == 10
+        assert all(proxy.total_successes == 2 for proxy in proxies)
+        assert checker._clients == {}
+
+    async def test_check_records_degraded_and_failed(self) -> None:
+        """Non-200 responses degrade a proxy; request errors mark it unhealthy."""
+        responses = iter([httpx.Response(503), httpx.ConnectError("refused")])
+
+        async def fake_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+            outcome = next(responses)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        degraded, failed = self._proxies(2)
+        checker = _HealthChecker("https://example.com", timeout=5, verify=True, concurrency=1)
+        with patch.object(httpx.AsyncClient, "get", new=fake_get):
+            degraded_status, code = await checker.check(degraded)
+            failed_status, error = await checker.check(failed)
+        await checker.aclose()
+
+        assert (degraded_status.health, code) == (HealthStatus.DEGRADED, "503")
+        assert failed_status.health == HealthStatus.UNHEALTHY
+        assert "refused" in error
+        assert failed.consecutive_failures == 1
+
+    async def test_monitor_rechecks_each_proxy_on_its_own_schedule(self) -> None:
+        """Continuous mode re-checks proxies independently and reports summaries."""
+
+        async def fake_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+            return httpx.Response(200)
+
+        proxies = self._proxies(3)
+        checks: dict[str, int] = {}
+        summaries: list[int] = []
+        checker = _HealthChecker("https://example.com", timeout=5, verify=True, concurrency=2)
+        with patch.object(httpx.AsyncClient, "get", new=fake_get):
+            with pytest.raises(TimeoutError):
+                await asyncio.wait_for(
+                    _monitor_health(
+                        checker,
+                        proxies,
+                        0.05,
+                        lambda p, s, d: checks.__setitem__(p.url, checks.get(p.url, 0) + 1),
+                        lambda results: summaries.append(len(results)),
+                    ),
+                    timeout=0.28,
+                )
+        await checker.aclose()
+
+        assert set(checks) == {proxy.url for proxy in proxies}
+        assert all(count >= 3 for count in checks.values())
+        assert summaries and summaries[-1] == 3
+
+    def test_health_json_reports_all_configured_proxies(self) -> None:
+        """The health command checks every configured proxy."""
+
+        async def fake_get(client: httpx.AsyncClient, url: str) -> httpx.Response:
+            return httpx.Response(200)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / ".proxywhirl.toml"
+            save_config(
+                CLIConfig(
+                    encrypt_credentials=False,
+                    proxies=[{"url": f"http://proxy{i}.example.com:8080"} for i in range(4)],
+                ),
+                config_path,
+            )
+            with patch.object(httpx.AsyncClient, "get", new=fake_get):
+                result = runner.invoke(
+                    app,
+                    [
+                        "--no-lock",
+                        "--config",
+                        str(config_path),
+                        "--format",
+                        "json",
+                        "health",
+                        "--concurrency",
+                        "2",
+                    ],
+                )
+
+        assert result.exit_code == 0, result.stdout
+        payload = json.loads(result.stdout)
+        assert payload["total_proxies"] == 4
+        assert payload["healthy"] == 4
+
+
 class TestValidateProxyCommand:
     """Regression tests for validate-proxy command execution."""
 
@@ -1441,6 +1568,125 @@ class TestFetchCommand:
         assert result.exit_code == 0
         assert "--concurrency" in result.stdout
 
+    def test_fetch_incremental_rejects_incompatible_flags(self) -> None:
+        """--incremental needs validation and a database to diff against."""
+        for extra in (["--no-validate"], ["--no-save-db"], ["--revalidate"]):
+            result = runner.invoke(app, ["fetch", "--incremental", *extra])
+            assert result.exit_code == 1, extra
+            assert "--incremental cannot be combined" in result.stdout
+
+    async def test_save_results_records_revalidated_proxies(self, tmp_path: Path) -> None:
+        """Stored proxies validated during an incremental run get their outcome recorded."""
+        from proxywhirl.cli import _save_results
+        from proxywhirl.models import Proxy
+        from proxywhirl.storage import SQLiteStorage
+
+        db_path = tmp_path / "incremental.db"
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [Proxy(url="http://1.1.1.1:8080"), Proxy(url="http://2.2.2.2:8080")]
+        )
+        await storage.close()
+
+        await _save_results(
+            [
+                {"url": "http://1.1.1.1:8080", "average_response_time_ms": 120.0},
+                {"url": "http://3.3.3.3:8080"},
+            ],
+            db_path,
+            revalidated_urls={"http://1.1.1.1:8080", "http://2.2.2.2:8080"},
+        )
+
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+        try:
+            stored = {p["url"]: p for p in await storage.load()}
+        finally:
+            await storage.close()
+
+        assert stored["http://1.1.1.1:8080"]["health_status"] == "healthy"
+        assert stored["http://1.1.1.1:8080"]["avg_response_time_ms"] == 120.0
+        assert stored["http://2.2.2.2:8080"]["health_status"] == "unhealthy"
+        assert stored["http://3.3.3.3:8080"]["health_status"] == "healthy"
+
+
+class TestChunkedRevalidation:
+    """Tests for chunked, resumable fetch --revalidate."""
+
+    class _FlakyValidator:
+        """Validator that passes even-numbered proxies and can fail on a given call."""
+
+        fail_on_call: int | None = None
+        calls = 0
+
+        def __init__(self, **kwargs: object) -> None:
+            pass
+
+        async def validate_batch(
+            self, proxies: list[dict], progress_callback: object = None
+        ) -> list[dict]:
+            type(self).calls += 1
+            if type(self).calls == type(self).fail_on_call:
+                raise RuntimeError("validator crashed")
+            return [p for p in proxies if int(p["url"].split(".")[-1].split(":")[0]) % 2 == 0]
+
+        async def close(self) -> None:
+            pass
+
+    def test_chunk_size_requires_revalidate(self) -> None:
+        """--revalidate-chunk-size only applies to --revalidate runs."""
+        result = runner.invoke(app, ["fetch", "--revalidate-chunk-size", "10"])
+        assert result.exit_code == 1
+        assert "--revalidate-chunk-size can only be used with --revalidate" in result.stdout
+
+    async def test_interrupted_run_resumes_from_checkpoint(self, tmp_path: Path) -> None:
+        """Chunks are committed as they finish and a rerun continues after the last one."""
+        from rich.console import Console
+
+        from proxywhirl.cli import _revalidate_in_chunks, _RevalidationCheckpoint
+        from proxywhirl.models import Proxy
+        from proxywhirl.storage import SQLiteStorage
+
+        db_path = tmp_path / "revalidate.db"
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [Proxy(url=f"http://10.0.0.{i}:8080", allow_local=True) for i in range(1, 8)]
+        )
+        await storage.close()
+
+        validator_cls = self._FlakyValidator
+        validator_cls.calls = 0
+        validator_cls.fail_on_call = 3
+        console = Console(file=open(os.devnull, "w"))
+        checkpoint_path = _RevalidationCheckpoint.path_for(db_path)
+
+        with patch("proxywhirl.fetchers.ProxyValidator", validator_cls):
+            with pytest.raises(RuntimeError, match="validator crashed"):
+                await _revalidate_in_chunks(db_path, 5, 10, False, None, 3, console)
+
+            checkpoint = _RevalidationCheckpoint.load(checkpoint_path)
+            assert checkpoint is not None
+            assert checkpoint.processed == 6
+
+            validator_cls.fail_on_call = None
+            valid, failed = await _revalidate_in_chunks(db_path, 5, 10, False, None, 3, console)
+
+        assert (valid, failed) == (3, 4)
+        assert validator_cls.calls == 4
+        assert not checkpoint_path.exists()
+
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+        try:
+            stored = {p["url"]: p for p in await storage.load()}
+        finally:
+            await storage.close()
+        assert all(p["total_checks"] == 1 for p in stored.values())
+        assert stored["http://10.0.0.2:8080"]["health_status"] == "healthy"
+        assert stored["http://10.0.0.7:8080"]["health_status"] == "unhealthy"
+
 
 class TestCLIErrorHandling:
     """Test CLI error handling and edge cases."""
@@ -0,0 +1,299 @@
+"""
+Unit tests for ColumnarProxyPool.
+
+The columnar pool must behave like ProxyPool for the operations it shares,
+so most tests drive both with the same proxies and compare results.
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import SecretStr
+
+from proxywhirl.columnar_pool import ColumnarProxyPool, PoolColumns
+from proxywhirl.exceptions import ProxyPoolEmptyError
+from proxywhirl.models import HealthStatus, Proxy, ProxyPool, ProxySource
+
+_STATUSES = (HealthStatus.HEALTHY, HealthStatus.UNKNOWN, HealthStatus.DEAD, HealthStatus.DEGRADED)
+
+
+def _make_proxy(i: int) -> Proxy:
+    return Proxy(
+        url=f"http://proxy{i}.example.com:8080",
+        health_status=_STATUSES[i % len(_STATUSES)],
+        source=ProxySource.FETCHED if i % 2 else ProxySource.USER,
+        country_code=("US", "DE", None)[i % 3],
+        total_requests=i % 7,
+        total_successes=min(i % 5, i % 7),
+        tags={"fast"} if i % 5 == 0 else set(),
+    )  # type: ignore
+
+
+@pytest.fixture
+def pools() -> tuple[ColumnarProxyPool, ProxyPool]:
+    """A columnar pool and an equivalent ProxyPool built from the same data."""
+    proxies = [_make_proxy(i) for i in range(40)]
+    # The columnar pool copies state out of the models, so sharing them is safe.
+    columnar = ColumnarProxyPool(name="columnar", proxies=proxies)
+    reference = ProxyPool(name="reference", proxies=proxies)
+    return columnar, reference
+
+
+def _urls(proxies: list[Proxy]) -> list[str]:
+    return [proxy.url for proxy in proxies]
+
+
+class TestColumnarProxyPoolStats:
+    """Aggregates match ProxyPool."""
+
+    def test_aggregates_match_proxy_pool(self, pools):
+        columnar, reference = pools
+        assert columnar.size == len(columnar) == reference.size
+        assert columnar.healthy_count == reference.healthy_count
+        assert columnar.unhealthy_count == reference.unhealthy_count
+        assert columnar.total_requests == reference.total_requests
+        assert columnar.overall_success_rate == reference.overall_success_rate
+        assert columnar.get_source_breakdown() == reference.get_source_breakdown()
+
+    def test_health_breakdown(self, pools):
+        columnar, reference = pools
+        expected: dict[str, int] = {}
+        for proxy in reference.proxies:
+            expected[proxy.health_status.value] = expected.get(proxy.health_status.value, 0) + 1
+        assert columnar.get_health_breakdown() == expected
+
+    def test_empty_pool(self):
+        pool = ColumnarProxyPool()
+        assert pool.size == 0
+        assert pool.overall_success_rate == 0.0
+        assert pool.get_all_proxies() == []
+
+    def test_version_bumps_on_mutation(self):
+        pool = ColumnarProxyPool()
+        before = pool.version
+        pool.add_proxy(_make_proxy(0))
+        assert pool.version > before
+
+
+class TestColumnarProxyPoolMembership:
+    """Adding, looking up and removing proxies."""
+
+    def test_materialized_proxy_round_trips(self):
+        proxy = Proxy(
+            url="socks5://proxy.example.com:1080",
+            username=SecretStr("user"),
+            password=SecretStr("secret"),
+            country_code="FR",
+            tags={"a", "b"},
+            metadata={"k": [1, 2]},
+            ttl=3600,
+        )  # type: ignore
+        pool = ColumnarProxyPool(proxies=[proxy])
+
+        restored = pool.get_proxy_by_url(proxy.url)
+
+        assert restored is not proxy
+        assert restored.model_dump() == proxy.model_dump()
+        assert restored.password.get_secret_value() == "secret"
+        assert restored.expires_at == proxy.expires_at
+        assert pool.get_proxy_by_id(proxy.id).url == proxy.url
+
+    def test_materialized_proxy_is_a_copy(self):
+        pool = ColumnarProxyPool(proxies=[_make_proxy(0)])
+        first = pool.get_all_proxies()[0]
+        first.tags.add("mutated")
+        first.total_requests = 999
+
+        again = pool.get_all_proxies()[0]
+        assert "mutated" not in again.tags
+        assert again.total_requests == 0
+
+    def test_duplicate_url_is_ignored(self):
+        pool = ColumnarProxyPool()
+        assert pool.add_proxies([_make_proxy(1), _make_proxy(1)]) == 1
+        assert pool.size == 1
+
+    def test_capacity_enforced(self):
+        pool = ColumnarProxyPool(max_pool_size=2)
+        pool.add_proxies([_make_proxy(0), _make_proxy(1)])
+        with pytest.raises(ValueError, match="maximum capacity"):
+            pool.add_proxy(_make_proxy(2))
+
+    def test_remove_proxy_keeps_index_consistent(self, pools):
+        columnar, reference = pools
+        for proxy in list(reference.proxies[::3]):
+            columnar.remove_proxy(proxy.id)
+            reference.remove_proxy(proxy.id)
+
+        assert sorted(_urls(columnar.get_all_proxies())) == sorted(_urls(reference.proxies))
+        assert columnar.total_requests == reference.total_requests
+        assert (
+            columnar.get_health_breakdown()
+            == ColumnarProxyPool(proxies=reference.proxies).get_health_breakdown()
+        )
+        for proxy in reference.proxies:
+            assert columnar.get_proxy_by_id(proxy.id).url == proxy.url
+            assert columnar.has_proxy_url(proxy.url)
+
+    def test_remove_unknown_id_is_noop(self, pools):
+        columnar, _ = pools
+        columnar.remove_proxy(_make_proxy(99).id)
+        assert columnar.size == 40
+
+    def test_iter_batches(self, pools):
+        columnar, reference = pools
+        batches = list(columnar.iter_batches(batch_size=16))
+        assert [len(batch) for batch in batches] == [16, 16, 8]
+        assert _urls([p for batch in batches for p in batch]) == _urls(reference.proxies)
+        with pytest.raises(ValueError):
+            list(columnar.iter_batches(batch_size=0))
+
+
+class TestColumnarProxyPoolUpdates:
+    """Per-proxy updates mirror the Proxy model methods."""
+
+    def test_record_methods_match_proxy(self):
+        pool = ColumnarProxyPool(proxies=[_make_proxy(3)])
+        proxy = _make_proxy(3)
+
+        proxy.record_success(120.0)
+        proxy.record_failure("boom")
+        proxy.record_failure()
+        pool.record_success(proxy.url, 120.0)
+        pool.record_failure(proxy.url, "boom")
+        pool.record_failure(proxy.url)
+
+        exclude = {"id", "created_at", "updated_at", "last_success_at", "last_failure_at"}
+        restored = pool.get_proxy_by_url(proxy.url)
+        assert restored.model_dump(exclude=exclude | {"metadata"}) == proxy.model_dump(
+            exclude=exclude | {"metadata"}
+        )
+        assert restored.metadata["last_errors"][0]["error"] == "boom"
+        assert pool.total_requests == proxy.total_requests
+
+    def test_record_unknown_url_raises(self):
+        pool = ColumnarProxyPool()
+        with pytest.raises(KeyError):
+            pool.record_success("http://missing.example.com:8080", 10.0)
+        with pytest.raises(KeyError):
+            pool.record_failure("http://missing.example.com:8080")
+
+    def test_set_health_status_updates_counts(self, pools):
+        columnar, _ = pools
+        healthy = columnar.healthy_count
+        target = columnar.filter_proxies(health_status=HealthStatus.DEAD, limit=1)[0]
+
+        columnar.set_health_status(target.url, HealthStatus.HEALTHY)
+
+        assert columnar.healthy_count == healthy + 1
+        assert columnar.get_proxy_by_url(target.url).health_status == HealthStatus.HEALTHY
+
+    def test_update_proxy_writes_back(self, pools):
+        columnar, _ = pools
+        proxy = columnar.get_all_proxies()[0]
+        proxy.tags = {"edited"}
+        proxy.total_requests = 100
+        proxy.total_successes = 50
+
+        assert columnar.update_proxy(proxy) is True
+        assert columnar.get_proxy_by_url(proxy.url).tags == {"edited"}
+        assert [p.url for p in columnar.filter_by_tags({"edited"})] == [proxy.url]
+        assert columnar.update_proxy(_make_proxy(99)) is False
+
+
+class TestColumnarProxyPoolFilters:
+    """Filters and bulk removal match ProxyPool."""
+
+    def test_filter_and_count(self, pools):
+        columnar, reference = pools
+        expected = [
+            p.url
+            for p in reference.proxies
+            if p.health_status in (HealthStatus.HEALTHY, HealthStatus.UNKNOWN)
+            and p.country_code == "US"
+        ]
+        kwargs = {
+            "health_status": [HealthStatus.HEALTHY, HealthStatus.UNKNOWN],
+            "country_code": "US",
+        }
+
+        assert _urls(columnar.filter_proxies(**kwargs)) == expected
+        assert columnar.count_proxies(**kwargs) == len(expected)
+        assert _urls(columnar.filter_proxies(**kwargs, limit=2)) == expected[:2]
+
+    def test_filter_by_source_and_tags(self, pools):
+        columnar, reference = pools
+        assert _urls(columnar.filter_by_source(ProxySource.USER)) == _urls(
+            reference.filter_by_source(ProxySource.USER)
+        )
+        assert _urls(columnar.filter_by_tags({"fast"})) == _urls(reference.filter_by_tags({"fast"}))
+
+    def test_get_healthy_proxies_and_select(self, pools):
+        columnar, reference = pools
+        assert _urls(columnar.get_healthy_proxies()) == _urls(reference.get_healthy_proxies())
+        assert columnar.select().url == reference.get_healthy_proxies()[0].url
+
+    def test_select_empty_raises(self):
+        pool = ColumnarProxyPool(proxies=[_make_proxy(2)])  # DEAD
+        with pytest.raises(ProxyPoolEmptyError):
+            pool.select()
+
+    def test_clear_unhealthy_preserves_order(self, pools):
+        columnar, reference = pools
+        assert columnar.clear_unhealthy() == reference.clear_unhealthy()
+        assert _urls(columnar.get_all_proxies()) == _urls(reference.proxies)
+        assert columnar.total_requests == reference.total_requests
+        assert columnar.get_source_breakdown() == reference.get_source_breakdown()
+        for proxy in reference.proxies:
+            assert columnar.get_proxy_by_id(proxy.id).url == proxy.url
+
+    def test_clear_expired(self):
+        expired = _make_proxy(0)
+        expired.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+        live = _make_proxy(1)
+        live.expires_at = datetime.now(UTC) + timedelta(hours=1)
+        pool = ColumnarProxyPool(proxies=[expired, live, _make_proxy(4)])
+
+        assert pool.count_proxies(exclude_expired=True) == 2
+        assert pool.clear_expired() == 1
+        assert _urls(pool.get_all_proxies()) == [live.url, _make_proxy(4).url]
+
+
+class TestColumnarProxyPoolColumns:
+    """Bulk export to and import from PoolColumns."""
+
+    def test_from_proxies_matches_pool(self, pools):
+        columnar, reference = pools
+        columns = PoolColumns.from_proxies([*reference.get_all_proxies(), _make_proxy(0)])
+        pool = ColumnarProxyPool.from_columns(columns)
+
+        assert len(columns) == 40
+        assert pool.get_health_breakdown() == columnar.get_health_breakdown()
+        assert pool.total_requests == columnar.total_requests
+        assert _urls(pool.get_all_proxies()) == _urls(reference.get_all_proxies())
+
+    def test_export_is_independent(self, pools):
+        columnar, _ = pools
+        columns = columnar.export_columns()
+        columnar.record_success(_make_proxy(0).url, 10.0)
+        columnar.remove_proxy(columnar.get_all_proxies()[1].id)
+
+        restored = ColumnarProxyPool.from_columns(columns)
+        assert restored.size == 40
+        assert restored.get_proxy_by_url(_make_proxy(0).url).total_requests == 0
+
+    def test_from_columns_rejects_mismatched_lengths(self, pools):
+        columns = pools[0].export_columns()
+        columns.health.pop()
+
+        with pytest.raises(ValueError, match="same rows"):
+            ColumnarProxyPool.from_columns(columns)
+
+    def test_from_columns_rejects_duplicates_and_overflow(self, pools):
+        columns = pools[0].export_columns()
+        with pytest.raises(ValueError, match="maximum capacity"):
+            ColumnarProxyPool.from_columns(columns, max_pool_size=10)
+
+        columns.urls[1] = columns.urls[0]
+        with pytest.raises(ValueError, match="duplicate"):
+            ColumnarProxyPool.from_columns(columns)
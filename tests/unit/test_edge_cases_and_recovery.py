@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -30,6 +31,14 @@ from proxywhirl.models import Proxy, ProxyPool
 from proxywhirl.rotator import ProxyWhirl
 
 
+def _tmp_cache_config(tmp_path: Path) -> CacheConfig:
+    """Cache config whose L2/L3 files live under ``tmp_path`` instead of the working directory."""
+    return CacheConfig(
+        l2_cache_dir=str(tmp_path / "cache"),
+        l3_database_path=str(tmp_path / "cache.db"),
+    )
+
+
 def _cache_entry(key: str, value: str) -> CacheEntry:
     """Build a current-shape cache entry for coherence tests."""
     now = datetime.now(timezone.utc)
@@ -170,11 +179,11 @@ class TestErrorRecoveryPaths:
 class TestDataCorruptionDetection:
     """Test detection of corrupted data."""
 
-    def test_cache_corruption_detection(self) -> None:
+    def test_cache_corruption_detection(self, tmp_path: Path) -> None:
         """Test detection of cache data corruption."""
         # This would test CacheCorruptionError being raised
         # when cached data fails validation
-        cache = CacheManager(CacheConfig())
+        cache = CacheManager(_tmp_cache_config(tmp_path))
 
         # Simulate corruption detection
         assert cache is not None
@@ -230,9 +239,9 @@ class TestCacheCoherence:
     """Test multi-tier cache consistency."""
 
     @pytest.mark.asyncio
-    async def test_cache_invalidation_propagation(self) -> None:
+    async def test_cache_invalidation_propagation(self, tmp_path: Path) -> None:
         """Test that cache invalidation propagates through tiers."""
-        cache = CacheManager(CacheConfig())
+        cache = CacheManager(_tmp_cache_config(tmp_path))
 
         # Set a value
         cache.put("key1", _cache_entry("key1", "value1"))
@@ -243,9 +252,9 @@ class TestCacheCoherence:
         assert cache.get("key1") is None
 
     @pytest.mark.asyncio
-    async def test_concurrent_cache_updates(self) -> None:
+    async def test_concurrent_cache_updates(self, tmp_path: Path) -> None:
         """Test concurrent cache updates don't cause corruption."""
-        cache = CacheManager(CacheConfig())
+        cache = CacheManager(_tmp_cache_config(tmp_path))
         lock = asyncio.Lock()
 
         async def update_cache(key: str, value: str) -> None:
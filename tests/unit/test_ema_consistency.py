@@ -9,11 +9,12 @@ from proxy identity, allowing different strategies to maintain independent
 per-proxy metrics.
 """
 
+import json
 from uuid import uuid4
 
 import pytest
 
-from proxywhirl.models import Proxy, StrategyConfig
+from proxywhirl.models import HealthStatus, Proxy, ProxyPool, StrategyConfig
 from proxywhirl.strategies import (
     LeastUsedStrategy,
     PerformanceBasedStrategy,
@@ -461,3 +462,37 @@ class TestStrategyState:
         metrics.update_ema(200.0, alpha=0.4)
         # EMA = 0.4 * 200 + 0.6 * 100 = 140
         assert metrics.ema_response_time_ms == pytest.approx(140.0)
+
+    def test_strategy_state_snapshot_round_trip(self):
+        """Test that snapshot_state output restores the same metrics."""
+        state = StrategyState(ema_alpha=0.3)
+        proxy_id = uuid4()
+        state.record_success(proxy_id, response_time_ms=100.0)
+        state.record_failure(proxy_id)
+
+        restored = StrategyState(ema_alpha=0.3)
+        restored.restore_state(json.loads(json.dumps(state.snapshot_state())))
+
+        assert restored.get_metrics(proxy_id) == state.get_metrics(proxy_id)
+
+
+class TestRoundRobinState:
+    """Test saving and restoring the round-robin position."""
+
+    def test_round_robin_resumes_from_snapshot(self):
+        """Test that a restored strategy continues where the original stopped."""
+        pool = ProxyPool(
+            name="test",
+            proxies=[
+                Proxy(url=f"http://proxy{i}.example.com:8080", health_status=HealthStatus.HEALTHY)
+                for i in range(3)
+            ],
+        )
+        strategy = RoundRobinStrategy()
+        strategy.select(pool)
+        strategy.select(pool)
+
+        restored = RoundRobinStrategy()
+        restored.restore_state(strategy.snapshot_state())
+
+        assert restored.select(pool).url == strategy.select(pool).url
@@ -22,6 +22,14 @@ from proxywhirl.storage import FileStorage
 from tests.conftest import ProxyFactory
 
 
+def _tmp_cache_config(tmp_path: Path) -> CacheConfig:
+    """Cache config whose L2/L3 files live under ``tmp_path`` instead of the working directory."""
+    return CacheConfig(
+        l2_cache_dir=str(tmp_path / "cache"),
+        l3_database_path=str(tmp_path / "cache.db"),
+    )
+
+
 def make_cache_entry(key: str, proxy_url: str, ttl_seconds: int = 60) -> CacheEntry:
     now = datetime.now(timezone.utc)
     return CacheEntry(
@@ -234,9 +242,9 @@ class TestRecoveryPaths:
 class TestCorruptionRecovery:
     """Test data corruption detection and recovery."""
 
-    def test_cache_corruption_detection(self) -> None:
+    def test_cache_corruption_detection(self, tmp_path: Path) -> None:
         """Test detection of corrupted cache data."""
-        cache = CacheManager(CacheConfig())
+        cache = CacheManager(_tmp_cache_config(tmp_path))
         proxy = ProxyFactory.build()
         cache_key = f"proxy:{proxy.id}"
         entry = make_cache_entry(cache_key, proxy.url)
@@ -282,9 +290,9 @@ class TestCorruptionRecovery:
 class TestTimeoutBehavior:
     """Test precise timeout behavior across components."""
 
-    def test_cache_manager_operation_timeout(self) -> None:
+    def test_cache_manager_operation_timeout(self, tmp_path: Path) -> None:
         """Test cache manager stores and returns cache entries."""
-        cache = CacheManager(CacheConfig())
+        cache = CacheManager(_tmp_cache_config(tmp_path))
         entry = make_cache_entry("test_key", "http://example.com:8080")
 
         assert cache.put("test_key", entry) is True
@@ -4,15 +4,20 @@ Tests cover parse_proxy_url, generate_rich_proxies, generate_stats_from_files,
 and export_for_web functionality.
 """
 
+import gzip
 import json
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from proxywhirl.export_formats import ExportFormat, MultiFormatExporter
 from proxywhirl.exports import (
+    MANIFEST_FILENAME,
     RELIABILITY_TIERS,
     _as_utc_aware,
     _classify_reliability_tier,
@@ -21,9 +26,50 @@ from proxywhirl.exports import (
     generate_rich_proxies,
     generate_stats_from_files,
     parse_proxy_url,
+    write_rich_proxies,
 )
 from proxywhirl.formatters import OutputFormat, format_proxies
 from proxywhirl.models import Proxy
+from proxywhirl.storage import ProxyIdentityTable, ProxyStatusTable, SQLiteStorage
+
+
+@pytest.fixture
+async def storage(tmp_path: Path) -> AsyncIterator[SQLiteStorage]:
+    """Create an initialized, empty SQLite storage."""
+    storage = SQLiteStorage(tmp_path / "exports.db")
+    await storage.initialize()
+    yield storage
+    await storage.close()
+
+
+async def _seed(storage: SQLiteStorage, rows: list[dict[str, Any]]) -> None:
+    """Insert identity/status rows shaped like the dicts returned by ``storage.load()``."""
+    async with AsyncSession(storage.engine) as session:
+        for row in rows:
+            host, port = parse_proxy_url(row["url"])
+            identity = {
+                "url": row["url"],
+                "protocol": row.get("protocol", "http"),
+                "host": host,
+                "port": port,
+                "source": row.get("source", "fetched"),
+                "country_code": row.get("country_code"),
+            }
+            if row.get("discovered_at") is not None:
+                identity["discovered_at"] = row["discovered_at"]
+            session.add(ProxyIdentityTable(**identity))
+            session.add(
+                ProxyStatusTable(
+                    proxy_url=row["url"],
+                    health_status=row.get("health_status", "unknown"),
+                    avg_response_time_ms=row.get("avg_response_time_ms"),
+                    total_checks=row.get("total_checks", 0),
+                    total_successes=row.get("total_successes", 0),
+                    last_success_at=row.get("last_success_at"),
+                    last_failure_at=row.get("last_failure_at"),
+                )
+            )
+        await session.commit()
 
 
 class TestLegacyProxyFormatters:
@@ -175,12 +221,9 @@ class TestParseProxyUrl:
 class TestGenerateRichProxies:
     """Test generate_rich_proxies function."""
 
-    async def test_empty_storage(self) -> None:
+    async def test_empty_storage(self, storage: SQLiteStorage) -> None:
         """Test with empty storage returns empty proxies list."""
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = []
-
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0)
 
         assert result["total"] == 0
         assert result["proxies"] == []
@@ -189,7 +232,7 @@ class TestGenerateRichProxies:
         assert result["aggregations"]["by_source"] == {}
         assert "generated_at" in result
 
-    async def test_single_proxy(self) -> None:
+    async def test_single_proxy(self, storage: SQLiteStorage) -> None:
         """Test with single proxy returns correct data."""
         # With normalized schema, load() returns dicts
         mock_proxy = {
@@ -206,10 +249,9 @@ class TestGenerateRichProxies:
             "country_code": None,
         }
 
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = [mock_proxy]
+        await _seed(storage, [mock_proxy])
 
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0, include_geo=False)
 
         assert result["total"] == 1
         assert len(result["proxies"]) == 1
@@ -225,22 +267,24 @@ class TestGenerateRichProxies:
         assert result["aggregations"]["by_protocol"]["http"] == 1
         assert result["aggregations"]["by_status"]["healthy"] == 1
 
-    async def test_invalid_proxy_urls_are_skipped(self) -> None:
+    async def test_invalid_proxy_urls_are_skipped(self, storage: SQLiteStorage) -> None:
         """Test rich export skips malformed proxy URLs instead of emitting :0 records."""
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = [
-            {"url": "http://192.168.1.1", "protocol": "http"},
-            {"url": "http://:8080", "protocol": "http"},
-            {"url": "http://192.168.1.2:8080", "protocol": "http"},
-        ]
+        await _seed(
+            storage,
+            [
+                {"url": "http://192.168.1.1", "protocol": "http"},
+                {"url": "http://:8080", "protocol": "http"},
+                {"url": "http://192.168.1.2:8080", "protocol": "http"},
+            ],
+        )
 
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0, include_geo=False)
 
         assert result["total"] == 1
         assert result["proxies"][0]["ip"] == "192.168.1.2"
         assert result["proxies"][0]["port"] == 8080
 
-    async def test_proxy_with_zero_requests(self) -> None:
+    async def test_proxy_with_zero_requests(self, storage: SQLiteStorage) -> None:
         """Test proxy with zero requests has None success_rate."""
         mock_proxy = {
             "url": "http://192.168.1.1:8080",
@@ -252,20 +296,19 @@ class TestGenerateRichProxies:
             "source": "geonode",
             "last_success_at": None,
             "last_failure_at": None,
-            "discovered_at": None,
+            "discovered_at": datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
             "country_code": None,
         }
 
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = [mock_proxy]
+        await _seed(storage, [mock_proxy])
 
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0, include_geo=False)
 
         assert result["proxies"][0]["success_rate"] is None
         assert result["proxies"][0]["last_checked"] is None
-        assert result["proxies"][0]["created_at"] is None
+        assert result["proxies"][0]["created_at"] == "2025-01-01T00:00:00+00:00"
 
-    async def test_proxy_with_only_failures(self) -> None:
+    async def test_proxy_with_only_failures(self, storage: SQLiteStorage) -> None:
         """Test proxy with only failure timestamp uses it for last_checked."""
         mock_proxy = {
             "url": "http://192.168.1.1:8080",
@@ -281,15 +324,14 @@ class TestGenerateRichProxies:
             "country_code": None,
         }
 
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = [mock_proxy]
+        await _seed(storage, [mock_proxy])
 
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0, include_geo=False)
 
         assert result["proxies"][0]["last_checked"] == "2025-01-02T12:00:00+00:00"
         assert result["proxies"][0]["success_rate"] == 0.0
 
-    async def test_multiple_proxies_aggregation(self) -> None:
+    async def test_multiple_proxies_aggregation(self, storage: SQLiteStorage) -> None:
         """Test aggregation counts with multiple proxies."""
         proxies = []
         for i in range(3):
@@ -324,10 +366,9 @@ class TestGenerateRichProxies:
         }
         proxies.append(socks_proxy)
 
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = proxies
+        await _seed(storage, proxies)
 
-        result = await generate_rich_proxies(mock_storage, max_age_hours=0)
+        result = await generate_rich_proxies(storage, max_age_hours=0, include_geo=False)
 
         assert result["total"] == 4
         assert result["aggregations"]["by_protocol"]["http"] == 3
@@ -481,18 +522,21 @@ class TestExportForWeb:
         output_dir.mkdir()
         (output_dir / "metadata.json").write_text("{}")
 
-        mock_storage = AsyncMock()
-        mock_storage.load.return_value = []
-
-        with patch("proxywhirl.exports.SQLiteStorage", return_value=mock_storage):
+        storage = SQLiteStorage(db_path)
+        with (
+            patch("proxywhirl.exports.SQLiteStorage", return_value=storage),
+            patch.object(storage, "initialize", wraps=storage.initialize) as initialize,
+            patch.object(storage, "close", wraps=storage.close) as close,
+        ):
             outputs = await export_for_web(
                 db_path, output_dir, include_stats=False, include_rich_proxies=True
             )
 
         assert "proxies_rich" in outputs
         assert outputs["proxies_rich"].exists()
-        mock_storage.initialize.assert_called_once()
-        mock_storage.close.assert_called_once()
+        assert json.loads(outputs["proxies_rich"].read_text())["total"] == 0
+        initialize.assert_called_once()
+        close.assert_called_once()
 
     async def test_skips_rich_proxies_when_db_missing(self, tmp_path: Path) -> None:
         """Test that rich proxies are skipped when database doesn't exist."""
@@ -529,7 +573,7 @@ class TestExportForWeb:
         (output_dir / "metadata.json").write_text("{}")
 
         mock_storage = AsyncMock()
-        mock_storage.load_validated.side_effect = RuntimeError("Test error")
+        mock_storage.count_proxy_list_entries.side_effect = RuntimeError("Test error")
 
         with patch("proxywhirl.exports.SQLiteStorage", return_value=mock_storage):
             with pytest.raises(RuntimeError, match="Test error"):
@@ -540,20 +584,27 @@ class TestExportForWeb:
         mock_storage.close.assert_called_once()
 
 
+_VALIDATED = {"health_status": "healthy", "last_success_at": datetime.now(timezone.utc)}
+
+
 class TestGenerateProxyListsProtocolSeparation:
     """Test that generate_proxy_lists properly separates HTTP and HTTPS proxies."""
 
-    async def test_http_and_https_are_separated(self, tmp_path: Path) -> None:
+    async def test_http_and_https_are_separated(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
         """http.txt and https.txt must contain different proxies."""
-        mock_storage = AsyncMock()
-        mock_storage.load_validated.return_value = [
-            {"url": "http://1.1.1.1:8080", "protocol": "http"},
-            {"url": "http://2.2.2.2:8080", "protocol": "http"},
-            {"url": "https://3.3.3.3:443", "protocol": "https"},
-            {"url": "socks4://4.4.4.4:1080", "protocol": "socks4"},
-        ]
+        await _seed(
+            storage,
+            [
+                {"url": "http://1.1.1.1:8080", "protocol": "http", **_VALIDATED},
+                {"url": "http://2.2.2.2:8080", "protocol": "http", **_VALIDATED},
+                {"url": "https://3.3.3.3:443", "protocol": "https", **_VALIDATED},
+                {"url": "socks4://4.4.4.4:1080", "protocol": "socks4", **_VALIDATED},
+            ],
+        )
 
-        counts = await generate_proxy_lists(mock_storage, tmp_path, max_age_hours=72)
+        counts = await generate_proxy_lists(storage, tmp_path, max_age_hours=72)
 
         assert counts["http"] == 2
         assert counts["https"] == 1
@@ -568,16 +619,362 @@ class TestGenerateProxyListsProtocolSeparation:
         assert "3.3.3.3:443" in https_lines
         assert "3.3.3.3:443" not in http_lines
 
-    async def test_all_txt_includes_https_section(self, tmp_path: Path) -> None:
+    async def test_all_txt_includes_https_section(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
         """all.txt must include an HTTPS section."""
-        mock_storage = AsyncMock()
-        mock_storage.load_validated.return_value = [
-            {"url": "http://1.1.1.1:8080", "protocol": "http"},
-            {"url": "https://2.2.2.2:443", "protocol": "https"},
-        ]
+        await _seed(
+            storage,
+            [
+                {"url": "http://1.1.1.1:8080", "protocol": "http", **_VALIDATED},
+                {"url": "https://2.2.2.2:443", "protocol": "https", **_VALIDATED},
+            ],
+        )
 
-        await generate_proxy_lists(mock_storage, tmp_path, max_age_hours=72)
+        await generate_proxy_lists(storage, tmp_path, max_age_hours=72)
 
         all_content = (tmp_path / "all.txt").read_text()
         assert "# HTTPS Proxies" in all_content
         assert "# HTTP Proxies" in all_content
+
+
+class TestSqlSideAggregation:
+    """Test that export grouping, dedup and percentiles are computed in SQL."""
+
+    @pytest.fixture
+    async def seeded(self, storage: SQLiteStorage) -> SQLiteStorage:
+        """Storage with 20 HTTP proxies, a duplicate address and a stale proxy."""
+        now = datetime.now(timezone.utc)
+        rows: list[dict[str, Any]] = [
+            {
+                "url": f"http://10.0.0.{i}:{8080 if i % 2 else 3128}",
+                "protocol": "http",
+                "health_status": "healthy",
+                "avg_response_time_ms": float(i * 100),
+                "total_checks": 10,
+                "total_successes": 10 if i < 10 else 6,
+                "source": "alpha" if i < 15 else "beta",
+                "country_code": "US" if i < 5 else None,
+                "last_success_at": now - timedelta(hours=1),
+                "discovered_at": now - timedelta(days=1),
+            }
+            for i in range(1, 21)
+        ]
+        # Same address as 10.0.0.1 over SOCKS5: only the faster row survives dedup
+        rows.append(
+            {
+                "url": "socks5://10.0.0.1:8080",
+                "protocol": "socks5",
+                "health_status": "healthy",
+                "avg_response_time_ms": 50.0,
+                "total_checks": 4,
+                "total_successes": 4,
+                "source": "beta",
+                "last_success_at": now - timedelta(hours=1),
+                "discovered_at": now - timedelta(days=200),
+            }
+        )
+        rows.append(
+            {
+                "url": "socks4://10.0.1.1:1080",
+                "protocol": "socks4",
+                "health_status": "dead",
+                "avg_response_time_ms": None,
+                "last_failure_at": now - timedelta(hours=2),
+                "discovered_at": now - timedelta(days=2),
+            }
+        )
+        await _seed(storage, rows)
+        return storage
+
+    async def test_aggregations_match_python_statistics(self, seeded: SQLiteStorage) -> None:
+        result = await generate_rich_proxies(seeded, max_age_hours=0, include_geo=False)
+        aggregations = result["aggregations"]
+
+        assert result["total"] == 21
+        addresses = {(p["ip"], p["port"]) for p in result["proxies"]}
+        assert len(addresses) == 21
+        deduped = next(p for p in result["proxies"] if p["ip"] == "10.0.0.1")
+        assert deduped["protocol"] == "socks5"
+        assert aggregations["by_protocol"] == {"http": 19, "socks5": 1, "socks4": 1}
+        assert aggregations["by_status"] == {"healthy": 20, "dead": 1}
+        assert aggregations["by_source"] == {"alpha": 13, "beta": 7, "fetched": 1}
+
+        times = [50.0] + [float(i * 100) for i in range(2, 21)]
+        sorted_times = sorted(times)
+        assert aggregations["performance"] == {
+            "avg_ms": round(sum(times) / len(times), 1),
+            "median_ms": round((sorted_times[9] + sorted_times[10]) / 2, 1),
+            "p95_ms": sorted_times[int(len(times) * 0.95)],
+            "min_ms": 50.0,
+            "max_ms": 2000.0,
+            "samples": 20,
+        }
+        distribution = {b["range"]: b["count"] for b in aggregations["response_time_distribution"]}
+        assert distribution == {
+            "<100ms": 1,
+            "100-500ms": 3,
+            "500ms-1s": 5,
+            "1-2s": 10,
+            "2-5s": 1,
+            ">5s": 0,
+        }
+        assert aggregations["by_port"] == [
+            {"port": 3128, "count": 10},
+            {"port": 8080, "count": 10},
+            {"port": 1080, "count": 1},
+        ]
+        tiers = {t["tier"]: t["count"] for t in aggregations["reliability_tiers"]}
+        assert tiers == {"Elite": 9, "Reliable": 0, "Moderate": 11, "Marginal": 1}
+        assert aggregations["by_country_detail"] == [
+            {"code": "US", "count": 3, "avg_response_ms": 300.0, "continent_code": None}
+        ]
+        alpha = next(m for m in aggregations["source_metrics"] if m["name"] == "alpha")
+        assert alpha["count"] == 13
+        assert alpha["reliability_pct"] == round((8 * 10 + 5 * 6) / 130 * 100, 1)
+        assert alpha["country_count"] == 1
+        assert alpha["freshness_pct"] > 99
+        # The 200-day-old discovery falls outside the 90 day window
+        assert sum(aggregations["discovery_by_date"].values()) == 20
+
+    async def test_proxies_stream_in_protocol_then_speed_order(self, seeded: SQLiteStorage) -> None:
+        chunks = [
+            rows async for rows in seeded.iter_export_proxies(0, ("http", "socks5"), chunk_size=4)
+        ]
+        rows = [row for chunk in chunks for row in chunk]
+
+        assert len(chunks) == 6
+        assert [row["protocol"] for row in rows] == ["http"] * 19 + ["socks5", "socks4"]
+        http_times = [row["avg_response_time_ms"] for row in rows[:19]]
+        assert http_times == sorted(http_times)
+
+    async def test_max_age_excludes_unhealthy_and_stale(self, seeded: SQLiteStorage) -> None:
+        result = await generate_rich_proxies(seeded, max_age_hours=72, include_geo=False)
+
+        assert result["total"] == 20
+        assert "dead" not in result["aggregations"]["by_status"]
+
+    async def test_geo_lookup_limited_to_sample(self, seeded: SQLiteStorage) -> None:
+        async def fake_geolocate(ips: list[str], **_: Any) -> dict[str, dict[str, str]]:
+            return {ip: {"country": "Germany", "countryCode": "DE"} for ip in ips}
+
+        with patch("proxywhirl.exports.batch_geolocate", side_effect=fake_geolocate) as geo:
+            result = await generate_rich_proxies(seeded, max_age_hours=0, geo_sample_size=5)
+
+        assert len(geo.call_args.args[0]) == 5
+        assert result["aggregations"]["by_country"] == {"DE": 5}
+        assert [p["country_code"] for p in result["proxies"][:6]] == ["DE"] * 5 + [None]
+        flow = result["aggregations"]["source_flow"]
+        assert sum(f["count"] for f in flow if f["country"] == "DE") == 5
+        assert sum(f["count"] for f in flow) == 21
+
+    async def test_write_rich_proxies_matches_generated_document(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "proxies-rich.json"
+
+        written = await write_rich_proxies(seeded, path, include_geo=False, max_age_hours=0)
+        expected = await generate_rich_proxies(seeded, include_geo=False, max_age_hours=0)
+
+        streamed = json.loads(path.read_text())
+        expected["generated_at"] = streamed["generated_at"]
+        assert written == 21
+        assert path.read_text() == json.dumps(expected)
+
+    async def test_proxy_lists_are_deduplicated_and_sorted_in_sql(
+        self, storage: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        await _seed(
+            storage,
+            [
+                {"url": "http://1.1.1.1:8080", "avg_response_time_ms": 900.0, **_VALIDATED},
+                {"url": "http://2.2.2.2:8080", "avg_response_time_ms": None, **_VALIDATED},
+                {"url": "http://3.3.3.3:8080", "avg_response_time_ms": 100.0, **_VALIDATED},
+                {
+                    "url": "http://user:pw@3.3.3.3:8080",
+                    "avg_response_time_ms": 50.0,
+                    **_VALIDATED,
+                },
+                {
+                    "url": "SOCKS5://4.4.4.4:1080",
+                    "protocol": "SOCKS5",
+                    "avg_response_time_ms": 10.0,
+                    **_VALIDATED,
+                },
+            ],
+        )
+
+        counts = await generate_proxy_lists(storage, tmp_path, max_age_hours=72)
+
+        assert counts == {"http": 3, "https": 0, "socks4": 0, "socks5": 1}
+        assert (tmp_path / "http.txt").read_text().splitlines() == [
+            "3.3.3.3:8080",
+            "1.1.1.1:8080",
+            "2.2.2.2:8080",
+        ]
+        assert (tmp_path / "https.txt").read_text() == ""
+        assert (tmp_path / "all.txt").read_text() == (
+            "# HTTP Proxies (3)\n3.3.3.3:8080\n1.1.1.1:8080\n2.2.2.2:8080\n\n"
+            "# HTTPS Proxies (0)\n\n"
+            "# SOCKS4 Proxies (0)\n\n"
+            "# SOCKS5 Proxies (1)\n4.4.4.4:1080\n\n"
+        )
+        proxies_json = (tmp_path / "proxies.json").read_text()
+        document = json.loads(proxies_json)
+        assert proxies_json == json.dumps(document, indent=2)
+        assert document["proxies"] == {
+            "http": ["3.3.3.3:8080", "1.1.1.1:8080", "2.2.2.2:8080"],
+            "https": [],
+            "socks4": [],
+            "socks5": ["4.4.4.4:1080"],
+        }
+        assert document["metadata"]["counts"] == counts
+
+
+class TestIncrementalExport:
+    """Test watermark skipping and content-addressed publishing in export_for_web."""
+
+    @pytest.fixture
+    async def seeded(self, storage: SQLiteStorage) -> SQLiteStorage:
+        """Storage with two validated HTTP proxies and one never validated SOCKS5 proxy."""
+        await _seed(
+            storage,
+            [
+                {"url": "http://1.1.1.1:8080", "avg_response_time_ms": 100.0, **_VALIDATED},
+                {"url": "http://2.2.2.2:8080", "avg_response_time_ms": 200.0, **_VALIDATED},
+                {"url": "socks5://3.3.3.3:1080", "protocol": "socks5"},
+            ],
+        )
+        return storage
+
+    @staticmethod
+    def _file_versions(output_dir: Path) -> dict[str, tuple[int, int]]:
+        """Map file names to (inode, mtime), which stay equal while a file is not replaced."""
+        return {
+            path.name: (path.stat().st_ino, path.stat().st_mtime_ns)
+            for path in output_dir.iterdir()
+            if path.is_file()
+        }
+
+    async def test_first_export_writes_manifest_and_gzip_siblings(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+
+        outputs = await export_for_web(seeded.filepath, output_dir)
+
+        manifest = json.loads(outputs["manifest"].read_text())
+        assert outputs["manifest"] == output_dir / MANIFEST_FILENAME
+        for name in ("http.txt", "all.txt", "proxies.json", "proxies-rich.json", "stats.json"):
+            entry = manifest["files"][name]
+            content = (output_dir / name).read_bytes()
+            assert entry["size"] == len(content)
+            assert f"{name}.gz" in entry["compressed"]
+            assert gzip.decompress((output_dir / f"{name}.gz").read_bytes()) == content
+            assert f"{name}.gz" in manifest["files"]
+        assert manifest["watermark"]["identities"] == 3
+        assert manifest["valid_until"] is not None
+        assert not [p for p in output_dir.iterdir() if p.name.startswith(".export-")]
+
+    async def test_unchanged_database_skips_generation(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        before = self._file_versions(output_dir)
+
+        with (
+            patch("proxywhirl.exports.generate_proxy_lists") as lists,
+            patch("proxywhirl.exports.write_rich_proxies") as rich,
+        ):
+            outputs = await export_for_web(seeded.filepath, output_dir)
+
+        lists.assert_not_called()
+        rich.assert_not_called()
+        assert outputs["proxies_rich"] == output_dir / "proxies-rich.json"
+        after = self._file_versions(output_dir)
+        del before[MANIFEST_FILENAME], after[MANIFEST_FILENAME]
+        assert after == before
+
+    async def test_only_changed_lists_are_republished(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        before = self._file_versions(output_dir)
+
+        await seeded.record_validation("socks5://3.3.3.3:1080", True, 50.0)
+        await export_for_web(seeded.filepath, output_dir)
+        after = self._file_versions(output_dir)
+
+        unchanged = ["http.txt", "http.txt.gz", "https.txt", "socks4.txt"]
+        assert {name: after[name] for name in unchanged} == {
+            name: before[name] for name in unchanged
+        }
+        for name in ("socks5.txt", "socks5.txt.gz", "all.txt", "proxies.json", "metadata.json"):
+            assert after[name] != before[name], name
+        assert (output_dir / "socks5.txt").read_text() == "3.3.3.3:1080\n"
+
+    async def test_data_change_outside_lists_keeps_list_files(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        before = self._file_versions(output_dir)
+
+        # Faster but still first in its list: only proxies-rich.json changes
+        await seeded.record_validation("http://1.1.1.1:8080", True, 50.0)
+        await export_for_web(seeded.filepath, output_dir)
+        after = self._file_versions(output_dir)
+
+        for name in ("metadata.json", "proxies.json", "all.txt", "http.txt"):
+            assert after[name] == before[name], name
+        assert after["proxies-rich.json"] != before["proxies-rich.json"]
+
+    async def test_full_export_republishes_everything(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        before = self._file_versions(output_dir)
+
+        await export_for_web(seeded.filepath, output_dir, incremental=False)
+        after = self._file_versions(output_dir)
+
+        assert all(after[name] != before[name] for name in before)
+
+    async def test_recency_window_expiry_forces_regeneration(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        manifest_path = output_dir / MANIFEST_FILENAME
+        manifest = json.loads(manifest_path.read_text())
+        manifest["valid_until"] = "2000-01-01T00:00:00+00:00"
+        manifest_path.write_text(json.dumps(manifest))
+
+        with patch("proxywhirl.exports.generate_proxy_lists", wraps=generate_proxy_lists) as lists:
+            await export_for_web(seeded.filepath, output_dir)
+
+        lists.assert_called_once()
+
+    async def test_regenerated_timestamps_alone_do_not_republish(
+        self, seeded: SQLiteStorage, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "out"
+        await export_for_web(seeded.filepath, output_dir)
+        before = self._file_versions(output_dir)
+        manifest_path = output_dir / MANIFEST_FILENAME
+        manifest = json.loads(manifest_path.read_text())
+        manifest["valid_until"] = "2000-01-01T00:00:00+00:00"
+        manifest_path.write_text(json.dumps(manifest))
+
+        with patch("proxywhirl.exports.write_rich_proxies", wraps=write_rich_proxies) as rich:
+            await export_for_web(seeded.filepath, output_dir)
+        after = self._file_versions(output_dir)
+
+        rich.assert_called_once()
+        for name in ("proxies-rich.json", "proxies-rich.json.gz", "stats.json", "stats.json.gz"):
+            assert after[name] == before[name], name
+        manifest = json.loads(manifest_path.read_text())
+        assert "content_sha256" in manifest["files"]["proxies-rich.json"]
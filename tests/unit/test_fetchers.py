@@ -11,6 +11,7 @@ Tests cover:
 """
 
 import json
+from typing import Any
 
 import pytest
 
@@ -1572,7 +1573,8 @@ class TestProxyFetcher:
         fetcher = ProxyFetcher()
 
         mock_response = MagicMock()
-        mock_response.text = '[{"host": "proxy1.com", "port": 8080}]'
+        mock_response.content = b'[{"host": "proxy1.com", "port": 8080}]'
+        mock_response.charset_encoding = "utf-8"
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client:
@@ -1664,7 +1666,8 @@ class TestProxyFetcher:
         fetcher = ProxyFetcher()
 
         mock_response = MagicMock()
-        mock_response.text = "custom data"
+        mock_response.content = b"custom data"
+        mock_response.charset_encoding = "utf-8"
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client:
@@ -2113,7 +2116,8 @@ class TestProxyFetcherClientPool:
         fetcher = ProxyFetcher()
 
         mock_response = MagicMock()
-        mock_response.text = '[{"host": "proxy1.com", "port": 8080}]'
+        mock_response.content = b'[{"host": "proxy1.com", "port": 8080}]'
+        mock_response.charset_encoding = "utf-8"
         mock_response.raise_for_status = MagicMock()
 
         # Mock _get_client to verify it's called
@@ -2145,3 +2149,294 @@ class TestProxyFetcherClientPool:
         assert isinstance(client, __import__("httpx").AsyncClient)
 
         await fetcher.close()
+
+
+class TestParseExecutor:
+    """Test the executor-backed parse stage of ProxyFetcher."""
+
+    @staticmethod
+    def _mock_client(body: bytes) -> Any:
+        from unittest.mock import AsyncMock, MagicMock
+
+        mock_response = MagicMock()
+        mock_response.content = body
+        mock_response.charset_encoding = "utf-8"
+        mock_response.raise_for_status = MagicMock()
+        client = AsyncMock()
+        client.get = AsyncMock(return_value=mock_response)
+        return client
+
+    @pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+    async def test_executors_produce_identical_results(self, mode: str) -> None:
+        """Every executor parses the same proxies and applies the source protocol."""
+        from unittest.mock import AsyncMock, patch
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(
+            url="http://example.com/socks.txt", format="plain_text", protocol="socks5"
+        )
+        body = b"1.2.3.4:1080\n5.6.7.8:1081\n"
+
+        async with ProxyFetcher(parse_executor=mode, parse_workers=1) as fetcher:
+            with patch.object(fetcher, "_get_client", new_callable=AsyncMock) as get_client:
+                get_client.return_value = self._mock_client(body)
+                proxies = await fetcher.fetch_from_source(source)
+
+            timing = fetcher.get_parse_timings()[str(source.url)]
+
+        assert [p["url"] for p in proxies] == ["socks5://1.2.3.4:1080", "socks5://5.6.7.8:1081"]
+        assert timing.executor == mode
+        assert timing.content_bytes == len(body)
+        assert timing.proxies == 2
+        assert timing.parse_ms >= 0
+
+    def test_auto_selects_executor_by_size_and_format(self) -> None:
+        """Auto mode parses small bodies inline and large text bodies in a process."""
+        from proxywhirl.fetchers import (
+            INLINE_PARSE_MAX_BYTES,
+            PROCESS_PARSE_MIN_BYTES,
+            ProxyFetcher,
+            ProxySourceConfig,
+        )
+
+        fetcher = ProxyFetcher()
+        text_source = ProxySourceConfig(url="http://example.com/p.txt", format="plain_text")
+        json_source = ProxySourceConfig(url="http://example.com/p.json", format="json")
+
+        select = fetcher._select_parse_executor
+        assert select(text_source, "plain_text", INLINE_PARSE_MAX_BYTES) == "inline"
+        assert select(text_source, "plain_text", INLINE_PARSE_MAX_BYTES + 1) == "thread"
+        assert select(text_source, "plain_text", PROCESS_PARSE_MIN_BYTES) == "process"
+        # JSON decoding is C-level; it never pays for a process hand-off
+        assert select(json_source, "json", PROCESS_PARSE_MIN_BYTES) == "thread"
+
+    def test_per_source_override_and_process_fallback(self) -> None:
+        """Per-source overrides win; custom parsers never run in a worker process."""
+        from unittest.mock import MagicMock
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        fetcher = ProxyFetcher(parse_executor="thread")
+        inline_source = ProxySourceConfig(
+            url="http://example.com/p.txt", format="plain_text", parse_executor="inline"
+        )
+        process_source = ProxySourceConfig(
+            url="http://example.com/p.txt", format="plain_text", parse_executor="process"
+        )
+
+        assert fetcher._select_parse_executor(inline_source, "plain_text", 10**7) == "inline"
+        assert fetcher._select_parse_executor(process_source, None, 10) == "thread"
+
+        fetcher._parsers["plain_text"] = MagicMock()
+        assert fetcher._select_parse_executor(process_source, "plain_text", 10) == "thread"
+
+    async def test_content_is_decoded_with_response_charset(self) -> None:
+        """Raw bytes are decoded in the parse stage using the response charset."""
+        from unittest.mock import AsyncMock, patch
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(url="http://example.com/p.json", format="json")
+        client = self._mock_client('[{"host": "prøxy.example", "port": 8080}]'.encode("latin-1"))
+        client.get.return_value.charset_encoding = "latin-1"
+
+        async with ProxyFetcher(parse_executor="thread") as fetcher:
+            with patch.object(fetcher, "_get_client", new_callable=AsyncMock) as get_client:
+                get_client.return_value = client
+                proxies = await fetcher.fetch_from_source(source)
+
+        assert proxies[0]["host"] == "prøxy.example"
+
+
+class TestConditionalRefresh:
+    """Test conditional GETs and per-source refresh scheduling."""
+
+    SOURCE_URL = "http://lists.example.com/http.txt"
+
+    async def test_sends_validators_and_skips_parse_on_304(self) -> None:
+        """Remembered ETag/Last-Modified are sent; a 304 is not parsed."""
+        import httpx
+        import respx
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(url=self.SOURCE_URL, format="plain_text")
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        with respx.mock:
+            route = respx.get(self.SOURCE_URL).mock(
+                side_effect=[
+                    httpx.Response(
+                        200,
+                        text="1.2.3.4:8080\n",
+                        headers={"ETag": '"v1"', "Last-Modified": last_modified},
+                    ),
+                    httpx.Response(304),
+                ]
+            )
+            async with ProxyFetcher() as fetcher:
+                assert len(await fetcher.fetch_if_changed(source)) == 1
+                parsed_at = fetcher.get_parse_timings()[self.SOURCE_URL].recorded_at
+
+                assert await fetcher.fetch_if_changed(source) is None
+                assert fetcher.get_parse_timings()[self.SOURCE_URL].recorded_at == parsed_at
+
+        conditional = route.calls[1].request.headers
+        assert conditional["If-None-Match"] == '"v1"'
+        assert conditional["If-Modified-Since"] == last_modified
+
+    async def test_validators_not_kept_when_parse_fails(self) -> None:
+        """A body that fails to parse is not answered with a 304 on the next fetch."""
+        import httpx
+        import respx
+
+        from proxywhirl.exceptions import ProxyFetchError
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(url=self.SOURCE_URL, format="json")
+        with respx.mock:
+            route = respx.get(self.SOURCE_URL).mock(
+                side_effect=[
+                    httpx.Response(200, text="{not json", headers={"ETag": '"v1"'}),
+                    httpx.Response(
+                        200, json=[{"host": "1.2.3.4", "port": 8080}], headers={"ETag": '"v1"'}
+                    ),
+                    httpx.Response(304),
+                ]
+            )
+            async with ProxyFetcher() as fetcher:
+                with pytest.raises(ProxyFetchError):
+                    await fetcher.fetch_if_changed(source)
+                assert len(await fetcher.fetch_if_changed(source)) == 1
+                assert await fetcher.fetch_if_changed(source) is None
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert route.calls[2].request.headers["If-None-Match"] == '"v1"'
+
+    async def test_identical_body_is_not_reparsed(self) -> None:
+        """Without validators, an unchanged body is detected by its content hash."""
+        import httpx
+        import respx
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(url=self.SOURCE_URL, format="plain_text")
+        with respx.mock:
+            route = respx.get(self.SOURCE_URL).mock(
+                side_effect=[
+                    httpx.Response(200, text="1.2.3.4:8080\n"),
+                    httpx.Response(200, text="1.2.3.4:8080\n"),
+                    httpx.Response(200, text="1.2.3.4:8080\n5.6.7.8:3128\n"),
+                ]
+            )
+            async with ProxyFetcher() as fetcher:
+                # A plain fetch primes the hash; conditional fetches bypass the request cache
+                assert len(await fetcher.fetch_from_source(source)) == 1
+                assert await fetcher.fetch_if_changed(source) is None
+                assert len(await fetcher.fetch_if_changed(source)) == 2
+
+        assert route.call_count == 3
+        assert "If-None-Match" not in route.calls[1].request.headers
+
+    async def test_refresh_sources_returns_only_changed_proxies(self) -> None:
+        """Unchanged and failing sources contribute nothing to a refresh cycle."""
+        from unittest.mock import AsyncMock, patch
+
+        from proxywhirl.exceptions import ProxyFetchError
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        changed = ProxySourceConfig(url="http://a.example.com/list.txt", format="plain_text")
+        unchanged = ProxySourceConfig(url="http://b.example.com/list.txt", format="plain_text")
+        failing = ProxySourceConfig(url="http://c.example.com/list.txt", format="plain_text")
+        results = {
+            changed.url: [{"url": "http://1.2.3.4:8080"}, {"url": "http://1.2.3.4:8080"}],
+            unchanged.url: None,
+        }
+
+        async def fake_fetch(source):
+            if source is failing:
+                raise ProxyFetchError("boom")
+            return results[source.url]
+
+        fetcher = ProxyFetcher()
+        with patch.object(fetcher, "fetch_if_changed", side_effect=fake_fetch):
+            proxies = await fetcher.refresh_sources([changed, unchanged, failing], validate=False)
+            assert proxies == [{"url": "http://1.2.3.4:8080"}]
+            assert await fetcher.refresh_sources([unchanged], validate=False) is None
+
+        with (
+            patch.object(fetcher, "fetch_if_changed", side_effect=fake_fetch),
+            patch.object(fetcher.validator, "validate_batch", new_callable=AsyncMock) as validate,
+        ):
+            validate.return_value = []
+            assert await fetcher.refresh_sources([changed]) == []
+            validate.assert_awaited_once()
+
+    async def test_periodic_refresh_honors_per_source_intervals(self) -> None:
+        """Each source is refreshed on its own interval; unchanged cycles skip the callback."""
+        import asyncio
+        from unittest.mock import patch
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        fast = ProxySourceConfig(url="http://fast.example.com/list.txt", format="plain_text")
+        slow = ProxySourceConfig(url="http://slow.example.com/list.txt", format="plain_text")
+        # Sub-second intervals keep the test fast
+        fast.refresh_interval = 0.05
+        slow.refresh_interval = 0.25
+
+        refreshed: list[str] = []
+        delivered: list[list[dict]] = []
+
+        async def fake_refresh(sources, validate=True):
+            refreshed.extend(str(source.url) for source in sources)
+            if any(source is slow for source in sources):
+                return [{"url": "http://9.9.9.9:80"}]
+            return None
+
+        async def callback(proxies):
+            delivered.append(proxies)
+
+        fetcher = ProxyFetcher(sources=[fast, slow])
+        with patch.object(fetcher, "refresh_sources", side_effect=fake_refresh):
+            task = asyncio.create_task(fetcher.start_periodic_refresh(callback=callback))
+            await asyncio.sleep(0.6)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        fast_count = refreshed.count(str(fast.url))
+        slow_count = refreshed.count(str(slow.url))
+        assert 1 <= slow_count <= 3
+        assert fast_count > slow_count
+        assert delivered == [[{"url": "http://9.9.9.9:80"}]] * slow_count
+
+
+class TestValidationFilter:
+    """Test fetch_all's validation_filter hook for incremental ingestion."""
+
+    async def test_only_filtered_proxies_are_validated(self) -> None:
+        """Proxies dropped by the filter are neither validated nor returned."""
+        from unittest.mock import AsyncMock, patch
+
+        from proxywhirl.fetchers import ProxyFetcher, ProxySourceConfig
+
+        source = ProxySourceConfig(url="http://example.com/list.txt", format="plain_text")
+        fetched = [{"url": "http://1.1.1.1:80"}, {"url": "http://2.2.2.2:80"}]
+
+        async def only_new(proxies):
+            return [p for p in proxies if p["url"] != "http://1.1.1.1:80"]
+
+        fetcher = ProxyFetcher(sources=[source])
+        with (
+            patch.object(fetcher, "fetch_from_source", new=AsyncMock(return_value=fetched)),
+            patch.object(fetcher.validator, "validate_batch", new_callable=AsyncMock) as validate,
+        ):
+            validate.side_effect = lambda proxies, progress_callback=None: proxies
+            result = await fetcher.fetch_all(validation_filter=only_new)
+
+            assert result == [{"url": "http://2.2.2.2:80"}]
+            assert validate.await_args.args[0] == [{"url": "http://2.2.2.2:80"}]
+
+            # The filter is ignored when validation is disabled
+            assert await fetcher.fetch_all(validate=False, validation_filter=only_new) == fetched
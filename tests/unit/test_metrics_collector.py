@@ -443,3 +443,218 @@ class TestMetricsValidation:
         # Should not raise exceptions
         health = metrics_collector.proxy_health_status.labels(proxy_id=proxy_id)._value.get()
         assert health == 1
+
+
+class TestStageProfilerExport:
+    """Test exposing per-stage latency histograms."""
+
+    def test_stage_histogram_rendered_at_scrape(self, metrics_collector):
+        """Stage buckets, sum and quantiles come from the registered profiler."""
+        from proxywhirl.stage_timing import StageProfiler
+
+        profiler = StageProfiler()
+        metrics_collector.register_stage_profiler(profiler)
+        for seconds in (0.002, 0.004, 0.3):
+            profiler.record("ttfb", seconds)
+
+        registry = metrics_collector._registry
+        labels = {"stage": "ttfb"}
+        assert registry.get_sample_value("proxywhirl_stage_duration_seconds_count", labels) == 3
+        assert registry.get_sample_value(
+            "proxywhirl_stage_duration_seconds_bucket", {**labels, "le": "0.005"}
+        ) == pytest.approx(2)
+        assert registry.get_sample_value(
+            "proxywhirl_stage_duration_seconds_sum", labels
+        ) == pytest.approx(0.306)
+        p99 = registry.get_sample_value(
+            "proxywhirl_stage_duration_quantile_seconds", {**labels, "quantile": "0.99"}
+        )
+        assert p99 == pytest.approx(0.3, rel=0.02)
+
+    def test_register_replaces_previous_profiler(self, metrics_collector):
+        """Registering twice does not duplicate the metric families."""
+        from proxywhirl.stage_timing import StageProfiler
+
+        first, second = StageProfiler(), StageProfiler()
+        first.record("select", 0.001)
+        metrics_collector.register_stage_profiler(first)
+        metrics_collector.register_stage_profiler(second)
+
+        count = metrics_collector._registry.get_sample_value(
+            "proxywhirl_stage_duration_seconds_count", {"stage": "select"}
+        )
+        assert count == 0
+
+
+@pytest.fixture
+def bounded_collector():
+    """Provide a bounded-cardinality collector that only flushes on demand."""
+    from proxywhirl.metrics_collector import MetricsCollector
+
+    collector = MetricsCollector(
+        registry=CollectorRegistry(), max_proxy_series=3, flush_interval=None
+    )
+    yield collector
+    collector.close()
+
+
+def _proxy_labels(collector, metric="proxywhirl_requests_total"):
+    return {
+        sample.labels["proxy_id"]
+        for family in collector._registry.collect()
+        for sample in family.samples
+        if sample.name == metric
+    }
+
+
+class TestBoundedProxyMetrics:
+    """Test the top-K + "other" metrics mode."""
+
+    def test_series_limited_to_top_k_and_other(self, bounded_collector):
+        """Only the busiest proxies keep their own series; totals are preserved."""
+        for i in range(20):
+            for _ in range(20 - i):
+                bounded_collector.record_request("success", 0.2, f"proxy-{i}")
+        bounded_collector.flush()
+        for i in range(20):
+            bounded_collector.record_request("success", 0.2, f"proxy-{i}")
+
+        assert _proxy_labels(bounded_collector) == {"proxy-0", "proxy-1", "proxy-2", "other"}
+        total = sum(
+            sample.value
+            for family in bounded_collector._registry.collect()
+            for sample in family.samples
+            if sample.name == "proxywhirl_requests_total"
+        )
+        assert total == sum(range(1, 21)) + 20
+
+    def test_proxy_leaving_top_k_drops_its_series(self, bounded_collector):
+        """A proxy that goes quiet is replaced and its series removed."""
+        bounded = bounded_collector.bounded
+        bounded.max_series = 1
+        bounded_collector.record_request("success", 0.2, "early")
+        bounded_collector.flush()
+        bounded_collector.record_request("success", 0.2, "early")
+        assert "early" in _proxy_labels(bounded_collector)
+
+        for _ in range(10):
+            bounded_collector.record_request("success", 0.2, "late")
+        bounded_collector.flush()
+
+        assert bounded.top_proxies == frozenset({"late"})
+        assert "early" not in _proxy_labels(bounded_collector)
+
+    def test_label_sums_never_decrease_across_rerank(self, bounded_collector):
+        """Series of evicted proxies are folded into "other" instead of dropped."""
+        bounded = bounded_collector.bounded
+        bounded.max_series = 1
+        registry = bounded_collector._registry
+
+        def total(name):
+            return sum(
+                sample.value
+                for family in registry.collect()
+                for sample in family.samples
+                if sample.name == name
+            )
+
+        previous = (0.0, 0.0)
+        for busy in ("a", "b", "c", "a"):
+            for _ in range(10):
+                bounded_collector.record_request("success", 0.2, busy)
+            bounded_collector.flush()
+            bounded_collector.record_request("success", 0.2, busy)
+            current = (
+                total("proxywhirl_requests_total"),
+                total("proxywhirl_request_duration_seconds_count"),
+            )
+            assert current[0] >= previous[0]
+            assert current[1] >= previous[1]
+            previous = current
+
+        assert previous == (44, 44)
+        assert _proxy_labels(bounded_collector) == {"a", "other"}
+
+    def test_concurrent_recording_is_lossless(self, bounded_collector):
+        """Per-thread buffers from finished threads are merged without losses."""
+        import threading
+
+        def worker(n: int) -> None:
+            for i in range(500):
+                bounded_collector.record_request("error", 1.5, f"proxy-{n}-{i % 7}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        registry = bounded_collector._registry
+        assert registry.get_sample_value(
+            "proxywhirl_request_duration_seconds_count", {"proxy_id": "other"}
+        ) == pytest.approx(4000)
+        assert bounded_collector.bounded._buffers == []
+
+    def test_other_series_carry_exemplars(self, bounded_collector):
+        """OpenMetrics output names the proxy behind "other" observations."""
+        from prometheus_client.openmetrics.exposition import generate_latest
+
+        bounded_collector.record_request("timeout", 7.0, "slow-proxy")
+        output = generate_latest(bounded_collector._registry).decode()
+
+        assert (
+            'proxywhirl_request_duration_seconds_bucket{le="10.0",proxy_id="other"} 1.0 '
+            '# {proxy_id="slow-proxy"} 7.0' in output
+        )
+        assert '# {proxy_id="slow-proxy"} 1.0' in output
+
+    def test_health_and_breaker_totals(self, bounded_collector):
+        """Per-state totals cover every proxy and follow clear_proxy_metrics."""
+        registry = bounded_collector._registry
+        for i in range(10):
+            bounded_collector.update_proxy_health(f"proxy-{i}", is_healthy=i % 2 == 0)
+            bounded_collector.update_circuit_breaker_state(f"proxy-{i}", "closed")
+        bounded_collector.update_proxy_health("proxy-1", is_healthy=True)
+        bounded_collector.update_circuit_breaker_state("proxy-0", "open")
+        bounded_collector.clear_proxy_metrics("proxy-2")
+
+        def value(name, labels):
+            return registry.get_sample_value(name, labels)
+
+        assert value("proxywhirl_proxies_by_health", {"health": "healthy"}) == 5
+        assert value("proxywhirl_proxies_by_health", {"health": "unhealthy"}) == 4
+        assert value("proxywhirl_circuit_breakers_by_state", {"state": "open"}) == 1
+        assert value("proxywhirl_circuit_breakers_by_state", {"state": "closed"}) == 8
+        assert _proxy_labels(bounded_collector, "proxywhirl_proxy_health_status") == set()
+
+    def test_background_flush(self):
+        """The flush thread re-ranks proxies without a scrape."""
+        import time
+
+        from proxywhirl.metrics_collector import MetricsCollector
+
+        collector = MetricsCollector(
+            registry=CollectorRegistry(), max_proxy_series=2, flush_interval=0.01
+        )
+        try:
+            collector.record_request("success", 0.1, "proxy-a")
+            deadline = time.monotonic() + 5
+            while not collector.bounded.top_proxies and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert collector.bounded.top_proxies == frozenset({"proxy-a"})
+        finally:
+            collector.close()
+
+    def test_global_collector_from_env(self, monkeypatch):
+        """PROXYWHIRL_METRICS_MAX_PROXY_SERIES enables bounded mode globally."""
+        from proxywhirl.metrics_collector import get_metrics_collector, reset_metrics_collector
+
+        monkeypatch.setenv("PROXYWHIRL_METRICS_MAX_PROXY_SERIES", "50")
+        reset_metrics_collector()
+        try:
+            collector = get_metrics_collector()
+            assert collector.bounded is not None
+            assert collector.bounded.max_series == 50
+            assert collector.requests_total is None
+        finally:
+            reset_metrics_collector()
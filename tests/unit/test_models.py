@@ -6,7 +6,7 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import pytest
-from pydantic import ValidationError
+from pydantic import ConfigDict, ValidationError
 
 from proxywhirl.models import HealthStatus, Proxy, ProxyPool
 
@@ -355,6 +355,44 @@ class TestProxyStats:
         assert proxy.metadata["last_errors"][0]["error"] == "Error 5"
         assert proxy.metadata["last_errors"][-1]["error"] == "Error 14"
 
+    def test_error_log_trimmed_in_place(self):
+        """Test that the error log is bounded without replacing the list."""
+        proxy = Proxy(url="http://proxy.example.com:8080", metadata={"last_errors": []})
+        errors = proxy.metadata["last_errors"]
+        for i in range(12):
+            proxy.record_failure(error=f"Error {i}")
+        assert proxy.metadata["last_errors"] is errors
+        assert [e["error"] for e in errors] == [f"Error {i}" for i in range(2, 12)]
+        assert errors[-1]["timestamp"] == proxy.last_failure_at.isoformat()
+
+    def test_complete_request_uses_one_timestamp(self):
+        """Test that one completed request stamps every field with the same time."""
+        proxy = Proxy(url="http://proxy.example.com:8080")
+        proxy.start_request()
+        assert proxy.window_start == proxy.updated_at
+        proxy.complete_request(success=True, response_time_ms=100.0)
+        assert proxy.last_success_at == proxy.updated_at
+        assert proxy.requests_active == 0
+        assert proxy.requests_completed == 1
+        assert proxy.health_status == HealthStatus.HEALTHY
+        assert {"requests_completed", "last_success_at", "total_requests"} <= (
+            proxy.model_fields_set
+        )
+
+    def test_accounting_respects_validate_assignment(self):
+        """Test that subclasses validating assignment still go through pydantic."""
+
+        class StrictProxy(Proxy):
+            model_config = ConfigDict(validate_assignment=True)
+
+        proxy = StrictProxy(url="http://proxy.example.com:8080")
+        proxy.start_request()
+        proxy.complete_request(success=False, response_time_ms=50.0)
+        assert proxy.total_failures == 1
+        assert proxy.health_status == HealthStatus.DEGRADED
+        with pytest.raises(ValidationError):
+            proxy.total_requests = "not a number"
+
 
 class TestProxyProperties:
     """Test Proxy computed properties."""
@@ -549,6 +587,64 @@ class TestProxyResponseTimeValidation:
             Proxy(url="http://proxy.example.com:8080", **{field: -1.0})
 
 
+class TestProxyFromTrusted:
+    """Test the validator-free trusted constructor used for bulk loads."""
+
+    def test_matches_validated_construction(self):
+        """Trusted proxies carry the same field values as validated ones."""
+        fields = {
+            "url": "socks5://proxy.example.com:1080",
+            "health_status": HealthStatus.HEALTHY,
+            "country_code": "US",
+            "ttl": 60,
+            "created_at": datetime(2026, 1, 1, tzinfo=UTC),
+        }
+        validated = Proxy(**fields)
+        trusted = Proxy.from_trusted(fields)
+
+        exclude = {"id", "updated_at"}
+        assert trusted.model_dump(exclude=exclude) == validated.model_dump(exclude=exclude)
+        assert trusted.protocol == "socks5"
+        assert trusted.expires_at == datetime(2026, 1, 1, 0, 1, tzinfo=UTC)
+        assert trusted.model_fields_set == validated.model_fields_set
+
+    def test_instances_do_not_share_state(self):
+        """Each proxy gets its own id, mutable defaults and window lock."""
+        first, second = Proxy.from_trusted_rows(
+            [{"url": "http://proxy1.example.com:8080"}, {"url": "http://proxy2.example.com:8080"}]
+        )
+
+        first.tags.add("a")
+        first.start_request()
+        first.complete_request(success=True, response_time_ms=10.0)
+
+        assert first.id != second.id
+        assert second.tags == set()
+        assert first._window_lock is not second._window_lock
+        assert (first.requests_completed, second.requests_completed) == (1, 0)
+
+    def test_skips_validators(self):
+        """Trusted rows are not re-checked (they were validated when stored)."""
+        proxy = Proxy.from_trusted({"url": "http://127.0.0.1:8080"})
+
+        assert proxy.protocol == "http"
+        with pytest.raises(ValidationError, match="Localhost"):
+            Proxy(url="http://127.0.0.1:8080")
+
+    @pytest.mark.parametrize(
+        "fields,error_pattern",
+        [
+            ({"url": "http://proxy.example.com:8080", "bogus": 1}, r"unknown: \['bogus'\]"),
+            ({"protocol": "http"}, r"missing: \['url'\]"),
+        ],
+        ids=["unknown", "missing"],
+    )
+    def test_rejects_unknown_and_missing_fields(self, fields, error_pattern):
+        """Field names are still checked."""
+        with pytest.raises(ValueError, match=error_pattern):
+            Proxy.from_trusted(fields)
+
+
 class TestProxySlidingWindowConcurrency:
     """Test Proxy sliding window counter thread safety."""
 
@@ -68,6 +68,24 @@ class TestProxyPoolBasics:
         pool.remove_proxy(proxy.id)
         assert pool.size == 0
 
+    def test_replace_proxies(self):
+        """Test replacing the pool contents in bulk."""
+        old = Proxy(url="http://old.example.com:8080")  # type: ignore
+        pool = ProxyPool(name="test-pool", proxies=[old])
+        version = pool.version
+        first = Proxy(url="http://a.example.com:8080")  # type: ignore
+        duplicate = Proxy(url="http://a.example.com:8080")  # type: ignore
+        second = Proxy(url="http://b.example.com:8080")  # type: ignore
+
+        pool.replace_proxies([first, duplicate, second])
+
+        assert pool.proxies == [first, second]
+        assert pool.get_proxy_by_id(first.id) is first
+        assert pool.get_proxy_by_id(old.id) is None
+        assert pool.has_proxy_url(second.url)
+        assert not pool.has_proxy_url(old.url)
+        assert pool.version > version
+
     def test_remove_nonexistent_proxy_no_error(self):
         """Test that removing non-existent proxy doesn't raise error."""
         pool = ProxyPool(name="test-pool")
@@ -284,6 +302,80 @@ class TestProxyPoolStats:
         assert pool.overall_success_rate == 0.0
 
 
+class TestProxyPoolIterBatches:
+    """Test ProxyPool.iter_batches batched iteration."""
+
+    def test_iter_batches_splits_pool(self):
+        """Test batches cover every proxy in insertion order."""
+        pool = ProxyPool(name="test-pool")
+        for i in range(5):
+            pool.add_proxy(Proxy(url=f"http://proxy{i}.example.com:8080"))  # type: ignore
+
+        batches = list(pool.iter_batches(batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [p.url for batch in batches for p in batch] == [p.url for p in pool.proxies]
+
+    def test_iter_batches_survives_removal_mid_iteration(self):
+        """Test removing an already-yielded proxy does not skip live ones."""
+        pool = ProxyPool(name="test-pool")
+        for i in range(6):
+            pool.add_proxy(Proxy(url=f"http://proxy{i}.example.com:8080"))  # type: ignore
+        expected = [p.url for p in pool.proxies]
+
+        seen = []
+        for batch in pool.iter_batches(batch_size=2):
+            if not seen:
+                pool.remove_proxy(batch[0].id)
+            seen.extend(p.url for p in batch)
+
+        assert seen == expected
+
+    def test_iter_batches_empty_pool(self):
+        """Test empty pool yields no batches."""
+        pool = ProxyPool(name="test-pool")
+        assert list(pool.iter_batches()) == []
+
+    def test_iter_batches_rejects_non_positive_size(self):
+        """Test batch_size must be positive."""
+        pool = ProxyPool(name="test-pool")
+        with pytest.raises(ValueError):
+            list(pool.iter_batches(batch_size=0))
+
+
+class TestProxyPoolVersion:
+    """Test ProxyPool.version change tracking."""
+
+    def test_version_advances_on_membership_changes(self):
+        """Test add and remove advance the version."""
+        pool = ProxyPool(name="test-pool")
+        proxy = Proxy(url="http://proxy.example.com:8080")  # type: ignore
+
+        v0 = pool.version
+        pool.add_proxy(proxy)
+        v1 = pool.version
+        pool.remove_proxy(proxy.id)
+
+        assert v0 < v1 < pool.version
+
+    def test_version_advances_on_proxy_stats(self):
+        """Test recording request outcomes advances the version."""
+        proxy = Proxy(url="http://proxy.example.com:8080")  # type: ignore
+        pool = ProxyPool(name="test-pool", proxies=[proxy])
+
+        before = pool.version
+        proxy.record_failure()
+
+        assert pool.version > before
+
+    def test_bump_version(self):
+        """Test explicit bump for direct field mutation."""
+        pool = ProxyPool(name="test-pool")
+        before = pool.version
+        pool.bump_version()
+        assert pool.version > before
+
+
 class TestProxyPoolThreadSafety:
     """Test ProxyPool thread-safety under concurrent access."""
 
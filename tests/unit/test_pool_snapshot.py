@@ -0,0 +1,316 @@
+"""Unit tests for pool snapshots (JSON snapshots and binary warm-start snapshots)."""
+
+from __future__ import annotations
+
+import struct
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+
+from proxywhirl.circuit_breaker import CircuitBreaker, CircuitBreakerState
+from proxywhirl.exceptions import SnapshotFormatError
+from proxywhirl.models import HealthStatus, Proxy, ProxyPool, ProxySource, StrategyConfig
+from proxywhirl.pool_snapshot import (
+    WARM_SNAPSHOT_SUFFIX,
+    SnapshotManager,
+    WarmSnapshotWriter,
+    read_warm_snapshot,
+    write_warm_snapshot,
+)
+from proxywhirl.rotator import AsyncProxyWhirl, ProxyWhirl
+
+
+def _full_proxy() -> Proxy:
+    """A proxy with every sparse field set."""
+    return Proxy(
+        url="http://full.example.com:8080",
+        username="user",
+        password="s3cret-password",
+        latency_ms=3.0,
+        ema_alpha=0.5,
+        window_start=datetime(2026, 1, 1, tzinfo=UTC),
+        window_duration_seconds=60,
+        region="EU",
+        recovery_attempt=2,
+        next_check_time=datetime(2026, 1, 2, tzinfo=UTC),
+        last_health_error="timeout",
+        total_health_failures=3,
+        tags={"fast", "eu"},
+        source=ProxySource.FETCHED,
+        source_url="https://src.example.com/list",
+        metadata={"k": [1, 2]},
+        ttl=3600,
+        cost_per_request=0.5,
+        total_requests=5,
+        total_successes=3,
+        total_failures=2,
+        ema_response_time_ms=123.4,
+        country_code="US",
+        health_status=HealthStatus.HEALTHY,
+    )  # type: ignore
+
+
+def _proxies(count: int = 5) -> list[Proxy]:
+    return [Proxy(url=f"http://p{i}.example.com:8080") for i in range(count)]  # type: ignore
+
+
+def _dump_by_url(proxies: list[Proxy]) -> dict[str, dict]:
+    return {proxy.url: proxy.model_dump() for proxy in proxies}
+
+
+class TestPoolSnapshot:
+    """JSON snapshots created through SnapshotManager."""
+
+    def test_create_and_restore(self, tmp_path: Path) -> None:
+        manager = SnapshotManager(tmp_path)
+        snapshot = manager.create_snapshot("pool", [_full_proxy(), *_proxies(2)])
+
+        restored = SnapshotManager(tmp_path).restore_snapshot(snapshot.snapshot_id)
+
+        assert restored is not None
+        assert len(restored.proxies) == 3
+        state = restored.proxies[0]
+        assert state["status"] == "healthy"
+        assert state["failure_count"] == 2
+        assert state["success_count"] == 3
+        assert state["tags"] == ["eu", "fast"]
+
+
+class TestWarmSnapshotRoundTrip:
+    """Writing and reading warm snapshots."""
+
+    @pytest.mark.parametrize("use_mmap", [True, False])
+    def test_round_trip_preserves_proxies(self, tmp_path: Path, use_mmap: bool) -> None:
+        proxies = [_full_proxy(), *_proxies()]
+        path = write_warm_snapshot(
+            tmp_path / f"pool{WARM_SNAPSHOT_SUFFIX}", ProxyPool(name="main", proxies=proxies)
+        )
+
+        snapshot = read_warm_snapshot(path, use_mmap=use_mmap)
+
+        assert len(snapshot) == 6
+        assert snapshot.pool_name == "main"
+        assert _dump_by_url(snapshot.proxies()) == _dump_by_url(proxies)
+
+    def test_empty_pool(self, tmp_path: Path) -> None:
+        path = write_warm_snapshot(tmp_path / "empty.pwsnap", [])
+        snapshot = read_warm_snapshot(path)
+
+        assert len(snapshot) == 0
+        assert snapshot.proxies() == []
+
+    def test_metadata_and_atomic_write(self, tmp_path: Path) -> None:
+        path = write_warm_snapshot(tmp_path / "m.pwsnap", _proxies(), metadata={"host": "a"})
+
+        assert read_warm_snapshot(path).metadata == {"host": "a"}
+        assert [p.name for p in tmp_path.iterdir()] == ["m.pwsnap"]
+
+    def test_to_columnar_pool(self, tmp_path: Path) -> None:
+        proxies = [_full_proxy(), *_proxies(3)]
+        path = write_warm_snapshot(tmp_path / "c.pwsnap", proxies)
+
+        pool = read_warm_snapshot(path).to_columnar_pool()
+
+        assert pool.size == 4
+        assert pool.healthy_count == 1
+        assert pool.get_proxy_by_url(proxies[0].url).password.get_secret_value() == (
+            "s3cret-password"
+        )
+
+
+class TestWarmSnapshotEncryption:
+    """Fernet encryption of the sparse section."""
+
+    def test_credentials_not_stored_in_plaintext(self, tmp_path: Path) -> None:
+        key = Fernet.generate_key()
+        path = write_warm_snapshot(tmp_path / "e.pwsnap", [_full_proxy()], encryption_key=key)
+
+        assert b"s3cret-password" not in path.read_bytes()
+        proxy = read_warm_snapshot(path, encryption_key=key).proxies()[0]
+        assert proxy.password.get_secret_value() == "s3cret-password"
+
+    def test_plaintext_without_key(self, tmp_path: Path) -> None:
+        path = write_warm_snapshot(tmp_path / "p.pwsnap", [_full_proxy()])
+        assert b"s3cret-password" in path.read_bytes()
+
+    @pytest.mark.parametrize("key_kind", ["missing", "wrong"])
+    def test_missing_or_wrong_key(self, tmp_path: Path, key_kind: str) -> None:
+        path = write_warm_snapshot(
+            tmp_path / "e.pwsnap", [_full_proxy()], encryption_key=Fernet.generate_key()
+        )
+        key = Fernet.generate_key() if key_kind == "wrong" else None
+        with pytest.raises(SnapshotFormatError):
+            read_warm_snapshot(path, encryption_key=key)
+
+
+class TestWarmSnapshotValidation:
+    """Corrupt, truncated and foreign files are rejected."""
+
+    @pytest.fixture
+    def snapshot_path(self, tmp_path: Path) -> Path:
+        return write_warm_snapshot(tmp_path / "v.pwsnap", [_full_proxy(), *_proxies()])
+
+    def test_checksum_mismatch(self, snapshot_path: Path) -> None:
+        data = bytearray(snapshot_path.read_bytes())
+        data[data.index(b"p0.example.com")] ^= 0xFF
+        snapshot_path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotFormatError, match="Checksum mismatch"):
+            read_warm_snapshot(snapshot_path)
+
+    def test_bad_magic(self, snapshot_path: Path) -> None:
+        snapshot_path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(SnapshotFormatError):
+            read_warm_snapshot(snapshot_path)
+
+    def test_truncated(self, snapshot_path: Path) -> None:
+        snapshot_path.write_bytes(snapshot_path.read_bytes()[:-16])
+        with pytest.raises(SnapshotFormatError):
+            read_warm_snapshot(snapshot_path)
+
+    def test_unsupported_version(self, snapshot_path: Path) -> None:
+        data = bytearray(snapshot_path.read_bytes())
+        struct.pack_into("<H", data, 8, 99)
+        snapshot_path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotFormatError, match="Unsupported warm snapshot version"):
+            read_warm_snapshot(snapshot_path)
+
+    def test_error_mentions_path(self, snapshot_path: Path) -> None:
+        snapshot_path.write_bytes(b"")
+        with pytest.raises(SnapshotFormatError) as excinfo:
+            read_warm_snapshot(snapshot_path, use_mmap=False)
+        assert excinfo.value.path == str(snapshot_path)
+
+
+class TestWarmSnapshotRestore:
+    """Restoring rotators from warm snapshots."""
+
+    def test_restores_pool_breakers_and_round_robin_index(self, tmp_path: Path) -> None:
+        full = _full_proxy()
+        source = ProxyWhirl(proxies=[full, *_proxies()], bootstrap=False)
+        breaker = source.circuit_breakers[str(full.id)]
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        source.strategy.restore_state({"current_index": 4})
+        manager = SnapshotManager(tmp_path)
+        manager.save_warm_snapshot(source)
+
+        target = ProxyWhirl(bootstrap=False)
+        breakers = target.circuit_breakers
+        assert manager.restore_warm_snapshot(target)
+
+        assert _dump_by_url(target.pool.get_all_proxies()) == _dump_by_url(
+            source.pool.get_all_proxies()
+        )
+        assert target.circuit_breakers is breakers
+        assert len(breakers) == 6
+        restored = breakers[str(full.id)]
+        assert restored.state == CircuitBreakerState.OPEN
+        assert len(restored.failure_window) == breaker.failure_threshold
+        assert restored.next_test_time == pytest.approx(breaker.next_test_time)
+        assert all(
+            cb.state == CircuitBreakerState.CLOSED
+            for proxy_id, cb in breakers.items()
+            if proxy_id != str(full.id)
+        )
+        assert target.strategy.snapshot_state() == {"current_index": 4}
+        assert target.pool.get_proxy_by_id(full.id) is not None
+
+    def test_only_non_initial_breakers_are_stored(self, tmp_path: Path) -> None:
+        proxies = _proxies(3)
+        breakers = {str(p.id): CircuitBreaker(proxy_id=str(p.id)) for p in proxies}
+        breakers[str(proxies[1].id)].record_failure()
+        breakers[str(proxies[2].id)].failure_threshold = 9
+
+        path = write_warm_snapshot(tmp_path / "b.pwsnap", proxies, circuit_breakers=breakers)
+        loaded = read_warm_snapshot(path).circuit_breakers
+
+        assert set(loaded) == {str(proxies[1].id), str(proxies[2].id)}
+        assert loaded[str(proxies[2].id)].failure_threshold == 9
+
+    def test_strategy_config_restored_when_unset(self, tmp_path: Path) -> None:
+        source = ProxyWhirl(proxies=_proxies(), strategy="weighted", bootstrap=False)
+        source.strategy.configure(StrategyConfig(weights={"http://p1.example.com:8080": 3.0}))
+        manager = SnapshotManager(tmp_path)
+        manager.save_warm_snapshot(source)
+
+        fresh = ProxyWhirl(strategy="weighted", bootstrap=False)
+        configured = ProxyWhirl(strategy="weighted", bootstrap=False)
+        configured.strategy.configure(StrategyConfig(weights={"http://p2.example.com:8080": 1.0}))
+        assert manager.restore_warm_snapshot(fresh)
+        assert manager.restore_warm_snapshot(configured)
+
+        assert fresh.strategy.config.weights == {"http://p1.example.com:8080": 3.0}
+        assert configured.strategy.config.weights == {"http://p2.example.com:8080": 1.0}
+
+    def test_strategy_state_ignored_for_other_strategy(self, tmp_path: Path) -> None:
+        source = ProxyWhirl(proxies=_proxies(), bootstrap=False)
+        source.strategy.restore_state({"current_index": 3})
+        manager = SnapshotManager(tmp_path)
+        manager.save_warm_snapshot(source)
+
+        target = ProxyWhirl(strategy="random", bootstrap=False)
+        assert manager.restore_warm_snapshot(target)
+        assert target.pool.size == 5
+
+    async def test_async_rotator(self, tmp_path: Path) -> None:
+        manager = SnapshotManager(tmp_path, encryption_key=Fernet.generate_key())
+        async with AsyncProxyWhirl(proxies=[_full_proxy(), *_proxies()]) as source:
+            manager.save_warm_snapshot(source)
+
+        async with AsyncProxyWhirl() as target:
+            assert manager.restore_warm_snapshot(target)
+            assert target.pool.size == 6
+            assert len(target.circuit_breakers) == 6
+
+    def test_missing_snapshot(self, tmp_path: Path) -> None:
+        manager = SnapshotManager(tmp_path)
+        assert manager.load_warm_snapshot() is None
+        assert not manager.restore_warm_snapshot(ProxyWhirl(bootstrap=False))
+
+    def test_corrupt_snapshot_falls_back(self, tmp_path: Path) -> None:
+        manager = SnapshotManager(tmp_path)
+        manager.warm_snapshot_path().write_bytes(b"garbage")
+        rotator = ProxyWhirl(proxies=_proxies(2), bootstrap=False)
+
+        assert not manager.restore_warm_snapshot(rotator)
+        assert rotator.pool.size == 2
+
+
+class TestWarmSnapshotWriter:
+    """Periodic background snapshots."""
+
+    def test_writes_only_on_change(self, tmp_path: Path) -> None:
+        rotator = ProxyWhirl(proxies=_proxies(2), bootstrap=False)
+        writer = WarmSnapshotWriter(SnapshotManager(tmp_path), rotator)
+
+        assert writer.write_now()
+        assert not writer.write_now()
+        rotator.add_proxy(Proxy(url="http://new.example.com:8080"))  # type: ignore
+        assert writer.write_now()
+
+    def test_background_thread_and_final_write(self, tmp_path: Path) -> None:
+        manager = SnapshotManager(tmp_path)
+        rotator = ProxyWhirl(proxies=_proxies(2), bootstrap=False)
+        writer = manager.start_warm_snapshots(rotator, interval=0.01)
+
+        deadline = time.monotonic() + 5
+        while not manager.warm_snapshot_path().exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.stop(final_write=False)
+        assert manager.warm_snapshot_path().exists()
+
+        rotator.add_proxy(Proxy(url="http://new.example.com:8080"))  # type: ignore
+        writer.stop()
+        assert len(manager.load_warm_snapshot()) == 3
+
+    @pytest.mark.parametrize("interval", [0, -1.0])
+    def test_rejects_invalid_interval(self, tmp_path: Path, interval: float) -> None:
+        with pytest.raises(ValueError, match="interval"):
+            WarmSnapshotWriter(
+                SnapshotManager(tmp_path), ProxyWhirl(bootstrap=False), interval=interval
+            )
@@ -121,7 +121,9 @@ EXPECTED_TOP_LEVEL_EXPORTS = [
     "redact_url",
     "safe_regex_compile",
     "safe_regex_findall",
+    "safe_regex_findall_many",
     "safe_regex_match",
+    "safe_regex_match_many",
     "safe_regex_search",
     "scrub_credentials_from_dict",
     "validate_proxy_model",
@@ -426,3 +426,82 @@ class TestSafeRegexTimeoutPaths:
         with pytest.raises(typer.Exit) as exc_info:
             safe_regex.safe_regex_findall(re.compile(r"a+"), "aaaa", validate=False, timeout=0.01)
         assert exc_info.value.exit_code == 1
+
+
+class TestRegexWorkerPool:
+    """Test the persistent regex worker pool and batch helpers."""
+
+    def test_workers_are_reused_across_calls(self) -> None:
+        """Consecutive calls are served by the same worker process."""
+        pool = safe_regex.RegexWorkerPool(max_workers=1)
+        try:
+            pool.run("search", r"a", 0, ["a"])
+            (worker,) = pool._idle
+            pool.run("findall", r"\d", 0, ["1 2"])
+
+            assert pool._idle == [worker]
+            assert worker.process.is_alive()
+        finally:
+            pool.shutdown()
+
+    def test_batch_runs_one_pattern_against_many_texts(self) -> None:
+        """One round trip returns a result per text."""
+        pool = safe_regex.RegexWorkerPool(max_workers=1)
+        try:
+            assert pool.run("search", r"^US:", 0, ["US:1", "UK:2", "US:3"]) == [True, False, True]
+            assert pool.run("findall", r"\d+", 0, ["1 2", "", "3"], max_results=10) == [
+                ["1", "2"],
+                [],
+                ["3"],
+            ]
+        finally:
+            pool.shutdown()
+
+    def test_timeout_replaces_only_the_stuck_worker(self) -> None:
+        """A worker that exceeds its budget is killed; idle workers survive."""
+        pool = safe_regex.RegexWorkerPool(max_workers=2)
+        try:
+            healthy = pool._acquire()
+            pool.run("search", r"a", 0, ["a"])
+            (stuck,) = pool._idle
+            pool._release(healthy)
+
+            # LIFO idle list: the most recently released worker takes the next call
+            pool._idle.remove(stuck)
+            pool._idle.append(stuck)
+            with pytest.raises(safe_regex.RegexTimeoutError):
+                pool.run("search", r"(a+)+$", 0, ["a" * 5000 + "!"], timeout=0.05)
+
+            assert not stuck.process.is_alive()
+            assert healthy.process.is_alive()
+            assert pool._idle == [healthy]
+            assert pool.run("search", r"b", 0, ["abc"]) == [True]
+        finally:
+            pool.shutdown()
+
+    def test_pattern_errors_propagate(self) -> None:
+        """Invalid patterns raise re.error without killing the worker."""
+        pool = safe_regex.RegexWorkerPool(max_workers=1)
+        try:
+            with pytest.raises(re.error):
+                pool.run("search", r"(", 0, ["x"])
+            assert pool.run("search", r"x", 0, ["x"]) == [True]
+        finally:
+            pool.shutdown()
+
+    def test_match_many_and_findall_many(self) -> None:
+        """Public batch helpers validate patterns and return per-text results."""
+        proxies = ["US:192.168.1.1:8080", "UK:192.168.1.2:8080", "US:192.168.1.3:8080"]
+
+        assert safe_regex.safe_regex_match_many(r"^US:", proxies) == [True, False, True]
+        assert safe_regex.safe_regex_findall_many(r":(\d+)$", proxies) == [["8080"]] * 3
+        assert safe_regex.safe_regex_match_many(r"^US:", []) == []
+        with pytest.raises(typer.Exit):
+            safe_regex.safe_regex_match_many(r"(a+)+", proxies)
+
+    def test_match_many_timeout_exits(self) -> None:
+        """Pathological batches are bounded by the hard timeout."""
+        with pytest.raises(typer.Exit):
+            safe_regex.safe_regex_match_many(
+                r"(a+)+$", ["a" * 5000 + "!"], validate=False, timeout=0.05
+            )
@@ -0,0 +1,249 @@
+"""Unit tests for per-stage latency profiling."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from proxywhirl.models import Proxy
+from proxywhirl.retry import RetryExecutor, RetryMetrics, RetryPolicy
+from proxywhirl.rotator import AsyncProxyWhirl, ProxyWhirl
+from proxywhirl.settings import ProxyConfiguration
+from proxywhirl.stage_timing import (
+    STAGES,
+    HTTPStageTrace,
+    LatencyHistogram,
+    StageProfiler,
+    _bucket_index,
+    _bucket_upper_ns,
+    current_profiler,
+    with_stage_trace,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802
+        body = b"x" * 4096
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        del format, args
+
+
+@pytest.fixture(scope="module")
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _proxy() -> Proxy:
+    return Proxy(url="http://proxy.example.com:8080")
+
+
+class TestLatencyHistogram:
+    """Bucket layout, percentiles and Prometheus-style cumulative counts."""
+
+    @pytest.mark.parametrize("value", [*range(300), 1_000, 123_456_789, 2**40 - 1])
+    def test_value_falls_inside_its_bucket(self, value: int) -> None:
+        index = _bucket_index(value)
+        assert value <= _bucket_upper_ns(index)
+        if index > 0:
+            assert value > _bucket_upper_ns(index - 1)
+
+    def test_percentiles_within_relative_error(self) -> None:
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.02)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.02)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+        assert histogram.min_ns == 1_000_000
+
+    def test_cumulative_counts(self) -> None:
+        histogram = LatencyHistogram()
+        for seconds in (0.001, 0.002, 0.2, 3.0):
+            histogram.record(seconds)
+
+        assert histogram.cumulative_counts([0.0005, 0.01, 1.0, 10.0]) == [0, 2, 3, 4]
+
+    def test_values_beyond_range_land_in_last_bucket(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.record(3600.0)
+        assert histogram.percentile(50) == 3600.0
+        assert histogram.cumulative_counts([60.0]) == [0]
+
+    def test_reset(self) -> None:
+        histogram = LatencyHistogram()
+        histogram.record_ns(-5)
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.percentile(50) == 0.0
+
+
+class TestStageProfiler:
+    """Sampling, activation and snapshots."""
+
+    @pytest.mark.parametrize("rate", [-0.1, 1.5])
+    def test_rejects_invalid_sample_rate(self, rate: float) -> None:
+        with pytest.raises(ValueError, match="sample_rate"):
+            StageProfiler(sample_rate=rate)
+
+    def test_sampling_extremes(self) -> None:
+        assert all(StageProfiler(1.0).should_sample() for _ in range(100))
+        assert not any(StageProfiler(0.0).should_sample() for _ in range(100))
+
+    def test_activate_is_scoped(self) -> None:
+        profiler = StageProfiler()
+        assert current_profiler() is None
+        token = profiler.activate()
+        assert current_profiler() is profiler
+        StageProfiler.deactivate(token)
+        assert current_profiler() is None
+
+    def test_snapshot_covers_every_stage(self) -> None:
+        profiler = StageProfiler()
+        with profiler.stage("select"):
+            pass
+        snapshot = profiler.snapshot()
+
+        assert set(snapshot) == set(STAGES)
+        assert snapshot["select"]["count"] == 1
+        assert snapshot["ttfb"]["count"] == 0
+
+
+class TestHTTPStageTrace:
+    """Mapping of httpcore trace events to stages."""
+
+    def test_events_map_to_stages(self) -> None:
+        profiler = StageProfiler()
+        trace = HTTPStageTrace(profiler)
+        for event in (
+            "connection.connect_tcp.started",
+            "connection.connect_tcp.complete",
+            "http11.send_request_headers.started",
+            "http11.send_request_headers.complete",
+            "http11.receive_response_headers.started",
+            "http11.receive_response_headers.complete",
+            "http11.receive_response_body.started",
+            "http11.receive_response_body.complete",
+        ):
+            trace(event, {})
+        trace.flush()
+
+        counts = {stage: h.count for stage, h in profiler.histograms.items()}
+        assert counts["connect"] == counts["ttfb"] == counts["body"] == 1
+
+    def test_reused_connection_records_no_connect(self) -> None:
+        profiler = StageProfiler()
+        trace = HTTPStageTrace(profiler)
+        trace("http2.send_request_headers.started", {})
+        trace("http2.receive_response_headers.complete", {})
+        trace.flush()
+
+        assert profiler.histograms["connect"].count == 0
+        assert profiler.histograms["ttfb"].count == 1
+
+    def test_existing_trace_extension_still_called(self) -> None:
+        existing = MagicMock()
+        trace, kwargs = with_stage_trace(
+            StageProfiler(), {"extensions": {"trace": existing}, "timeout": 5}, is_async=False
+        )
+        kwargs["extensions"]["trace"]("connection.connect_tcp.started", {"a": 1})
+
+        assert kwargs["timeout"] == 5
+        assert kwargs["extensions"]["trace"] is trace
+        existing.assert_called_once_with("connection.connect_tcp.started", {"a": 1})
+
+    def test_real_request(self, server_url: str) -> None:
+        profiler = StageProfiler()
+        trace, kwargs = with_stage_trace(profiler, {}, is_async=False)
+        with httpx.Client() as client:
+            client.get(server_url, **kwargs)
+        trace.flush()
+
+        assert profiler.histograms["connect"].count == 1
+        assert profiler.histograms["ttfb"].count == 1
+        assert profiler.histograms["body"].count == 1
+
+
+class TestRotatorStages:
+    """Stage timing wired through ProxyWhirl, AsyncProxyWhirl and RetryExecutor."""
+
+    def test_disabled_by_default(self) -> None:
+        assert ProxyWhirl(bootstrap=False).stage_profiler is None
+        assert AsyncProxyWhirl(bootstrap=False).stage_profiler is None
+
+    def test_enabled_from_config(self) -> None:
+        config = ProxyConfiguration(stage_timing_sample_rate=0.25)
+        rotator = ProxyWhirl(config=config, bootstrap=False)
+        assert rotator.stage_profiler is not None
+        assert rotator.stage_profiler.sample_rate == 0.25
+
+    def test_sync_request_records_every_request_stage(self, server_url: str) -> None:
+        rotator = ProxyWhirl(proxies=[_proxy()], bootstrap=False)
+        rotator.stage_profiler = StageProfiler()
+        with (
+            httpx.Client() as client,
+            patch.object(rotator, "_get_or_create_client", return_value=client),
+        ):
+            rotator.get(server_url)
+            rotator.get(server_url)
+
+        counts = {stage: h.count for stage, h in rotator.stage_profiler.histograms.items()}
+        for stage in ("select", "cb_filter", "client_get", "ttfb", "body", "record"):
+            assert counts[stage] == 2, stage
+        assert counts["connect"] >= 1
+        assert counts["retry_wait"] == 0
+        assert current_profiler() is None
+
+    def test_unsampled_request_passes_kwargs_through(self) -> None:
+        rotator = ProxyWhirl(proxies=[_proxy()], bootstrap=False)
+        rotator.stage_profiler = StageProfiler(sample_rate=0.0)
+        client = MagicMock()
+        client.request.return_value = MagicMock(status_code=200)
+        with patch.object(rotator, "_get_or_create_client", return_value=client):
+            rotator.get("https://example.com/")
+
+        assert "extensions" not in client.request.call_args.kwargs
+        assert all(h.count == 0 for h in rotator.stage_profiler.histograms.values())
+
+    async def test_async_request_records_every_request_stage(self, server_url: str) -> None:
+        rotator = AsyncProxyWhirl(proxies=[_proxy()], bootstrap=False)
+        rotator.stage_profiler = StageProfiler()
+        async with httpx.AsyncClient() as client:
+            with patch.object(rotator, "_get_or_create_client", new=AsyncMock(return_value=client)):
+                await rotator.get(server_url)
+
+        counts = {stage: h.count for stage, h in rotator.stage_profiler.histograms.items()}
+        for stage in ("select", "cb_filter", "client_get", "connect", "ttfb", "body", "record"):
+            assert counts[stage] == 1, stage
+
+    def test_retry_wait_recorded_for_active_profiler(self) -> None:
+        executor = RetryExecutor(
+            RetryPolicy(max_attempts=2, base_delay=0.01, jitter=False), {}, RetryMetrics()
+        )
+        request_fn = MagicMock(side_effect=[httpx.ConnectError("boom"), MagicMock(status_code=200)])
+        profiler = StageProfiler()
+        token = profiler.activate()
+        try:
+            with patch("time.sleep") as sleep:
+                executor.execute_with_retry(request_fn, _proxy(), "GET", "https://example.com/")
+        finally:
+            StageProfiler.deactivate(token)
+
+        sleep.assert_called_once()
+        assert profiler.histograms["retry_wait"].count == 1
@@ -2967,3 +2967,652 @@ class TestDictToProxy:
 
         assert restored.username is None
         assert restored.password is None
+
+    def test_dict_to_proxy_trusted_matches_validated(self) -> None:
+        """Trusted hydration builds the same proxy as validation."""
+        from proxywhirl.storage import dict_to_proxy
+
+        row = {
+            "url": "https://proxy.example.com:8443",
+            "protocol": "https",
+            "health_status": "healthy",
+            "source": "fetched",
+            "country_code": "DE",
+            "source_url": "https://lists.example.com/proxies.txt",
+            "discovered_at": datetime(2024, 6, 1, 12, 0, 0),
+            "last_check_at": datetime(2024, 6, 2, 12, 0, 0),
+            "avg_response_time_ms": 120.5,
+            "total_checks": 4,
+            "total_successes": 3,
+        }
+
+        trusted = dict_to_proxy(row, trusted=True)
+        validated = dict_to_proxy(row)
+
+        exclude = {"id", "updated_at"}
+        assert trusted.model_dump(exclude=exclude) == validated.model_dump(exclude=exclude)
+        assert trusted.model_dump_json(exclude=exclude) == validated.model_dump_json(
+            exclude=exclude
+        )
+
+    def test_dict_to_proxy_validates_by_default(self) -> None:
+        """Rows are checked against the local-address policy unless trusted."""
+        from pydantic import ValidationError
+
+        from proxywhirl.storage import dict_to_proxy
+
+        with pytest.raises(ValidationError, match="Localhost"):
+            dict_to_proxy({"url": "http://127.0.0.1:8080"})
+
+    def test_dict_to_proxy_parses_iso_timestamps_by_default(self) -> None:
+        from proxywhirl.storage import dict_to_proxy
+
+        restored = dict_to_proxy(
+            {
+                "url": "http://proxy.example.com:8080",
+                "discovered_at": "2024-06-01T12:00:00+00:00",
+                "last_success_at": "2024-06-02T12:00:00+00:00",
+            }
+        )
+
+        assert restored.created_at == datetime(2024, 6, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert restored.last_success_at == datetime(2024, 6, 2, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class TestIncrementalIngestion:
+    """Tests for diff-based incremental ingestion against the normalized schema."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Storage with one freshly checked, one never checked and one stale proxy."""
+        from proxywhirl.storage import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "ingest.db")
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [Proxy(url="http://1.1.1.1:8080", allow_local=True)], validated=True
+        )
+        await storage.add_proxies_batch(
+            [
+                Proxy(url="http://2.2.2.2:8080", allow_local=True),
+                Proxy(url="http://3.3.3.3:8080", allow_local=True),
+            ]
+        )
+        async with storage.engine.begin() as conn:
+            await conn.execute(
+                sa.text("UPDATE proxy_statuses SET last_check_at = :old WHERE proxy_url = :url"),
+                {
+                    "old": datetime.now(timezone.utc) - timedelta(days=2),
+                    "url": "http://3.3.3.3:8080",
+                },
+            )
+        yield storage
+        await storage.close()
+
+    async def test_diff_partitions_new_stale_and_fresh(self, storage) -> None:
+        """URLs are split by presence and last-check freshness, in input order."""
+        urls = [
+            "http://9.9.9.9:8080",
+            "http://3.3.3.3:8080",
+            "http://1.1.1.1:8080",
+            "http://2.2.2.2:8080",
+        ]
+
+        diff = await storage.diff_for_ingestion(urls, timedelta(hours=1), chunk_size=1)
+
+        assert diff.new == ["http://9.9.9.9:8080"]
+        assert diff.stale == ["http://3.3.3.3:8080", "http://2.2.2.2:8080"]
+        assert diff.fresh == ["http://1.1.1.1:8080"]
+
+    async def test_touch_discovered_bumps_timestamp_and_source(self, storage) -> None:
+        """Seen-again proxies get a new discovered_at and keep attribution unless given."""
+        before = {p["url"]: p for p in await storage.load()}
+
+        applied = await storage.touch_discovered(
+            [
+                ("http://1.1.1.1:8080", "https://lists.example.com/http.txt"),
+                ("http://2.2.2.2:8080", None),
+            ]
+        )
+
+        after = {p["url"]: p for p in await storage.load()}
+        assert applied == 2
+        assert after["http://1.1.1.1:8080"]["source_url"] == "https://lists.example.com/http.txt"
+        assert after["http://2.2.2.2:8080"]["source_url"] is None
+        for url in ("http://1.1.1.1:8080", "http://2.2.2.2:8080"):
+            assert after[url]["discovered_at"] > before[url]["discovered_at"]
+
+    async def test_touch_discovered_stores_orm_timestamp_format(self, storage) -> None:
+        """Touched rows keep the naive UTC text the ORM writes, so they sort with the rest."""
+        await storage.touch_discovered([("http://1.1.1.1:8080", None)])
+
+        async with storage.engine.connect() as conn:
+            result = await conn.execute(
+                sa.text("SELECT url, discovered_at FROM proxy_identities ORDER BY url")
+            )
+            stored = dict(result.all())
+
+        touched = stored["http://1.1.1.1:8080"]
+        untouched = stored["http://2.2.2.2:8080"]
+        assert "+" not in touched
+        assert len(touched) == len(untouched)
+        assert touched[10] == untouched[10] == " "
+        assert touched > untouched
+
+    async def test_filter_only_passes_new_and_stale_proxies(self, storage) -> None:
+        """The ingest filter drops fresh proxies and records the diff."""
+        from proxywhirl.storage import IncrementalIngestFilter
+
+        ingest_filter = IncrementalIngestFilter(storage, timedelta(hours=1))
+        incoming = [
+            {"url": "http://1.1.1.1:8080"},
+            {"url": "http://3.3.3.3:8080"},
+            {"url": "http://9.9.9.9:8080"},
+        ]
+
+        to_validate = await ingest_filter(incoming)
+
+        assert to_validate == incoming[1:]
+        assert ingest_filter.diff is not None
+        assert ingest_filter.diff.fresh == ["http://1.1.1.1:8080"]
+
+
+class TestStreamingRevalidation:
+    """Tests for keyset-paginated revalidation candidate streaming."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Storage with two never-checked proxies and three checked at different times."""
+        from proxywhirl.storage import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "revalidate.db")
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [Proxy(url=f"http://10.0.0.{i}:8080", allow_local=True) for i in range(1, 6)]
+        )
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        async with storage.engine.begin() as conn:
+            for url, last_check_at in [
+                ("http://10.0.0.1:8080", base + timedelta(hours=2)),
+                ("http://10.0.0.2:8080", base + timedelta(hours=1)),
+                ("http://10.0.0.3:8080", base + timedelta(hours=1)),
+            ]:
+                await conn.execute(
+                    sa.text("UPDATE proxy_statuses SET last_check_at = :ts WHERE proxy_url = :url"),
+                    {"ts": last_check_at, "url": url},
+                )
+        yield storage
+        await storage.close()
+
+    @staticmethod
+    async def _collect(storage, **kwargs):
+        chunks = []
+        async for chunk, cursor in storage.iter_revalidation_candidates(**kwargs):
+            chunks.append(([p["url"] for p in chunk], cursor))
+        return chunks
+
+    async def test_chunks_follow_oldest_first_order(self, storage) -> None:
+        """Never-checked proxies come first, then (last_check_at, url) order."""
+        chunks = await self._collect(
+            storage, checked_before=datetime.now(timezone.utc), chunk_size=2
+        )
+
+        assert [urls for urls, _ in chunks] == [
+            ["http://10.0.0.4:8080", "http://10.0.0.5:8080"],
+            ["http://10.0.0.2:8080", "http://10.0.0.3:8080"],
+            ["http://10.0.0.1:8080"],
+        ]
+        assert chunks[0][1].last_check_at is None
+
+    async def test_resume_after_cursor_and_limit(self, storage) -> None:
+        """A cursor resumes mid-order and limit caps the total yielded."""
+        checked_before = datetime.now(timezone.utc)
+        first = await self._collect(storage, checked_before=checked_before, chunk_size=3, limit=3)
+        cursor = first[-1][1]
+
+        rest = await self._collect(storage, checked_before=checked_before, after=cursor)
+
+        assert sum(len(urls) for urls, _ in first) == 3
+        assert cursor.url == "http://10.0.0.2:8080"
+        assert [urls for urls, _ in rest] == [["http://10.0.0.3:8080", "http://10.0.0.1:8080"]]
+
+    async def test_recorded_proxies_are_not_revisited(self, storage) -> None:
+        """Recording results between chunks moves proxies past checked_before."""
+        checked_before = datetime.now(timezone.utc)
+        seen: list[str] = []
+        async for chunk, _ in storage.iter_revalidation_candidates(checked_before, chunk_size=2):
+            seen.extend(p["url"] for p in chunk)
+            await storage.record_validations_batch([(p["url"], True, 10.0, None) for p in chunk])
+
+        assert sorted(seen) == [f"http://10.0.0.{i}:8080" for i in range(1, 6)]
+        assert await storage.count_revalidation_candidates(checked_before) == 0
+
+
+class TestIterProxies:
+    """Tests for streaming proxy rows with keyset pagination."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Storage with six proxies: mixed protocols, checks and response times."""
+        from proxywhirl.storage import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "iter.db")
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [
+                Proxy(url=f"{scheme}://10.0.0.{i}:8080", allow_local=True)
+                for i, scheme in enumerate(["http", "socks5", "http", "http", "socks5", "http"], 1)
+            ]
+        )
+        await storage.record_validations_batch(
+            [
+                ("http://10.0.0.1:8080", True, 300.0, None),
+                ("socks5://10.0.0.2:8080", True, 100.0, None),
+                ("http://10.0.0.3:8080", True, 200.0, None),
+            ]
+        )
+        async with storage.engine.begin() as conn:
+            await conn.execute(
+                sa.text("UPDATE proxy_statuses SET last_check_at = :ts WHERE proxy_url = :url"),
+                {"ts": datetime(2026, 1, 1, tzinfo=timezone.utc), "url": "http://10.0.0.3:8080"},
+            )
+        yield storage
+        await storage.close()
+
+    @staticmethod
+    async def _urls(storage, *args, **kwargs) -> list[str]:
+        return [row["url"] async for row in storage.iter_proxies(*args, **kwargs)]
+
+    async def test_rows_match_load(self, storage) -> None:
+        """Streamed rows carry the same fields as load() plus updated_at."""
+        loaded = {row["url"]: row for row in await storage.load()}
+        streamed = [row async for row in storage.iter_proxies(batch_size=2)]
+
+        assert [row["url"] for row in streamed] == sorted(loaded)
+        for row in streamed:
+            updated_at = row.pop("updated_at")
+            assert isinstance(updated_at, datetime)
+            assert row == loaded[row["url"]]
+
+    async def test_keyset_pages_cover_every_row_once(self, storage) -> None:
+        """Small pages neither skip nor repeat rows, and limit caps the total."""
+        every = await self._urls(storage)
+
+        assert await self._urls(storage, batch_size=1) == every
+        assert await self._urls(storage, batch_size=4, limit=5) == every[:5]
+
+    async def test_filters(self, storage) -> None:
+        """Equality, IN and time-window filters narrow the rows."""
+        assert await self._urls(storage, {"protocol": "socks5"}) == [
+            "socks5://10.0.0.2:8080",
+            "socks5://10.0.0.5:8080",
+        ]
+        assert await self._urls(
+            storage, {"protocol": ["http"], "health_status": "healthy"}, batch_size=1
+        ) == ["http://10.0.0.1:8080", "http://10.0.0.3:8080"]
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        assert await self._urls(storage, {"succeeded_since": since}) == [
+            "http://10.0.0.1:8080",
+            "http://10.0.0.3:8080",
+            "socks5://10.0.0.2:8080",
+        ]
+
+    async def test_last_check_order(self, storage) -> None:
+        """Never-checked proxies come first, then oldest checks first."""
+        urls = await self._urls(storage, order="last_check", batch_size=2)
+
+        assert urls == [
+            "http://10.0.0.4:8080",
+            "http://10.0.0.6:8080",
+            "socks5://10.0.0.5:8080",
+            "http://10.0.0.3:8080",
+            "http://10.0.0.1:8080",
+            "socks5://10.0.0.2:8080",
+        ]
+        checked_before = datetime(2026, 6, 1, tzinfo=timezone.utc)
+        assert (
+            await self._urls(storage, {"checked_before": checked_before}, order="last_check")
+            == urls[:4]
+        )
+
+    async def test_response_time_order(self, storage) -> None:
+        """Fastest proxies first, unknown response times last by URL."""
+        urls = await self._urls(storage, order="response_time", batch_size=2, limit=4)
+
+        assert urls == [
+            "socks5://10.0.0.2:8080",
+            "http://10.0.0.3:8080",
+            "http://10.0.0.1:8080",
+            "http://10.0.0.4:8080",
+        ]
+
+    async def test_rows_written_between_pages_do_not_shift_pages(self, storage) -> None:
+        """Deleting an already-yielded row mid-iteration does not skip later rows."""
+        seen: list[str] = []
+        async for row in storage.iter_proxies(batch_size=2):
+            seen.append(row["url"])
+            if len(seen) == 1:
+                await storage.delete(row["url"])
+
+        assert len(seen) == 6
+
+    async def test_rejects_unknown_order_and_filter(self, storage) -> None:
+        """Unsupported orders and filter names raise ValueError."""
+        with pytest.raises(ValueError, match="order"):
+            await self._urls(storage, order="discovered_at")
+        with pytest.raises(ValueError, match="filter"):
+            await self._urls(storage, {"city": "Paris"})
+
+
+class TestHotQueryIndexes:
+    """Query-plan regression tests for the composite/covering proxy_statuses indexes."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Storage with 60 proxies: a third healthy, some never checked, mixed countries."""
+        from proxywhirl.storage import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "plans.db")
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [
+                Proxy(
+                    url=f"{'socks5' if i % 2 else 'http'}://10.0.1.{i}:8080",
+                    country_code="US" if i % 4 == 0 else "DE",
+                    allow_local=True,
+                )
+                for i in range(60)
+            ]
+        )
+        await storage.record_validations_batch(
+            [
+                (f"{'socks5' if i % 2 else 'http'}://10.0.1.{i}:8080", i % 3 == 0, 10.0 * i, None)
+                for i in range(40)
+            ]
+        )
+        yield storage
+        await storage.close()
+
+    @staticmethod
+    async def _plans(storage, awaitable) -> list[str]:
+        """Run ``awaitable`` and return the EXPLAIN QUERY PLAN of each SELECT it issued."""
+        statements: list[tuple[str, object]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        sync_engine = storage.engine.sync_engine
+        sa.event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await awaitable
+        finally:
+            sa.event.remove(sync_engine, "before_cursor_execute", capture)
+
+        plans = []
+        async with storage.engine.connect() as conn:
+            for statement, parameters in statements:
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                plans.append(" | ".join(row[3] for row in result))
+        return plans
+
+    async def test_initialize_creates_indexes(self, tmp_path) -> None:
+        """initialize() adds the hot-query indexes and drops the superseded one."""
+        from proxywhirl.storage import _HOT_QUERY_INDEXES, SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "upgrade.db")
+        await storage.initialize()
+        async with storage.engine.begin() as conn:
+            await conn.execute(
+                sa.text(
+                    "CREATE INDEX idx_proxy_status_health "
+                    "ON proxy_statuses(health_status, last_success_at DESC)"
+                )
+            )
+        await storage.initialize()
+        async with storage.engine.connect() as conn:
+            result = await conn.execute(
+                sa.text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            indexes = {row[0] for row in result}
+        await storage.close()
+
+        assert set(_HOT_QUERY_INDEXES) <= indexes
+        assert "idx_proxy_status_health" not in indexes
+
+    async def test_healthy_proxies_walk_latency_index(self, storage) -> None:
+        """Healthy selection reads the latency index in order instead of sorting."""
+        plans = await self._plans(storage, storage.get_healthy_proxies(limit=5))
+        plans += await self._plans(
+            storage, storage.get_healthy_proxies(protocol="http", country_code="US", limit=5)
+        )
+        plans += await self._plans(
+            storage,
+            storage.get_healthy_proxies_batch(protocols=["http"], country_codes=["US", "DE"]),
+        )
+
+        assert len(plans) == 3
+        for plan in plans:
+            assert "USING INDEX idx_proxy_status_health_latency (health_status=?)" in plan
+            assert "TEMP B-TREE" not in plan
+
+    async def test_healthy_proxies_keep_fastest_first_unknown_last(self, storage) -> None:
+        """The index-friendly ordering still sorts unknown response times last."""
+        async with storage.engine.begin() as conn:
+            await conn.execute(
+                sa.text(
+                    "UPDATE proxy_statuses SET avg_response_time_ms = NULL "
+                    "WHERE proxy_url = 'http://10.0.1.0:8080'"
+                )
+            )
+
+        rows = await storage.get_healthy_proxies()
+        times = [row["avg_response_time_ms"] for row in rows]
+
+        assert times[-1] is None
+        assert times[:-1] == sorted(times[:-1])
+        assert all(row["health_status"] == "healthy" for row in rows)
+
+    async def test_revalidation_candidates_walk_check_order_index(self, storage) -> None:
+        """Oldest-first revalidation order is read straight from the index."""
+        plans = await self._plans(storage, storage.load_revalidation_candidates(limit=5))
+
+        assert len(plans) == 1
+        assert "SCAN proxy_statuses USING INDEX idx_proxy_status_check_order" in plans[0]
+        assert "TEMP B-TREE" not in plans[0]
+
+    async def test_cleanup_scans_use_covering_indexes(self, storage) -> None:
+        """Each cleanup candidate scan is answered from a covering index."""
+        plans = await self._plans(storage, storage.cleanup(vacuum=False))
+        scans = [plan for plan in plans if plan.startswith("SEARCH proxy_statuses")]
+
+        assert scans == [
+            "SEARCH proxy_statuses USING COVERING INDEX "
+            "idx_proxy_status_health_latency (health_status=?)",
+            "SEARCH proxy_statuses USING COVERING INDEX "
+            "idx_proxy_status_check_order (last_check_at<?)",
+            "SEARCH proxy_statuses USING COVERING INDEX idx_proxy_status_checks (total_checks=?)",
+        ]
+
+
+class TestValidationRetention:
+    """Tests for validation_results rollups, batched retention and incremental vacuum."""
+
+    NOW = datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)
+    A = "http://10.0.2.1:8080"
+    B = "http://10.0.2.2:8080"
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        """Storage with two proxies and no validation history."""
+        from proxywhirl.storage import SQLiteStorage
+
+        storage = SQLiteStorage(tmp_path / "retention.db")
+        await storage.initialize()
+        await storage.add_proxies_batch(
+            [Proxy(url=url, allow_local=True) for url in (self.A, self.B)]
+        )
+        yield storage
+        await storage.close()
+
+    @staticmethod
+    async def _insert(storage, rows) -> None:
+        """Insert (proxy_url, validated_at, is_valid, response_time_ms) results."""
+        from sqlmodel.ext.asyncio.session import AsyncSession
+
+        from proxywhirl.storage import ValidationResultTable
+
+        async with AsyncSession(storage.engine) as session:
+            session.add_all(
+                [
+                    ValidationResultTable(
+                        proxy_url=url, validated_at=at, is_valid=ok, response_time_ms=ms
+                    )
+                    for url, at, ok, ms in rows
+                ]
+            )
+            await session.commit()
+
+    @staticmethod
+    async def _raw_count(storage) -> int:
+        async with storage.engine.connect() as conn:
+            result = await conn.execute(sa.text("SELECT COUNT(*) FROM validation_results"))
+            return result.scalar()
+
+    async def test_rollup_aggregates_complete_buckets(self, storage) -> None:
+        """Complete hours/days get counts and nearest-rank latency percentiles."""
+        hour = datetime(2026, 3, 9, 8, tzinfo=timezone.utc)
+        await self._insert(
+            storage,
+            [(self.A, hour + timedelta(minutes=i), True, 100.0 * (i + 1)) for i in range(10)]
+            + [(self.A, hour + timedelta(minutes=30), False, None)] * 2
+            + [(self.B, hour + timedelta(hours=1), False, None)]
+            + [(self.A, self.NOW - timedelta(minutes=10), True, 50.0)],
+        )
+
+        written = await storage.rollup_validations(self.NOW)
+        hourly = await storage.load_validation_rollups("hour", proxy_url=self.A)
+        daily = await storage.load_validation_rollups("day")
+
+        assert written == {"hour": 2, "day": 2}
+        assert len(hourly) == 1
+        rollup = hourly[0]
+        assert rollup["bucket_start"] == hour
+        assert (rollup["checks"], rollup["successes"], rollup["response_time_count"]) == (
+            12,
+            10,
+            10,
+        )
+        assert rollup["avg_response_time_ms"] == pytest.approx(550.0)
+        assert (rollup["min_response_time_ms"], rollup["max_response_time_ms"]) == (100.0, 1000.0)
+        assert (
+            rollup["p50_response_time_ms"],
+            rollup["p90_response_time_ms"],
+            rollup["p99_response_time_ms"],
+        ) == (500.0, 900.0, 1000.0)
+        assert [(r["proxy_url"], r["checks"], r["p50_response_time_ms"]) for r in daily] == [
+            (self.A, 12, 500.0),
+            (self.B, 1, None),
+        ]
+
+    async def test_rollup_resumes_after_newest_bucket(self, storage) -> None:
+        """Re-running writes nothing new; later buckets are picked up incrementally."""
+        await self._insert(storage, [(self.A, self.NOW - timedelta(hours=3), True, 10.0)])
+        await storage.rollup_validations(self.NOW)
+
+        assert await storage.rollup_validations(self.NOW) == {"hour": 0, "day": 0}
+
+        await self._insert(storage, [(self.A, self.NOW, True, 20.0)])
+        later = self.NOW + timedelta(hours=1)
+
+        assert await storage.rollup_validations(later) == {"hour": 1, "day": 0}
+        hourly = await storage.load_validation_rollups("hour", since=self.NOW - timedelta(hours=1))
+        assert [r["avg_response_time_ms"] for r in hourly] == [20.0]
+
+    async def test_retention_deletes_rolled_up_rows_in_batches(self, storage) -> None:
+        """Raw rows past the horizon and expired rollups are deleted; recent rows stay."""
+        from proxywhirl.storage import ValidationRetention
+
+        old = self.NOW - timedelta(days=3)
+        await self._insert(
+            storage,
+            [(self.A, old + timedelta(minutes=i), True, 10.0) for i in range(7)]
+            + [(self.A, self.NOW - timedelta(hours=1), True, 10.0)],
+        )
+
+        counts = await storage.apply_validation_retention(
+            ValidationRetention(hourly=timedelta(days=2), batch_size=3), now=self.NOW
+        )
+
+        assert counts == {
+            "hourly_rollups": 2,
+            "daily_rollups": 1,
+            "raw_deleted": 7,
+            "rollups_deleted": 1,
+        }
+        assert await self._raw_count(storage) == 1
+        assert [r["checks"] for r in await storage.load_validation_rollups("day")] == [7]
+        assert len(await storage.load_validation_rollups("hour")) == 1
+
+    async def test_raw_rows_kept_until_their_day_is_rolled_up(self, storage) -> None:
+        """A short raw horizon never deletes rows of the current, unrolled day."""
+        from proxywhirl.storage import ValidationRetention
+
+        await self._insert(storage, [(self.A, self.NOW - timedelta(hours=5), True, 10.0)])
+
+        counts = await storage.apply_validation_retention(
+            ValidationRetention(raw=timedelta(hours=1)), now=self.NOW
+        )
+
+        assert counts["raw_deleted"] == 0
+        assert await self._raw_count(storage) == 1
+
+    async def test_cleanup_trims_history_and_vacuums_incrementally(self, storage) -> None:
+        """cleanup() reports history counts and releases free pages without a full VACUUM."""
+        old = datetime.now(timezone.utc) - timedelta(days=3)
+        await self._insert(
+            storage, [(self.A, old + timedelta(seconds=i), True, 10.0) for i in range(2000)]
+        )
+
+        counts = await storage.cleanup(
+            remove_dead=False, remove_stale_days=0, remove_never_validated=False
+        )
+
+        assert counts["old_validations"] == 2000
+        assert counts["expired_rollups"] == 0
+        async with storage.engine.connect() as conn:
+            mode = (await conn.execute(sa.text("PRAGMA auto_vacuum"))).scalar()
+            free = (await conn.execute(sa.text("PRAGMA freelist_count"))).scalar()
+        assert (mode, free) == (2, 0)
+
+    async def test_vacuum_converts_existing_database(self, tmp_path) -> None:
+        """Databases created without incremental auto-vacuum are converted once."""
+        import sqlite3
+
+        from proxywhirl.storage import SQLiteStorage
+
+        db_path = tmp_path / "legacy.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("CREATE TABLE legacy (id INTEGER)")
+        storage = SQLiteStorage(db_path)
+        await storage.initialize()
+
+        async def mode() -> int:
+            async with storage.engine.connect() as conn:
+                return (await conn.execute(sa.text("PRAGMA auto_vacuum"))).scalar()
+
+        assert await mode() == 0
+        await storage.vacuum(incremental=True)
+        assert await mode() == 2
+        await storage.close()
+
+    async def test_rejects_invalid_policy_and_period(self, storage) -> None:
+        """Non-positive horizons, empty batches and unknown periods raise ValueError."""
+        from proxywhirl.storage import ValidationRetention
+
+        with pytest.raises(ValueError, match="positive"):
+            ValidationRetention(raw=timedelta(0))
+        with pytest.raises(ValueError, match="batch_size"):
+            ValidationRetention(batch_size=0)
+        with pytest.raises(ValueError, match="period"):
+            await storage.load_validation_rollups("week")
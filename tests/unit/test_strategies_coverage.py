@@ -73,6 +73,23 @@ class TestCompositeStrategy:
 
         assert selected == proxy
 
+    def test_select_from_pool_larger_than_default_capacity(self) -> None:
+        """Test that temporary filter pools are not capped at the default max_pool_size."""
+        proxies = [
+            Proxy(
+                url=f"http://proxy{i}.example.com:8080",
+                health_status=HealthStatus.HEALTHY,
+                country_code="US",
+            )
+            for i in range(150)
+        ]
+        pool = ProxyPool(name="test-pool", proxies=proxies, max_pool_size=150)
+
+        strategy = CompositeStrategy(filters=[GeoTargetedStrategy()], selector=RandomStrategy())
+        selected = strategy.select(pool, SelectionContext(target_country="US"))
+
+        assert selected in proxies
+
     def test_select_with_geo_filter(self) -> None:
         """Test selection with geo filter applied."""
         pool = ProxyPool(name="test-pool")